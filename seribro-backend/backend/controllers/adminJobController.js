@@ -0,0 +1,43 @@
+// backend/controllers/adminJobController.js
+// Hinglish: Admin background jobs monitoring - scheduler ke per-job metrics
+
+const { getJobMetrics } = require('../utils/scheduler/jobScheduler');
+const { getOutboxStats } = require('../utils/notifications/notificationOutbox');
+const { getSocketStats } = require('../utils/socket/socketManager');
+const { getRecentMessagesStats } = require('../utils/workspace/recentMessages');
+const applicationStatsCache = require('../utils/company/applicationStatsCache');
+const responseCache = require('../utils/responseCache');
+
+/**
+ * Hinglish: Consistent response format
+ */
+const sendResponse = (res, success, message, data = null, status = 200) => {
+  return res.status(status).json({
+    success,
+    message: String(message || 'Operation completed'),
+    data
+  });
+};
+
+/**
+ * Hinglish: Sab scheduled jobs ke metrics - last duration, items, lag, lease owner
+ * @desc Get background job metrics
+ * @route GET /api/admin/jobs
+ * @access Private (Admin)
+ */
+exports.getJobs = async (req, res) => {
+  try {
+    const metrics = await getJobMetrics();
+    // Hinglish: Is process ka notification outbox (buffered, delivered, pushed, replayed)
+    metrics.notificationOutbox = getOutboxStats();
+    // Hinglish: Socket bus + cluster presence (kitne nodes, kitne sockets)
+    metrics.socket = getSocketStats();
+    metrics.recentMessages = getRecentMessagesStats();
+    metrics.applicationStatsCache = applicationStatsCache.getStats();
+    metrics.responseCache = responseCache.getStats();
+    return sendResponse(res, true, 'Job metrics fetched successfully', metrics);
+  } catch (error) {
+    console.error('Error getting job metrics:', error);
+    return sendResponse(res, false, error.message, null, 500);
+  }
+};
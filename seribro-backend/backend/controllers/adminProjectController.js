@@ -4,6 +4,7 @@
 const Project = require('../models/Project');
 const Company = require('../models/companyProfile');
 const Application = require('../models/Application');
+const { getLoaders } = require('../utils/loaders/requestLoaders');
 
 /**
  * Hinglish: Consistent response format
@@ -140,14 +141,21 @@ exports.getAllProjects = async (req, res) => {
     const limitNum = parseInt(limit) || 20;
     const skip = (pageNum - 1) * limitNum;
 
-    // Hinglish: Projects nikalo aur company data populate karo
+    // Hinglish: Projects nikalo aur company data batch loader se ek $in query mein attach karo
     const projects = await Project.find(filter)
-      .populate('companyId', 'name email logo')
       .sort({ createdAt: -1 })
       .skip(skip)
       .limit(limitNum)
       .lean();
 
+    const companies = await getLoaders(req).company.loadMany(projects.map((project) => project.companyId));
+    projects.forEach((project, index) => {
+      const company = companies[index];
+      project.companyId = company
+        ? { _id: company._id, name: company.companyName, email: company.companyEmail, logo: company.logoUrl }
+        : project.companyId;
+    });
+
     // Hinglish: Har project ke liye application stats nikalo
     const projectsWithStats = await Promise.all(
       projects.map(async (project) => {
@@ -211,14 +219,15 @@ exports.getProjectDetails = async (req, res) => {
   try {
     const { projectId } = req.params;
 
-    const project = await Project.findById(projectId)
-      .populate('companyId', 'companyName officeAddress.city officeAddress.state email logo industryType')
-      .lean();
+    const project = await Project.findById(projectId).lean();
 
     if (!project) {
       return sendResponse(res, false, 'Project nahi mila', null, 404);
     }
 
+    // Hinglish: Company data batch loader se (CompanyProfile, legacy Company fallback)
+    project.companyId = (await getLoaders(req).company.load(project.companyId)) || project.companyId;
+
     // Hinglish: Application stats nikalo
     const appStats = await Application.aggregate([
       { $match: { projectId: project._id } },
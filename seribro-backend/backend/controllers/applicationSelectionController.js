@@ -14,7 +14,7 @@ const Application = require('../models/Application');
 const Project = require('../models/Project');
 const StudentProfile = require('../models/StudentProfile');
 const CompanyProfile = require('../models/companyProfile');
-const Notification = require('../models/Notification');
+const { enqueue: enqueueNotification } = require('../utils/notifications/notificationOutbox');
 const User = require('../models/User');
 
 // ============================================
@@ -51,13 +51,13 @@ const addStatusHistory = (application, newStatus, changedBy, reason = '', metada
  */
 const createNotification = async (userId, userRole, message, type, relatedApplicationId = null) => {
     try {
-        await Notification.create({
+        // Outbox mein queue - batched insert + socket push, request wait nahi karta
+        enqueueNotification({
             userId,
             userRole,
             message,
             type,
             relatedApplicationId,
-            isRead: false,
         });
     } catch (error) {
         console.error('Error creating notification:', error);
@@ -7,6 +7,7 @@ const Student = require("../models/Student");
 const Company = require("../models/Company");
 const OTP = require("../models/OTP");
 const generateToken = require("../utils/generateToken");
+const principalCache = require("../utils/principalCache");
 const jwt = require('jsonwebtoken');
 const generateResetToken = require("../utils/generateResetToken");
 const generateOTP = require("../utils/generateOTP");
@@ -832,6 +833,18 @@ const googleAuthCallback = asyncHandler(async (req, res) => {
 // @route   POST /api/auth/logout
 // @access  Private
 const logoutUser = asyncHandler(async (req, res) => {
+  // Hinglish: Token valid ho to us user ka cached principal bhi hatao
+  const authHeader = req.headers.authorization || '';
+  const token = authHeader.startsWith('Bearer') ? authHeader.split(' ')[1] : req.cookies?.jwt;
+  if (token) {
+    try {
+      const decoded = jwt.verify(token, process.env.JWT_SECRET);
+      principalCache.invalidateUser(decoded.userId);
+    } catch (error) {
+      // Expired/invalid token - cache mein waise bhi kuch use nahi hoga
+    }
+  }
+
   res.cookie("jwt", "", {
     httpOnly: true,
     expires: new Date(0),
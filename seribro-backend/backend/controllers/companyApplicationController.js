@@ -6,8 +6,11 @@ const Project = require('../models/Project');
 const StudentProfile = require('../models/StudentProfile');
 const CompanyProfile = require('../models/companyProfile');
 const User = require('../models/User');
-const Notification = require('../models/Notification');
+const { enqueue: enqueueNotification } = require('../utils/notifications/notificationOutbox');
 const mongoose = require('mongoose');
+const { getLoaders } = require('../utils/loaders/requestLoaders');
+const { runBulkTransition, MAX_BULK_ITEMS } = require('../utils/applications/bulkTransitions');
+const applicationStatsCache = require('../utils/company/applicationStatsCache');
 
 // ============================================
 // UTILITY FUNCTIONS
@@ -76,13 +79,13 @@ const cacheStudentData = async (studentId, application) => {
  */
 const createNotification = async (userId, userRole, message, type, relatedProfileId = null) => {
     try {
-        await Notification.create({
+        // Outbox mein queue - batched insert + socket push, request wait nahi karta
+        enqueueNotification({
             userId,
             userRole,
             message,
             type,
             relatedProfileId,
-            isRead: false,
         });
     } catch (error) {
         console.error('Error creating notification:', error);
@@ -145,8 +148,8 @@ exports.getProjectApplications = async (req, res) => {
             applications.map(async (app) => {
                 // Use snapshot if available, otherwise fetch from profile
                 const studentData = app.studentSnapshot || {};
-                const studentProfile = await StudentProfile.findById(app.student?._id || app.studentId)
-                    .select('basicInfo.fullName basicInfo.collegeName basicInfo.location skills.technical skills.soft skills.languages documents.resume.url documents.collegeId.url');
+                // Batch loader - page ke saare student profiles ek $in query mein
+                const studentProfile = await getLoaders(req).studentProfile.load(app.student?._id || app.studentId);
                 
                 // PART 4: Return ONLY allowed fields - NO email, NO phone
                 return {
@@ -259,8 +262,8 @@ exports.getAllCompanyApplications = async (req, res) => {
             applications.map(async (app) => {
                 // Phase 4: Use studentData (with hidden fields) if available, otherwise use studentSnapshot or fetch fresh
                 const cachedData = app.studentData || app.studentSnapshot || {};
-                const studentProfile = await StudentProfile.findById(app.student?._id || app.studentId)
-                    .select('basicInfo.fullName basicInfo.collegeName basicInfo.location skills.technical skills.soft skills.languages documents.resume.url documents.collegeId.url');
+                // Batch loader - page ke saare student profiles ek $in query mein
+                const studentProfile = await getLoaders(req).studentProfile.load(app.student?._id || app.studentId);
                 
                 // PART 4: Return ONLY allowed fields - NO email, NO phone, NO _hiddenEmail, NO _hiddenPhone
                 // Remove hidden fields before sending to frontend
@@ -609,15 +612,23 @@ exports.approveStudentForProject = async (req, res) => {
         project.selectedApplicationId = application._id;
         await project.save({ session });
 
-        // PART 6: Step 4 - Send notifications
-        // Get student user for notification
-        const studentProfile = await StudentProfile.findById(application.studentId).session(session);
-        const studentUser = studentProfile ? await User.findOne({ _id: studentProfile.user }).session(session) : null;
+        // PART 6: Step 4 - Notification recipients - ek $in query, har rejected student ke liye alag lookup nahi
+        const recipientProfiles = await StudentProfile.find({
+            _id: { $in: [application.studentId, ...otherApplications.map(app => app.studentId)] },
+        })
+            .select('user basicInfo.fullName name')
+            .session(session)
+            .lean();
+        const profileById = new Map(recipientProfiles.map(profile => [String(profile._id), profile]));
+        const studentProfile = profileById.get(String(application.studentId));
+
+        await session.commitTransaction();
 
+        // Hinglish: Notifications commit ke baad queue karo - abort hua to koi notification nahi jayega
         // To approved student
-        if (studentUser) {
+        if (studentProfile && studentProfile.user) {
             await createNotification(
-                studentUser._id,
+                studentProfile.user,
                 'student',
                 `Your application has been approved. You are assigned to this project: "${project.title}".`,
                 'application_accepted',
@@ -640,23 +651,18 @@ exports.approveStudentForProject = async (req, res) => {
 
         // To rejected students
         for (const rejectedApp of otherApplications) {
-            const rejectedStudentProfile = await StudentProfile.findById(rejectedApp.studentId).session(session);
-            if (rejectedStudentProfile) {
-                const rejectedStudentUser = await User.findOne({ _id: rejectedStudentProfile.user }).session(session);
-                if (rejectedStudentUser) {
-                    await createNotification(
-                        rejectedStudentUser._id,
-                        'student',
-                        `Your application was not selected for project: "${project.title}".`,
-                        'application_rejected',
-                        rejectedApp._id
-                    );
-                }
+            const rejectedStudentProfile = profileById.get(String(rejectedApp.studentId));
+            if (rejectedStudentProfile && rejectedStudentProfile.user) {
+                await createNotification(
+                    rejectedStudentProfile.user,
+                    'student',
+                    `Your application was not selected for project: "${project.title}".`,
+                    'application_rejected',
+                    rejectedApp._id
+                );
             }
         }
 
-        await session.commitTransaction();
-
         // NOTE: Payment creation is intentionally skipped here. Payment will be created dynamically when the company initiates payment (using the selected application's proposal price).
 
         return sendResponse(res, true, 'Student approved and project assigned successfully', {
@@ -768,40 +774,43 @@ exports.acceptApplication = async (req, res) => {
             { session }
         );
 
-        // Phase 4: Notify accepted student with correct type
-        const acceptedStudentProfile = await StudentProfile.findById(application.studentId);
-        if (acceptedStudentProfile) {
-            const acceptedStudentUser = await User.findById(acceptedStudentProfile.user);
-            if (acceptedStudentUser) {
-                await createNotification(
-                    acceptedStudentUser._id,
-                    'student',
-                    `Great! Your application for "${project.title}" has been accepted! You are assigned to this project.`,
-                    'application_accepted',
-                    application._id
-                );
-            }
+        // Notification recipients - ek $in query (StudentProfile.user hi user id hai)
+        const recipientProfiles = await StudentProfile.find({
+            _id: { $in: [application.studentId, ...otherApplications.map(app => app.studentId)] },
+        })
+            .select('user')
+            .session(session)
+            .lean();
+        const userByStudent = new Map(recipientProfiles.map(profile => [String(profile._id), profile.user]));
+
+        await session.commitTransaction();
+
+        // Phase 4: Notify accepted student with correct type (commit ke baad queue)
+        const acceptedStudentUserId = userByStudent.get(String(application.studentId));
+        if (acceptedStudentUserId) {
+            await createNotification(
+                acceptedStudentUserId,
+                'student',
+                `Great! Your application for "${project.title}" has been accepted! You are assigned to this project.`,
+                'application_accepted',
+                application._id
+            );
         }
 
         // Phase 4: Notify rejected students with correct type
         for (const rejectedApp of otherApplications) {
-            const rejectedStudentProfile = await StudentProfile.findById(rejectedApp.studentId);
-            if (rejectedStudentProfile) {
-                const rejectedStudentUser = await User.findById(rejectedStudentProfile.user);
-                if (rejectedStudentUser) {
-                    await createNotification(
-                        rejectedStudentUser._id,
-                        'student',
-                        `Your application for "${project.title}" has been rejected as another candidate was selected.`,
-                        'application_rejected',
-                        rejectedApp._id
-                    );
-                }
+            const rejectedStudentUserId = userByStudent.get(String(rejectedApp.studentId));
+            if (rejectedStudentUserId) {
+                await createNotification(
+                    rejectedStudentUserId,
+                    'student',
+                    `Your application for "${project.title}" has been rejected as another candidate was selected.`,
+                    'application_rejected',
+                    rejectedApp._id
+                );
             }
         }
 
-        await session.commitTransaction();
-
         return sendResponse(res, true, 'Application accepted and others rejected', {
             application,
             rejectedCount: otherApplications.length,
@@ -903,6 +912,47 @@ exports.rejectApplication = async (req, res) => {
     }
 };
 
+/**
+ * Hinglish: Bulk endpoints ka common flow - company resolve, engine chalao, per-item results bhejo
+ * Kuch items fail hon to bhi 200 (results mein reason), koi bhi na ho paaye to 400/403/404
+ */
+const runBulkAction = async (req, res, action, applicationIds, reason = '') => {
+    if (!Array.isArray(applicationIds) || applicationIds.length === 0) {
+        return sendResponse(res, false, 'Application IDs zaroori hain', null, 400);
+    }
+    if (applicationIds.length > MAX_BULK_ITEMS) {
+        return sendResponse(res, false, `Ek baar mein zyada se zyada ${MAX_BULK_ITEMS} applications`, null, 400);
+    }
+
+    const companyProfile = await CompanyProfile.findOne({ user: req.user._id }).select('_id').lean();
+    if (!companyProfile) {
+        return sendResponse(res, false, 'Company profile nahi mila', null, 404);
+    }
+
+    const { results, summary } = await runBulkTransition({
+        action,
+        applicationIds,
+        companyProfileId: companyProfile._id,
+        actorUserId: req.user._id,
+        reason,
+    });
+
+    const pastTense = { reject: 'rejected', shortlist: 'shortlisted', expire: 'expired' }[action];
+    if (summary.succeeded === 0) {
+        const codes = new Set(results.map((result) => result.code));
+        const status = codes.size === 1 && codes.has('NOT_FOUND') ? 404
+            : codes.size === 1 && codes.has('FORBIDDEN') ? 403
+            : 400;
+        return sendResponse(res, false, `Koi bhi application ${pastTense} nahi hua`, { results, summary }, status);
+    }
+
+    return sendResponse(res, true, `${summary.succeeded} applications ${pastTense}`, {
+        [`${pastTense}Count`]: summary.succeeded,
+        results,
+        summary,
+    });
+};
+
 // ============================================
 // 7. POST /api/company/applications/bulk-reject
 // ============================================
@@ -917,11 +967,6 @@ exports.bulkRejectApplications = async (req, res) => {
     try {
         const { applicationIds, rejectionReason } = req.body;
 
-        // Validation
-        if (!Array.isArray(applicationIds) || applicationIds.length === 0) {
-            return sendResponse(res, false, 'Application IDs zaroori hain', null, 400);
-        }
-
         if (!rejectionReason || rejectionReason.length < 10 || rejectionReason.length > 500) {
             return sendResponse(
                 res,
@@ -932,71 +977,108 @@ exports.bulkRejectApplications = async (req, res) => {
             );
         }
 
-        // Applications fetch karo
-        const applications = await Application.find({ _id: { $in: applicationIds } });
-
-        if (applications.length === 0) {
-            return sendResponse(res, false, 'Koi bhi application nahi mila', null, 404);
-        }
-
-        // Get company profile for ownership check
-        const companyProfile = await CompanyProfile.findOne({ user: req.user._id });
-        if (!companyProfile) {
-            return sendResponse(res, false, 'Company profile nahi mila', null, 404);
-        }
-
-        // Check ownership - sab applications company ke hone chahiye
-        for (const app of applications) {
-            const project = await Project.findById(app.projectId);
-            if (!project) {
-                return sendResponse(res, false, 'Project nahi mila', null, 404);
-            }
-            if (project.companyId.toString() !== companyProfile._id.toString()) {
-                return sendResponse(res, false, 'Kuch applications aapke nahi hain', null, 403);
-            }
-        }
-
-        // Update all applications
-        await Application.updateMany(
-            { _id: { $in: applicationIds }, status: { $in: ['pending', 'shortlisted'] } },
-            {
-                $set: {
-                    status: 'rejected',
-                    rejectionReason,
-                    rejectedAt: new Date(),
-                },
-            }
-        );
+        return await runBulkAction(req, res, 'reject', applicationIds, rejectionReason);
+    } catch (error) {
+        console.error('Bulk reject error:', error);
+        return sendResponse(res, false, error.message, null, 500);
+    }
+};
 
-        // Notify all students
-        for (const app of applications) {
-            if (['pending', 'shortlisted'].includes(app.status)) {
-                const studentProfile = await StudentProfile.findById(app.studentId);
-                if (studentProfile) {
-                    const studentUser = await User.findById(studentProfile.user);
-                    if (studentUser) {
-                        const project = await Project.findById(app.projectId);
-                        await createNotification(
-                            studentUser._id,
-                            'student',
-                            `Your application for "${project.title}" has been rejected. Reason: ${rejectionReason}`,
-                            'application_rejected',
-                            app._id
-                        );
-                    }
-                }
-            }
-        }
+/**
+ * Hinglish: Multiple pending applications ko ek saath shortlist karo
+ * @desc Bulk shortlist applications
+ * @route POST /api/company/applications/bulk-shortlist
+ * @access Private (Company)
+ */
+exports.bulkShortlistApplications = async (req, res) => {
+    try {
+        return await runBulkAction(req, res, 'shortlist', req.body.applicationIds);
+    } catch (error) {
+        console.error('Bulk shortlist error:', error);
+        return sendResponse(res, false, error.message, null, 500);
+    }
+};
 
-        return sendResponse(res, true, `${applicationIds.length} applications rejected`, {
-            rejectedCount: applicationIds.length,
-        });
+/**
+ * Hinglish: Review band - open applications ko ek saath expire karo
+ * @desc Bulk expire applications
+ * @route POST /api/company/applications/bulk-expire
+ * @access Private (Company)
+ */
+exports.bulkExpireApplications = async (req, res) => {
+    try {
+        const reason = typeof req.body.reason === 'string' ? req.body.reason.trim().slice(0, 500) : '';
+        return await runBulkAction(req, res, 'expire', req.body.applicationIds, reason);
     } catch (error) {
-        console.error('Bulk reject error:', error);
+        console.error('Bulk expire error:', error);
         return sendResponse(res, false, error.message, null, 500);
     }
 };
 
+/**
+ * Hinglish: Company ke application stats ek hi $facet aggregation mein -
+ * per-status, per-project aur aaj ke naye applications. Application par companyId
+ * denormalized hai, isliye pehle company ke projects load karne ki zaroorat nahi.
+ */
+const computeApplicationStats = async (companyProfileId) => {
+    const startOfToday = new Date(new Date().setHours(0, 0, 0, 0));
+    const [stats] = await Application.aggregate([
+        { $match: { companyId: new mongoose.Types.ObjectId(String(companyProfileId)) } },
+        {
+            $facet: {
+                byStatus: [
+                    { $group: { _id: '$status', count: { $sum: 1 } } },
+                ],
+                byProject: [
+                    { $group: { _id: { projectId: '$projectId', status: '$status' }, count: { $sum: 1 } } },
+                    {
+                        $group: {
+                            _id: '$_id.projectId',
+                            statuses: { $push: { k: '$_id.status', v: '$count' } },
+                            total: { $sum: '$count' },
+                        },
+                    },
+                    { $sort: { total: -1, _id: 1 } },
+                    {
+                        $lookup: {
+                            from: Project.collection.name,
+                            localField: '_id',
+                            foreignField: '_id',
+                            pipeline: [{ $project: { title: 1 } }],
+                            as: 'project',
+                        },
+                    },
+                    {
+                        $project: {
+                            _id: 0,
+                            projectId: '$_id',
+                            title: { $first: '$project.title' },
+                            total: 1,
+                            byStatus: { $arrayToObject: '$statuses' },
+                        },
+                    },
+                ],
+                newToday: [
+                    { $match: { appliedAt: { $gte: startOfToday } } },
+                    { $count: 'count' },
+                ],
+            },
+        },
+    ]);
+
+    const countOf = (status) => stats.byStatus.find((s) => s._id === status)?.count || 0;
+
+    return {
+        total: stats.byStatus.reduce((sum, s) => sum + s.count, 0),
+        pending: countOf('pending'),
+        shortlisted: countOf('shortlisted'),
+        accepted: countOf('accepted'),
+        rejected: countOf('rejected'),
+        newToday: stats.newToday[0]?.count || 0,
+        byProject: stats.byProject,
+    };
+};
+
 // ============================================
 // 8. GET /api/company/applications/stats
 // ============================================
@@ -1009,63 +1091,29 @@ exports.bulkRejectApplications = async (req, res) => {
  */
 exports.getApplicationStats = async (req, res) => {
     try {
-        // Get company profile
-        const companyProfile = await CompanyProfile.findOne({ user: req.user._id });
-        if (!companyProfile) {
-            return sendResponse(res, false, 'Company profile nahi mila', null, 404);
+        // Principal cache se profile id, warna lookup
+        let companyProfileId = req.user.companyProfileId;
+        if (!companyProfileId) {
+            const companyProfile = await CompanyProfile.findOne({ user: req.user._id }).select('_id').lean();
+            if (!companyProfile) {
+                return sendResponse(res, false, 'Company profile nahi mila', null, 404);
+            }
+            companyProfileId = companyProfile._id;
         }
 
-        // Company ke sab projects
-        const projects = await Project.find({ companyId: companyProfile._id });
-        const projectIds = projects.map(p => p._id);
+        const { value, etag } = await applicationStatsCache.get(
+            companyProfileId,
+            () => computeApplicationStats(companyProfileId)
+        );
 
-        // Stats query
-        const stats = await Application.aggregate([
-            {
-                $match: {
-                    projectId: { $in: projectIds },
-                },
-            },
-            {
-                $facet: {
-                    byStatus: [
-                        {
-                            $group: {
-                                _id: '$status',
-                                count: { $sum: 1 },
-                            },
-                        },
-                    ],
-                    newToday: [
-                        {
-                            $match: {
-                                appliedAt: {
-                                    $gte: new Date(new Date().setHours(0, 0, 0, 0)),
-                                },
-                            },
-                        },
-                        {
-                            $count: 'count',
-                        },
-                    ],
-                },
-            },
-        ]);
-
-        // Format response
-        const byStatus = stats[0].byStatus;
-        const newTodayCount = stats[0].newToday[0]?.count || 0;
-
-        const result = {
-            total: byStatus.reduce((sum, s) => sum + s.count, 0),
-            pending: byStatus.find(s => s._id === 'pending')?.count || 0,
-            shortlisted: byStatus.find(s => s._id === 'shortlisted')?.count || 0,
-            accepted: byStatus.find(s => s._id === 'accepted')?.count || 0,
-            rejected: byStatus.find(s => s._id === 'rejected')?.count || 0,
-            newToday: newTodayCount,
-        };
-
-        return sendResponse(res, true, 'Application stats fetched', result);
+        // Conditional GET - poll par kuch nahi badla to 304, body dobara serialize nahi
+        res.set('Cache-Control', 'private, no-cache');
+        res.set('ETag', etag);
+        if (req.fresh) {
+            return res.status(304).end();
+        }
+
+        return sendResponse(res, true, 'Application stats fetched', value);
     } catch (error) {
         console.error('Get application stats error:', error);
         return sendResponse(res, false, error.message, null, 500);
@@ -7,6 +7,7 @@ const CompanyProfile = require('../models/companyProfile');
 const Company = require('../models/Company');
 const User = require('../models/User');
 const Notification = require('../models/Notification');
+const counterStore = require('../utils/counters/counterStore');
 const { calculateCompanyProfileCompletion } = require('../utils/company/calculateCompanyProfileCompletion');
 
 // ============ HELPER FUNCTIONS ============
@@ -108,13 +109,18 @@ exports.getCompanyDashboard = asyncHandler(async (req, res) => {
     const verificationStatus = profile.verificationStatus || 'draft';
     const alertMessage = generateAlertMessage(verificationStatus);
 
-    // Hinglish: Admin notifications fetch karna
-    const notifications = await Notification.find({
-      userId: userId,
-      userRole: 'company',
-    })
-      .sort({ createdAt: -1 })
-      .limit(10);
+    // Hinglish: Latest notifications + denormalized counters (O(1) reads, collections scan nahi)
+    const [notifications, userCounts, companyCounts] = await Promise.all([
+      Notification.find({
+        userId: userId,
+        userRole: 'company',
+      })
+        .sort({ createdAt: -1 })
+        .limit(10)
+        .lean(),
+      counterStore.getCounts('user', userId),
+      counterStore.getCounts('company', profile._id),
+    ]);
 
     // Hinglish: Dashboard data ko prepare karna
     const dashboardData = {
@@ -198,9 +204,15 @@ exports.getCompanyDashboard = asyncHandler(async (req, res) => {
         id: notif._id,
         message: notif.message,
         type: notif.type,
-        isRead: notif.isRead,
+        isRead: Boolean(notif.isRead),
         createdAt: notif.createdAt,
       })),
+
+      // Hinglish: Counters - unread notifications aur applications by status
+      counters: {
+        unreadNotifications: userCounts.unreadNotifications || 0,
+        applications: companyCounts.applications || { total: 0 },
+      },
     };
 
     res.status(200).json({
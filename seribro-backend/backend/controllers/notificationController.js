@@ -2,6 +2,7 @@
 // Hinglish: Notification management controller - get, mark as read, delete
 
 const Notification = require('../models/Notification');
+const counterStore = require('../utils/counters/counterStore');
 
 /**
  * Hinglish: Consistent response format
@@ -36,11 +37,8 @@ exports.getNotifications = async (req, res) => {
       .limit(limitNum)
       .lean();
 
-    // Hinglish: Unread count nikalo
-    const unreadCount = await Notification.countDocuments({
-      userId,
-      isRead: false
-    });
+    // Hinglish: Unread count counter se (O(1))
+    const { unreadNotifications: unreadCount = 0 } = await counterStore.getCounts('user', userId);
 
     const total = await Notification.countDocuments({ userId });
     const totalPages = Math.ceil(total / limitNum);
@@ -104,9 +102,9 @@ exports.markAllAsRead = async (req, res) => {
   try {
     const userId = req.user.id;
 
-    // Hinglish: Sab unread notifications ko read mark karo
+    // Hinglish: Sab unread notifications ko read mark karo (purane docs mein isRead field hi nahi hai)
     const result = await Notification.updateMany(
-      { userId, isRead: false },
+      { userId, isRead: { $ne: true } },
       { $set: { isRead: true } }
     );
 
@@ -185,10 +183,8 @@ exports.getUnreadCount = async (req, res) => {
   try {
     const userId = req.user.id;
 
-    const unreadCount = await Notification.countDocuments({
-      userId,
-      isRead: false
-    });
+    // Hinglish: Denormalized counter - countDocuments scan nahi
+    const { unreadNotifications: unreadCount = 0 } = await counterStore.getCounts('user', userId);
 
     return sendResponse(res, true, 'Unread count fetched', { unreadCount });
   } catch (error) {
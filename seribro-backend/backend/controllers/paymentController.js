@@ -10,6 +10,7 @@ const {
 } = require("../utils/payment/razorpayHelper");
 const { getIO } = require("../utils/socket/socketManager");
 const sendResponse = require("../utils/students/sendResponse");
+const earningsLedger = require("../utils/ledger/earningsLedger");
 const {
   sendNotification,
   sendAdminNotification,
@@ -788,24 +789,9 @@ exports.getStudentEarnings = async (req, res) => {
       .limit(10)
       .lean();
 
-    // Fetch monthly earnings for last 12 months
-    const monthly = await Payment.aggregate([
-      {
-        $match: {
-          student: new mongoose.Types.ObjectId(student._id),
-          status: "released",
-        },
-      },
-      {
-        $group: {
-          _id: { $dateToString: { format: "%Y-%m", date: "$releasedAt" } },
-          total: { $sum: { $ifNull: ["$netAmount", "$amount"] } },
-          count: { $sum: 1 },
-        },
-      },
-      { $sort: { _id: 1 } },
-      { $limit: 12 },
-    ]);
+    // Monthly earnings for last 12 months - ledger buckets, per-request $group nahi
+    const balance = await earningsLedger.getBalance("student", student._id);
+    const monthly = earningsLedger.recentMonths(balance);
 
     // Calculate summary stats
     const totalEarned = student.earnings?.totalEarned || 0;
@@ -813,15 +799,8 @@ exports.getStudentEarnings = async (req, res) => {
     const completedProjects = student.earnings?.completedProjects || 0;
     const lastPaymentDate = student.earnings?.lastPaymentDate || null;
 
-    // Calculate available for withdrawal (released but not transferred)
-    const allPayments = await Payment.find({
-      student: student._id,
-      status: "released",
-    }).lean();
-    const availableForWithdrawal = allPayments.reduce(
-      (sum, p) => sum + (p.netAmount || p.amount),
-      0
-    );
+    // Available for withdrawal (released but not transferred) - ledger running balance
+    const availableForWithdrawal = balance.totals.released || 0;
 
     return sendResponse(res, 200, true, "Earnings fetched", {
       summary: {
@@ -848,11 +827,7 @@ exports.getStudentEarnings = async (req, res) => {
         transactionId: p.razorpayPaymentId || p.razorpayOrderId || (p.razorpay && p.razorpay.paymentId),
         paymentMethod: p.paymentMethod || "Razorpay",
       })),
-      monthlyEarnings: monthly.map((m) => ({
-        month: m._id,
-        total: m.total,
-        projectCount: m.count,
-      })),
+      monthlyEarnings: monthly,
     });
   } catch (error) {
     console.error("getStudentEarnings error:", error);
@@ -992,24 +967,9 @@ exports.getCompanyPayments = async (req, res) => {
       .limit(10)
       .lean();
 
-    // Fetch monthly spending for last 12 months
-    const monthly = await Payment.aggregate([
-      {
-        $match: {
-          company: new mongoose.Types.ObjectId(company._id),
-          status: "released",
-        },
-      },
-      {
-        $group: {
-          _id: { $dateToString: { format: "%Y-%m", date: "$releasedAt" } },
-          total: { $sum: { $ifNull: ["$netAmount", "$amount"] } },
-          count: { $sum: 1 },
-        },
-      },
-      { $sort: { _id: 1 } },
-      { $limit: 12 },
-    ]);
+    // Monthly spending for last 12 months - company ledger buckets
+    const balance = await earningsLedger.getBalance("company", company._id);
+    const monthly = earningsLedger.recentMonths(balance);
 
     // Calculate summary stats
     const totalSpent = company.payments?.totalSpent || 0;
@@ -1047,11 +1007,7 @@ exports.getCompanyPayments = async (req, res) => {
         transactionId: p.razorpayPaymentId || p.razorpayOrderId || (p.razorpay && p.razorpay.paymentId),
         paymentMethod: p.paymentMethod || "Razorpay",
       })),
-      monthlySpending: monthly.map((m) => ({
-        month: m._id,
-        total: m.total,
-        projectCount: m.count,
-      })),
+      monthlySpending: monthly,
     });
   } catch (error) {
     console.error("getCompanyPayments error:", error);
@@ -7,6 +7,8 @@ const StudentProfile = require('../models/StudentProfile');
 const Student = require('../models/Student');
 const User = require('../models/User');
 const Notification = require('../models/Notification');
+const counterStore = require('../utils/counters/counterStore');
+const earningsLedger = require('../utils/ledger/earningsLedger');
 
 // ============ HELPER FUNCTIONS ============
 
@@ -154,13 +156,19 @@ exports.getStudentDashboard = asyncHandler(async (req, res) => {
     const verificationStatus = profile.verificationStatus || 'draft';
     const alertMessage = generateAlertMessage(verificationStatus);
 
-    // Hinglish: Admin notifications fetch karna
-    const notifications = await Notification.find({
-      userId: userId,
-      userRole: 'student',
-    })
-      .sort({ createdAt: -1 })
-      .limit(10);
+    // Hinglish: Latest notifications + denormalized counters aur ledger balance (O(1) reads, collections scan nahi)
+    const [notifications, userCounts, studentCounts, balance] = await Promise.all([
+      Notification.find({
+        userId: userId,
+        userRole: 'student',
+      })
+        .sort({ createdAt: -1 })
+        .limit(10)
+        .lean(),
+      counterStore.getCounts('user', userId),
+      counterStore.getCounts('student', profile._id),
+      earningsLedger.getBalance('student', profile._id),
+    ]);
 
     // Hinglish: Dashboard data ko prepare karna
     const dashboardData = {
@@ -244,9 +252,21 @@ exports.getStudentDashboard = asyncHandler(async (req, res) => {
         id: notif._id,
         message: notif.message,
         type: notif.type,
-        isRead: notif.isRead,
+        isRead: Boolean(notif.isRead),
         createdAt: notif.createdAt,
       })),
+
+      // Hinglish: Counters - unread notifications, applications by status, earnings totals
+      counters: {
+        unreadNotifications: userCounts.unreadNotifications || 0,
+        applications: studentCounts.applications || { total: 0 },
+        // Hinglish: Earnings ledger se - escrow mein captured + ready_for_release dono
+        earnings: {
+          released: balance.totals.released || 0,
+          releasedCount: balance.totals.releasedCount || 0,
+          inEscrow: balance.totals.escrow || 0,
+        },
+      },
     };
 
     res.status(200).json({
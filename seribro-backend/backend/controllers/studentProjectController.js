@@ -5,9 +5,13 @@ const Project = require('../models/Project');
 const StudentProfile = require('../models/StudentProfile');
 const CompanyProfile = require('../models/companyProfile');
 const Application = require('../models/Application');
-const Notification = require('../models/Notification');
+const { enqueue: enqueueNotification } = require('../utils/notifications/notificationOutbox');
 const User = require('../models/User');
 const { calculateSkillMatch, getRecommendedProjects } = require('../utils/students/projectHelpers');
+const { isCursorRequest, fetchCursorPage } = require('../utils/pagination/cursorPagination');
+const { searchTerms, escapeRegex, buildHighlight } = require('../utils/students/projectSearch');
+const { getLoaders, toCompanyCard } = require('../utils/loaders/requestLoaders');
+const { topProjectsForSkills } = require('../utils/students/skillIndex');
 
 // ============================================
 // UTILITY FUNCTIONS
@@ -27,13 +31,13 @@ const sendResponse = (res, success, message, data = null, status = 200) => {
  */
 const createNotification = async (userId, userRole, message, type, relatedProfileId = null) => {
     try {
-        await Notification.create({
+        // Outbox mein queue - batched insert + socket push, request wait nahi karta
+        enqueueNotification({
             userId,
             userRole,
             message,
             type,
             relatedProfileId,
-            isRead: false,
         });
     } catch (error) {
         console.error('Error creating notification:', error);
@@ -56,90 +60,139 @@ exports.browseProjects = async (req, res) => {
         const skills = req.query.skills ? req.query.skills.split(',') : [];
         const budgetMin = req.query.budgetMin ? parseInt(req.query.budgetMin) : 0;
         const budgetMax = req.query.budgetMax ? parseInt(req.query.budgetMax) : Infinity;
-        const sortBy = req.query.sortBy || 'newest'; // newest, deadline, budget-high, budget-low
+        // Search ho to default relevance, warna newest
+        const sortBy = req.query.sortBy || (search ? 'relevance' : 'newest'); // relevance, newest, deadline, budget-high, budget-low
+        const searchMode = req.query.searchMode === 'regex' ? 'regex' : 'text'; // text (indexed) ya legacy regex
 
         // Student profile dhundo - skill matching ke liye zaruri hai
         const studentProfile = await StudentProfile.findOne({ user: req.user.id });
 
         // Filter banao - sirf open projects (not assigned)
-        const filter = {
+        const baseFilter = {
             status: 'open',
             isDeleted: false,
             assignedStudent: null, // PART 7: Don't show assigned projects
         };
 
-        // Search filter
-        if (search) {
-            filter.$or = [
-                { title: { $regex: search, $options: 'i' } },
-                { description: { $regex: search, $options: 'i' } },
-            ];
-        }
-
         // Category filter
         if (category) {
-            filter.category = category;
+            baseFilter.category = category;
         }
 
         // Budget filter
-        filter.budgetMin = { $lte: budgetMax };
-        filter.budgetMax = { $gte: budgetMin };
+        baseFilter.budgetMin = { $lte: budgetMax };
+        baseFilter.budgetMax = { $gte: budgetMin };
 
         // Required skills filter - agar student ne skill select kiye hain
         if (skills.length > 0) {
-            filter.requiredSkills = { $in: skills };
+            baseFilter.requiredSkills = { $in: skills };
         }
 
-        // Sorting
-        let sortOptions = { createdAt: -1 }; // Default - newest first
-        if (sortBy === 'deadline') {
-            sortOptions = { deadline: 1 }; // Deadline soon
-        } else if (sortBy === 'budget-high') {
-            sortOptions = { budgetMax: -1 }; // Highest budget first
-        } else if (sortBy === 'budget-low') {
-            sortOptions = { budgetMin: 1 }; // Lowest budget first
-        }
+        // Search filter - text index (ranked) ya legacy unanchored regex
+        const withSearch = (mode) => {
+            if (!search) return baseFilter;
+            if (mode === 'text') return { ...baseFilter, $text: { $search: search } };
+            const pattern = escapeRegex(search);
+            return {
+                ...baseFilter,
+                $or: [
+                    { title: { $regex: pattern, $options: 'i' } },
+                    { description: { $regex: pattern, $options: 'i' } },
+                ],
+            };
+        };
 
-        // Count total documents
-        const total = await Project.countDocuments(filter);
+        const fetchPage = async (filter) => {
+            const rankByRelevance = Boolean(filter.$text) && sortBy === 'relevance';
+
+            // Sorting
+            let sortOptions = { createdAt: -1 }; // Default - newest first
+            if (sortBy === 'deadline') {
+                sortOptions = { deadline: 1 }; // Deadline soon
+            } else if (sortBy === 'budget-high') {
+                sortOptions = { budgetMax: -1 }; // Highest budget first
+            } else if (sortBy === 'budget-low') {
+                sortOptions = { budgetMin: 1 }; // Lowest budget first
+            } else if (rankByRelevance) {
+                sortOptions = { score: { $meta: 'textScore' }, createdAt: -1 }; // Best match first
+            }
 
-        // Fetch projects with pagination
-        // Populate both company and companyId for backward compatibility
-        const projects = await Project.find(filter)
-            .populate('company', 'companyName city logo isVerified')
-            .populate('companyId', 'companyName city logo isVerified')
-            .sort(sortOptions)
-            .limit(limit)
-            .skip((page - 1) * limit)
-            .lean();
+            // Relevance score par keyset stable nahi hai, isliye ranked search offset mode mein hi chalta hai
+            if (isCursorRequest(req.query) && !rankByRelevance) {
+                // Cursor mode - (sortField, _id) keyset, skip ke bina deep pages bhi fast
+                const [sortField, sortDirection] = Object.entries(sortOptions)[0];
+                const result = await fetchCursorPage({
+                    Model: Project,
+                    filter,
+                    field: sortField,
+                    direction: sortDirection,
+                    limit,
+                    after: req.query.after,
+                });
+                if (result.error) return { error: result.error };
+                return { projects: result.items, pagination: result.pagination };
+            }
+
+            // Count total documents
+            const total = await Project.countDocuments(filter);
+
+            // Fetch projects with pagination (company data neeche batch loader se)
+            const items = await Project.find(filter)
+                .select(filter.$text ? { score: { $meta: 'textScore' } } : {})
+                .sort(sortOptions)
+                .limit(limit)
+                .skip((page - 1) * limit)
+                .lean();
 
-        // Get Company model for manual lookup if needed
-        const Company = require('../models/Company');
-
-        // Ensure company data is available (use companyId if company is missing)
-        const enrichedProjects = await Promise.all(projects.map(async (project) => {
-            // Use companyId first, fallback to company for backward compatibility
-            let companyData = project.companyId || project.company;
-
-            // If company data is still not available, try manual lookup
-            if (!companyData) {
-                const companyId = project.company || project.companyId;
-                if (companyId) {
-                    try {
-                        companyData = await Company.findById(companyId).lean();
-                    } catch (err) {
-                        console.error(`Error fetching company for project ${project._id}:`, err);
-                    }
-                }
+            return {
+                projects: items,
+                pagination: {
+                    total,
+                    page,
+                    limit,
+                    pages: Math.ceil(total / limit),
+                },
+                total,
+            };
+        };
+
+        let searchModeUsed = search ? searchMode : null;
+        let result = await fetchPage(withSearch(searchMode));
+
+        // $text sirf poore (stemmed) words match karta hai - browse box ke partial words
+        // ("reac", "node.j") par kuch na mile to legacy regex se dobara dhundo
+        if (searchModeUsed === 'text' && !result.error && result.projects.length === 0) {
+            const textMatchesNothing = result.total !== undefined
+                ? result.total === 0
+                : !req.query.after || !(await Project.exists(withSearch('text')));
+            if (textMatchesNothing) {
+                searchModeUsed = 'regex';
+                result = await fetchPage(withSearch('regex'));
             }
+        }
 
-            const studentSkills = studentProfile
-                ? [
-                    ...(studentProfile.skills?.technical || []),
-                    ...(studentProfile.skills?.soft || []),
-                    ...(studentProfile.skills?.languages || []),
-                  ].map((s) => s.toLowerCase())
-                : [];
+        if (result.error) {
+            return sendResponse(res, false, result.error, null, 400);
+        }
+        const { projects, pagination } = result;
+
+        const terms = search ? searchTerms(search) : [];
+
+        // Page ki saari companies ek hi $in query mein (companyId first, company fallback)
+        const companies = await getLoaders(req).company.loadMany(
+            projects.map((project) => project.companyId || project.company)
+        );
+
+        const studentSkills = studentProfile
+            ? [
+                ...(studentProfile.skills?.technical || []),
+                ...(studentProfile.skills?.soft || []),
+                ...(studentProfile.skills?.languages || []),
+              ].map((s) => s.toLowerCase())
+            : [];
+
+        const enrichedProjects = projects.map((project, index) => {
+            const companyData = companies[index];
             const projectSkills = project.requiredSkills.map((s) => s.toLowerCase());
             const matchPercentage = calculateSkillMatch(studentSkills, projectSkills);
 
@@ -156,15 +209,14 @@ exports.browseProjects = async (req, res) => {
                 status: project.status,
                 assignedStudent: project.assignedStudent,
                 applicationsCount: project.applicationsCount || 0,
-                company: companyData ? {
-                    name: companyData.companyName,
-                    city: companyData.city,
-                    logo: companyData.logo,
-                    isVerified: companyData.isVerified,
-                } : null,
+                company: toCompanyCard(companyData),
                 skillMatch: matchPercentage,
+                ...(search ? {
+                    searchScore: project.score,
+                    highlight: buildHighlight(project, terms),
+                } : {}),
             };
-        }));
+        });
 
         return sendResponse(
             res,
@@ -172,12 +224,8 @@ exports.browseProjects = async (req, res) => {
             'Projects successfully fetch ho gaye!',
             {
                 projects: enrichedProjects,
-                pagination: {
-                    total,
-                    page,
-                    limit,
-                    pages: Math.ceil(total / limit),
-                },
+                pagination,
+                ...(search ? { searchMode: searchModeUsed } : {}),
             },
             200
         );
@@ -214,29 +262,14 @@ exports.getProjectDetails = async (req, res) => {
         }
 
         // Project dhundo
-        // Populate both company and companyId for backward compatibility
-        let project = await Project.findById(id)
-            .populate('company', 'companyName city logo isVerified')
-            .populate('companyId', 'companyName city logo isVerified')
-            .lean();
+        let project = await Project.findById(id).lean();
 
         if (!project) {
             return sendResponse(res, false, 'Project nahi mila.', null, 404);
         }
 
-        // Manual company lookup if populate failed
-        const Company = require('../models/Company');
-        let companyData = project.companyId || project.company;
-        if (!companyData) {
-            const companyId = project.company || project.companyId;
-            if (companyId) {
-                try {
-                    companyData = await Company.findById(companyId).lean();
-                } catch (err) {
-                    console.error(`Error fetching company for project ${id}:`, err);
-                }
-            }
-        }
+        // Company data - CompanyProfile first, legacy Company fallback (batch loader)
+        const companyData = await getLoaders(req).company.load(project.companyId || project.company);
 
         // Extract skills from the previously fetched `studentProfile` (if any)
         const studentSkills = studentProfile 
@@ -282,12 +315,7 @@ exports.getProjectDetails = async (req, res) => {
                 assignedStudent: project.assignedStudent,
                 selectedStudentId: project.selectedStudentId || null,
                     applicationsCount: project.applicationsCount || 0,
-                    company: companyData ? {
-                        name: companyData.companyName,
-                        city: companyData.city,
-                        logo: companyData.logo,
-                        isVerified: companyData.isVerified,
-                    } : null,
+                    company: toCompanyCard(companyData),
                     skillMatch: matchPercentage,
                     matchedSkills,
                     hasApplied: hasApplied,
@@ -502,6 +530,31 @@ exports.getMyApplications = async (req, res) => {
             filter.status = status;
         }
 
+        if (isCursorRequest(req.query)) {
+            // Cursor mode - (appliedAt, _id) keyset on { studentId, appliedAt } index
+            const result = await fetchCursorPage({
+                Model: Application,
+                filter,
+                field: 'appliedAt',
+                direction: -1,
+                limit,
+                after: req.query.after,
+                decorate: (query) => query
+                    .populate('project', 'title category budgetMin budgetMax deadline')
+                    .populate('company', 'companyName logoUrl'),
+            });
+            if (result.error) {
+                return sendResponse(res, false, result.error, null, 400);
+            }
+            return sendResponse(
+                res,
+                true,
+                'Applications successfully fetch ho gaye!',
+                { applications: result.items, pagination: result.pagination },
+                200
+            );
+        }
+
         // Count total
         const total = await Application.countDocuments(filter);
 
@@ -690,26 +743,39 @@ exports.getRecommendedProjects = async (req, res) => {
             return sendResponse(res, false, 'Student profile nahi mila.', null, 404);
         }
 
-        // Open projects fetch karo
+        // Technical skills + tech stack se skill index query (top 6, bounded heap)
+        const studentSkills = [
+            ...(studentProfile.skills?.technical || []),
+            ...(studentProfile.skills?.techStack || []),
+        ];
+        const top = await topProjectsForSkills(studentSkills, 6);
+
+        // Sirf top-K projects hi DB se laao
         const projects = await Project.find({
+            _id: { $in: top.map((item) => item.projectId) },
             status: 'open',
             isDeleted: false,
-        }).populate('company', 'companyName logoUrl');
-
-        // Skill match calculate karo har project ke liye
-        const scored = projects
-            .map((project) => {
-                const studentSkills = studentProfile.skills?.map((s) => s.toLowerCase()) || [];
-                const projectSkills = project.requiredSkills.map((s) => s.toLowerCase());
-                const matchPercentage = calculateSkillMatch(studentSkills, projectSkills);
-
-                return {
-                    ...project.toObject(),
-                    skillMatch: matchPercentage,
-                };
-            })
-            .sort((a, b) => b.skillMatch - a.skillMatch)
-            .slice(0, 6); // Top 6 projects
+        }).lean();
+        const companies = await getLoaders(req).company.loadMany(
+            projects.map((project) => project.companyId || project.company)
+        );
+        const projectsById = new Map(projects.map((project, index) => [
+            String(project._id),
+            {
+                ...project,
+                company: companies[index]
+                    ? { _id: companies[index]._id, companyName: companies[index].companyName, logoUrl: companies[index].logoUrl }
+                    : project.company,
+            },
+        ]));
+
+        const scored = top
+            .filter((item) => projectsById.has(item.projectId))
+            .map((item) => ({
+                ...projectsById.get(item.projectId),
+                skillMatch: item.skillMatch,
+                matchedSkills: item.matchedSkills,
+            }));
 
         return sendResponse(
             res,
@@ -11,6 +11,8 @@ const { uploadToCloudinary } = require('../utils/students/uploadToCloudinary');
 const { sendNotification } = require('../utils/notifications/sendNotification');
 const { validateWorkspaceAccess } = require('../utils/workspace/validateWorkspaceAccess');
 const { emitNewMessage } = require('../utils/socket/socketManager');
+const recentMessageBuffer = require('../utils/workspace/recentMessages');
+const { isCursorRequest, encodeCursor } = require('../utils/pagination/cursorPagination');
 
 const sendResponse = (res, success, message, data = null, status = 200) => {
     return res.status(status).json({ 
@@ -28,6 +30,13 @@ const getProjectWithRelations = async (projectId) => {
         .populate('companyId', 'companyName industryType about logoUrl user');
 };
 
+// Oldest loaded message -> `before` cursor for the next history page
+const historyCursor = (messages) => {
+    if (!messages.length) return null;
+    const oldest = messages[0];
+    return encodeCursor({ createdAt: new Date(oldest.createdAt), _id: oldest._id }, 'createdAt');
+};
+
 const buildSenderName = (role, studentProfile, companyProfile) => {
     if (role === 'student') {
         return (
@@ -72,12 +81,9 @@ exports.getWorkspaceOverview = async (req, res) => {
 
         const messageCount = project.messageCount || 0;
         const unreadMessages = await Message.getUnreadCount(projectId, req.user._id);
-        const latestMessages = await Message.find({ project: projectId })
-            .sort({ createdAt: -1 })
-            .limit(5)
-            .lean();
-
-        const recentMessages = [...latestMessages].reverse(); // chronological
+        // Hot path: ring buffer (warm projects never touch Mongo for these)
+        const recent = await recentMessageBuffer.getRecentMessages(projectId);
+        const recentMessages = recent.messages; // chronological
 
         const statusAllowsSubmit = ['assigned', 'in-progress'].includes(project.status);
         const statusAllowsReview = ['submitted', 'under-review', 'completed'].includes(project.status);
@@ -144,6 +150,11 @@ exports.getWorkspaceOverview = async (req, res) => {
                 lastActivity: project.lastActivity,
             },
             recentMessages,
+            // Older history: GET .../messages?before=<nextCursor>
+            messageHistory: {
+                hasMore: recent.hasMore,
+                nextCursor: recent.hasMore ? historyCursor(recentMessages) : null,
+            },
             currentUserId: req.user._id,
         });
     } catch (error) {
@@ -175,13 +186,13 @@ exports.sendMessage = async (req, res) => {
         const studentProfile = await StudentProfile.findById(project.assignedStudent || project.selectedStudentId);
         const companyProfile = await CompanyProfile.findById(project.companyId);
 
-        // Handle attachments (uploaded by multer to local disk)
+        // Handle attachments (multer streaming storage ne upload kar diye - yahan sirf metadata)
         let attachments = [];
         if (req.files && req.files.length > 0) {
             const uploads = [];
             for (const file of req.files) {
                 uploads.push(
-                    uploadToCloudinary(file.path, 'workspace-messages', req.user._id.toString())
+                    uploadToCloudinary(file, 'workspace-messages', req.user._id.toString())
                         .then((result) => ({
                             filename: file.filename,
                             originalName: file.originalname,
@@ -189,6 +200,7 @@ exports.sendMessage = async (req, res) => {
                             url: result.secure_url || result.url,
                             public_id: result.public_id || result.publicId,
                             size: file.size,
+                            hash: file.hash,
                             uploadedAt: new Date(),
                         }))
                 );
@@ -250,13 +262,16 @@ exports.sendMessage = async (req, res) => {
         try {
             emitNewMessage(projectId, {
                 _id: newMessage._id,
+                project: newMessage.project,
                 message: newMessage.message,
                 sender: newMessage.sender,
                 senderName: newMessage.senderName,
                 senderRole: newMessage.senderRole,
                 attachments: newMessage.attachments,
                 createdAt: newMessage.createdAt,
+                updatedAt: newMessage.updatedAt,
                 isRead: newMessage.isRead,
+                readAt: newMessage.readAt,
             });
         } catch (socketErr) {
             console.warn('[Socket.io] Failed to emit message (non-blocking):', socketErr.message);
@@ -270,10 +285,12 @@ exports.sendMessage = async (req, res) => {
 };
 
 // GET /api/workspace/projects/:projectId/messages
+// Cursor mode: ?before=<cursor> (ya ?paginate=cursor newest page ke liye); warna legacy ?page=
 exports.getMessages = async (req, res) => {
     try {
         const { projectId } = req.params;
-        const { page = 1, limit = 20 } = req.query;
+        const { page = 1, limit = 20, before } = req.query;
+        const cursorMode = Boolean(before) || isCursorRequest(req.query);
 
         const project = await getProjectWithRelations(projectId);
         if (!project) {
@@ -285,13 +302,37 @@ exports.getMessages = async (req, res) => {
             return sendResponse(res, false, access.error || 'Access denied', null, 403);
         }
 
-        const result = await Message.getProjectMessages(projectId, page, limit);
+        let result;
+        const limitNum = Math.min(Math.max(parseInt(limit) || 20, 1), 100);
+        if (cursorMode && !before && recentMessageBuffer.canServe(limitNum)) {
+            // Newest page (polling / first render) - straight from the ring buffer
+            const recent = await recentMessageBuffer.getRecentMessages(projectId, limitNum);
+            result = {
+                messages: recent.messages,
+                pagination: {
+                    mode: 'cursor',
+                    limit: limitNum,
+                    total: project.messageCount || recent.messages.length,
+                    totalIsApproximate: true,
+                    hasMore: recent.hasMore,
+                    nextCursor: recent.hasMore ? historyCursor(recent.messages) : null,
+                },
+            };
+        } else if (cursorMode) {
+            result = await Message.getProjectMessagesBefore(projectId, { before, limit: limitNum });
+            if (result.error) {
+                return sendResponse(res, false, result.error, null, 400);
+            }
+        } else {
+            result = await Message.getProjectMessages(projectId, page, limit);
+        }
 
         // Mark visible messages as read if they are not sent by the current user
         await Message.updateMany(
             { project: projectId, sender: { $ne: req.user._id }, isRead: false },
             { $set: { isRead: true, readAt: new Date() } }
         );
+        recentMessageBuffer.markRead(projectId, req.user._id);
 
         const unreadCount = await Message.getUnreadCount(projectId, req.user._id);
 
@@ -321,6 +362,7 @@ exports.markMessagesAsRead = async (req, res) => {
         }
 
         await Message.markAllAsRead(projectId, req.user._id);
+        recentMessageBuffer.markRead(projectId, req.user._id);
         const unreadCount = await Message.getUnreadCount(projectId, req.user._id);
 
         return sendResponse(res, true, 'Messages marked as read', { unreadCount });
@@ -1,125 +1,226 @@
 // backend/jobs/autoCloseProjects.js
 // Hinglish: Auto-close expired projects job
+//
+// Streaming pipeline: expired projects ek cursor se batches mein aate hain,
+// har batch par fixed number of queries chalti hain (bulkWrite close,
+// ek updateMany reject; notifications outbox se batched insertMany) - project count
+// kitna bhi ho, per-project round trips nahi.
 
 const Project = require('../models/Project');
 const Application = require('../models/Application');
-const Notification = require('../models/Notification');
-const User = require('../models/User');
+const { enqueue: enqueueNotification } = require('../utils/notifications/notificationOutbox');
+const StudentProfile = require('../models/StudentProfile');
+const skillIndex = require('../utils/students/skillIndex');
+
+const DEFAULT_BATCH_SIZE = 500;
+const DEFAULT_MAX_DURATION_MS = 10 * 60 * 1000;
+
+const REJECTABLE_STATUSES = ['pending', 'shortlisted'];
+
+// Hinglish: Last run ke counters (monitoring / logs ke liye)
+let lastRun = null;
+
+/**
+ * Hinglish: Ek batch close karo - projects, applications, notifications
+ * @param {Array} projects - Lean projects (_id, title, createdBy)
+ * @param {Date} now
+ * @returns {Promise<Object>} batch counters
+ */
+async function closeBatch(projects, now) {
+  const projectIds = projects.map((project) => project._id);
+
+  // Hinglish: Projects close - status guard taki beech mein assign hua project close na ho
+  const closeResult = await Project.bulkWrite(
+    projects.map((project) => ({
+      updateOne: {
+        filter: { _id: project._id, status: 'open', assignedStudent: null },
+        update: {
+          $set: {
+            status: 'closed',
+            closedAt: now,
+            closedReason: 'Deadline passed without assignment',
+          },
+        },
+      },
+    })),
+    { ordered: false }
+  );
+
+  // Hinglish: Jo sach mein close hue sirf unhi ke applications/notifications
+  const closedIds = closeResult.modifiedCount === projects.length
+    ? projectIds
+    : (await Project.find({ _id: { $in: projectIds }, status: 'closed', closedAt: now }).select('_id').lean())
+      .map((project) => project._id);
+  const closedSet = new Set(closedIds.map(String));
+  const closedProjects = projects.filter((project) => closedSet.has(String(project._id)));
+
+  // Hinglish: Pending aur shortlisted applications - notification recipients ke liye pehle padh lo
+  const applications = await Application.find({
+    projectId: { $in: closedIds },
+    status: { $in: REJECTABLE_STATUSES },
+  })
+    .select('_id projectId studentId')
+    .lean();
+
+  // Hinglish: Sab ko ek hi updateMany mein reject karo
+  const rejectResult = applications.length > 0
+    ? await Application.updateMany(
+      {
+        projectId: { $in: closedIds },
+        status: { $in: REJECTABLE_STATUSES },
+      },
+      {
+        $set: {
+          status: 'rejected',
+          rejectionReason: 'Project closed - deadline expired',
+          rejectedAt: now,
+        },
+      }
+    )
+    : { modifiedCount: 0 };
+
+  // Hinglish: Students ke user ids ek $in query se
+  const studentProfiles = await StudentProfile.find({
+    _id: { $in: [...new Set(applications.map((app) => String(app.studentId)))] },
+  })
+    .select('user')
+    .lean();
+  const userByStudent = new Map(studentProfiles.map((profile) => [String(profile._id), profile.user]));
+  const titleByProject = new Map(closedProjects.map((project) => [String(project._id), project.title]));
+
+  const notifications = [];
+  closedProjects.forEach((project) => {
+    if (!project.createdBy) return;
+    notifications.push({
+      userId: project.createdBy,
+      userRole: 'company',
+      message: `Your project "${project.title}" has been auto-closed because the deadline passed without any student being assigned.`,
+      type: 'info',
+      relatedProfileType: 'project',
+      relatedProfileId: project._id,
+    });
+  });
+  applications.forEach((app) => {
+    const userId = userByStudent.get(String(app.studentId));
+    if (!userId) return;
+    notifications.push({
+      userId,
+      userRole: 'student',
+      message: `The project "${titleByProject.get(String(app.projectId))}" you applied for has been closed because the deadline expired.`,
+      type: 'info',
+      relatedProfileId: app._id,
+    });
+  });
+
+  // Hinglish: Outbox mein queue - batched insertMany + socket push background mein
+  const notificationsSent = enqueueNotification(notifications).length;
+
+  return {
+    projectsClosed: closedIds.length,
+    applicationsRejected: rejectResult.modifiedCount || 0,
+    notificationsSent,
+  };
+}
 
 /**
  * Hinglish: Expired projects ko automatically close karo
  * - Sab projects jinke deadline pass ho gayi aur assigned nahi hue
- * - In sab ko close kar do
- * - Applications ko reject karo
- * - Notifications create karo
+ * - Cursor se batches mein close karo (bulkWrite)
+ * - Har batch ke applications ek updateMany se reject karo
+ * - Notifications outbox mein queue karo (batched insertMany + socket push)
+ *
+ * @param {Object} options
+ * @param {Number} options.batchSize - Projects per batch
+ * @param {Number} options.maxDurationMs - Is se zyada chale to ruk jao (baaki next run)
+ * @returns {Promise<Object>} run counters
  */
-async function closeExpiredProjects() {
-  try {
-    console.log('\n📅 Starting auto-close job for expired projects...');
+async function closeExpiredProjects({ batchSize = DEFAULT_BATCH_SIZE, maxDurationMs = DEFAULT_MAX_DURATION_MS } = {}) {
+  const startedAt = Date.now();
+  const now = new Date();
+  const stats = {
+    startedAt: now,
+    batches: 0,
+    projectsClosed: 0,
+    applicationsRejected: 0,
+    notificationsSent: 0,
+    failedBatches: 0,
+    truncated: false,
+    durationMs: 0,
+  };
+
+  console.log('\n📅 Starting auto-close job for expired projects...');
 
-    const now = new Date();
-
-    // Hinglish: Sab expired projects nikalo jo still open hain
-    const expiredProjects = await Project.find({
+  try {
+    // Hinglish: Sab expired projects jo still open hain - cursor se stream (memory bounded)
+    const cursor = Project.find({
       status: 'open',
       deadline: { $lt: now },
-      assignedStudent: { $exists: false }
-    });
-
-    if (expiredProjects.length === 0) {
-      console.log('✅ No expired projects to close');
-      return;
-    }
-
-    console.log(`\n🔍 Found ${expiredProjects.length} expired projects to close`);
-
-    // Hinglish: Har project ko handle karo
-    for (const project of expiredProjects) {
+      assignedStudent: null,
+    })
+      .select('_id title createdBy')
+      .lean()
+      .cursor({ batchSize });
+
+    let batch = [];
+    const flush = async () => {
+      if (batch.length === 0) return;
       try {
-        console.log(`\n⏳ Processing project: ${project.title}`);
-
-        // Hinglish: Project ko close mark karo
-        project.status = 'closed';
-        project.closedAt = now;
-        project.closedReason = 'Deadline passed without assignment';
-        await project.save();
-
-        console.log(`   ✅ Project closed: ${project.title}`);
-
-        // Hinglish: Company ko notification bhejo
-        const companyUser = await User.findById(project.createdBy);
-        if (companyUser) {
-          try {
-            await Notification.create({
-              userId: companyUser._id,
-              userRole: 'company',
-              message: `Your project "${project.title}" has been auto-closed because the deadline passed without any student being assigned.`,
-              type: 'info',
-              relatedProfileId: project._id
-            });
-            console.log(`   📬 Notification sent to company`);
-          } catch (notifErr) {
-            console.log(`   ⚠️  Could not send company notification: ${notifErr.message}`);
-          }
-        }
-
-        // Hinglish: Pending aur shortlisted applications nikalo
-        const pendingApplications = await Application.find({
-          projectId: project._id,
-          status: { $in: ['pending', 'shortlisted'] }
-        });
-
-        console.log(`   🔍 Found ${pendingApplications.length} pending/shortlisted applications`);
-
-        // Hinglish: Sab ko reject karo
-        if (pendingApplications.length > 0) {
-          await Application.updateMany(
-            {
-              projectId: project._id,
-              status: { $in: ['pending', 'shortlisted'] }
-            },
-            {
-              $set: {
-                status: 'rejected',
-                rejectionReason: 'Project closed - deadline expired',
-                rejectedAt: now
-              }
-            }
-          );
-
-          console.log(`   ✅ ${pendingApplications.length} applications rejected`);
-
-          // Hinglish: Har student ko notification bhejo
-          for (const app of pendingApplications) {
-            try {
-              const studentUser = await User.findById(app.student);
-              if (studentUser) {
-                await Notification.create({
-                  userId: studentUser._id,
-                  userRole: 'student',
-                  message: `The project "${project.title}" you applied for has been closed because the deadline expired.`,
-                  type: 'info',
-                  relatedProfileId: app._id
-                });
-              }
-            } catch (studentNotifErr) {
-              console.log(`   ⚠️  Could not send student notification for app ${app._id}`);
-            }
-          }
-
-          console.log(`   📬 Notifications sent to ${pendingApplications.length} students`);
+        const result = await closeBatch(batch, now);
+        stats.projectsClosed += result.projectsClosed;
+        stats.applicationsRejected += result.applicationsRejected;
+        stats.notificationsSent += result.notificationsSent;
+      } catch (batchError) {
+        stats.failedBatches += 1;
+        console.error(`\n❌ Error closing batch of ${batch.length} projects:`, batchError.message);
+        // Continue with next batch
+      }
+      stats.batches += 1;
+      batch = [];
+    };
+
+    for await (const project of cursor) {
+      batch.push(project);
+      if (batch.length >= batchSize) {
+        await flush();
+        if (Date.now() - startedAt > maxDurationMs) {
+          stats.truncated = true;
+          break;
         }
-      } catch (projectError) {
-        console.error(`\n❌ Error processing project ${project._id}:`, projectError.message);
-        // Continue with next project
       }
     }
+    if (!stats.truncated) {
+      await flush();
+    }
+    await cursor.close();
 
-    console.log(`\n✅ Auto-close job completed successfully!`);
-    console.log(`   Closed ${expiredProjects.length} projects\n`);
+    // bulkWrite save hooks nahi chalata - recommendations index refresh karo
+    if (stats.projectsClosed > 0) {
+      skillIndex.markStale();
+    }
+
+    stats.durationMs = Date.now() - startedAt;
+    if (stats.projectsClosed === 0 && stats.failedBatches === 0) {
+      console.log('✅ No expired projects to close');
+    } else {
+      console.log(`\n✅ Auto-close job completed${stats.truncated ? ' (time budget reached, rest next run)' : ''}`);
+      console.log(`   Closed ${stats.projectsClosed} projects, rejected ${stats.applicationsRejected} applications, ` +
+        `${stats.notificationsSent} notifications in ${stats.durationMs}ms (${stats.batches} batches)\n`);
+    }
   } catch (error) {
+    stats.durationMs = Date.now() - startedAt;
+    stats.error = error.message;
     console.error('\n❌ Fatal error in auto-close job:', error);
   }
+
+  lastRun = stats;
+  return stats;
+}
+
+/**
+ * Hinglish: Last run ke counters
+ */
+function getLastRunStats() {
+  return lastRun;
 }
 
-module.exports = { closeExpiredProjects };
+module.exports = { closeExpiredProjects, getLastRunStats };
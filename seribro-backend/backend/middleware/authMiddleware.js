@@ -3,6 +3,30 @@
 const jwt = require('jsonwebtoken');
 const asyncHandler = require('express-async-handler');
 const User = require('../models/User');
+const principalCache = require('../utils/principalCache');
+
+// Hinglish: Cache miss par user + role profile ids DB se resolve karo (plain objects)
+const loadPrincipal = async (userId) => {
+  const user = await User.findById(userId).select('-password').lean();
+  if (!user) return null;
+
+  const principal = { user, student: null, studentProfileId: null, companyProfileId: null };
+  if (user.role === 'student') {
+    const Student = require('../models/Student');
+    const StudentProfile = require('../models/StudentProfile');
+    const [student, studentProfile] = await Promise.all([
+      Student.findOne({ user: user._id }).lean(),
+      StudentProfile.findOne({ user: user._id }).select('_id').lean(),
+    ]);
+    principal.student = student;
+    principal.studentProfileId = studentProfile ? studentProfile._id : null;
+  } else if (user.role === 'company') {
+    const CompanyProfile = require('../models/companyProfile');
+    const companyProfile = await CompanyProfile.findOne({ user: user._id }).select('_id').lean();
+    principal.companyProfileId = companyProfile ? companyProfile._id : null;
+  }
+  return principal;
+};
 
 // Hinglish: JWT token ko verify karke user ko request object mein add karta hai
 const protect = asyncHandler(async (req, res, next) => {
@@ -23,18 +47,29 @@ const protect = asyncHandler(async (req, res, next) => {
       // Token verify karna (Hinglish: Verifying the token)
       const decoded = jwt.verify(token, process.env.JWT_SECRET);
 
-      // User ko database se fetch karna (password field exclude karke)
-      // Hinglish: User ko database se fetch kiya (password ke bina)
-      req.user = await User.findById(decoded.userId).select('-password');
+      // User + role profile ids - pehle principal cache, miss par database (password ke bina)
+      let principal = principalCache.get(decoded);
+      if (!principal) {
+        principal = await loadPrincipal(decoded.userId);
+        if (principal) {
+          principalCache.set(decoded, principal);
+        }
+      }
+      if (!principal) {
+        throw new Error('User not found for token');
+      }
 
-      // Fetch Student record if user is a student
-      if (req.user.role === 'student') {
+      // Har request ko apna mongoose document milta hai (cached plain object share nahi hota)
+      req.user = User.hydrate(principal.user);
+      req.user.studentProfileId = principal.studentProfileId;
+      req.user.companyProfileId = principal.companyProfileId;
+
+      // Student record if user is a student
+      if (principal.student) {
         const Student = require('../models/Student');
-        req.student = await Student.findOne({ user: req.user._id });
+        req.student = Student.hydrate(principal.student);
         // Attach student ID for controllers
-        if (req.student) {
-          req.user.studentId = req.student._id;
-        }
+        req.user.studentId = req.student._id;
       }
 
       next(); // Hinglish: Agle middleware ya controller function par jaao
@@ -0,0 +1,60 @@
+// middleware/conditionalGet.js
+// Hinglish: Polled GET routes ke liye ETag / Last-Modified + optional per-user response cache
+//
+// - Response body ka ETag banta hai; client ka If-None-Match match kare to 304 (body nahi jaati)
+// - `versions` diye hon to Last-Modified un models ke aakhri write ka time hota hai
+// - `cache: true` par same user + URL + versions tag ka response memory se (handler, Mongo,
+//   JSON.stringify sab skip). Versions model hooks se bump hote hain (utils/responseCache).
+// Sirf side-effect free GETs par cache lagao - hit par controller chalta hi nahi.
+
+const responseCache = require('../utils/responseCache');
+
+/**
+ * @desc Conditional GET middleware (protect ke baad lagao)
+ * @param {Object} options
+ * @param {Function} [options.versions] - req => ['Model' | ['Model', scopeId]] dependencies
+ * @param {Boolean} [options.cache] - Per-user response cache on karo (versions zaroori)
+ * @param {Number} [options.ttlMs] - Cache entry ka max age
+ */
+const conditionalGet = ({ versions = null, cache = false, ttlMs } = {}) => (req, res, next) => {
+  if (req.method !== 'GET' && req.method !== 'HEAD') return next();
+
+  const specs = versions ? versions(req).filter(Boolean) : [];
+  const { tag, lastModified } = responseCache.versionTag(specs);
+
+  res.set('Cache-Control', 'private, no-cache');
+  if (specs.length > 0) res.set('Last-Modified', lastModified.toUTCString());
+
+  const userId = req.user && req.user._id;
+  const key = cache && userId && specs.length > 0 ? `${userId}|${req.originalUrl}|${tag}` : null;
+
+  // Hinglish: Cache hit - controller chalaye bina wahi bytes (ya 304)
+  if (key) {
+    const hit = responseCache.getResponse(key);
+    if (hit) {
+      res.set('ETag', hit.etag);
+      if (req.fresh) return res.status(304).end();
+      res.type('json');
+      return res.send(hit.body);
+    }
+  }
+
+  // Hinglish: Miss - res.json ko wrap karo: ek baar serialize, ETag, 304 check, cache store
+  const json = res.json.bind(res);
+  res.json = (payload) => {
+    const ok = res.statusCode >= 200 && res.statusCode < 300 && !(payload && payload.success === false);
+    if (!ok) return json(payload);
+
+    const body = JSON.stringify(payload);
+    const etag = responseCache.etagFor(body);
+    res.set('ETag', etag);
+    if (key) responseCache.setResponse(key, { body, etag }, ttlMs);
+    if (req.fresh) return res.status(304).end();
+    res.type('json');
+    return res.send(body);
+  };
+
+  next();
+};
+
+module.exports = { conditionalGet };
@@ -2,19 +2,20 @@
 
 const multer = require('multer');
 const path = require('path');
+const { createStreamingStorage } = require('../utils/uploads/streamingStorage');
+const { createLocalBackend } = require('../utils/uploads/backends');
 
-// Storage configuration (Hinglish: File kahan aur kis naam se save hogi)
-const storage = multer.diskStorage({
-  destination: (req, file, cb) => {
-    // Hinglish: Files 'uploads' folder mein save hongi
-    cb(null, path.join(__dirname, '..', 'uploads'));
-  },
-  filename: (req, file, cb) => {
-    // Hinglish: File ka unique naam banana: fieldname-timestamp-originalextension
-    const uniqueSuffix = Date.now() + '-' + Math.round(Math.random() * 1E9);
-    const ext = path.extname(file.originalname);
-    cb(null, file.fieldname + '-' + uniqueSuffix + ext);
-  },
+const MAX_FILE_SIZE = 5 * 1024 * 1024;
+
+// Storage configuration (Hinglish: Signup documents local 'uploads' folder mein hi rehte hain -
+// stream seedha file mein, raaste mein content type / size check aur hash)
+// File ka naam pehle jaisa: fieldname-timestamp-random.ext, aur req.file.path bhi milta hai
+const storage = createStreamingStorage({
+  backend: createLocalBackend({ root: path.join(__dirname, '..', 'uploads'), baseUrl: '/uploads' }),
+  folder: '',
+  maxFileSize: MAX_FILE_SIZE,
+  // Hinglish: authController galat request par file khud delete karta hai
+  cleanupOnError: false,
 });
 
 // File filter to allow only images and PDFs (Hinglish: Sirf images aur PDF allow karna)
@@ -34,7 +35,7 @@ const fileFilter = (req, file, cb) => {
 // Multer upload instance (Hinglish: Multer ka instance)
 const upload = multer({
   storage: storage,
-  limits: { fileSize: 5 * 1024 * 1024 }, // Hinglish: File size limit 5MB
+  limits: { fileSize: MAX_FILE_SIZE }, // Hinglish: File size limit 5MB
   fileFilter: fileFilter,
 });
 
@@ -1,22 +1,20 @@
 // backend/middleware/workSubmissionUploadMiddleware.js
 const multer = require('multer');
 const path = require('path');
-const fs = require('fs');
+const mongoose = require('mongoose');
+const { createStreamingStorage } = require('../utils/uploads/streamingStorage');
+const sendResponse = require('../utils/students/sendResponse');
 
 const MAX_FILES = Number(process.env.WORK_MAX_FILES || 10);
 const MAX_FILE_SIZE_MB = Number(process.env.WORK_MAX_FILE_SIZE_MB || 100);
 const MAX_FILE_SIZE = MAX_FILE_SIZE_MB * 1024 * 1024;
 
-const uploadDir = path.join(__dirname, '..', 'uploads', 'work-submissions');
-if (!fs.existsSync(uploadDir)) fs.mkdirSync(uploadDir, { recursive: true });
-
-const storage = multer.diskStorage({
-  destination: (req, file, cb) => cb(null, uploadDir),
-  filename: (req, file, cb) => {
-    const uniqueSuffix = Date.now() + '-' + Math.round(Math.random() * 1e9);
-    const ext = path.extname(file.originalname);
-    cb(null, file.fieldname + '-' + uniqueSuffix + ext);
-  },
+// Files disk par nahi aati - multipart stream seedha storage backend (Cloudinary / local) mein,
+// folder work-submissions/{projectId}; size, content type aur sha256 raaste mein hi
+const storage = createStreamingStorage({
+  folder: (req) => `work-submissions/${req.params.projectId}`,
+  publicIdPrefix: (req) => req.params.projectId,
+  maxFileSize: MAX_FILE_SIZE,
 });
 
 // Allowed extensions and mime types for work submissions
@@ -39,7 +37,15 @@ const upload = multer({
   fileFilter,
 });
 
+const workFilesUpload = upload.array('workFiles', MAX_FILES);
+
 // Export middleware for field 'workFiles' - array up to MAX_FILES
-const uploadWorkFiles = upload.array('workFiles', MAX_FILES);
+// projectId storage folder / publicId mein jaata hai (Express %2F decode karta hai) - stream khulne se pehle validate
+const uploadWorkFiles = (req, res, next) => {
+  if (!mongoose.Types.ObjectId.isValid(req.params.projectId)) {
+    return sendResponse(res, 400, false, 'Invalid project ID');
+  }
+  return workFilesUpload(req, res, next);
+};
 
 module.exports = { uploadWorkFiles };
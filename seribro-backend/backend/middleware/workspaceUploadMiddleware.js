@@ -3,23 +3,7 @@
 
 const multer = require('multer');
 const path = require('path');
-const fs = require('fs');
-
-const UPLOAD_DIR = path.join(__dirname, '..', 'uploads', 'workspace-messages');
-if (!fs.existsSync(UPLOAD_DIR)) {
-    fs.mkdirSync(UPLOAD_DIR, { recursive: true });
-}
-
-const storage = multer.diskStorage({
-    destination: (req, file, cb) => {
-        cb(null, UPLOAD_DIR);
-    },
-    filename: (req, file, cb) => {
-        const uniqueSuffix = `${Date.now()}-${Math.round(Math.random() * 1e9)}`;
-        const ext = path.extname(file.originalname);
-        cb(null, `workspace-${uniqueSuffix}${ext}`);
-    },
-});
+const { createStreamingStorage } = require('../utils/uploads/streamingStorage');
 
 // Allowed file extensions
 const allowedExtensions = ['.jpg', '.jpeg', '.png', '.gif', '.pdf', '.doc', '.docx', '.zip'];
@@ -39,6 +23,14 @@ const allowedMimeTypes = [
 const MAX_FILE_SIZE = 5 * 1024 * 1024; // 5MB
 const MAX_FILES = 3;
 
+// Attachments disk par nahi aate - stream seedha storage backend mein (seribro/workspace-messages),
+// content type / size raaste mein check, sha256 hash saath mein
+const storage = createStreamingStorage({
+    folder: 'workspace-messages',
+    publicIdPrefix: (req) => req.user._id.toString(),
+    maxFileSize: MAX_FILE_SIZE,
+});
+
 const uploadMessageFiles = multer({
     storage,
     limits: { fileSize: MAX_FILE_SIZE, files: MAX_FILES },
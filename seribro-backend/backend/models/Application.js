@@ -2,6 +2,8 @@
 // Student applications ka model - Phase 4.2
 
 const mongoose = require('mongoose');
+const counterStore = require('../utils/counters/counterStore');
+const applicationStatsCache = require('../utils/company/applicationStatsCache');
 
 // Main Application Schema
 const ApplicationSchema = new mongoose.Schema(
@@ -345,6 +347,9 @@ ApplicationSchema.index({ projectId: 1, companyId: 1, status: 1 });
 // Applied date ke liye sorting
 ApplicationSchema.index({ appliedAt: -1 });
 
+// Student ki my-applications list - cursor pagination (appliedAt, _id)
+ApplicationSchema.index({ studentId: 1, appliedAt: -1, _id: -1 });
+
 // Duplicate prevention - ek student ek project mein sirf ek bar apply kar sakta hai
 // Withdrawn applications ko bhi count karte hain taki wo dobara apply kar sakein
 ApplicationSchema.index(
@@ -404,22 +409,10 @@ ApplicationSchema.statics.getActiveApplications = function(studentId) {
  * Hinglish: Calculate statistics for a student
  */
 ApplicationSchema.statics.getStudentStats = async function(studentId) {
-    const stats = await this.aggregate([
-        {
-            $match: {
-                student: new mongoose.Types.ObjectId(studentId),
-                status: { $ne: 'withdrawn' },
-            },
-        },
-        {
-            $group: {
-                _id: '$status',
-                count: { $sum: 1 },
-            },
-        },
-    ]);
+    // Denormalized counter se (O(1)) - aggregate scan nahi
+    const { applications = {} } = await counterStore.getCounts('student', studentId);
 
-    // Format karte hain
+    // Format karte hain - withdrawn total mein nahi gine jaate
     const result = {
         total: 0,
         pending: 0,
@@ -428,14 +421,34 @@ ApplicationSchema.statics.getStudentStats = async function(studentId) {
         rejected: 0,
     };
 
-    stats.forEach((stat) => {
-        result[stat._id] = stat.count;
-        result.total += stat.count;
+    Object.entries(applications).forEach(([status, count]) => {
+        if (status === 'total' || status === 'withdrawn') return;
+        result[status] = count;
+        result.total += count;
     });
 
     return result;
 };
 
+/**
+ * Hinglish: Application counters - project, company aur student teeno ke applications.<status>
+ */
+counterStore.attachCounterHooks(ApplicationSchema, 'Application', {
+    fields: ['status', 'projectId', 'companyId', 'studentId'],
+    contributions: (doc) => ['project', 'company', 'student'].flatMap((scope) => {
+        const ref = doc[`${scope}Id`];
+        return [
+            { scope, ref, path: `applications.${doc.status}`, by: 1 },
+            { scope, ref, path: 'applications.total', by: 1 },
+        ];
+    }),
+});
+
+/**
+ * Hinglish: Company ke application stats cache - writes par invalidate
+ */
+applicationStatsCache.attachInvalidationHooks(ApplicationSchema);
+
 const Application = mongoose.model('Application', ApplicationSchema);
 
 module.exports = Application;
@@ -0,0 +1,44 @@
+// models/Counter.js
+// Hinglish: Denormalized counters - dashboards aur badges ke liye O(1) reads
+//
+// Ek document = ek scope (user / project / company / student) ke saare counters.
+// Writes `$inc` se hote hain (utils/counters/counterStore.js), reconciliation job
+// raw collections se dobara gin kar drift theek karta hai.
+
+const mongoose = require('mongoose');
+
+const CounterSchema = new mongoose.Schema({
+  // Hinglish: `${scope}:${ref}` - e.g. 'user:65ab...', 'project:65cd...'
+  _id: {
+    type: String,
+  },
+  scope: {
+    type: String,
+    enum: ['user', 'project', 'company', 'student'],
+    required: true,
+  },
+  // Hinglish: User / Project / CompanyProfile / StudentProfile ka id
+  ref: {
+    type: mongoose.Schema.Types.ObjectId,
+    required: true,
+  },
+  // Hinglish: Nested counters - unreadNotifications, unreadMessagesBy.<senderId>,
+  // applications.<status>
+  counts: {
+    type: mongoose.Schema.Types.Mixed,
+    default: {},
+  },
+  // Hinglish: Aakhri baar raw data se kab gina - null = abhi tak sirf $inc, trust nahi kar sakte
+  reconciledAt: {
+    type: Date,
+    default: null,
+  },
+}, {
+  timestamps: true,
+  minimize: false,
+  collection: 'counters',
+});
+
+const Counter = mongoose.model('Counter', CounterSchema);
+
+module.exports = Counter;
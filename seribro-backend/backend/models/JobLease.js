@@ -0,0 +1,60 @@
+// models/JobLease.js
+// Hinglish: Scheduler ke jobs ka lease/lock document - cluster mein ek job ek time par ek hi process chalaye
+
+const mongoose = require('mongoose');
+
+const JobLeaseSchema = new mongoose.Schema({
+  // Hinglish: Job ka naam hi _id hai (e.g. 'closeExpiredProjects', 'applicationTimeout:shard-0')
+  _id: {
+    type: String,
+  },
+  // Hinglish: Lease kis process ke paas hai (hostname:pid:random)
+  owner: {
+    type: String,
+    default: null,
+  },
+  // Hinglish: Is time ke baad lease free maana jayega (crash hua process lease hamesha nahi rakhega)
+  leaseUntil: {
+    type: Date,
+    default: null,
+  },
+  // Hinglish: Aakhri schedule slot jo chal chuka - same slot dobara kisi replica par nahi chalega
+  lastSlot: {
+    type: String,
+    default: null,
+  },
+  runStartedAt: {
+    type: Date,
+    default: null,
+  },
+  // Hinglish: Last run ke metrics - koi bhi replica padh sakta hai
+  lastRun: {
+    owner: String,
+    slot: String,
+    scheduledAt: Date,
+    startedAt: Date,
+    finishedAt: Date,
+    durationMs: Number,
+    lagMs: Number,
+    items: Number,
+    success: Boolean,
+    error: String,
+  },
+  // Hinglish: Time budget par ruke batched jobs ka resume point - lease kisi bhi replica par jaye, agla run yahin se shuru
+  cursor: {
+    type: mongoose.Schema.Types.Mixed,
+    default: null,
+  },
+  totals: {
+    runs: { type: Number, default: 0 },
+    failures: { type: Number, default: 0 },
+    items: { type: Number, default: 0 },
+  },
+}, {
+  timestamps: true,
+  collection: 'joblocks',
+});
+
+const JobLease = mongoose.model('JobLease', JobLeaseSchema);
+
+module.exports = JobLease;
@@ -0,0 +1,54 @@
+// models/LedgerBalance.js
+// Hinglish: Earnings ledger ke running balances - ek document per student / company
+//
+// Ledger entries post hote waqt isi document par `$inc` hota hai (same transaction),
+// isliye earnings page ko Payment collection scan ya monthly `$group` nahi chahiye.
+
+const mongoose = require('mongoose');
+
+const LedgerBalanceSchema = new mongoose.Schema({
+  // Hinglish: `${scope}:${ref}` - e.g. 'student:65ab...', 'company:65cd...'
+  _id: {
+    type: String,
+  },
+  scope: {
+    type: String,
+    enum: ['student', 'company'],
+    required: true,
+  },
+  // Hinglish: StudentProfile / CompanyProfile ka id
+  ref: {
+    type: mongoose.Schema.Types.ObjectId,
+    required: true,
+  },
+  // Hinglish: escrow = captured + ready_for_release, released = released (net), releasedCount
+  totals: {
+    type: mongoose.Schema.Types.Mixed,
+    default: {},
+  },
+  // Hinglish: Released amounts per month (releasedAt) - { '2025-01': { total, count } }
+  months: {
+    type: mongoose.Schema.Types.Mixed,
+    default: {},
+  },
+  entries: {
+    type: Number,
+    default: 0,
+  },
+  lastEntryAt: {
+    type: Date,
+    default: null,
+  },
+  // Hinglish: Aakhri baar raw Payments se verify kab hua - null = abhi tak sirf postings
+  verifiedAt: {
+    type: Date,
+    default: null,
+  },
+}, {
+  minimize: false,
+  collection: 'ledgerbalances',
+});
+
+const LedgerBalance = mongoose.model('LedgerBalance', LedgerBalanceSchema);
+
+module.exports = LedgerBalance;
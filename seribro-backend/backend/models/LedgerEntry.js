@@ -0,0 +1,52 @@
+// models/LedgerEntry.js
+// Hinglish: Earnings ledger ki append-only entries - har payment status transition ek entry
+//
+// Entry kabhi update/delete nahi hoti. `_id` = `${paymentId}:${fromStatus}->${toStatus}:${seq}`
+// hai, seq = payment ki transition chain mein position. Isliye repeat transitions
+// (captured -> failed -> captured) alag entries hain, aur ek hi transition do baar post
+// ho (retry, do hooks) to chain ki aakhri entry se pakda jaata hai. Verifier ki
+// corrections alag 'adjustment' entries hain (`adj:...`).
+
+const mongoose = require('mongoose');
+
+const PostingSchema = new mongoose.Schema({
+  // Hinglish: 'student' | 'company'
+  scope: { type: String, required: true },
+  ref: { type: mongoose.Schema.Types.ObjectId, required: true },
+  // Hinglish: Balance document par `$inc` paths, e.g. { 'totals.escrow': -500, 'months.2025-01.total': 500 }
+  inc: { type: mongoose.Schema.Types.Mixed, default: {} },
+}, { _id: false });
+
+const LedgerEntrySchema = new mongoose.Schema({
+  _id: {
+    type: String,
+  },
+  kind: {
+    type: String,
+    enum: ['transition', 'adjustment'],
+    default: 'transition',
+  },
+  payment: { type: mongoose.Schema.Types.ObjectId, ref: 'Payment', default: null },
+  project: { type: mongoose.Schema.Types.ObjectId, ref: 'Project', default: null },
+  student: { type: mongoose.Schema.Types.ObjectId, ref: 'StudentProfile', default: null },
+  company: { type: mongoose.Schema.Types.ObjectId, ref: 'CompanyProfile', default: null },
+  fromStatus: { type: String, default: null },
+  toStatus: { type: String, default: null },
+  // Hinglish: Payment ki transition chain mein position (0 se) - adjustments mein nahi
+  seq: { type: Number },
+  // Hinglish: Student ko milne wala net (netAmount, warna amount)
+  amount: { type: Number, default: 0 },
+  postings: [PostingSchema],
+  note: { type: String },
+}, {
+  timestamps: { createdAt: true, updatedAt: false },
+  collection: 'ledgerentries',
+});
+
+LedgerEntrySchema.index({ student: 1, createdAt: -1 });
+LedgerEntrySchema.index({ company: 1, createdAt: -1 });
+LedgerEntrySchema.index({ payment: 1, seq: -1 });
+
+const LedgerEntry = mongoose.model('LedgerEntry', LedgerEntrySchema);
+
+module.exports = LedgerEntry;
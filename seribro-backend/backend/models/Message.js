@@ -2,6 +2,8 @@
 // Workspace Message Model - Phase 5.1
 
 const mongoose = require('mongoose');
+const counterStore = require('../utils/counters/counterStore');
+const { encodeCursor, fetchCursorPage } = require('../utils/pagination/cursorPagination');
 
 const attachmentSchema = new mongoose.Schema({
     filename: String,
@@ -10,6 +12,8 @@ const attachmentSchema = new mongoose.Schema({
     url: String,
     public_id: String,
     size: Number,
+    // sha256 of the content (streaming upload computes it on the fly)
+    hash: String,
     uploadedAt: {
         type: Date,
         default: Date.now,
@@ -62,9 +66,18 @@ const MessageSchema = new mongoose.Schema(
 );
 
 // Indexes
-MessageSchema.index({ project: 1, createdAt: -1 });
+// _id tie-breaker - cursor paging (createdAt, _id) seedha is index se chalta hai
+MessageSchema.index({ project: 1, createdAt: -1, _id: -1 });
 MessageSchema.index({ sender: 1 });
 
+// Unread message = project counter mein sender ke naam +1 (user ke liye unread = dusre senders ka sum)
+counterStore.attachCounterHooks(MessageSchema, 'Message', {
+    fields: ['project', 'sender', 'isRead'],
+    contributions: (doc) => (doc.isRead ? [] : [
+        { scope: 'project', ref: doc.project, path: `unreadMessagesBy.${doc.sender}`, by: 1 },
+    ]),
+});
+
 // Instance method: mark a single message as read
 MessageSchema.methods.markAsRead = async function () {
     if (!this.isRead) {
@@ -105,13 +118,40 @@ MessageSchema.statics.getProjectMessages = async function (projectId, page = 1,
     };
 };
 
-// Static: unread count for a user on a project
-MessageSchema.statics.getUnreadCount = async function (projectId, userId) {
-    return this.countDocuments({
-        project: projectId,
-        sender: { $ne: userId },
-        isRead: false,
+// `before` = opaque cursor token (nextCursor) ya raw `<createdAt ISO>,<messageId>` pair
+const normalizeBeforeCursor = (before) => {
+    const raw = String(before);
+    const comma = raw.lastIndexOf(',');
+    if (comma === -1) return raw;
+    const createdAt = new Date(raw.slice(0, comma));
+    const id = raw.slice(comma + 1);
+    if (Number.isNaN(createdAt.getTime()) || !mongoose.Types.ObjectId.isValid(id)) return raw;
+    return encodeCursor({ createdAt, _id: id }, 'createdAt');
+};
+
+// Static: cursor (keyset) history page - messages strictly older than `before`, returned chronologically
+MessageSchema.statics.getProjectMessagesBefore = async function (projectId, { before, limit = 20 } = {}) {
+    const limitNum = Math.min(Math.max(parseInt(limit) || 20, 1), 100);
+    const result = await fetchCursorPage({
+        Model: this,
+        filter: { project: projectId },
+        field: 'createdAt',
+        direction: -1,
+        limit: limitNum,
+        after: before ? normalizeBeforeCursor(before) : undefined,
     });
+    if (result.error) return result;
+
+    return {
+        messages: [...result.items].reverse(),
+        pagination: result.pagination,
+    };
+};
+
+// Static: unread count for a user on a project (O(1) counter read instead of countDocuments)
+MessageSchema.statics.getUnreadCount = async function (projectId, userId) {
+    const counts = await counterStore.getCounts('project', projectId);
+    return counterStore.unreadMessagesFor(counts, userId);
 };
 
 // Static: mark all as read for current user (marks messages sent by the other party)
@@ -2,6 +2,8 @@
 // Hinglish: Notification model - admin, student, aur company ke liye notifications
 
 const mongoose = require('mongoose');
+const counterStore = require('../utils/counters/counterStore');
+const responseCache = require('../utils/responseCache');
 
 const NotificationSchema = new mongoose.Schema({
   // Hinglish: Kis user ke liye notification hai
@@ -34,7 +36,9 @@ const NotificationSchema = new mongoose.Schema({
       'profile-submitted', 'approved', 'rejected', 'resubmitted', 'info',
       // Phase 4: Application workflow
       'application_submitted', 'application_received', 'application_shortlisted',
-      'application_accepted', 'application_rejected', 'project_assigned',
+      'application_accepted', 'application_rejected', 'application_expired', 'project_assigned',
+      // Phase 4.5+: Selection timeouts (applicationTimeoutJob)
+      'selected', 'all_declined',
       // Phase 5: Workspace messaging
       'workspace_message',
       // Phase 5: Payments
@@ -42,6 +46,12 @@ const NotificationSchema = new mongoose.Schema({
     ], 
     },
   
+  // Hinglish: Read status - unread counter isi se banta hai
+  isRead: {
+    type: Boolean,
+    default: false
+  },
+
   // Hinglish: Related profile type - student ya company ya project
   relatedProfileType: {
     type: String,
@@ -60,6 +70,20 @@ const NotificationSchema = new mongoose.Schema({
 
 // Hinglish: Compound index for efficient queries
 NotificationSchema.index({ userId: 1, isRead: 1, createdAt: -1 });
+// Hinglish: Dashboard/bell ki latest list - isRead filter ke bina sort
+NotificationSchema.index({ userId: 1, createdAt: -1 });
+
+// Hinglish: Unread notification = user ke counter mein +1
+counterStore.attachCounterHooks(NotificationSchema, 'Notification', {
+  fields: ['userId', 'isRead'],
+  contributions: (doc) => (doc.isRead === true ? [] : [
+    { scope: 'user', ref: doc.userId, path: 'unreadNotifications', by: 1 },
+  ]),
+});
+
+// Hinglish: Polled notification GETs ka cache - user ke notifications badle to uska version bump
+// (counter hooks ke baad register karo - bump tabhi ho jab unread counter likh chuka ho)
+responseCache.attachVersionHooks(NotificationSchema, 'Notification', (doc) => doc.userId);
 
 const Notification = mongoose.model('Notification', NotificationSchema);
 
@@ -0,0 +1,49 @@
+// models/NotificationOutbox.js
+// Hinglish: Notification outbox - parked queue, jin notifications ka Notification insert fail hua
+// (fast path outbox ko touch nahi karta, sirf failure par yahan row banti hai)
+//
+// Outbox row ka _id hi final Notification ka _id banta hai, isliye restart ke
+// baad replay duplicate notification nahi banata (duplicate key = already delivered).
+
+const mongoose = require('mongoose');
+
+const NotificationOutboxSchema = new mongoose.Schema({
+  // Hinglish: Notification ka pura data (userId, userRole, message, type, related*)
+  payload: {
+    type: mongoose.Schema.Types.Mixed,
+    required: true,
+  },
+  // Hinglish: Kis process ne row claim ki hai - claimedUntil ke baad koi bhi replica utha sakta hai
+  owner: {
+    type: String,
+    default: null,
+  },
+  claimedUntil: {
+    type: Date,
+    default: null,
+  },
+  attempts: {
+    type: Number,
+    default: 0,
+  },
+  lastError: {
+    type: String,
+    default: null,
+  },
+  // Hinglish: maxAttempts ke baad 'failed' - sweep dobara nahi uthata
+  status: {
+    type: String,
+    enum: ['pending', 'failed'],
+    default: 'pending',
+  },
+}, {
+  timestamps: true,
+  collection: 'notificationoutbox',
+});
+
+// Hinglish: Sweep query - pending rows jinka claim expire ho gaya, purane pehle
+NotificationOutboxSchema.index({ status: 1, claimedUntil: 1, createdAt: 1 });
+
+const NotificationOutbox = mongoose.model('NotificationOutbox', NotificationOutboxSchema);
+
+module.exports = NotificationOutbox;
@@ -1,5 +1,6 @@
 const mongoose = require('mongoose');
 const Schema = mongoose.Schema;
+const earningsLedger = require('../utils/ledger/earningsLedger');
 
 const TransactionSchema = new Schema({
   action: { type: String, required: true },
@@ -112,10 +113,15 @@ PaymentSchema.statics.getPendingReleases = function () {
   return this.find({ status: 'ready_for_release' }).populate('project company student').sort({ createdAt: 1 });
 };
 
+// Ledger balance se - released payments scan nahi karta
 PaymentSchema.statics.getStudentEarnings = async function (studentId) {
-  const payments = await this.find({ student: studentId, status: 'released' });
-  const total = payments.reduce((s, p) => s + (p.netAmount || (p.amount - (p.platformFee || 0))), 0);
-  return { totalEarned: total, payments };
+  const balance = await earningsLedger.getBalance('student', studentId);
+  return {
+    totalEarned: balance.totals.released || 0,
+    releasedCount: balance.totals.releasedCount || 0,
+    inEscrow: balance.totals.escrow || 0,
+    monthly: earningsLedger.recentMonths(balance),
+  };
 };
 
 PaymentSchema.statics.getCompanyPayments = function (companyId) {
@@ -130,4 +136,11 @@ PaymentSchema.statics.getPlatformRevenue = async function () {
   return (paid[0] && paid[0].totalPlatformFee) || 0;
 };
 
+// Earnings ledger - har status transition ek append-only entry + student/company balances
+earningsLedger.attachLedgerHooks(PaymentSchema);
+
+// Recent payments lists (earnings / company payments pages)
+PaymentSchema.index({ student: 1, status: 1, releasedAt: -1 });
+PaymentSchema.index({ company: 1, createdAt: -1 });
+
 module.exports = mongoose.model('Payment', PaymentSchema);
@@ -2,6 +2,7 @@
 // Company ke projects ka schema - Phase 4.1
 
 const mongoose = require('mongoose');
+const skillIndex = require('../utils/students/skillIndex');
 
 // Shortlisted student ka structure
 const shortlistedStudentSchema = new mongoose.Schema({
@@ -137,6 +138,7 @@ const ProjectSchema = new mongoose.Schema(
                         url: String,
                         public_id: String,
                         size: Number,
+                        hash: String,
                         uploadedAt: { type: Date, default: Date.now },
                     },
                 ],
@@ -369,6 +371,16 @@ ProjectSchema.index({ status: 1 }); // Status ke basis par filter karo
 ProjectSchema.index({ createdAt: -1 }); // Latest projects pehle
 ProjectSchema.index({ companyId: 1, status: 1 }); // Company + Status ke basis par
 ProjectSchema.index({ isDeleted: 1 }); // Soft delete ke liye
+// Browse search - text index (title sabse important, phir skills, phir description)
+ProjectSchema.index(
+    { title: 'text', requiredSkills: 'text', description: 'text' },
+    { weights: { title: 10, requiredSkills: 5, description: 1 }, name: 'project_text_search' }
+);
+// Browse cursor pagination - open projects + sort key + _id tie-breaker (keyset scan, no skip)
+ProjectSchema.index({ status: 1, isDeleted: 1, createdAt: -1, _id: -1 });
+ProjectSchema.index({ status: 1, isDeleted: 1, deadline: 1, _id: 1 });
+ProjectSchema.index({ status: 1, isDeleted: 1, budgetMax: -1, _id: -1 });
+ProjectSchema.index({ status: 1, isDeleted: 1, budgetMin: 1, _id: 1 });
 
 // Workspace helper - update last activity timestamp
 ProjectSchema.methods.updateLastActivity = function () {
@@ -556,4 +568,7 @@ ProjectSchema.methods.rejectWork = async function (reviewerId, reason) {
     return { submission: currentSub, project: this };
 };
 
+// Recommended projects ka skill index writes ke saath sync rahe
+skillIndex.attachHooks(ProjectSchema);
+
 module.exports = mongoose.model('Project', ProjectSchema);
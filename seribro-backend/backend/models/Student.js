@@ -2,6 +2,7 @@
 
 const mongoose = require('mongoose');
 const User = require('./User'); // Hinglish: Base User model ko import kiya
+const principalCache = require('../utils/principalCache');
 
 const StudentSchema = new mongoose.Schema({
   user: {
@@ -27,6 +28,9 @@ const StudentSchema = new mongoose.Schema({
   timestamps: true,
 });
 
+// Hinglish: Student record badla to protect ka principal cache hatao
+principalCache.attachInvalidationHooks(StudentSchema, (doc) => doc.user);
+
 const Student = mongoose.model('Student', StudentSchema);
 
 module.exports = Student;
\ No newline at end of file
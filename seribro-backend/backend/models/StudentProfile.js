@@ -2,6 +2,7 @@
 // Student Profile Model - Phase 2.1
 
 const mongoose = require('mongoose');
+const principalCache = require('../utils/principalCache');
 
 // Project Sub-Schema
 const ProjectSchema = new mongoose.Schema({
@@ -752,6 +753,9 @@ StudentProfileSchema.pre('save', function(next) {
     next();
 });
 
+// Profile edits / verification status change par protect ka principal cache hatao
+principalCache.attachInvalidationHooks(StudentProfileSchema, (doc) => doc.user);
+
 const StudentProfile = mongoose.model('StudentProfile', StudentProfileSchema);
 
 module.exports = StudentProfile;
\ No newline at end of file
@@ -1,5 +1,6 @@
 const mongoose = require('mongoose');
 const bcrypt = require('bcryptjs');
+const principalCache = require('../utils/principalCache');
 
 const UserSchema = new mongoose.Schema({
   email: {
@@ -71,5 +72,8 @@ UserSchema.methods.matchPassword = async function (enteredPassword) {
   return await bcrypt.compare(enteredPassword, this.password);
 };
 
+// Hinglish: User badla (password, verification, profile flags) to protect ka principal cache hatao
+principalCache.attachInvalidationHooks(UserSchema, (doc) => doc._id);
+
 const User = mongoose.model('User', UserSchema);
 module.exports = User;
\ No newline at end of file
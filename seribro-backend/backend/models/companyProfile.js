@@ -1,4 +1,5 @@
 const mongoose = require('mongoose');
+const principalCache = require('../utils/principalCache');
 
 // Authorized Person ka sub-document schema
 const authorizedPersonSchema = new mongoose.Schema({
@@ -202,6 +203,9 @@ CompanyProfileSchema.methods.updateRating = function(newRating) {
     return this.save();
 };
 
+// Profile edits / verification status change par protect ka principal cache hatao
+principalCache.attachInvalidationHooks(CompanyProfileSchema, (doc) => doc.user);
+
 // Check if model already exists to prevent OverwriteModelError
 const CompanyProfile = mongoose.models.CompanyProfile || mongoose.model('CompanyProfile', CompanyProfileSchema);
 
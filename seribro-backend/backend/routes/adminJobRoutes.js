@@ -0,0 +1,16 @@
+// backend/routes/adminJobRoutes.js
+// Hinglish: Admin background jobs monitoring routes
+
+const express = require('express');
+const router = express.Router();
+
+const { getJobs } = require('../controllers/adminJobController');
+
+const { protect } = require('../middleware/authMiddleware');
+const { isAdmin } = require('../middleware/roleMiddleware');
+
+// GET /api/admin/jobs
+// Scheduler jobs ke metrics (last run, lag, items, lease owner)
+router.get('/', protect, isAdmin, getJobs);
+
+module.exports = router;
@@ -7,6 +7,7 @@ const router = express.Router();
 // Auth middlewares
 const { protect } = require('../middleware/authMiddleware');
 const adminOnly = require('../middleware/adminOnly');
+const { conditionalGet } = require('../middleware/conditionalGet');
 
 // Controllers
 const {
@@ -23,8 +24,8 @@ const {
   markNotificationAsRead,
 } = require('../controllers/adminVerificationController');
 
-// Dashboard
-router.get('/dashboard', protect, adminOnly, getAdminDashboard);
+// Dashboard - har view audit log hota hai, isliye sirf ETag / 304 (response cache nahi)
+router.get('/dashboard', protect, adminOnly, conditionalGet(), getAdminDashboard);
 
 // Pending lists
 router.get('/students/pending', protect, adminOnly, getPendingStudents);
@@ -51,7 +52,13 @@ router.post('/company/:id/reject', protect, adminOnly, rejectCompany);
  * @access  Private (Admin)
  * Hinglish: Admin ke liye sabhi notifications fetch karna
  */
-router.get('/notifications', protect, adminOnly, getNotifications);
+router.get(
+  '/notifications',
+  protect,
+  adminOnly,
+  conditionalGet({ versions: (req) => [['Notification', req.user._id]], cache: true }),
+  getNotifications
+);
 
 /**
  * @route   PATCH /api/admin/notifications/:id/read
@@ -14,6 +14,8 @@ const {
     acceptApplication,
     rejectApplication,
     bulkRejectApplications,
+    bulkShortlistApplications,
+    bulkExpireApplications,
     getApplicationStats,
 } = require('../controllers/companyApplicationController');
 
@@ -120,6 +122,26 @@ router.post(
     bulkRejectApplications
 );
 
+// POST   /api/company/applications/bulk-shortlist
+// Multiple pending applications ko bulk shortlist karo
+// @access Private (Company)
+router.post(
+    '/bulk-shortlist',
+    protect,
+    roleCheck('company'),
+    bulkShortlistApplications
+);
+
+// POST   /api/company/applications/bulk-expire
+// Open applications ko bulk expire karo (review band)
+// @access Private (Company)
+router.post(
+    '/bulk-expire',
+    protect,
+    roleCheck('company'),
+    bulkExpireApplications
+);
+
 // GET    /api/company/applications/:applicationId
 // Single application ka complete details
 // IMPORTANT: This MUST be last because :applicationId matches anything
@@ -14,16 +14,23 @@ const {
 } = require('../controllers/notificationController');
 
 const { protect } = require('../middleware/authMiddleware');
+const { conditionalGet } = require('../middleware/conditionalGet');
+
+// Hinglish: Bell / dashboard poll - user ke notifications na badle to cache ya 304
+const notificationsCache = conditionalGet({
+  versions: (req) => [['Notification', req.user._id]],
+  cache: true,
+});
 
 // Hinglish: Sab routes protected hain - login zaroori hai
 
 // GET /api/notifications
 // Sab notifications fetch karo
-router.get('/', protect, getNotifications);
+router.get('/', protect, notificationsCache, getNotifications);
 
 // GET /api/notifications/unread/count
 // Unread count nikalo
-router.get('/unread/count', protect, getUnreadCount);
+router.get('/unread/count', protect, notificationsCache, getUnreadCount);
 
 // PUT /api/notifications/:notificationId/read
 // Single notification ko read mark karo
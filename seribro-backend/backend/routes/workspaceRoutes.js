@@ -6,6 +6,7 @@ const router = express.Router();
 const { protect } = require('../middleware/authMiddleware');
 const { roleMiddleware } = require('../middleware/student/roleMiddleware');
 const { uploadMessageFiles } = require('../middleware/workspaceUploadMiddleware');
+const { conditionalGet } = require('../middleware/conditionalGet');
 const {
     getWorkspaceOverview,
     sendMessage,
@@ -17,7 +18,8 @@ const {
 router.use(protect);
 
 // Workspace overview
-router.get('/projects/:projectId', roleMiddleware(['student', 'company']), getWorkspaceOverview);
+// Overview kai models par depend karta hai - sirf ETag / 304
+router.get('/projects/:projectId', roleMiddleware(['student', 'company']), conditionalGet(), getWorkspaceOverview);
 
 // Message routes
 router.post(
@@ -26,7 +28,9 @@ router.post(
     uploadMessageFiles,
     sendMessage
 );
-router.get('/projects/:projectId/messages', roleMiddleware(['student', 'company']), getMessages);
+// 30s poll - getMessages dusron ke messages read mark karta hai, isliye response cache nahi
+// (hit par controller skip ho jaata) - sirf ETag / 304
+router.get('/projects/:projectId/messages', roleMiddleware(['student', 'company']), conditionalGet(), getMessages);
 router.put('/projects/:projectId/messages/read', roleMiddleware(['student', 'company']), markMessagesAsRead);
 
 module.exports = router;
@@ -0,0 +1,254 @@
+// backend/utils/applications/bulkTransitions.js
+// Hinglish: Applications ke bulk status transitions (reject / shortlist / expire) - set-based engine
+//
+// Pehle bulk reject har application ke liye alag Project / StudentProfile / User lookups
+// karta tha (~5 round trips per applicant). Yahan poora batch fixed queries mein hota hai:
+// 1. Applications ek `$in` find se, ownership ek `$in` Project query se
+// 2. Updates + statusHistory push ek bulkWrite mein (status guard ke saath)
+// 3. Notifications ek aggregation join ($lookup studentprofiles + projects) se
+// Har item ka apna result aata hai - ek galat id poore batch ko fail nahi karti.
+
+const mongoose = require('mongoose');
+const Application = require('../../models/Application');
+const Project = require('../../models/Project');
+const StudentProfile = require('../../models/StudentProfile');
+const { enqueue: enqueueNotification } = require('../notifications/notificationOutbox');
+const { recordChanges } = require('../counters/counterStore');
+const applicationStatsCache = require('../company/applicationStatsCache');
+
+const MAX_BULK_ITEMS = parseInt(process.env.BULK_TRANSITION_MAX_ITEMS, 10) || 1000;
+
+/**
+ * Hinglish: Har action ka transition - kis status se, kis status mein, kya set hota hai
+ * aur student ko kya notification jaata hai
+ */
+const TRANSITIONS = {
+    reject: {
+        from: ['pending', 'shortlisted'],
+        to: 'rejected',
+        fields: (now, reason) => ({ rejectedAt: now, rejectionReason: reason }),
+        notification: (title, reason) => ({
+            type: 'application_rejected',
+            message: `Your application for "${title}" has been rejected. Reason: ${reason}`,
+        }),
+    },
+    shortlist: {
+        from: ['pending'],
+        to: 'shortlisted',
+        fields: (now) => ({ shortlistedAt: now }),
+        notification: (title) => ({
+            type: 'application_shortlisted',
+            message: `Congratulations! Your application for "${title}" has been shortlisted!`,
+        }),
+    },
+    expire: {
+        from: ['pending', 'shortlisted', 'on_hold'],
+        to: 'expired',
+        fields: () => ({}),
+        notification: (title) => ({
+            type: 'application_expired',
+            message: `Your application for "${title}" has expired as the company is no longer reviewing applications.`,
+        }),
+    },
+};
+
+// Hinglish: Counter hooks jin fields se contributions banate hain
+const COUNTER_FIELDS = 'status projectId companyId studentId';
+
+/**
+ * Hinglish: Ids normalize karo - duplicates hatao, invalid ids ka result pehle hi likh do
+ */
+const normalizeIds = (applicationIds, results) => {
+    const seen = new Set();
+    const ids = [];
+    applicationIds.forEach((raw) => {
+        const id = String(raw);
+        if (seen.has(id)) return;
+        seen.add(id);
+        if (!mongoose.Types.ObjectId.isValid(id)) {
+            results.set(id, { applicationId: id, success: false, code: 'INVALID_ID', message: 'Invalid application ID' });
+            return;
+        }
+        ids.push(id);
+    });
+    return ids;
+};
+
+/**
+ * Hinglish: Updated applications ke notifications - ek aggregation mein student ka user
+ * aur project ka title join karke, phir outbox mein ek saath queue
+ */
+const notifyTransitioned = async (transition, applicationIds, reason) => {
+    if (applicationIds.length === 0) return 0;
+
+    const rows = await Application.aggregate([
+        { $match: { _id: { $in: applicationIds } } },
+        {
+            $lookup: {
+                from: StudentProfile.collection.name,
+                localField: 'studentId',
+                foreignField: '_id',
+                pipeline: [{ $project: { user: 1 } }],
+                as: 'student',
+            },
+        },
+        {
+            $lookup: {
+                from: Project.collection.name,
+                localField: 'projectId',
+                foreignField: '_id',
+                pipeline: [{ $project: { title: 1 } }],
+                as: 'project',
+            },
+        },
+        {
+            $project: {
+                userId: { $first: '$student.user' },
+                title: { $first: '$project.title' },
+            },
+        },
+    ]);
+
+    const notifications = rows
+        .filter((row) => row.userId)
+        .map((row) => ({
+            userId: row.userId,
+            userRole: 'student',
+            ...transition.notification(row.title || 'the project', reason),
+            relatedProfileId: row._id,
+        }));
+
+    if (notifications.length === 0) return 0;
+    return enqueueNotification(notifications).length;
+};
+
+/**
+ * Hinglish: Bulk transition chalao
+ * @param {Object} options
+ * @param {String} options.action - 'reject' | 'shortlist' | 'expire'
+ * @param {Array} options.applicationIds
+ * @param {ObjectId} options.companyProfileId - Ownership isi company ke projects se
+ * @param {ObjectId} options.actorUserId - statusHistory.changedBy
+ * @param {String} options.reason - Reject ke liye zaroori, baaki ke liye optional
+ * @returns {Object} { results: [{ applicationId, success, status | code, message }], summary }
+ */
+const runBulkTransition = async ({ action, applicationIds, companyProfileId, actorUserId = null, reason = '' }) => {
+    const transition = TRANSITIONS[action];
+    if (!transition) {
+        throw new Error(`Unknown bulk transition: ${action}`);
+    }
+    if (!Array.isArray(applicationIds) || applicationIds.length === 0) {
+        throw new Error('Application IDs zaroori hain');
+    }
+    if (applicationIds.length > MAX_BULK_ITEMS) {
+        throw new Error(`Ek baar mein zyada se zyada ${MAX_BULK_ITEMS} applications`);
+    }
+
+    const now = new Date();
+    const results = new Map();
+    const ids = normalizeIds(applicationIds, results);
+
+    // 1. Applications + ownership - do queries, chahe kitne bhi items hon
+    const applications = ids.length > 0
+        ? await Application.find({ _id: { $in: ids } }).select(COUNTER_FIELDS).lean()
+        : [];
+    const byId = new Map(applications.map((app) => [String(app._id), app]));
+
+    const projectIds = [...new Set(applications.map((app) => String(app.projectId)))];
+    const ownedProjects = projectIds.length > 0
+        ? await Project.find({ _id: { $in: projectIds }, companyId: companyProfileId }).select('_id').lean()
+        : [];
+    const owned = new Set(ownedProjects.map((project) => String(project._id)));
+
+    const eligible = [];
+    ids.forEach((id) => {
+        const app = byId.get(id);
+        if (!app) {
+            results.set(id, { applicationId: id, success: false, code: 'NOT_FOUND', message: 'Application nahi mila' });
+        } else if (!owned.has(String(app.projectId))) {
+            results.set(id, { applicationId: id, success: false, code: 'FORBIDDEN', message: 'Ye application aapke project ka nahi hai' });
+        } else if (!transition.from.includes(app.status)) {
+            results.set(id, {
+                applicationId: id,
+                success: false,
+                code: 'INVALID_STATUS',
+                message: `Application ${app.status} status mein hai - ${action} nahi ho sakta`,
+            });
+        } else {
+            eligible.push(app);
+        }
+    });
+
+    // 2. Ek bulkWrite - guard wahi status jo padha tha, taki beech mein badla hua
+    //    application overwrite na ho aur counters ka "before" sahi rahe
+    let applied = [];
+    if (eligible.length > 0) {
+        await Application.bulkWrite(
+            eligible.map((app) => ({
+                updateOne: {
+                    filter: { _id: app._id, status: app.status },
+                    update: {
+                        $set: { status: transition.to, ...transition.fields(now, reason) },
+                        $push: {
+                            statusHistory: {
+                                status: transition.to,
+                                changedAt: now,
+                                changedBy: actorUserId,
+                                reason: reason || `Bulk ${action}`,
+                                metadata: { bulk: true, previousStatus: app.status },
+                            },
+                        },
+                    },
+                },
+            })),
+            { ordered: false }
+        );
+
+        // bulkWrite per-op matched nahi batata - jis doc mein humari history entry hai wahi applied hai
+        const confirmed = await Application.find({
+            _id: { $in: eligible.map((app) => app._id) },
+            statusHistory: { $elemMatch: { status: transition.to, changedAt: now } },
+        }).select(COUNTER_FIELDS).lean();
+        const confirmedIds = new Set(confirmed.map((app) => String(app._id)));
+        applied = eligible.filter((app) => confirmedIds.has(String(app._id)));
+
+        eligible.forEach((app) => {
+            const id = String(app._id);
+            results.set(id, confirmedIds.has(id)
+                ? { applicationId: id, success: true, status: transition.to }
+                : { applicationId: id, success: false, code: 'CONFLICT', message: 'Application ka status beech mein badal gaya' });
+        });
+
+        // bulkWrite counter / cache hooks nahi chalata - per-status counters aur stats cache khud
+        if (applied.length > 0) {
+            await recordChanges('Application', applied, confirmed);
+            applicationStatsCache.invalidateCompany(companyProfileId);
+        }
+    }
+
+    // 3. Notifications - ek aggregation join, outbox batched insert karta hai
+    let notified = 0;
+    try {
+        notified = await notifyTransitioned(transition, applied.map((app) => app._id), reason);
+    } catch (error) {
+        console.error(`Bulk ${action} notifications error:`, error);
+    }
+
+    const ordered = [...new Set(applicationIds.map(String))].map((id) => results.get(id));
+    const succeeded = ordered.filter((result) => result.success).length;
+    return {
+        results: ordered,
+        summary: {
+            requested: ordered.length,
+            succeeded,
+            failed: ordered.length - succeeded,
+            notified,
+        },
+    };
+};
+
+module.exports = {
+    MAX_BULK_ITEMS,
+    TRANSITIONS,
+    runBulkTransition,
+};
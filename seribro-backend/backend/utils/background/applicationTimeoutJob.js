@@ -12,184 +12,333 @@ const mongoose = require('mongoose');
 const Application = require('../../models/Application');
 const Project = require('../../models/Project');
 const CompanyProfile = require('../../models/companyProfile');
-const User = require('../../models/User');
-const Notification = require('../../models/Notification');
+const StudentProfile = require('../../models/StudentProfile');
+const { enqueue: enqueueNotification } = require('../notifications/notificationOutbox');
+const skillIndex = require('../students/skillIndex');
+const applicationStatsCache = require('../company/applicationStatsCache');
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+const DEFAULT_BATCH_SIZE = 500;
+const MAX_BATCHES_PER_RUN = 200; // Ek run bounded rahe - baaki agle interval mein
+
+// Hinglish: ObjectId ke aakhri 3 bytes (counter / random) - timestamp seconds mein hota hai,
+// uska millisecond value hamesha 1000 ka multiple hai, isliye uspar $mod shards ko bhookha rakhta hai
+const SHARD_KEY_HEX_DIGITS = 6;
+const HEX = '0123456789abcdef';
 
 /**
- * Process expired applications every 5 minutes
+ * Hinglish: projectId ke low-order bytes ka integer (aggregation expression)
  */
-exports.processExpiredApplications = async () => {
-    const session = await mongoose.startSession();
-    session.startTransaction();
+const shardKeyExpr = {
+    $reduce: {
+        input: { $range: [24 - SHARD_KEY_HEX_DIGITS, 24] },
+        initialValue: 0,
+        in: {
+            $add: [
+                { $multiply: ['$$value', 16] },
+                { $indexOfCP: [HEX, { $substrCP: [{ $toString: '$projectId' }, '$$this', 1] }] },
+            ],
+        },
+    },
+};
 
-    try {
-        const now = new Date();
-        let processed = 0;
+/**
+ * Hinglish: Shard filter - projectId ke low-order bytes par $mod, taki ek project ke
+ * saare applications hamesha ek hi worker ke paas jaayein (overlap nahi)
+ */
+const shardMatch = (shard, shards) => {
+    if (!shards || shards <= 1) return {};
+    return {
+        $expr: {
+            $eq: [{ $mod: [shardKeyExpr, shards] }, shard],
+        },
+    };
+};
 
-        console.log(`[${new Date().toISOString()}] Starting application timeout job...`);
+/**
+ * Hinglish: shardMatch ka JS roop - project kis shard mein jaayega
+ * @param {ObjectId|String} projectId
+ * @param {Number} shards
+ * @returns {Number}
+ */
+exports.shardOf = (projectId, shards) => {
+    if (!shards || shards <= 1) return 0;
+    return parseInt(String(projectId).slice(-SHARD_KEY_HEX_DIGITS), 16) % shards;
+};
 
-        // Find expired applications
-        const expiredApplications = await Application.find({
-            status: 'awaiting_acceptance',
-            acceptanceDeadline: { $lt: now },
-        })
-            .session(session)
-            .lean();
+exports.shardMatch = shardMatch;
 
-        console.log(`Found ${expiredApplications.length} expired applications`);
+/**
+ * Hinglish: Ek batch process karo - expire, promote, projects update, notifications
+ * Har step set-based hai (bulkWrite / $in / aggregate), per-item round trips nahi.
+ */
+const processBatch = async (batch, now, session) => {
+    // 1. Expire - status guard taki concurrent run dobara na kare
+    const expireResult = await Application.bulkWrite(
+        batch.map((app) => ({
+            updateOne: {
+                filter: { _id: app._id, status: 'awaiting_acceptance' },
+                update: {
+                    $set: { status: 'expired', respondedToSelectionAt: now },
+                    $push: {
+                        statusHistory: {
+                            status: 'expired',
+                            changedAt: now,
+                            reason: 'Automatic timeout - 24h deadline exceeded',
+                            metadata: { expiredAt: now },
+                        },
+                    },
+                },
+            },
+        })),
+        { ordered: false, session }
+    );
 
-        for (const expiredAppData of expiredApplications) {
-            const expiredApp = await Application.findById(expiredAppData._id).session(session);
+    // Project-wise latest expired application (selection round carry forward ke liye)
+    const expiredByProject = new Map();
+    batch.forEach((app) => expiredByProject.set(String(app.projectId), app));
+    const projectIds = [...expiredByProject.values()].map((app) => app.projectId);
 
-            if (!expiredApp || expiredApp.status !== 'awaiting_acceptance') {
-                continue; // Skip if already processed
-            }
+    // 2. Jin projects mein abhi bhi koi valid awaiting_acceptance hai unhe chhod do
+    const stillWaiting = new Set(
+        (await Application.distinct('projectId', {
+            projectId: { $in: projectIds },
+            status: 'awaiting_acceptance',
+            acceptanceDeadline: { $gte: now },
+        }).session(session)).map(String)
+    );
+    const candidates = projectIds.filter((id) => !stillWaiting.has(String(id)));
 
-            // Mark as expired
-            expiredApp.status = 'expired';
-            expiredApp.respondedToSelectionAt = now;
+    // 3. Har project ka next on_hold student ek hi aggregation mein
+    const nextByProject = new Map(
+        (await Application.aggregate([
+            { $match: { projectId: { $in: candidates }, status: 'on_hold' } },
+            { $sort: { projectId: 1, shortlistPriority: 1, createdAt: 1 } },
+            { $group: { _id: '$projectId', applicationId: { $first: '$_id' }, studentId: { $first: '$studentId' } } },
+        ]).session(session)).map((row) => [String(row._id), row])
+    );
 
-            if (!expiredApp.statusHistory) {
-                expiredApp.statusHistory = [];
-            }
+    const newDeadline = new Date(now.getTime() + DAY_MS);
+    const promotions = [];
+    const projectOps = [];
+    const reopened = [];
 
-            expiredApp.statusHistory.push({
-                status: 'expired',
-                changedAt: now,
-                reason: 'Automatic timeout - 24h deadline exceeded',
-                metadata: { expiredAt: now },
+    candidates.forEach((projectId) => {
+        const key = String(projectId);
+        const expiredApp = expiredByProject.get(key);
+        const next = nextByProject.get(key);
+
+        if (next) {
+            promotions.push({
+                updateOne: {
+                    filter: { _id: next.applicationId, status: 'on_hold' },
+                    update: {
+                        $set: {
+                            status: 'awaiting_acceptance',
+                            selectedAt: now,
+                            acceptanceDeadline: newDeadline,
+                            currentSelectionRound: expiredApp.currentSelectionRound,
+                        },
+                        $push: {
+                            statusHistory: {
+                                status: 'awaiting_acceptance',
+                                changedAt: now,
+                                reason: 'Auto-selected from backup after previous student timeout',
+                                metadata: { previousStudent: expiredApp.studentId },
+                            },
+                        },
+                    },
+                },
+            });
+            projectOps.push({
+                updateOne: {
+                    filter: { _id: projectId },
+                    update: {
+                        $set: {
+                            studentUnderConsideration: next.studentId,
+                            applicationUnderConsideration: next.applicationId,
+                            selectionDeadline: newDeadline,
+                        },
+                    },
+                },
             });
+        } else {
+            // No backup students - reopen project
+            reopened.push(projectId);
+            projectOps.push({
+                updateOne: {
+                    filter: { _id: projectId },
+                    update: {
+                        $set: {
+                            status: 'open',
+                            studentUnderConsideration: null,
+                            applicationUnderConsideration: null,
+                            selectionDeadline: null,
+                        },
+                        $inc: { currentSelectionRound: 1 },
+                    },
+                },
+            });
+        }
+    });
 
-            await expiredApp.save({ session });
-            processed++;
+    // 4. Promotions + project updates - dono bulkWrite
+    if (promotions.length > 0) {
+        await Application.bulkWrite(promotions, { ordered: false, session });
+    }
+    if (projectOps.length > 0) {
+        await Project.bulkWrite(projectOps, { ordered: false, session });
+        // bulkWrite save hooks nahi chalata - reopened projects recommendations mein wapas aayein
+        if (reopened.length > 0) skillIndex.markStale();
+    }
 
-            console.log(`Marked application ${expiredApp._id} as expired`);
+    return {
+        expired: expireResult.modifiedCount || 0,
+        promoted: [...nextByProject.values()],
+        reopened,
+        projectIds: candidates,
+    };
+};
 
-            // Get project
-            const project = await Project.findById(expiredApp.projectId).session(session);
-            if (!project) {
-                console.error(`Project ${expiredApp.projectId} not found`);
-                continue;
-            }
+/**
+ * Hinglish: Batch ke notifications ek saath - user ids $in se resolve, phir insertMany
+ */
+const notifyBatch = async ({ promoted, reopened, projectIds }) => {
+    if (promoted.length === 0 && reopened.length === 0) return 0;
+
+    const projects = await Project.find({ _id: { $in: projectIds } }).select('title companyId').lean();
+    const projectById = new Map(projects.map((project) => [String(project._id), project]));
+
+    const [studentProfiles, companies] = await Promise.all([
+        StudentProfile.find({ _id: { $in: promoted.map((row) => row.studentId) } }).select('user').lean(),
+        CompanyProfile.find({
+            _id: { $in: reopened.map((id) => projectById.get(String(id))?.companyId).filter(Boolean) },
+        }).select('user').lean(),
+    ]);
+    const studentUser = new Map(studentProfiles.map((profile) => [String(profile._id), profile.user]));
+    const companyUser = new Map(companies.map((company) => [String(company._id), company.user]));
+
+    const notifications = [];
+    promoted.forEach((row) => {
+        const project = projectById.get(String(row._id));
+        const userId = studentUser.get(String(row.studentId));
+        if (!project || !userId) return;
+        notifications.push({
+            userId,
+            userRole: 'student',
+            message: `You've been selected for "${project.title}"! You have 24 hours to accept or decline.`,
+            type: 'selected',
+            relatedProfileType: 'project',
+            relatedProfileId: project._id,
+            isRead: false,
+        });
+    });
+    reopened.forEach((projectId) => {
+        const project = projectById.get(String(projectId));
+        const userId = project && companyUser.get(String(project.companyId));
+        if (!userId) return;
+        notifications.push({
+            userId,
+            userRole: 'company',
+            message: `The selected student did not respond within 24 hours for "${project.title}". All backup students have also declined. Please select new students or reopen the project.`,
+            type: 'all_declined',
+            relatedProfileType: 'project',
+            relatedProfileId: project._id,
+            isRead: false,
+        });
+    });
+
+    if (notifications.length === 0) return 0;
+    // Outbox batched insertMany + socket push karta hai - job DB write ka wait nahi karta
+    return enqueueNotification(notifications).length;
+};
+
+/**
+ * Process expired applications in batches
+ * Hinglish: Har batch apna chhota transaction hai - poore backlog ke liye ek lamba transaction nahi
+ *
+ * @param {Object} options
+ * @param {Number} options.batchSize - Ek batch mein kitne applications
+ * @param {Number} options.shard - Is worker ka shard (0-based)
+ * @param {Number} options.shards - Total shards
+ */
+exports.processExpiredApplications = async ({ batchSize = DEFAULT_BATCH_SIZE, shard = 0, shards = 1 } = {}) => {
+    const startedAt = Date.now();
+    const now = new Date();
+    const totals = { batches: 0, expired: 0, promoted: 0, reopened: 0, notifications: 0 };
+
+    console.log(`[${now.toISOString()}] Starting application timeout job (shard ${shard + 1}/${shards})...`);
 
-            // Find next on_hold student
-            const nextStudent = await Application.findOne({
-                project: expiredApp.projectId,
-                status: 'on_hold',
+    try {
+        while (totals.batches < MAX_BATCHES_PER_RUN) {
+            // Processed applications status badal dete hain, isliye har baar shuru se query (skip nahi)
+            const batch = await Application.find({
+                status: 'awaiting_acceptance',
+                acceptanceDeadline: { $lt: now },
+                ...shardMatch(shard, shards),
             })
-                .sort({ shortlistPriority: 1, createdAt: 1 })
-                .session(session);
-
-            if (nextStudent) {
-                const newDeadline = new Date(now.getTime() + 24 * 60 * 60 * 1000);
-
-                nextStudent.status = 'awaiting_acceptance';
-                nextStudent.selectedAt = now;
-                nextStudent.acceptanceDeadline = newDeadline;
-                nextStudent.currentSelectionRound = expiredApp.currentSelectionRound;
-
-                if (!nextStudent.statusHistory) {
-                    nextStudent.statusHistory = [];
-                }
-
-                nextStudent.statusHistory.push({
-                    status: 'awaiting_acceptance',
-                    changedAt: now,
-                    reason: 'Auto-selected from backup after previous student timeout',
-                    metadata: { previousStudent: expiredApp.studentId },
-                });
+                .select('_id projectId companyId studentId currentSelectionRound')
+                .sort({ projectId: 1, acceptanceDeadline: 1 })
+                .limit(batchSize)
+                .lean();
 
-                await nextStudent.save({ session });
-
-                project.studentUnderConsideration = nextStudent.studentId;
-                project.applicationUnderConsideration = nextStudent._id;
-                project.selectionDeadline = newDeadline;
-
-                console.log(`Auto-selected backup student ${nextStudent.studentId} for project ${project._id}`);
-
-                // Notify next student
-                try {
-                    await Notification.create(
-                        [
-                            {
-                                userId: nextStudent.studentId,
-                                userRole: 'student',
-                                message: `You've been selected for "${project.title}"! You have 24 hours to accept or decline.`,
-                                type: 'selected',
-                                relatedApplicationId: nextStudent._id,
-                                isRead: false,
-                            },
-                        ],
-                        { session }
-                    );
-                } catch (notifError) {
-                    console.error('Error creating notification:', notifError);
-                    // Continue anyway
-                }
-            } else {
-                // No backup students - reopen project
-                project.status = 'open';
-                project.studentUnderConsideration = null;
-                project.applicationUnderConsideration = null;
-                project.selectionDeadline = null;
-                project.currentSelectionRound = (project.currentSelectionRound || 0) + 1;
-
-                console.log(`Reopened project ${project._id} - no backup students`);
-
-                // Notify company
-                try {
-                    const company = await CompanyProfile.findById(project.companyId).session(session);
-                    if (company) {
-                        const companyUser = await User.findById(company.user).session(session);
-                        if (companyUser) {
-                            await Notification.create(
-                                [
-                                    {
-                                        userId: companyUser._id,
-                                        userRole: 'company',
-                                        message: `The selected student did not respond within 24 hours for "${project.title}". All backup students have also declined. Please select new students or reopen the project.`,
-                                        type: 'all_declined',
-                                        isRead: false,
-                                    },
-                                ],
-                                { session }
-                            );
-                        }
-                    }
-                } catch (notifError) {
-                    console.error('Error creating notification:', notifError);
-                }
+            if (batch.length === 0) break;
+
+            const session = await mongoose.startSession();
+            let result;
+            try {
+                await session.withTransaction(async () => {
+                    result = await processBatch(batch, now, session);
+                });
+            } finally {
+                await session.endSession();
             }
 
-            await project.save({ session });
-        }
+            // bulkWrite Application hooks bypass karta hai - company stats cache khud invalidate
+            new Set(batch.map((app) => String(app.companyId))).forEach((companyId) => {
+                applicationStatsCache.invalidateCompany(companyId);
+            });
 
-        await session.commitTransaction();
+            totals.batches += 1;
+            totals.expired += result.expired;
+            totals.promoted += result.promoted.length;
+            totals.reopened += result.reopened.length;
+            totals.notifications += await notifyBatch(result);
 
-        console.log(`[${new Date().toISOString()}] Application timeout job completed. Processed: ${processed}`);
-        return { success: true, processed };
+            if (batch.length < batchSize) break;
+        }
+
+        const durationMs = Date.now() - startedAt;
+        console.log(`[${new Date().toISOString()}] Application timeout job completed (shard ${shard + 1}/${shards}). ` +
+            `Expired: ${totals.expired}, promoted: ${totals.promoted}, reopened: ${totals.reopened}, ${durationMs}ms`);
+        return { success: true, processed: totals.expired, ...totals, durationMs };
     } catch (error) {
-        await session.abortTransaction();
         console.error('Application timeout job error:', error);
-        return { success: false, error: error.message };
-    } finally {
-        await session.endSession();
+        return { success: false, error: error.message, ...totals };
     }
 };
 
 /**
  * Start the background job (call this in server.js)
+ * Hinglish: Har shard ek alag leased scheduler job hai - har interval par har shard
+ * cluster mein ek hi replica par chalta hai, aur replicas badhne par shards unme bant jaate hain.
  */
-exports.startApplicationTimeoutJob = (interval = 5 * 60 * 1000) => {
-    console.log(`Starting application timeout job with interval: ${interval}ms`);
-
-    setInterval(async () => {
-        try {
-            await this.processExpiredApplications();
-        } catch (error) {
-            console.error('Background job error:', error);
-        }
-    }, interval);
+exports.startApplicationTimeoutJob = (interval = 5 * 60 * 1000, { shards, batchSize } = {}) => {
+    const { registerJob, startScheduler } = require('../scheduler/jobScheduler');
+    const totalShards = shards || parseInt(process.env.APPLICATION_TIMEOUT_SHARDS, 10) || 1;
+
+    console.log(`Starting application timeout job with interval: ${interval}ms, shards: ${totalShards}`);
+
+    for (let shard = 0; shard < totalShards; shard += 1) {
+        registerJob({
+            name: `applicationTimeout:shard-${shard}`,
+            interval,
+            leaseMs: Math.max(interval, 60 * 1000),
+            run: () => this.processExpiredApplications({ shard, shards: totalShards, batchSize }),
+            items: (result) => (result ? result.expired : 0),
+        });
+    }
+    startScheduler();
 };
 
 module.exports = exports;
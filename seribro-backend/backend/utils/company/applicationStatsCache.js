@@ -0,0 +1,193 @@
+// utils/company/applicationStatsCache.js
+// Hinglish: Company application stats ka chhota TTL cache - har company ki ek entry
+//
+// CompanyApplications page har open tab se 30s par stats poll karta hai. Stats ek
+// $facet aggregation se bante hain; result + uska ETag yahan thodi der rakhte hain.
+// Company ke kisi application par write hote hi (Application model hooks, bulkWrite
+// callers explicitly) entry hat jaati hai, isliye TTL sirf upper bound hai.
+// Multi-node setup mein invalidation bus se baaki nodes tak bhi jaata hai (socketManager attachBus karta hai).
+
+const crypto = require('crypto');
+
+const TTL_MS = parseInt(process.env.APPLICATION_STATS_CACHE_TTL_MS, 10) || 15 * 1000;
+const MAX_ENTRIES = parseInt(process.env.APPLICATION_STATS_CACHE_MAX_ENTRIES, 10) || 5000;
+const CHANNEL = 'applications.statsCache';
+
+const entries = new Map(); // companyId -> { value, etag, expiresAt } (insertion order = LRU order)
+const versions = new Map(); // companyId -> compute ke dauraan hue writes (stale result store nahi hota)
+const inflight = new Map(); // companyId -> Promise (ek company ke concurrent misses ek hi query share karein)
+let generation = 0; // clear() par badhta hai - unknown company wale writes ke liye
+
+const stats = { hits: 0, misses: 0, invalidations: 0, evictions: 0, skippedWrites: 0 };
+
+let bus = null;
+let unsubscribe = null;
+
+// Hinglish: Stats sirf inhi fields se bante hain - baaki fields ke updates entry ko stale nahi karte
+const STATS_FIELDS = ['status', 'companyId', 'projectId', 'appliedAt'];
+
+const etagFor = (value) => `W/"${crypto.createHash('sha1').update(JSON.stringify(value)).digest('base64url')}"`;
+
+// Hinglish: newToday midnight par badalta hai - entry usse aage valid nahi
+const expiryFrom = (now) => {
+    const midnight = new Date(now);
+    midnight.setHours(24, 0, 0, 0);
+    return Math.min(now + TTL_MS, midnight.getTime());
+};
+
+const versionOf = (key) => `${generation}:${versions.get(key) || 0}`;
+
+/**
+ * Hinglish: Company ke stats lo - fresh entry ho to wahi, warna compute karke cache karo
+ * @param {String|ObjectId} companyId
+ * @param {Function} compute - () => Promise<Object> stats
+ * @returns {Promise<Object>} { value, etag, cached }
+ */
+const get = async (companyId, compute) => {
+    const key = String(companyId);
+    const entry = entries.get(key);
+    if (entry && entry.expiresAt > Date.now()) {
+        entries.delete(key);
+        entries.set(key, entry);
+        stats.hits += 1;
+        return { value: entry.value, etag: entry.etag, cached: true };
+    }
+    stats.misses += 1;
+
+    if (!inflight.has(key)) {
+        const version = versionOf(key);
+        const promise = (async () => {
+            const value = await compute();
+            const fresh = { value, etag: etagFor(value), expiresAt: expiryFrom(Date.now()) };
+            // Compute ke dauraan write hua to result purana ho sakta hai - bhejo, par rakho mat
+            if (versionOf(key) === version) {
+                entries.delete(key);
+                entries.set(key, fresh);
+                while (entries.size > MAX_ENTRIES) {
+                    entries.delete(entries.keys().next().value);
+                    stats.evictions += 1;
+                }
+            }
+            return fresh;
+        })().finally(() => {
+            inflight.delete(key);
+            versions.delete(key);
+        });
+        inflight.set(key, promise);
+    }
+
+    const { value, etag } = await inflight.get(key);
+    return { value, etag, cached: false };
+};
+
+const applyInvalidate = (key) => {
+    if (inflight.has(key)) versions.set(key, (versions.get(key) || 0) + 1);
+    entries.delete(key);
+    stats.invalidations += 1;
+};
+
+const applyClear = () => {
+    generation += 1;
+    entries.clear();
+    versions.clear();
+    stats.invalidations += 1;
+};
+
+/**
+ * Hinglish: Company ki entry hatao (uske kisi application par write hua) - is node par aur bus se baaki nodes par
+ * @param {String|ObjectId} companyId
+ */
+const invalidateCompany = (companyId) => {
+    if (!companyId) return;
+    const key = String(companyId);
+    applyInvalidate(key);
+    if (bus) bus.publish(CHANNEL, { c: key });
+};
+
+const clear = () => {
+    applyClear();
+    if (bus) bus.publish(CHANNEL, { all: true });
+};
+
+/**
+ * Hinglish: Cross-node bus se jodo (socketManager init par) - null pass karo to detach
+ * @param {Object|null} nextBus
+ */
+const attachBus = (nextBus) => {
+    if (unsubscribe) unsubscribe();
+    unsubscribe = null;
+    bus = nextBus;
+    if (!bus) return;
+    unsubscribe = bus.subscribe(CHANNEL, (event) => {
+        if (!event) return;
+        if (event.all) applyClear();
+        else if (event.c) applyInvalidate(event.c);
+    });
+};
+
+const getStats = () => ({ ...stats, size: entries.size, ttlMs: TTL_MS, maxEntries: MAX_ENTRIES });
+
+/**
+ * Hinglish: Update kisi stats field (STATS_FIELDS) ko touch karta hai? counterStore ke touchesCounters jaisa
+ * @param {Object|Array} update - query.getUpdate()
+ */
+const touchesStats = (update) => {
+    if (!update) return false;
+    // Pipeline update ($set stages ka array) - kuch bhi badal sakta hai
+    if (Array.isArray(update)) return true;
+    const paths = Object.entries(update).flatMap(([key, value]) => (
+        key.startsWith('$') && value && typeof value === 'object' ? Object.keys(value) : [key]
+    ));
+    return paths.some((path) => STATS_FIELDS.includes(path.split('.')[0]));
+};
+
+/**
+ * Hinglish: Application schema par hooks - company ke application par write = us company ki entry invalid
+ * bulkWrite in hooks ko bypass karta hai, uske callers invalidateCompany khud bulate hain.
+ * @param {mongoose.Schema} schema
+ */
+const attachInvalidationHooks = (schema) => {
+    const invalidateDoc = (doc) => {
+        if (doc) invalidateCompany(doc.companyId);
+    };
+    schema.post('save', invalidateDoc);
+    schema.post('insertMany', (docs) => (docs || []).forEach(invalidateDoc));
+    schema.post('findOneAndUpdate', function (doc) {
+        if (touchesStats(this.getUpdate())) invalidateDoc(doc);
+    });
+    schema.post('findOneAndDelete', invalidateDoc);
+    schema.post('deleteOne', { document: true, query: false }, invalidateDoc);
+    // Query-level writes mein doc nahi milta - filter mein companyId ho to wahi,
+    // warna matching docs ki companies pehle padh lo (ye writes projectId par filtered hote hain)
+    const queryOps = ['updateOne', 'updateMany', 'deleteOne', 'deleteMany'];
+    const filterCompany = (query) => {
+        const { companyId } = query.getFilter() || {};
+        return companyId && (typeof companyId === 'string' || companyId._bsontype === 'ObjectId') ? companyId : null;
+    };
+    // Update jo stats fields ko touch hi nahi karta (companyViewedAt, notes...) - lookup bhi nahi
+    const skips = (query) => ['updateOne', 'updateMany'].includes(query.op) && !touchesStats(query.getUpdate());
+    schema.pre(queryOps, { document: false, query: true }, async function () {
+        if (skips(this)) {
+            stats.skippedWrites += 1;
+            return;
+        }
+        if (filterCompany(this)) return;
+        const lookup = this.model.distinct('companyId', this.getFilter());
+        const session = this.getOptions().session;
+        if (session) lookup.session(session);
+        this._statsCompanies = await lookup;
+    });
+    schema.post(queryOps, { document: false, query: true }, function () {
+        if (skips(this)) return;
+        const companyId = filterCompany(this);
+        if (companyId) {
+            invalidateCompany(companyId);
+        } else if (this._statsCompanies) {
+            this._statsCompanies.forEach(invalidateCompany);
+        } else {
+            clear();
+        }
+    });
+};
+
+module.exports = { get, invalidateCompany, clear, getStats, attachInvalidationHooks, touchesStats, attachBus };
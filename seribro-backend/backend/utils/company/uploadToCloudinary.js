@@ -6,11 +6,16 @@ const fs = require('fs');
 
 /**
  * File ko Cloudinary par upload karta hai.
- * @param {string} filePath - Local file ka path.
+ * Streaming storage wali multer file pehle hi upload ho chuki hai - uska stored result hi lautao.
+ * @param {string|object} filePath - Local file ka path, ya streamed multer file.
  * @param {string} folder - Cloudinary par target folder.
  * @returns {Promise<{ url: string, publicId: string }>} - Uploaded file ka URL aur Public ID.
  */
 const uploadToCloudinary = async (filePath, folder) => {
+    if (filePath && filePath.storage === 'stream') {
+        return { url: filePath.url, publicId: filePath.publicId };
+    }
+
     try {
         // Cloudinary par upload karna
         const result = await cloudinary.uploader.upload(filePath, {
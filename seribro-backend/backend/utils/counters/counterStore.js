@@ -0,0 +1,357 @@
+// backend/utils/counters/counterStore.js
+// Hinglish: Denormalized counters store - unread notifications, unread messages,
+// applications by status (earnings totals earningsLedger mein hain)
+//
+// Har model apna "contribution" batata hai (e.g. unread notification = user ke
+// `unreadNotifications` mein +1). Model hooks document ke pehle aur baad ke
+// contributions ka diff nikal kar `$inc` karte hain - create, save, updateMany,
+// delete sab ek hi tarah. Reads O(1) hain: ek counter document.
+//
+// Counters eventually consistent hain: aborted transaction ya hooks ke bina
+// likhe gaye documents (bulkWrite) se drift ho sakta hai. reconcileCounters
+// raw collections se dobara gin kar theek karta hai, aur jo counter kabhi gina
+// nahi gaya (reconciledAt null) uska pehla read khud gin leta hai.
+
+const mongoose = require('mongoose');
+const Counter = require('../../models/Counter');
+const { getJobCursor, setJobCursor } = require('../scheduler/jobScheduler');
+
+const DEFAULT_RECONCILE_BATCH = 200;
+const DEFAULT_RECONCILE_MAX_MS = 5 * 60 * 1000;
+const RECONCILE_CONCURRENCY = 10;
+// Hinglish: Resume cursor isi job ke lease document par rehta hai (process memory mein nahi)
+const RECONCILE_JOB = 'reconcileCounters';
+
+const specs = new Map(); // modelName -> { fields, contributions }
+
+const keyOf = (scope, ref) => `${scope}:${ref}`;
+const toObjectId = (ref) => (ref instanceof mongoose.Types.ObjectId ? ref : new mongoose.Types.ObjectId(String(ref)));
+
+/**
+ * Hinglish: Contributions ka diff - [{ scope, ref, path, by }] jahan by != 0
+ */
+const diffContributions = (before, after) => {
+  const totals = new Map();
+  const add = (items, sign) => items.forEach((item) => {
+    if (!item.ref || !item.by) return;
+    const key = `${item.scope}|${item.ref}|${item.path}`;
+    const entry = totals.get(key) || { scope: item.scope, ref: item.ref, path: item.path, by: 0 };
+    entry.by += sign * item.by;
+    totals.set(key, entry);
+  });
+  add(before, -1);
+  add(after, 1);
+  return [...totals.values()].filter((entry) => entry.by !== 0);
+};
+
+/**
+ * Hinglish: Counters par $inc - ek hi bulkWrite, per counter document ek update
+ * @param {Array} increments - [{ scope, ref, path, by }]
+ */
+const increment = async (increments) => {
+  const byKey = new Map();
+  increments.forEach(({ scope, ref, path, by }) => {
+    if (!ref || !by) return;
+    const key = keyOf(scope, ref);
+    if (!byKey.has(key)) byKey.set(key, { scope, ref, inc: {} });
+    const { inc } = byKey.get(key);
+    inc[`counts.${path}`] = (inc[`counts.${path}`] || 0) + by;
+  });
+  if (byKey.size === 0) return;
+
+  try {
+    // Raw driver - Mixed `counts` par mongoose casting/defaults ke conflicts se bachne ke liye
+    await Counter.collection.bulkWrite(
+      [...byKey.entries()].map(([key, { scope, ref, inc }]) => ({
+        updateOne: {
+          filter: { _id: key },
+          update: {
+            $inc: inc,
+            $setOnInsert: { scope, ref: toObjectId(ref), reconciledAt: null },
+          },
+          upsert: true,
+        },
+      })),
+      { ordered: false }
+    );
+  } catch (error) {
+    // Counter fail hone se asli write fail nahi hona chahiye - reconcile theek kar dega
+    console.error('[Counters] Increment failed:', error.message);
+  }
+};
+
+// ============================================
+// RECOUNT (raw collections se exact values)
+// ============================================
+
+const applicationCounts = async (match) => {
+  const rows = await mongoose.model('Application').aggregate([
+    { $match: match },
+    { $group: { _id: '$status', count: { $sum: 1 } } },
+  ]);
+  const counts = { total: 0 };
+  rows.forEach((row) => {
+    counts[row._id] = row.count;
+    counts.total += row.count;
+  });
+  return counts;
+};
+
+const RECOUNTERS = {
+  user: async (ref) => ({
+    unreadNotifications: await mongoose.model('Notification').countDocuments({ userId: ref, isRead: { $ne: true } }),
+  }),
+
+  project: async (ref) => {
+    const [messages, applications] = await Promise.all([
+      mongoose.model('Message').aggregate([
+        { $match: { project: ref, isRead: false } },
+        { $group: { _id: '$sender', count: { $sum: 1 } } },
+      ]),
+      applicationCounts({ projectId: ref }),
+    ]);
+    const unreadMessagesBy = {};
+    messages.forEach((row) => {
+      unreadMessagesBy[String(row._id)] = row.count;
+    });
+    return { unreadMessagesBy, applications };
+  },
+
+  company: async (ref) => ({
+    applications: await applicationCounts({ companyId: ref }),
+  }),
+
+  student: async (ref) => ({
+    applications: await applicationCounts({ studentId: ref }),
+  }),
+};
+
+/**
+ * Hinglish: Nested counts ko flat { 'a.b': n } mein - zero values ignore (missing = 0)
+ */
+const flatten = (value, prefix = '', out = {}) => {
+  Object.entries(value || {}).forEach(([key, child]) => {
+    const path = prefix ? `${prefix}.${key}` : key;
+    if (child && typeof child === 'object') {
+      flatten(child, path, out);
+    } else if (Number(child)) {
+      out[path] = Number(child);
+    }
+  });
+  return out;
+};
+
+const sameCounts = (a, b) => {
+  const flatA = flatten(a);
+  const flatB = flatten(b);
+  const keys = new Set([...Object.keys(flatA), ...Object.keys(flatB)]);
+  return [...keys].every((key) => flatA[key] === flatB[key]);
+};
+
+/**
+ * Hinglish: Ek counter raw data se dobara gino aur save karo
+ * @returns {Promise<Object>} { counts, drifted }
+ */
+const reconcile = async (scope, ref, existing = undefined) => {
+  const recount = RECOUNTERS[scope];
+  if (!recount) throw new Error(`Unknown counter scope: ${scope}`);
+  const objectId = toObjectId(ref);
+  const key = keyOf(scope, objectId);
+
+  const current = existing !== undefined ? existing : await Counter.findById(key).lean();
+  const counts = await recount(objectId);
+  const drifted = Boolean(current && current.reconciledAt && !sameCounts(current.counts, counts));
+
+  await Counter.collection.updateOne(
+    { _id: key },
+    { $set: { scope, ref: objectId, counts, reconciledAt: new Date() } },
+    { upsert: true }
+  );
+  return { counts, drifted };
+};
+
+/**
+ * Hinglish: Counters padho - kabhi gina nahi gaya to pehle gin lo
+ * @param {String} scope - 'user' | 'project' | 'company' | 'student'
+ * @param {String|ObjectId} ref
+ * @returns {Promise<Object>} counts
+ */
+const getCounts = async (scope, ref) => {
+  if (!ref) return {};
+  const doc = await Counter.findById(keyOf(scope, ref)).lean();
+  if (doc && doc.reconciledAt) return doc.counts || {};
+  const { counts } = await reconcile(scope, ref, doc);
+  return counts;
+};
+
+/**
+ * Hinglish: Project workspace mein user ke liye unread messages (dusre senders ke)
+ */
+const unreadMessagesFor = (counts, userId) => Object.entries((counts && counts.unreadMessagesBy) || {})
+  .reduce((sum, [senderId, count]) => (senderId === String(userId) ? sum : sum + (Number(count) || 0)), 0);
+
+// ============================================
+// MODEL HOOKS
+// ============================================
+
+/**
+ * Hinglish: Hooks ke bina hue writes (bulkWrite, duplicate error wala insertMany) ke counters
+ * @param {String} modelName
+ * @param {Array} beforeDocs - Write se pehle (insert ke liye [])
+ * @param {Array} afterDocs - Write ke baad (delete ke liye [])
+ */
+const recordChanges = (modelName, beforeDocs, afterDocs) => {
+  const spec = specs.get(modelName);
+  if (!spec) return Promise.resolve();
+  return increment(diffContributions(
+    (beforeDocs || []).flatMap((doc) => spec.contributions(doc)),
+    (afterDocs || []).flatMap((doc) => spec.contributions(doc))
+  ));
+};
+
+/**
+ * Hinglish: Schema par counter hooks lagao
+ * @param {mongoose.Schema} schema
+ * @param {String} modelName
+ * @param {Object} spec
+ * @param {Array<String>} spec.fields - Jin fields se contributions bante hain
+ * @param {Function} spec.contributions - doc => [{ scope, ref, path, by }]
+ */
+const attachCounterHooks = (schema, modelName, { fields, contributions }) => {
+  specs.set(modelName, { fields, contributions });
+  const projection = fields.join(' ');
+  const touchesCounters = (update) => {
+    if (!update) return false;
+    const paths = Object.entries(update).flatMap(([key, value]) => (
+      key.startsWith('$') && value && typeof value === 'object' ? Object.keys(value) : [key]
+    ));
+    return paths.some((path) => fields.some((field) => path === field || path.startsWith(`${field}.`)));
+  };
+
+  // Document load hua - pehle ka contribution yaad rakho (partial select ho to trust nahi)
+  schema.post('init', function () {
+    this.$locals.counterBefore = fields.every((field) => this.isSelected(field))
+      ? contributions(this)
+      : null;
+  });
+
+  schema.pre('save', function () {
+    this.$locals.counterWasNew = this.isNew;
+  });
+
+  // Hinglish: $inc ka promise return karo - mongoose agle post hooks (e.g. responseCache version bump)
+  // isi ke baad chalata hai, warna naye tag ke saath purana count cache ho sakta hai
+  schema.post('save', function (doc) {
+    const before = doc.$locals.counterWasNew ? [] : doc.$locals.counterBefore;
+    if (!before) return undefined;
+    const after = contributions(doc);
+    doc.$locals.counterBefore = after;
+    return increment(diffContributions(before, after));
+  });
+
+  schema.post('insertMany', (docs) => increment(docs.flatMap((doc) => contributions(doc))));
+
+  // Query updates - affected docs pehle aur baad mein padho, diff $inc karo
+  const single = ['updateOne', 'findOneAndUpdate'];
+  schema.pre(['updateOne', 'updateMany', 'findOneAndUpdate'], { document: false, query: true }, async function () {
+    if (!touchesCounters(this.getUpdate())) return;
+    const query = this.model.find(this.getFilter()).select(projection).lean();
+    if (single.includes(this.op)) query.limit(1);
+    const session = this.getOptions().session;
+    if (session) query.session(session);
+    this._counterBefore = await query;
+  });
+
+  schema.post(['updateOne', 'updateMany', 'findOneAndUpdate'], { document: false, query: true }, async function () {
+    const beforeDocs = this._counterBefore;
+    if (!beforeDocs || beforeDocs.length === 0) return;
+    const query = this.model.find({ _id: { $in: beforeDocs.map((doc) => doc._id) } }).select(projection).lean();
+    const session = this.getOptions().session;
+    if (session) query.session(session);
+    const afterDocs = await query;
+    await increment(diffContributions(
+      beforeDocs.flatMap((doc) => contributions(doc)),
+      afterDocs.flatMap((doc) => contributions(doc))
+    ));
+  });
+
+  // Deletes - doc.deleteOne() bhi andar query deleteOne hi chalata hai
+  schema.pre(['deleteOne', 'deleteMany', 'findOneAndDelete'], { document: false, query: true }, async function () {
+    const query = this.model.find(this.getFilter()).select(projection).lean();
+    if (this.op !== 'deleteMany') query.limit(1);
+    const session = this.getOptions().session;
+    if (session) query.session(session);
+    this._counterBefore = await query;
+  });
+
+  schema.post(['deleteOne', 'deleteMany', 'findOneAndDelete'], { document: false, query: true }, async function () {
+    const beforeDocs = this._counterBefore;
+    if (!beforeDocs || beforeDocs.length === 0) return;
+    const remaining = await this.model.find({ _id: { $in: beforeDocs.map((doc) => doc._id) } }).select('_id').lean();
+    const remainingIds = new Set(remaining.map((doc) => String(doc._id)));
+    const deleted = beforeDocs.filter((doc) => !remainingIds.has(String(doc._id)));
+    await increment(diffContributions(deleted.flatMap((doc) => contributions(doc)), []));
+  });
+};
+
+// ============================================
+// RECONCILIATION JOB
+// ============================================
+
+/**
+ * Hinglish: Saare counters raw data se verify karo, drift mile to repair
+ * @param {Object} options
+ * @param {Number} options.batchSize - Ek baar mein kitne counters
+ * @param {Number} options.maxDurationMs - Time budget (baaki next run, _id order se resume - kisi bhi replica par)
+ */
+const reconcileCounters = async ({
+  batchSize = DEFAULT_RECONCILE_BATCH,
+  maxDurationMs = DEFAULT_RECONCILE_MAX_MS,
+} = {}) => {
+  const startedAt = Date.now();
+  const stats = { checked: 0, repaired: 0, errors: 0, truncated: false, durationMs: 0 };
+
+  let resumeAfter = await getJobCursor(RECONCILE_JOB);
+  let done = false;
+  while (!done) {
+    const filter = resumeAfter ? { _id: { $gt: resumeAfter } } : {};
+    const batch = await Counter.find(filter).sort({ _id: 1 }).limit(batchSize).lean();
+    if (batch.length < batchSize) done = true;
+
+    for (let i = 0; i < batch.length; i += RECONCILE_CONCURRENCY) {
+      await Promise.all(batch.slice(i, i + RECONCILE_CONCURRENCY).map(async (counter) => {
+        try {
+          const { drifted } = await reconcile(counter.scope, counter.ref, counter);
+          stats.checked += 1;
+          if (drifted) stats.repaired += 1;
+        } catch (error) {
+          stats.errors += 1;
+          console.error(`[Counters] Reconcile failed for ${counter._id}:`, error.message);
+        }
+      }));
+    }
+    resumeAfter = done ? null : batch[batch.length - 1]._id;
+    await setJobCursor(RECONCILE_JOB, resumeAfter);
+
+    if (!done && Date.now() - startedAt > maxDurationMs) {
+      stats.truncated = true;
+      break;
+    }
+  }
+
+  stats.durationMs = Date.now() - startedAt;
+  if (stats.repaired > 0) {
+    console.log(`[Counters] Reconciled ${stats.checked} counters, repaired ${stats.repaired} drifted`);
+  }
+  return stats;
+};
+
+module.exports = {
+  increment,
+  getCounts,
+  reconcile,
+  reconcileCounters,
+  unreadMessagesFor,
+  recordChanges,
+  attachCounterHooks,
+};
@@ -1,8 +1,13 @@
 // backend/utils/cronScheduler.js
 // Hinglish: Cron jobs scheduler - daily tasks
+//
+// Jobs ab jobScheduler ke through register hote hain: har replica timer chalata
+// hai, lekin Mongo lease ki wajah se har schedule slot cluster mein ek hi baar chalta hai.
 
-const cron = require('node-cron');
 const { closeExpiredProjects } = require('../jobs/autoCloseProjects');
+const { registerJob, startScheduler } = require('./scheduler/jobScheduler');
+const { reconcileCounters } = require('./counters/counterStore');
+const { verifyLedger } = require('./ledger/earningsLedger');
 
 /**
  * Hinglish: Sab cron jobs initialize karo
@@ -15,30 +20,44 @@ function initializeCronJobs() {
     // Hinglish: Har roz 00:00 (midnight) par run karo
     // Cron format: minute hour day month day-of-week
     // '0 0 * * *' = Midnight every day
-    const closeProjectsJob = cron.schedule('0 0 * * *', async () => {
-      console.log('\n🔔 Cron Job: Auto-close projects started');
-      try {
-        await closeExpiredProjects();
-      } catch (error) {
-        console.error('❌ Cron job error:', error.message);
-      }
+    // Dev mode mein test karne ke liye har 5 minute (midnight bhi isi mein aa jata hai)
+    const isDev = process.env.NODE_ENV === 'development';
+    registerJob({
+      name: 'closeExpiredProjects',
+      cron: isDev ? '*/5 * * * *' : '0 0 * * *',
+      leaseMs: 5 * 60 * 1000,
+      jitterMs: 10 * 1000,
+      run: () => closeExpiredProjects(),
+      items: (result) => (result ? result.projectsClosed : 0),
     });
 
-    console.log('✅ Auto-close projects job scheduled for midnight every day');
-
-    // Hinglish: Dev mode mein test karne ke liye har 5 minute bhi karo (optional)
-    if (process.env.NODE_ENV === 'development') {
-      console.log('📌 [DEV MODE] Auto-close will also run every 5 minutes for testing');
-      const testJob = cron.schedule('*/5 * * * *', async () => {
-        console.log('\n🧪 TEST Cron Job: Auto-close projects started');
-        try {
-          await closeExpiredProjects();
-        } catch (error) {
-          console.error('❌ Test cron job error:', error.message);
-        }
-      });
+    // Hinglish: Har ghante denormalized counters ko raw collections se match karo (drift repair)
+    registerJob({
+      name: 'reconcileCounters',
+      cron: '17 * * * *',
+      leaseMs: 10 * 60 * 1000,
+      jitterMs: 10 * 1000,
+      run: () => reconcileCounters(),
+      items: (result) => (result ? result.repaired : 0),
+    });
+
+    // Hinglish: Har ghante earnings ledger balances ko raw Payments se verify karo
+    registerJob({
+      name: 'verifyEarningsLedger',
+      cron: '37 * * * *',
+      leaseMs: 10 * 60 * 1000,
+      jitterMs: 10 * 1000,
+      run: () => verifyLedger(),
+      items: (result) => (result ? result.repaired : 0),
+    });
+
+    if (isDev) {
+      console.log('📌 [DEV MODE] Auto-close will run every 5 minutes for testing');
+    } else {
+      console.log('✅ Auto-close projects job scheduled for midnight every day');
     }
 
+    startScheduler();
     console.log('✅ All cron jobs initialized successfully\n');
   } catch (error) {
     console.error('❌ Error initializing cron jobs:', error.message);
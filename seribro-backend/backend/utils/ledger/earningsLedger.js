@@ -0,0 +1,450 @@
+// backend/utils/ledger/earningsLedger.js
+// Hinglish: Earnings ledger - payment status transitions se append-only entries aur
+// per-student / per-company running balances (monthly buckets ke saath)
+//
+// Har status ka ek "contribution" hai (e.g. captured = escrow mein +net, released =
+// released total +net aur us mahine ke bucket mein +net/+1). Transition par pehle aur
+// baad ke contributions ka diff ek LedgerEntry ban jaata hai, aur wahi diff dono
+// balance documents par `$inc` hota hai - entry insert + balances ek transaction mein.
+//
+// Entry ka `_id` `${paymentId}:${fromStatus}->${toStatus}:${seq}` hai - seq payment ki
+// transition chain mein position hai, isliye captured -> failed -> captured jaise repeat
+// transitions alag entries bante hain. Chain ki aakhri entry wahi transition ho to
+// (retry, do hooks) post no-op hai.
+// verifyLedger raw Payments se balances dobara banata hai; drift mile to ek
+// 'adjustment' entry likh kar balance theek karta hai (ledger append-only rehta hai).
+
+const mongoose = require('mongoose');
+const LedgerEntry = require('../../models/LedgerEntry');
+const LedgerBalance = require('../../models/LedgerBalance');
+const { getJobCursor, setJobCursor } = require('../scheduler/jobScheduler');
+
+const ESCROW_STATUSES = ['captured', 'ready_for_release'];
+const SCOPES = ['student', 'company'];
+const PAYMENT_FIELDS = ['status', 'amount', 'netAmount', 'student', 'company', 'project', 'releasedAt', 'capturedAt', 'createdAt'];
+const AMOUNT_EPSILON = 0.005;
+
+const DEFAULT_VERIFY_BATCH = 200;
+const DEFAULT_VERIFY_MAX_MS = 5 * 60 * 1000;
+const VERIFY_CONCURRENCY = 10;
+// Hinglish: Resume cursor isi job ke lease document par rehta hai (process memory mein nahi)
+const VERIFY_JOB = 'verifyEarningsLedger';
+const POST_ATTEMPTS = 3;
+
+const keyOf = (scope, ref) => `${scope}:${ref}`;
+const toObjectId = (ref) => (ref instanceof mongoose.Types.ObjectId ? ref : new mongoose.Types.ObjectId(String(ref)));
+const round = (value) => Math.round(value * 100) / 100;
+
+// Hinglish: Student ko milne wala amount - earnings page aur purane aggregate jaisa hi
+const netOf = (payment) => (payment.netAmount != null ? payment.netAmount : (payment.amount || 0));
+
+// Hinglish: Released bucket ka mahina (UTC, `$dateToString` jaisa)
+const monthOf = (payment) => {
+  const date = payment.releasedAt || payment.capturedAt || payment.createdAt;
+  return date ? new Date(date).toISOString().slice(0, 7) : 'unknown';
+};
+
+const snapshot = (doc) => PAYMENT_FIELDS.reduce((out, field) => {
+  out[field] = doc[field];
+  return out;
+}, { _id: doc._id });
+
+/**
+ * Hinglish: Ek payment apni current status mein balances mein kya jodta hai
+ * @returns {Array} [{ scope, ref, path, by }]
+ */
+const contributions = (payment) => {
+  if (!payment || !payment.status) return [];
+  const amount = netOf(payment);
+  const parties = SCOPES.map((scope) => [scope, payment[scope]]).filter(([, ref]) => ref);
+
+  if (ESCROW_STATUSES.includes(payment.status)) {
+    return parties.map(([scope, ref]) => ({ scope, ref, path: 'totals.escrow', by: amount }));
+  }
+  if (payment.status === 'released') {
+    const month = monthOf(payment);
+    return parties.flatMap(([scope, ref]) => [
+      { scope, ref, path: 'totals.released', by: amount },
+      { scope, ref, path: 'totals.releasedCount', by: 1 },
+      { scope, ref, path: `months.${month}.total`, by: amount },
+      { scope, ref, path: `months.${month}.count`, by: 1 },
+    ]);
+  }
+  return []; // pending / failed / refunded - kisi balance mein nahi
+};
+
+/**
+ * Hinglish: Pehle/baad ke contributions ka diff, per balance document group
+ * @returns {Array} [{ scope, ref, inc }]
+ */
+const postingsFor = (before, after) => {
+  const byKey = new Map();
+  const add = (items, sign) => items.forEach(({ scope, ref, path, by }) => {
+    const key = keyOf(scope, ref);
+    if (!byKey.has(key)) byKey.set(key, { scope, ref: toObjectId(ref), inc: {} });
+    const { inc } = byKey.get(key);
+    inc[path] = round((inc[path] || 0) + sign * by);
+  });
+  add(contributions(before), -1);
+  add(contributions(after), 1);
+
+  return [...byKey.values()]
+    .map(({ scope, ref, inc }) => ({
+      scope,
+      ref,
+      inc: Object.fromEntries(Object.entries(inc).filter(([, by]) => by !== 0)),
+    }))
+    .filter(({ inc }) => Object.keys(inc).length > 0);
+};
+
+const balanceOps = (postings, now) => postings.map(({ scope, ref, inc }) => ({
+  updateOne: {
+    filter: { _id: keyOf(scope, ref) },
+    update: {
+      $inc: { ...inc, entries: 1 },
+      $set: { lastEntryAt: now },
+      $setOnInsert: { scope, ref, verifiedAt: null },
+    },
+    upsert: true,
+  },
+}));
+
+const isDuplicateKey = (error) => error && (error.code === 11000
+  || (Array.isArray(error.writeErrors) && error.writeErrors.some((writeError) => writeError.code === 11000)));
+
+/**
+ * Hinglish: Transition entry + balances ek transaction mein
+ * Chain ki aakhri entry se seq nikalta hai; wahi transition pehle se aakhri ho to duplicate.
+ * Do concurrent transitions ek hi seq le lein to duplicate key par dobara try.
+ * @returns {Promise<Boolean>} false agar entry pehle se thi (duplicate)
+ */
+const post = async (entry, postings) => {
+  for (let attempt = 1; ; attempt += 1) {
+    const now = new Date();
+    const session = await mongoose.startSession();
+    try {
+      let posted = false;
+      await session.withTransaction(async () => {
+        posted = false;
+        const last = await LedgerEntry.collection.findOne(
+          { payment: entry.payment, kind: 'transition' },
+          { sort: { seq: -1 }, projection: { seq: 1, fromStatus: 1, toStatus: 1 }, session }
+        );
+        if (last && last.fromStatus === entry.fromStatus && last.toStatus === entry.toStatus) return;
+
+        const seq = last && Number.isInteger(last.seq) ? last.seq + 1 : 0;
+        await LedgerEntry.collection.insertOne({
+          _id: `${entry.payment}:${entry.fromStatus}->${entry.toStatus}:${seq}`,
+          ...entry,
+          seq,
+          postings,
+          createdAt: now,
+        }, { session });
+        if (postings.length > 0) {
+          await LedgerBalance.collection.bulkWrite(balanceOps(postings, now), { session, ordered: true });
+        }
+        posted = true;
+      });
+      return posted;
+    } catch (error) {
+      if (!isDuplicateKey(error) || attempt >= POST_ATTEMPTS) throw error;
+    } finally {
+      await session.endSession();
+    }
+  }
+};
+
+/**
+ * Hinglish: Ek payment ka status transition ledger mein post karo
+ * Ledger fail hone se payment write fail nahi hota - verifier drift theek kar dega.
+ * @param {Object|null} before - Transition se pehle ka snapshot (naya payment = null)
+ * @param {Object} after - Transition ke baad ka snapshot
+ */
+const recordTransition = async (before, after) => {
+  if (!after || !after.status) return;
+  const fromStatus = before ? before.status : null;
+  if (fromStatus === after.status) return;
+
+  try {
+    await post({
+      kind: 'transition',
+      payment: after._id,
+      project: after.project || null,
+      student: after.student || null,
+      company: after.company || null,
+      fromStatus,
+      toStatus: after.status,
+      amount: netOf(after),
+    }, postingsFor(before, after));
+  } catch (error) {
+    console.error(`[Ledger] Failed to post ${after._id} ${fromStatus} -> ${after.status}:`, error.message);
+  }
+};
+
+/**
+ * Hinglish: Hooks ke bina hue Payment writes (bulkWrite etc.) ke transitions post karo
+ * @param {Array} beforeDocs - Write se pehle (insert ke liye [])
+ * @param {Array} afterDocs - Write ke baad
+ */
+const recordPaymentChanges = async (beforeDocs, afterDocs) => {
+  const beforeById = new Map((beforeDocs || []).map((doc) => [String(doc._id), snapshot(doc)]));
+  for (const doc of afterDocs || []) {
+    await recordTransition(beforeById.get(String(doc._id)) || null, snapshot(doc));
+  }
+};
+
+// ============================================
+// VERIFY (raw Payments se exact balances)
+// ============================================
+
+const emptyBalance = () => ({ totals: { escrow: 0, released: 0, releasedCount: 0 }, months: {} });
+
+/**
+ * Hinglish: Raw Payment rows se ek student/company ka balance dobara banao
+ */
+const recompute = async (scope, ref) => {
+  const rows = await mongoose.model('Payment').aggregate([
+    { $match: { [scope]: ref, status: { $in: [...ESCROW_STATUSES, 'released'] } } },
+    {
+      $group: {
+        _id: {
+          status: '$status',
+          month: {
+            $dateToString: {
+              format: '%Y-%m',
+              date: { $ifNull: ['$releasedAt', { $ifNull: ['$capturedAt', '$createdAt'] }] },
+            },
+          },
+        },
+        total: { $sum: { $ifNull: ['$netAmount', { $ifNull: ['$amount', 0] }] } },
+        count: { $sum: 1 },
+      },
+    },
+  ]);
+
+  const balance = emptyBalance();
+  rows.forEach(({ _id, total, count }) => {
+    if (ESCROW_STATUSES.includes(_id.status)) {
+      balance.totals.escrow = round(balance.totals.escrow + total);
+      return;
+    }
+    const month = _id.month || 'unknown';
+    balance.totals.released = round(balance.totals.released + total);
+    balance.totals.releasedCount += count;
+    const bucket = balance.months[month] || { total: 0, count: 0 };
+    balance.months[month] = { total: round(bucket.total + total), count: bucket.count + count };
+  });
+  return balance;
+};
+
+// Hinglish: { totals, months } ko flat { 'totals.escrow': n, 'months.2025-01.total': n } mein
+const flatten = (balance) => {
+  const out = {};
+  Object.entries((balance && balance.totals) || {}).forEach(([key, value]) => {
+    out[`totals.${key}`] = Number(value) || 0;
+  });
+  Object.entries((balance && balance.months) || {}).forEach(([month, bucket]) => {
+    out[`months.${month}.total`] = Number(bucket && bucket.total) || 0;
+    out[`months.${month}.count`] = Number(bucket && bucket.count) || 0;
+  });
+  return out;
+};
+
+const deltaOf = (current, expected) => {
+  const flatCurrent = flatten(current);
+  const flatExpected = flatten(expected);
+  const delta = {};
+  new Set([...Object.keys(flatCurrent), ...Object.keys(flatExpected)]).forEach((path) => {
+    const diff = round((flatExpected[path] || 0) - (flatCurrent[path] || 0));
+    if (Math.abs(diff) > AMOUNT_EPSILON) delta[path] = diff;
+  });
+  return delta;
+};
+
+/**
+ * Hinglish: Ek balance verify karo; drift mile to adjustment entry + balance reset
+ * @returns {Promise<Object>} { balance, drifted }
+ */
+const verifyBalance = async (scope, ref, existing = undefined) => {
+  if (!SCOPES.includes(scope)) throw new Error(`Unknown ledger scope: ${scope}`);
+  const objectId = toObjectId(ref);
+  const key = keyOf(scope, objectId);
+
+  const current = existing !== undefined ? existing : await LedgerBalance.findById(key).lean();
+  const expected = await recompute(scope, objectId);
+  const delta = deltaOf(current, expected);
+  const drifted = Object.keys(delta).length > 0;
+  const wasVerified = Boolean(current && current.verifiedAt);
+  const now = new Date();
+
+  const session = await mongoose.startSession();
+  try {
+    await session.withTransaction(async () => {
+      if (drifted) {
+        await LedgerEntry.collection.insertOne({
+          _id: `adj:${key}:${now.getTime()}`,
+          kind: 'adjustment',
+          [scope]: objectId,
+          amount: delta['totals.released'] || 0,
+          postings: [{ scope, ref: objectId, inc: delta }],
+          // Hinglish: Pehli verify = ledger se pehle ke payments ka opening balance
+          note: wasVerified ? 'Drift repair from raw payments' : 'Opening balance from raw payments',
+          createdAt: now,
+        }, { session });
+      }
+      await LedgerBalance.collection.updateOne(
+        { _id: key },
+        {
+          $set: { scope, ref: objectId, totals: expected.totals, months: expected.months, verifiedAt: now },
+          $inc: { entries: drifted ? 1 : 0 },
+        },
+        { upsert: true, session }
+      );
+    });
+  } finally {
+    await session.endSession();
+  }
+
+  return { balance: { ...expected, verifiedAt: now }, drifted: wasVerified && drifted };
+};
+
+/**
+ * Hinglish: Balance padho - kabhi verify nahi hua to pehle raw Payments se bana lo
+ * @param {String} scope - 'student' | 'company'
+ * @param {String|ObjectId} ref - StudentProfile / CompanyProfile id
+ * @returns {Promise<Object>} { totals, months }
+ */
+const getBalance = async (scope, ref) => {
+  if (!ref) return emptyBalance();
+  const doc = await LedgerBalance.findById(keyOf(scope, ref)).lean();
+  if (doc && doc.verifiedAt) {
+    return { totals: { ...emptyBalance().totals, ...doc.totals }, months: doc.months || {} };
+  }
+  const { balance } = await verifyBalance(scope, ref, doc);
+  return balance;
+};
+
+/**
+ * Hinglish: Latest N months (chronological) jinmein kuch release hua
+ * @returns {Array} [{ month, total, projectCount }]
+ */
+const recentMonths = (balance, limit = 12) => Object.entries((balance && balance.months) || {})
+  .filter(([month, bucket]) => month !== 'unknown' && bucket && bucket.count > 0)
+  .sort(([a], [b]) => (a < b ? -1 : 1))
+  .slice(-limit)
+  .map(([month, bucket]) => ({ month, total: round(bucket.total), projectCount: bucket.count }));
+
+// ============================================
+// MODEL HOOKS
+// ============================================
+
+/**
+ * Hinglish: Payment schema par ledger hooks - save, insertMany aur status wale query updates
+ * @param {mongoose.Schema} schema
+ */
+const attachLedgerHooks = (schema) => {
+  const projection = PAYMENT_FIELDS.join(' ');
+  const touchesStatus = (update) => Boolean(update) && Object.entries(update).some(([key, value]) => (
+    key === 'status' || (key.startsWith('$') && value && typeof value === 'object' && 'status' in value)
+  ));
+
+  // Partial select wale docs par transition ka pata nahi chal sakta - undefined = skip
+  schema.post('init', function () {
+    this.$locals.ledgerBefore = PAYMENT_FIELDS.every((field) => this.isSelected(field)) ? snapshot(this) : undefined;
+  });
+
+  schema.pre('save', function () {
+    this.$locals.ledgerWasNew = this.isNew;
+  });
+
+  schema.post('save', async function (doc) {
+    const before = doc.$locals.ledgerWasNew ? null : doc.$locals.ledgerBefore;
+    if (before === undefined) return;
+    const after = snapshot(doc);
+    doc.$locals.ledgerBefore = after;
+    await recordTransition(before, after);
+  });
+
+  schema.post('insertMany', async (docs) => {
+    await recordPaymentChanges([], docs);
+  });
+
+  const single = ['updateOne', 'findOneAndUpdate'];
+  schema.pre(['updateOne', 'updateMany', 'findOneAndUpdate'], { document: false, query: true }, async function () {
+    if (!touchesStatus(this.getUpdate())) return;
+    const query = this.model.find(this.getFilter()).select(projection).lean();
+    if (single.includes(this.op)) query.limit(1);
+    this._ledgerBefore = await query;
+  });
+
+  schema.post(['updateOne', 'updateMany', 'findOneAndUpdate'], { document: false, query: true }, async function () {
+    const beforeDocs = this._ledgerBefore;
+    if (!beforeDocs || beforeDocs.length === 0) return;
+    const afterDocs = await this.model.find({ _id: { $in: beforeDocs.map((doc) => doc._id) } }).select(projection).lean();
+    await recordPaymentChanges(beforeDocs, afterDocs);
+  });
+};
+
+// ============================================
+// VERIFIER JOB
+// ============================================
+
+/**
+ * Hinglish: Saare balances raw Payments se verify karo, drift mile to adjustment
+ * @param {Object} options
+ * @param {Number} options.batchSize
+ * @param {Number} options.maxDurationMs - Time budget (baaki next run, _id order se resume - kisi bhi replica par)
+ */
+const verifyLedger = async ({
+  batchSize = DEFAULT_VERIFY_BATCH,
+  maxDurationMs = DEFAULT_VERIFY_MAX_MS,
+} = {}) => {
+  const startedAt = Date.now();
+  const stats = { checked: 0, repaired: 0, errors: 0, truncated: false, durationMs: 0 };
+
+  let resumeAfter = await getJobCursor(VERIFY_JOB);
+  let done = false;
+  while (!done) {
+    const filter = resumeAfter ? { _id: { $gt: resumeAfter } } : {};
+    const batch = await LedgerBalance.find(filter).sort({ _id: 1 }).limit(batchSize).lean();
+    if (batch.length < batchSize) done = true;
+
+    for (let i = 0; i < batch.length; i += VERIFY_CONCURRENCY) {
+      await Promise.all(batch.slice(i, i + VERIFY_CONCURRENCY).map(async (balance) => {
+        try {
+          const { drifted } = await verifyBalance(balance.scope, balance.ref, balance);
+          stats.checked += 1;
+          if (drifted) stats.repaired += 1;
+        } catch (error) {
+          stats.errors += 1;
+          console.error(`[Ledger] Verify failed for ${balance._id}:`, error.message);
+        }
+      }));
+    }
+    resumeAfter = done ? null : batch[batch.length - 1]._id;
+    await setJobCursor(VERIFY_JOB, resumeAfter);
+
+    if (!done && Date.now() - startedAt > maxDurationMs) {
+      stats.truncated = true;
+      break;
+    }
+  }
+
+  stats.durationMs = Date.now() - startedAt;
+  if (stats.repaired > 0) {
+    console.log(`[Ledger] Verified ${stats.checked} balances, repaired ${stats.repaired} drifted`);
+  }
+  return stats;
+};
+
+module.exports = {
+  contributions,
+  postingsFor,
+  recordTransition,
+  recordPaymentChanges,
+  getBalance,
+  recentMonths,
+  verifyBalance,
+  verifyLedger,
+  attachLedgerHooks,
+};
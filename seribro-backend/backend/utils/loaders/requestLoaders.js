@@ -0,0 +1,136 @@
+// backend/utils/loaders/requestLoaders.js
+// Request-scoped batch loaders (DataLoader style)
+//
+// Ek request ke andar jitne bhi `loader.load(id)` same tick mein call hote
+// hain, unhe ek hi `$in` query mein resolve karte hain, aur result request
+// khatam hone tak cache rehta hai. List endpoints (browse, applications) mein
+// per-item `findById` (N+1) ki jagah isi ko use karo.
+
+const mongoose = require('mongoose');
+const CompanyProfile = require('../../models/companyProfile');
+const Company = require('../../models/Company');
+const StudentProfile = require('../../models/StudentProfile');
+
+// Company card ke liye jo fields chahiye (student browse, admin list, details)
+const COMPANY_FIELDS = 'companyName companyEmail logoUrl officeAddress.city officeAddress.state industryType verificationStatus';
+
+// Company applications list ke student card fields (NO email/phone)
+const STUDENT_CARD_FIELDS = 'basicInfo.fullName basicInfo.collegeName basicInfo.location skills.technical skills.soft skills.languages documents.resume.url documents.collegeId.url';
+
+class BatchLoader {
+    /**
+     * @param {Function} batchFn - async (keys: String[]) => Map<String, doc>
+     */
+    constructor(batchFn) {
+        this.batchFn = batchFn;
+        this.cache = new Map(); // key -> Promise
+        this.queue = [];
+    }
+
+    load(id) {
+        if (!id) return Promise.resolve(null);
+        const key = String(id._id || id);
+        if (this.cache.has(key)) {
+            return this.cache.get(key);
+        }
+
+        const promise = new Promise((resolve, reject) => {
+            this.queue.push({ key, resolve, reject });
+            // Pehla item aate hi dispatch schedule karo - same tick ke baaki loads isi batch mein
+            if (this.queue.length === 1) {
+                process.nextTick(() => this.dispatch());
+            }
+        });
+        this.cache.set(key, promise);
+        return promise;
+    }
+
+    loadMany(ids = []) {
+        return Promise.all(ids.map((id) => this.load(id)));
+    }
+
+    prime(id, value) {
+        const key = String(id);
+        if (!this.cache.has(key)) {
+            this.cache.set(key, Promise.resolve(value));
+        }
+        return this;
+    }
+
+    async dispatch() {
+        const queue = this.queue;
+        this.queue = [];
+        const keys = [...new Set(queue.map((item) => item.key))];
+        try {
+            const found = await this.batchFn(keys);
+            queue.forEach((item) => item.resolve(found.get(item.key) || null));
+        } catch (error) {
+            // Error cache mat karo - agla load dobara try kare
+            queue.forEach((item) => {
+                this.cache.delete(item.key);
+                item.reject(error);
+            });
+        }
+    }
+}
+
+const validObjectIds = (keys) => keys.filter((key) => mongoose.Types.ObjectId.isValid(key));
+
+const toMap = (docs) => new Map(docs.map((doc) => [String(doc._id), doc]));
+
+/**
+ * Hinglish: Company ids ko CompanyProfile se resolve karo; jo nahi mile unke liye
+ * purana Company model (backward compatibility) - max 2 queries per batch
+ */
+const batchCompanies = async (keys) => {
+    const ids = validObjectIds(keys);
+    if (ids.length === 0) return new Map();
+
+    const found = toMap(await CompanyProfile.find({ _id: { $in: ids } }).select(COMPANY_FIELDS).lean());
+    const missing = ids.filter((id) => !found.has(id));
+    if (missing.length > 0) {
+        const legacy = await Company.find({ _id: { $in: missing } }).lean();
+        legacy.forEach((doc) => found.set(String(doc._id), doc));
+    }
+    return found;
+};
+
+const batchStudentProfiles = async (keys) => {
+    const ids = validObjectIds(keys);
+    if (ids.length === 0) return new Map();
+    return toMap(await StudentProfile.find({ _id: { $in: ids } }).select(STUDENT_CARD_FIELDS).lean());
+};
+
+/**
+ * Hinglish: Request ke loaders - pehli call par banate hain, phir req par hi rehte hain
+ * @param {Object} req - Express request
+ * @returns {{ company: BatchLoader, studentProfile: BatchLoader }}
+ */
+exports.getLoaders = (req) => {
+    if (!req.loaders) {
+        req.loaders = {
+            company: new BatchLoader(batchCompanies),
+            studentProfile: new BatchLoader(batchStudentProfiles),
+        };
+    }
+    return req.loaders;
+};
+
+/**
+ * Hinglish: CompanyProfile ya legacy Company doc ko ek common card shape mein badlo
+ * @param {Object} company - Loaded company doc
+ * @returns {Object|null} { name, city, logo, isVerified }
+ */
+exports.toCompanyCard = (company) => {
+    if (!company) return null;
+    return {
+        name: company.companyName,
+        city: company.officeAddress?.city || company.city,
+        logo: company.logoUrl || company.logo,
+        isVerified: company.verificationStatus
+            ? company.verificationStatus === 'approved'
+            : Boolean(company.isVerified),
+    };
+};
+
+exports.BatchLoader = BatchLoader;
@@ -0,0 +1,361 @@
+// backend/utils/notifications/notificationOutbox.js
+// Hinglish: In-process notification outbox - request path se notification writes bahar
+//
+// enqueue() sirf memory buffer mein daalta hai aur turant return karta hai.
+// Buffer size (BATCH_SIZE) ya time (FLUSH_INTERVAL_MS) par flush hota hai:
+//   1. Notification.insertMany  - asli notifications, ek write per batch (fast path)
+//   2. Socket.io push           - `user_<userId>` room mein 'notification' event
+// insertMany fail ho (DB error) to batch NotificationOutbox collection mein park hota hai
+// (same _id); leased sweep job unhe replay karta hai, same _id ki wajah se replay
+// duplicate notification nahi banata. Outbox bhi na likh paaye to batch buffer mein
+// wapas aata hai (backoff ke saath).
+//
+// Durability: flush se pehle (max FLUSH_INTERVAL_MS) notifications sirf memory mein hain -
+// us window mein process crash / OOM ho to wo kho jaati hain. SIGTERM / SIGINT par
+// drainNotificationOutbox buffer flush karta hai.
+
+const Notification = require('../../models/Notification');
+const NotificationOutbox = require('../../models/NotificationOutbox');
+const { emitToUser } = require('../socket/socketManager');
+const { registerJob, OWNER } = require('../scheduler/jobScheduler');
+const counterStore = require('../counters/counterStore');
+const responseCache = require('../responseCache');
+
+const BATCH_SIZE = parseInt(process.env.NOTIFICATION_BATCH_SIZE, 10) || 200;
+const FLUSH_INTERVAL_MS = parseInt(process.env.NOTIFICATION_FLUSH_MS, 10) || 100;
+const CLAIM_MS = 60 * 1000;
+const MAX_ATTEMPTS = 5;
+const MAX_BUFFERED = 20000;
+const MAX_RETRY_DELAY_MS = 30 * 1000;
+const SWEEP_INTERVAL_MS = 15 * 1000;
+
+const FIELDS = ['userId', 'userRole', 'message', 'type', 'relatedProfileType', 'relatedProfileId'];
+
+let buffer = []; // { _id, payload }
+let timer = null;
+let flushing = null;
+let retryDelayMs = 0;
+
+const stats = {
+  enqueued: 0,
+  invalid: 0,
+  dropped: 0,
+  parked: 0,
+  delivered: 0,
+  duplicates: 0,
+  failed: 0,
+  pushed: 0,
+  flushes: 0,
+  replayed: 0,
+  lastFlushMs: null,
+  lastError: null,
+};
+
+/**
+ * Hinglish: insertMany error mein sirf duplicate key errors hain? (matlab baaki sab insert ho gaye)
+ */
+const duplicateIdsOf = (error) => {
+  if (error && error.code === 11000 && !error.writeErrors) return null;
+  const writeErrors = error && Array.isArray(error.writeErrors) ? error.writeErrors : null;
+  if (!writeErrors || writeErrors.length === 0) return null;
+  const codeOf = (writeError) => writeError.code || (writeError.err && writeError.err.code);
+  if (!writeErrors.every((writeError) => codeOf(writeError) === 11000)) return null;
+  return writeErrors.map((writeError) => writeError.index);
+};
+
+/**
+ * Hinglish: Notifications insert karo - pehle se maujood _id (replay) ko delivered maano
+ * @param {Array} docs - Notification docs (_id ke saath)
+ * @returns {Promise<Set>} Duplicate docs ke indexes (ye pehle hi insert + push ho chuke)
+ */
+const insertNotifications = async (docs) => {
+  try {
+    await Notification.insertMany(docs, { ordered: false });
+    return new Set();
+  } catch (error) {
+    const duplicates = duplicateIdsOf(error);
+    if (!duplicates) throw error;
+    // Pichle attempt mein insert ho chuke the (crash/timeout ke baad replay)
+    const duplicateIndexes = new Set(duplicates);
+    stats.duplicates += duplicates.length;
+    // Error wale insertMany par post hooks nahi chalte - naye inserts ke unread counters aur
+    // response cache versions khud update karo (counter pehle, bump baad mein)
+    const inserted = docs.filter((doc, index) => !duplicateIndexes.has(index));
+    await counterStore.recordChanges('Notification', [], inserted);
+    new Set(inserted.map((doc) => String(doc.userId))).forEach((userId) => responseCache.bump('Notification', userId));
+    return duplicateIndexes;
+  }
+};
+
+/**
+ * Hinglish: Naye inserts socket par push karo - duplicate pehle hi push ho chuka hoga
+ */
+const push = (docs, duplicateIndexes) => {
+  docs.forEach((doc, index) => {
+    if (duplicateIndexes.has(index)) return;
+    if (emitToUser(doc.userId, 'notification', doc)) {
+      stats.pushed += 1;
+    }
+  });
+};
+
+/**
+ * Hinglish: Parked outbox rows replay karo - Notification insert, delivered rows hatao, push
+ * @param {Array} rows - [{ _id, payload }]
+ * @returns {Promise<Number>} delivered count
+ */
+const deliver = async (rows) => {
+  if (rows.length === 0) return 0;
+
+  const docs = rows.map((row) => ({ ...row.payload, _id: row._id }));
+  const duplicateIndexes = await insertNotifications(docs);
+  await NotificationOutbox.deleteMany({ _id: { $in: rows.map((row) => row._id) } });
+  stats.delivered += rows.length;
+  push(docs, duplicateIndexes);
+  return rows.length;
+};
+
+/**
+ * Hinglish: Ek batch flush - seedha Notification insert, fail ho to outbox mein park
+ * @returns {Promise<Boolean>} false = na insert hua na park (batch buffer mein wapas)
+ */
+const flushBatch = async (batch) => {
+  const docs = batch.map((item) => ({ ...item.payload, _id: item._id }));
+  let insertError;
+  try {
+    const duplicateIndexes = await insertNotifications(docs);
+    stats.delivered += batch.length;
+    push(docs, duplicateIndexes);
+    return true;
+  } catch (error) {
+    insertError = error;
+  }
+
+  // Hinglish: Kuch docs insert ho gaye ho sakte hain (ordered: false) - poora batch park karo,
+  // replay same _id se unhe duplicate maan lega
+  try {
+    await NotificationOutbox.insertMany(
+      batch.map((item) => ({
+        _id: item._id,
+        payload: item.payload,
+        owner: null,
+        claimedUntil: null,
+        attempts: 1,
+        lastError: insertError.message,
+      })),
+      { ordered: false }
+    );
+  } catch (error) {
+    // Retry ke baad duplicate = pichli baar park ho chuka tha
+    if (!duplicateIdsOf(error)) {
+      buffer = batch.concat(buffer);
+      stats.lastError = error.message;
+      console.error(`[NotificationOutbox] Could not insert or park ${batch.length} notifications:`, error.message);
+      return false;
+    }
+  }
+  stats.parked += batch.length;
+  stats.lastError = insertError.message;
+  console.error(`[NotificationOutbox] Insert failed for ${batch.length} notifications, parked for sweep:`, insertError.message);
+  return true;
+};
+
+const scheduleFlush = (delayMs) => {
+  if (timer) {
+    if (delayMs > 0) return;
+    clearTimeout(timer);
+  }
+  timer = setTimeout(runFlush, delayMs);
+  // Pending flush process ko zinda na rakhe (shutdown par drainNotificationOutbox flush karta hai)
+  if (timer.unref) timer.unref();
+};
+
+const flushLoop = async () => {
+  while (buffer.length > 0) {
+    const startedAt = Date.now();
+    const batch = buffer.splice(0, BATCH_SIZE);
+    stats.flushes += 1;
+    const flushed = await flushBatch(batch);
+    stats.lastFlushMs = Date.now() - startedAt;
+    if (!flushed) {
+      // DB down - exponential backoff, buffer memory mein hi rahega
+      retryDelayMs = Math.min(Math.max(retryDelayMs * 2, 500), MAX_RETRY_DELAY_MS);
+      scheduleFlush(retryDelayMs);
+      return;
+    }
+    retryDelayMs = 0;
+  }
+};
+
+function runFlush() {
+  timer = null;
+  if (flushing) return flushing;
+  flushing = flushLoop()
+    .catch((error) => console.error('[NotificationOutbox] Flush error:', error.message))
+    .finally(() => {
+      flushing = null;
+      // Flush ke dauran aaye items
+      if (buffer.length > 0 && !timer) {
+        scheduleFlush(buffer.length >= BATCH_SIZE ? 0 : FLUSH_INTERVAL_MS);
+      }
+    });
+  return flushing;
+}
+
+/**
+ * Hinglish: Notification(s) queue mein daalo - DB write ka wait nahi
+ * @param {Object|Array} input - { userId, userRole, message, type, relatedProfileType?, relatedProfileId? }
+ * @returns {Array} Queued notifications (_id ke saath) - invalid wale skip
+ */
+const enqueue = (input) => {
+  const items = Array.isArray(input) ? input : [input];
+  const queued = [];
+  const createdAt = new Date();
+
+  items.forEach((item) => {
+    if (!item) return;
+    const data = {};
+    FIELDS.forEach((field) => {
+      if (item[field] !== undefined && item[field] !== null) data[field] = item[field];
+    });
+
+    // Hinglish: Validation yahin - galat type/role wala notification queue mein na aaye
+    const doc = new Notification(data);
+    const validationError = doc.validateSync();
+    if (validationError) {
+      stats.invalid += 1;
+      console.error(`Error sending notification: ${validationError.message}`);
+      return;
+    }
+
+    const payload = doc.toObject({ depopulate: true });
+    delete payload._id;
+    payload.createdAt = createdAt;
+    payload.updatedAt = createdAt;
+
+    const queuedItem = { _id: doc._id, payload };
+    buffer.push(queuedItem);
+    queued.push({ _id: queuedItem._id, ...payload });
+  });
+
+  stats.enqueued += queued.length;
+
+  if (buffer.length > MAX_BUFFERED) {
+    // DB bahut der se down - memory bounded rakho, purane items chhodo
+    const overflow = buffer.length - MAX_BUFFERED;
+    buffer.splice(0, overflow);
+    stats.dropped += overflow;
+    console.error(`[NotificationOutbox] Buffer full, dropped ${overflow} oldest notifications`);
+  }
+
+  if (queued.length > 0 && !flushing) {
+    scheduleFlush(buffer.length >= BATCH_SIZE ? 0 : FLUSH_INTERVAL_MS);
+  }
+  return queued;
+};
+
+/**
+ * Hinglish: Outbox sweep - expired claim wali pending rows replay karo (restart/crash ke baad)
+ * @param {Object} options
+ * @param {Number} options.limit - Ek run mein max rows
+ */
+const sweepOutbox = async ({ limit = BATCH_SIZE * 5 } = {}) => {
+  const now = new Date();
+  const claimable = {
+    status: 'pending',
+    $or: [{ claimedUntil: null }, { claimedUntil: { $lt: now } }],
+  };
+
+  const candidates = await NotificationOutbox.find(claimable)
+    .sort({ createdAt: 1 })
+    .limit(limit)
+    .select('_id')
+    .lean();
+  if (candidates.length === 0) {
+    return { success: true, replayed: 0, failed: 0 };
+  }
+
+  // Hinglish: Claim karo - beech mein koi aur process utha le to wo rows yahan nahi aayengi
+  const claimToken = `${OWNER}:sweep:${now.getTime()}`;
+  await NotificationOutbox.updateMany(
+    { ...claimable, _id: { $in: candidates.map((row) => row._id) } },
+    {
+      $set: { owner: claimToken, claimedUntil: new Date(now.getTime() + CLAIM_MS) },
+      $inc: { attempts: 1 },
+    }
+  );
+  const claimed = await NotificationOutbox.find({ owner: claimToken })
+    .sort({ createdAt: 1 })
+    .select('_id payload attempts')
+    .lean();
+
+  const exhausted = claimed.filter((row) => row.attempts > MAX_ATTEMPTS);
+  if (exhausted.length > 0) {
+    await NotificationOutbox.updateMany(
+      { _id: { $in: exhausted.map((row) => row._id) } },
+      { $set: { status: 'failed', lastError: stats.lastError } }
+    );
+    stats.failed += exhausted.length;
+  }
+
+  const rows = claimed.filter((row) => row.attempts <= MAX_ATTEMPTS);
+  let replayed = 0;
+  for (let i = 0; i < rows.length; i += BATCH_SIZE) {
+    const chunk = rows.slice(i, i + BATCH_SIZE);
+    try {
+      replayed += await deliver(chunk);
+    } catch (error) {
+      stats.lastError = error.message;
+      await NotificationOutbox.updateMany(
+        { _id: { $in: chunk.map((row) => row._id) } },
+        { $set: { lastError: error.message } }
+      ).catch(() => {});
+      console.error(`[NotificationOutbox] Replay failed for ${chunk.length} notifications:`, error.message);
+    }
+  }
+  stats.replayed += replayed;
+
+  return { success: true, replayed, failed: exhausted.length };
+};
+
+/**
+ * Hinglish: Sweep job register karo - har replica register karta hai, lease se ek hi chalata hai
+ */
+const startNotificationOutbox = () => {
+  registerJob({
+    name: 'notificationOutboxSweep',
+    interval: SWEEP_INTERVAL_MS,
+    leaseMs: CLAIM_MS,
+    jitterMs: 1000,
+    run: () => sweepOutbox(),
+    items: (result) => (result ? result.replayed : 0),
+  });
+  console.log(`✅ Notification outbox started (batch ${BATCH_SIZE}, flush every ${FLUSH_INTERVAL_MS}ms)`);
+};
+
+/**
+ * Hinglish: Shutdown se pehle buffer flush karo
+ */
+const drainNotificationOutbox = async () => {
+  if (timer) {
+    clearTimeout(timer);
+    timer = null;
+  }
+  if (flushing) await flushing;
+  if (buffer.length > 0) await runFlush();
+};
+
+const getOutboxStats = () => ({
+  ...stats,
+  buffered: buffer.length,
+  batchSize: BATCH_SIZE,
+  flushIntervalMs: FLUSH_INTERVAL_MS,
+});
+
+module.exports = {
+  enqueue,
+  sweepOutbox,
+  startNotificationOutbox,
+  drainNotificationOutbox,
+  getOutboxStats,
+};
@@ -1,8 +1,11 @@
 // backend/utils/notifications/sendNotification.js
 // Notification Utility - Phase 3
 // Hinglish: Notifications send karne ka utility function
+//
+// Notification ab outbox mein queue hota hai (batched insertMany + socket push),
+// isliye caller ko DB write ka wait nahi karna padta.
 
-const Notification = require('../../models/Notification');
+const { enqueue } = require('./notificationOutbox');
 
 /**
  * Hinglish: Notification send karna function
@@ -12,7 +15,7 @@ const Notification = require('../../models/Notification');
  * @param {String} type - Notification ki type (profile-submitted, approved, rejected)
  * @param {String} relatedProfileType - Related profile ka type (student, company)
  * @param {String} relatedProfileId - Related profile ka ID
- * @returns {Object} Created notification object
+ * @returns {Object} Queued notification object (_id ke saath), invalid par null
  */
 const sendNotification = async (
   userId,
@@ -35,8 +38,6 @@ const sendNotification = async (
       userRole,
       message,
       type,
-      isRead: false,
-      createdAt: new Date(),
     };
 
     // Hinglish: Optional fields add karna agar provided hain
@@ -47,11 +48,10 @@ const sendNotification = async (
       notificationData.relatedProfileId = relatedProfileId;
     }
 
-    // Hinglish: Notification database mein save karna
-    const notification = await Notification.create(notificationData);
+    // Hinglish: Outbox mein daalo - flush background mein hota hai
+    const [notification] = enqueue(notificationData);
 
-    console.log(`Notification sent successfully to user ${userId}`);
-    return notification;
+    return notification || null;
   } catch (error) {
     console.error(`Error sending notification: ${error.message}`);
     return null;
@@ -0,0 +1,151 @@
+// backend/utils/pagination/cursorPagination.js
+// Keyset (cursor) pagination helpers - browse projects, my-applications aur chat messages ke liye
+//
+// Offset pagination (`skip((page - 1) * limit)`) har page par pichle saare
+// documents scan karta hai, isliye deep pages collection ke saath linearly slow
+// hote hain. Cursor mode mein client ko ek opaque `after` token milta hai jo
+// last row ka (sortValue, _id) encode karta hai; agla page seedha index se
+// wahi position se shuru hota hai.
+
+const mongoose = require('mongoose');
+
+const COUNT_CACHE_TTL_MS = 60 * 1000;
+const COUNT_CACHE_MAX_ENTRIES = 500;
+
+// key -> { total, expiresAt } (Map insertion order = oldest first, eviction ke liye)
+const countCache = new Map();
+
+/**
+ * Hinglish: Check karo ki request cursor mode maang rahi hai ya nahi
+ * Opt-in: `?after=<token>` ya `?paginate=cursor`
+ */
+exports.isCursorRequest = (query = {}) => Boolean(query.after) || query.paginate === 'cursor';
+
+/**
+ * Hinglish: Last row se opaque cursor token banao
+ * @param {Object} doc - Last document of the page
+ * @param {String} field - Sort field (e.g. createdAt, appliedAt, budgetMax)
+ * @returns {String} base64url token
+ */
+exports.encodeCursor = (doc, field) => {
+    const value = doc[field];
+    const payload = {
+        k: field,
+        t: value instanceof Date ? 'date' : typeof value,
+        v: value instanceof Date ? value.toISOString() : value,
+        id: String(doc._id),
+    };
+    return Buffer.from(JSON.stringify(payload)).toString('base64url');
+};
+
+/**
+ * Hinglish: Token decode karo; galat ya dusre sort ka token ho to null
+ * @param {String} token - `after` query value
+ * @param {String} field - Expected sort field
+ * @returns {Object|null} { value, id }
+ */
+exports.decodeCursor = (token, field) => {
+    try {
+        const payload = JSON.parse(Buffer.from(String(token), 'base64url').toString('utf8'));
+        if (payload.k !== field || !mongoose.Types.ObjectId.isValid(payload.id)) {
+            return null;
+        }
+        let value = payload.v;
+        if (payload.t === 'date') {
+            value = new Date(payload.v);
+            if (Number.isNaN(value.getTime())) return null;
+        }
+        return { value, id: new mongoose.Types.ObjectId(payload.id) };
+    } catch (error) {
+        return null;
+    }
+};
+
+/**
+ * Hinglish: Keyset condition - (field, _id) cursor ke baad wali rows
+ * @param {String} field - Sort field
+ * @param {Number} direction - 1 (asc) ya -1 (desc)
+ * @param {Object} cursor - decodeCursor ka result
+ * @returns {Object} Mongo filter fragment
+ */
+exports.keysetCondition = (field, direction, cursor) => {
+    const op = direction === -1 ? '$lt' : '$gt';
+    return {
+        $or: [
+            { [field]: { [op]: cursor.value } },
+            { [field]: cursor.value, _id: { [op]: cursor.id } },
+        ],
+    };
+};
+
+/**
+ * Hinglish: Cached countDocuments - cursor mode mein total approximate hai
+ * (COUNT_CACHE_TTL_MS tak purana ho sakta hai), har page par dobara count nahi hota
+ * @param {Object} Model - Mongoose model
+ * @param {Object} filter - Base filter (cursor condition ke bina)
+ * @returns {Promise<Number>}
+ */
+exports.cachedCount = async (Model, filter) => {
+    const key = `${Model.modelName}:${JSON.stringify(filter)}`;
+    const now = Date.now();
+    const hit = countCache.get(key);
+    if (hit && hit.expiresAt > now) {
+        return hit.total;
+    }
+
+    const total = await Model.countDocuments(filter);
+    countCache.delete(key);
+    countCache.set(key, { total, expiresAt: now + COUNT_CACHE_TTL_MS });
+    if (countCache.size > COUNT_CACHE_MAX_ENTRIES) {
+        countCache.delete(countCache.keys().next().value);
+    }
+    return total;
+};
+
+/**
+ * Hinglish: Ek cursor page fetch karo
+ * `limit + 1` rows laate hain taki bina count ke pata chale ki aur page hai ya nahi.
+ *
+ * @param {Object} options
+ * @param {Object} options.Model - Mongoose model
+ * @param {Object} options.filter - Base filter
+ * @param {String} options.field - Sort field
+ * @param {Number} options.direction - 1 ya -1
+ * @param {Number} options.limit - Page size
+ * @param {String} [options.after] - Cursor token
+ * @param {Function} [options.decorate] - Query par populate/select lagane ke liye
+ * @returns {Promise<Object>} { items, pagination } ya { error } agar token invalid ho
+ */
+exports.fetchCursorPage = async ({ Model, filter, field, direction, limit, after, decorate }) => {
+    let pageFilter = filter;
+    if (after) {
+        const cursor = exports.decodeCursor(after, field);
+        if (!cursor) {
+            return { error: 'Invalid pagination cursor' };
+        }
+        pageFilter = { $and: [filter, exports.keysetCondition(field, direction, cursor)] };
+    }
+
+    let query = Model.find(pageFilter)
+        .sort({ [field]: direction, _id: direction })
+        .limit(limit + 1);
+    if (decorate) {
+        query = decorate(query);
+    }
+
+    const [rows, total] = await Promise.all([query.lean(), exports.cachedCount(Model, filter)]);
+    const hasMore = rows.length > limit;
+    const items = hasMore ? rows.slice(0, limit) : rows;
+
+    return {
+        items,
+        pagination: {
+            mode: 'cursor',
+            limit,
+            total,
+            totalIsApproximate: true,
+            hasMore,
+            nextCursor: hasMore ? exports.encodeCursor(items[items.length - 1], field) : null,
+        },
+    };
+};
@@ -0,0 +1,151 @@
+// utils/principalCache.js
+// Hinglish: Authenticated user (principal) ka bounded TTL cache - protect middleware ke liye
+//
+// Har authenticated request par `User.findById` + role profile lookup hota tha.
+// Ab (userId, token issue time) key par user aur uska resolved profile id
+// thodi der ke liye memory mein rakhte hain. Logout, password change,
+// verification change aur profile edits par user ki saari entries explicitly
+// invalidate hoti hain (model hooks + authController). Multi-node setup mein
+// invalidation bus se baaki nodes tak bhi jaata hai (socketManager attachBus karta hai).
+
+const TTL_MS = parseInt(process.env.PRINCIPAL_CACHE_TTL_MS, 10) || 30 * 1000;
+const MAX_ENTRIES = parseInt(process.env.PRINCIPAL_CACHE_MAX_ENTRIES, 10) || 10000;
+const CHANNEL = 'auth.principalCache';
+
+const entries = new Map(); // key -> { value, expiresAt } (insertion order = LRU order)
+const keysByUser = new Map(); // userId -> Set<key>
+
+const stats = { hits: 0, misses: 0, invalidations: 0, evictions: 0 };
+
+let bus = null;
+let unsubscribe = null;
+
+const keyFor = (decoded) => `${decoded.userId}:${decoded.iat || 0}`;
+
+const forget = (key) => {
+    const entry = entries.get(key);
+    if (!entry) return;
+    entries.delete(key);
+    const userKeys = keysByUser.get(entry.userId);
+    if (userKeys) {
+        userKeys.delete(key);
+        if (userKeys.size === 0) keysByUser.delete(entry.userId);
+    }
+};
+
+/**
+ * Hinglish: Decoded JWT ke liye cached principal lo (miss ya expire par null)
+ * @param {Object} decoded - jwt.verify ka result ({ userId, iat, exp })
+ * @returns {Object|null} { user, student, studentProfileId, companyProfileId }
+ */
+const get = (decoded) => {
+    const key = keyFor(decoded);
+    const entry = entries.get(key);
+    if (!entry) {
+        stats.misses += 1;
+        return null;
+    }
+    if (entry.expiresAt <= Date.now()) {
+        forget(key);
+        stats.misses += 1;
+        return null;
+    }
+    // LRU: recently used entry ko end par le jao
+    entries.delete(key);
+    entries.set(key, entry);
+    stats.hits += 1;
+    return entry.value;
+};
+
+/**
+ * Hinglish: Principal cache mein rakho - TTL token expiry se aage nahi jaata
+ * @param {Object} decoded - jwt.verify ka result
+ * @param {Object} value - Plain objects (mongoose docs nahi) taki requests ke beech share na ho
+ */
+const set = (decoded, value) => {
+    const key = keyFor(decoded);
+    const userId = String(decoded.userId);
+    const tokenExpiry = decoded.exp ? decoded.exp * 1000 : Infinity;
+
+    forget(key);
+    entries.set(key, { value, userId, expiresAt: Math.min(Date.now() + TTL_MS, tokenExpiry) });
+    if (!keysByUser.has(userId)) keysByUser.set(userId, new Set());
+    keysByUser.get(userId).add(key);
+
+    while (entries.size > MAX_ENTRIES) {
+        forget(entries.keys().next().value);
+        stats.evictions += 1;
+    }
+};
+
+const applyInvalidate = (userId) => {
+    const userKeys = keysByUser.get(userId);
+    if (!userKeys) return;
+    [...userKeys].forEach(forget);
+    stats.invalidations += 1;
+};
+
+const applyClear = () => {
+    entries.clear();
+    keysByUser.clear();
+};
+
+/**
+ * Hinglish: User ki saari cached entries hatao (logout, password/profile/verification change) - is node par aur bus se baaki nodes par
+ * @param {String|ObjectId} userId
+ */
+const invalidateUser = (userId) => {
+    if (!userId) return;
+    const key = String(userId);
+    applyInvalidate(key);
+    if (bus) bus.publish(CHANNEL, { u: key });
+};
+
+const clear = () => {
+    applyClear();
+    if (bus) bus.publish(CHANNEL, { all: true });
+};
+
+/**
+ * Hinglish: Cross-node bus se jodo (socketManager init par) - null pass karo to detach
+ * @param {Object|null} nextBus
+ */
+const attachBus = (nextBus) => {
+    if (unsubscribe) unsubscribe();
+    unsubscribe = null;
+    bus = nextBus;
+    if (!bus) return;
+    unsubscribe = bus.subscribe(CHANNEL, (event) => {
+        if (!event) return;
+        if (event.all) applyClear();
+        else if (event.u) applyInvalidate(event.u);
+    });
+};
+
+const getStats = () => ({ ...stats, size: entries.size, ttlMs: TTL_MS, maxEntries: MAX_ENTRIES });
+
+/**
+ * Hinglish: Model par hooks lagao - save/update hote hi related user ka cache hatao
+ * @param {mongoose.Schema} schema
+ * @param {Function} userIdOf - doc => userId (User ke liye doc._id, profiles ke liye doc.user)
+ */
+const attachInvalidationHooks = (schema, userIdOf) => {
+    const invalidateDoc = (doc) => {
+        if (doc) invalidateUser(userIdOf(doc));
+    };
+    schema.post('save', invalidateDoc);
+    schema.post('findOneAndUpdate', invalidateDoc);
+    schema.post('findOneAndDelete', invalidateDoc);
+    schema.post('deleteOne', { document: true, query: false }, invalidateDoc);
+    // Query-level updates mein doc nahi milta - filter se user id nikal sakte ho to wahi hatao, warna sab
+    schema.post(['updateOne', 'updateMany'], function () {
+        const userId = userIdOf(this.getFilter());
+        if (userId && (typeof userId === 'string' || userId._bsontype === 'ObjectId')) {
+            invalidateUser(userId);
+        } else {
+            clear();
+        }
+    });
+};
+
+module.exports = { get, set, invalidateUser, clear, getStats, attachInvalidationHooks, attachBus };
@@ -0,0 +1,167 @@
+// utils/responseCache.js
+// Hinglish: Polled GET routes ke liye version keys + per-user response cache
+//
+// Frontend kai endpoints 10-30s par poll karta hai aur zyada tar same payload wapas aata hai.
+// Har model write par us model ka version bump hota hai - scope ke saath (e.g.
+// Notification:userId) jab doc / filter se pata chale, warna poore model ka. Sirf wahi
+// models hooks lagate hain jinke versions koi route declare karta hai. Cached response ki key mein route ke versions ka tag hota hai, isliye write
+// ke baad purani entry apne aap miss ho jaati hai; TTL sirf un dependencies ka upper
+// bound hai jo versions mein declare nahi hain. middleware/conditionalGet isko use karta hai.
+
+const crypto = require('crypto');
+
+const TTL_MS = parseInt(process.env.RESPONSE_CACHE_TTL_MS, 10) || 60 * 1000;
+const MAX_ENTRIES = parseInt(process.env.RESPONSE_CACHE_MAX_ENTRIES, 10) || 5000;
+const MAX_VERSION_KEYS = parseInt(process.env.RESPONSE_CACHE_MAX_VERSION_KEYS, 10) || 50000;
+const CHANNEL = 'responseCache.versions';
+
+const entries = new Map(); // key -> { body, etag, expiresAt } (insertion order = LRU order)
+const versions = new Map(); // 'Model' | 'Model:scope' -> { seq, at } (insertion order = bump order)
+
+// Hinglish: seq har bump par badhta hai. Evict hue scoped version ki jagah `floor` use hota hai -
+// floor hamesha evicted seq se bada hai, isliye purani entry ka tag dobara match nahi hota.
+let seq = 0;
+const startedAt = new Date();
+let floor = { seq: 0, at: startedAt };
+
+let bus = null;
+let unsubscribe = null;
+
+const stats = { hits: 0, misses: 0, stores: 0, bumps: 0, evictions: 0 };
+
+const keyOf = (model, scope) => (scope ? `${model}:${scope}` : model);
+
+const applyBump = (key) => {
+    seq += 1;
+    versions.delete(key);
+    versions.set(key, { seq, at: new Date() });
+    stats.bumps += 1;
+    while (versions.size > MAX_VERSION_KEYS) {
+        const oldest = versions.keys().next().value;
+        versions.delete(oldest);
+        seq += 1;
+        floor = { seq, at: new Date() };
+    }
+};
+
+/**
+ * Hinglish: Model (aur optional scope) ka version badhao - is node par aur bus se baaki nodes par
+ * @param {String} model - Mongoose model name
+ * @param {String|ObjectId} [scope] - userId / projectId / companyId; na ho to poora model
+ */
+const bump = (model, scope) => {
+    const key = keyOf(model, scope && String(scope));
+    applyBump(key);
+    if (bus) bus.publish(CHANNEL, { k: key });
+};
+
+const versionOf = (key) => versions.get(key) || floor;
+
+/**
+ * Hinglish: Route ki dependencies ka tag + Last-Modified
+ * @param {Array} specs - ['Model'] ya [['Model', scopeId]] entries
+ * @returns {Object} { tag, lastModified }
+ */
+const versionTag = (specs) => {
+    let lastModified = startedAt;
+    const parts = specs.map((spec) => {
+        const [model, scope] = Array.isArray(spec) ? spec : [spec];
+        const global = versionOf(model);
+        const scoped = scope ? versionOf(keyOf(model, String(scope))) : null;
+        [global, scoped].forEach((version) => {
+            if (version && version.at > lastModified) lastModified = version.at;
+        });
+        return scoped ? `${global.seq}.${scoped.seq}` : `${global.seq}`;
+    });
+    return { tag: parts.join('-'), lastModified };
+};
+
+const etagFor = (body) => `W/"${crypto.createHash('sha1').update(body).digest('base64url')}"`;
+
+const getResponse = (key) => {
+    const entry = entries.get(key);
+    if (!entry || entry.expiresAt <= Date.now()) {
+        if (entry) entries.delete(key);
+        stats.misses += 1;
+        return null;
+    }
+    entries.delete(key);
+    entries.set(key, entry);
+    stats.hits += 1;
+    return entry;
+};
+
+const setResponse = (key, { body, etag }, ttlMs = TTL_MS) => {
+    entries.delete(key);
+    entries.set(key, { body, etag, expiresAt: Date.now() + ttlMs });
+    stats.stores += 1;
+    while (entries.size > MAX_ENTRIES) {
+        entries.delete(entries.keys().next().value);
+        stats.evictions += 1;
+    }
+};
+
+const clear = () => entries.clear();
+
+/**
+ * Hinglish: Schema par hooks - write hote hi model ka (scoped) version bump
+ * Sirf tab jab kuch sach mein badla ho, warna "mark read" jaise no-op writes har poll par
+ * cache tod dete. bulkWrite hooks bypass karta hai - uske callers bump khud bulaate hain.
+ * @param {mongoose.Schema} schema
+ * @param {String} model - Model name
+ * @param {Function} scopeOf - doc ya query filter => scope id (na mile to undefined)
+ */
+const attachVersionHooks = (schema, model, scopeOf) => {
+    const scopeFrom = (source) => {
+        const scope = source ? scopeOf(source) : null;
+        return scope && (typeof scope === 'string' || scope._bsontype === 'ObjectId') ? scope : null;
+    };
+    const bumpDoc = (doc) => {
+        if (doc) bump(model, scopeFrom(doc));
+    };
+    schema.post('save', bumpDoc);
+    schema.post('insertMany', (docs) => {
+        new Set((docs || []).map((doc) => String(scopeFrom(doc) || ''))).forEach((scope) => bump(model, scope || null));
+    });
+    schema.post(['findOneAndUpdate', 'findOneAndDelete'], bumpDoc);
+    schema.post('deleteOne', { document: true, query: false }, bumpDoc);
+    schema.post(['updateOne', 'updateMany', 'deleteOne', 'deleteMany'], { document: false, query: true }, function (result) {
+        const changed = result ? (result.modifiedCount || 0) + (result.upsertedCount || 0) + (result.deletedCount || 0) : 1;
+        if (changed === 0) return;
+        bump(model, scopeFrom(this.getFilter()));
+    });
+};
+
+/**
+ * Hinglish: Cross-node bus se jodo (socketManager init par) - null pass karo to detach
+ * @param {Object|null} nextBus
+ */
+const attachBus = (nextBus) => {
+    if (unsubscribe) unsubscribe();
+    unsubscribe = null;
+    bus = nextBus;
+    if (!bus) return;
+    unsubscribe = bus.subscribe(CHANNEL, (event) => {
+        if (event && event.k) applyBump(event.k);
+    });
+};
+
+const getStats = () => ({
+    ...stats,
+    size: entries.size,
+    versionKeys: versions.size,
+    ttlMs: TTL_MS,
+    maxEntries: MAX_ENTRIES,
+});
+
+module.exports = {
+    bump,
+    versionTag,
+    etagFor,
+    getResponse,
+    setResponse,
+    clear,
+    attachVersionHooks,
+    attachBus,
+    getStats,
+};
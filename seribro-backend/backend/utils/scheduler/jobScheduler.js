@@ -0,0 +1,299 @@
+// backend/utils/scheduler/jobScheduler.js
+// Hinglish: Distributed job scheduler - cron aur interval jobs cluster mein exactly-once chalane ke liye
+//
+// Har replica apne timers chalata hai, lekin run se pehle Mongo `joblocks`
+// collection mein job ka lease lena padta hai. Lease ke saath schedule slot bhi
+// likhte hain (`lastSlot`), isliye ek slot (e.g. aaj ki midnight, ya 5-minute
+// window) sirf ek replica par chalta hai. Lambe runs heartbeat se lease badhate
+// hain; crash hua process lease expire hone par chhod deta hai.
+//
+// Sharded jobs (e.g. applicationTimeout:shard-N) alag-alag leases hain, isliye
+// replicas badhane se kaam divide hota hai, duplicate nahi.
+
+const os = require('os');
+const crypto = require('crypto');
+const cron = require('node-cron');
+const JobLease = require('../../models/JobLease');
+
+const OWNER = `${os.hostname()}:${process.pid}:${crypto.randomBytes(3).toString('hex')}`;
+
+const DEFAULT_LEASE_MS = 5 * 60 * 1000;
+const DEFAULT_JITTER_MS = 5 * 1000;
+
+const jobs = new Map(); // name -> job state
+let started = false;
+
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+const newMetrics = () => ({
+  runs: 0,
+  failures: 0,
+  skippedLease: 0,
+  skippedOverlap: 0,
+  running: false,
+  lastStartedAt: null,
+  lastDurationMs: null,
+  lastItems: null,
+  lastLagMs: null,
+  lastError: null,
+});
+
+/**
+ * Hinglish: Job ka lease lo - slot pehle kisi ne chala liya ho ya lease kisi aur ke paas ho to false
+ */
+const acquireLease = async (job, slot, now) => {
+  try {
+    const lease = await JobLease.findOneAndUpdate(
+      {
+        _id: job.name,
+        lastSlot: { $ne: slot },
+        $or: [{ leaseUntil: null }, { leaseUntil: { $lt: now } }, { owner: OWNER }],
+      },
+      {
+        $set: {
+          owner: OWNER,
+          leaseUntil: new Date(now.getTime() + job.leaseMs),
+          lastSlot: slot,
+          runStartedAt: now,
+        },
+      },
+      { upsert: true, new: true }
+    );
+    return Boolean(lease);
+  } catch (error) {
+    // Upsert ka duplicate key = document hai par filter match nahi hua = lease/slot kisi aur ka
+    if (error.code === 11000) return false;
+    throw error;
+  }
+};
+
+const releaseLease = (job, lastRun) => JobLease.updateOne(
+  { _id: job.name, owner: OWNER },
+  {
+    $set: { leaseUntil: null, lastRun },
+    $inc: {
+      'totals.runs': 1,
+      'totals.failures': lastRun.success ? 0 : 1,
+      'totals.items': lastRun.items || 0,
+    },
+  }
+);
+
+/**
+ * Hinglish: Ek scheduled tick - jitter, overlap check, lease, run, metrics
+ * @param {Object} job
+ * @param {String} slot - Schedule slot id
+ * @param {Date} scheduledAt - Slot ka intended start time (lag ke liye)
+ */
+const tick = async (job, slot, scheduledAt) => {
+  const { metrics } = job;
+  if (metrics.running) {
+    // Pichla run abhi chal raha hai - overlap nahi
+    metrics.skippedOverlap += 1;
+    return;
+  }
+  metrics.running = true;
+
+  let heartbeat = null;
+  try {
+    // Jitter - saare replicas ek hi millisecond par lease ke liye na ladein
+    if (job.jitterMs > 0) {
+      await sleep(Math.floor(Math.random() * job.jitterMs));
+    }
+
+    const startedAt = new Date();
+    if (!(await acquireLease(job, slot, startedAt))) {
+      metrics.skippedLease += 1;
+      return;
+    }
+
+    // Lambe run mein lease expire na ho
+    heartbeat = setInterval(() => {
+      JobLease.updateOne(
+        { _id: job.name, owner: OWNER },
+        { $set: { leaseUntil: new Date(Date.now() + job.leaseMs) } }
+      ).catch((error) => console.error(`[Scheduler] Heartbeat failed for ${job.name}:`, error.message));
+    }, Math.max(1000, Math.floor(job.leaseMs / 3)));
+
+    let result;
+    let runError = null;
+    try {
+      result = await job.run();
+      if (result && result.success === false) {
+        runError = new Error(result.error || 'Job reported failure');
+      }
+    } catch (error) {
+      runError = error;
+    }
+
+    const finishedAt = new Date();
+    const lastRun = {
+      owner: OWNER,
+      slot,
+      scheduledAt,
+      startedAt,
+      finishedAt,
+      durationMs: finishedAt - startedAt,
+      lagMs: Math.max(0, startedAt - scheduledAt),
+      items: runError ? 0 : Number(job.items(result)) || 0,
+      success: !runError,
+      error: runError ? runError.message : null,
+    };
+
+    metrics.runs += 1;
+    metrics.lastStartedAt = startedAt;
+    metrics.lastDurationMs = lastRun.durationMs;
+    metrics.lastItems = lastRun.items;
+    metrics.lastLagMs = lastRun.lagMs;
+    metrics.lastError = lastRun.error;
+    if (runError) {
+      metrics.failures += 1;
+      console.error(`[Scheduler] ${job.name} failed:`, runError.message);
+    }
+
+    await releaseLease(job, lastRun);
+  } catch (error) {
+    metrics.failures += 1;
+    metrics.lastError = error.message;
+    console.error(`[Scheduler] ${job.name} tick error:`, error.message);
+  } finally {
+    if (heartbeat) clearInterval(heartbeat);
+    metrics.running = false;
+  }
+};
+
+const startJob = (job) => {
+  if (job.cron) {
+    job.task = cron.schedule(job.cron, (firedAt) => {
+      const at = firedAt instanceof Date ? firedAt : new Date();
+      // Cron slot = fire minute (saare replicas ke liye same)
+      const minute = Math.floor(at.getTime() / 60000);
+      tick(job, `cron:${minute}`, new Date(minute * 60000));
+    });
+  } else {
+    job.task = setInterval(() => {
+      const slotIndex = Math.floor(Date.now() / job.interval);
+      tick(job, `interval:${slotIndex}`, new Date(slotIndex * job.interval));
+    }, job.interval);
+  }
+};
+
+const stopJob = (job) => {
+  if (!job.task) return;
+  if (job.cron) {
+    job.task.stop();
+  } else {
+    clearInterval(job.task);
+  }
+  job.task = null;
+};
+
+/**
+ * Hinglish: Job register karo
+ * @param {Object} definition
+ * @param {String} definition.name - Cluster-wide unique naam (lease key)
+ * @param {String} [definition.cron] - node-cron expression
+ * @param {Number} [definition.interval] - ms (cron na ho to)
+ * @param {Function} definition.run - async () => result
+ * @param {Function} [definition.items] - result => processed items count
+ * @param {Number} [definition.leaseMs] - Lease duration (heartbeat se badhta hai)
+ * @param {Number} [definition.jitterMs] - Max random delay before acquiring
+ */
+const registerJob = (definition) => {
+  if (!definition.name || typeof definition.run !== 'function') {
+    throw new Error('Scheduler job needs a name and a run function');
+  }
+  if (!definition.cron && !definition.interval) {
+    throw new Error(`Scheduler job ${definition.name} needs a cron expression or an interval`);
+  }
+  if (definition.cron && !cron.validate(definition.cron)) {
+    throw new Error(`Invalid cron expression for ${definition.name}: ${definition.cron}`);
+  }
+
+  const existing = jobs.get(definition.name);
+  if (existing) stopJob(existing);
+
+  const job = {
+    name: definition.name,
+    cron: definition.cron || null,
+    interval: definition.interval || null,
+    run: definition.run,
+    items: definition.items || (() => 0),
+    leaseMs: definition.leaseMs || DEFAULT_LEASE_MS,
+    jitterMs: definition.jitterMs === undefined ? DEFAULT_JITTER_MS : definition.jitterMs,
+    metrics: existing ? existing.metrics : newMetrics(),
+    task: null,
+  };
+  jobs.set(job.name, job);
+  if (started) startJob(job);
+  return job;
+};
+
+const startScheduler = () => {
+  if (started) return;
+  started = true;
+  jobs.forEach(startJob);
+  console.log(`[Scheduler] Started ${jobs.size} job(s) as ${OWNER}`);
+};
+
+const stopScheduler = () => {
+  jobs.forEach(stopJob);
+  started = false;
+};
+
+/**
+ * Hinglish: Is process ke metrics + cluster-wide lease info (last run kisi bhi replica ka ho)
+ */
+const getJobMetrics = async () => {
+  const leases = await JobLease.find({ _id: { $in: [...jobs.keys()] } }).lean();
+  const leaseByName = new Map(leases.map((lease) => [lease._id, lease]));
+
+  return {
+    owner: OWNER,
+    jobs: [...jobs.values()].map((job) => {
+      const lease = leaseByName.get(job.name);
+      return {
+        name: job.name,
+        schedule: job.cron || `every ${job.interval}ms`,
+        local: { ...job.metrics },
+        cluster: lease ? {
+          owner: lease.owner,
+          leaseUntil: lease.leaseUntil,
+          lastRun: lease.lastRun || null,
+          totals: lease.totals || null,
+        } : null,
+      };
+    }),
+  };
+};
+
+/**
+ * Hinglish: Job ka resume cursor (lease document par) - batched jobs ise process memory ki jagah use karein
+ * @param {String} name - Job name (lease _id)
+ * @returns {Promise<*>} cursor ya null
+ */
+const getJobCursor = async (name) => {
+  const lease = await JobLease.findById(name).select('cursor').lean();
+  return lease && lease.cursor !== undefined ? lease.cursor : null;
+};
+
+/**
+ * Hinglish: Job ka resume cursor save karo (null = agla run shuru se)
+ * @param {String} name - Job name (lease _id)
+ * @param {*} cursor
+ */
+const setJobCursor = (name, cursor) => JobLease.updateOne(
+  { _id: name },
+  { $set: { cursor } },
+  { upsert: true }
+);
+
+module.exports = {
+  registerJob,
+  startScheduler,
+  stopScheduler,
+  getJobMetrics,
+  getJobCursor,
+  setJobCursor,
+  OWNER,
+};
@@ -0,0 +1,32 @@
+/**
+ * backend/utils/socket/bus/index.js
+ * Pick the cross-node message bus from the environment
+ *
+ * SOCKET_BUS=memory        (default) single node, nothing leaves the process
+ * SOCKET_BUS=local-broker  several processes on one machine via scripts/socketBroker.js
+ *                          (SOCKET_BROKER_HOST, SOCKET_BROKER_PORT - default 127.0.0.1:7071)
+ *
+ * A bus is { kind, publish(channel, message), subscribe(channel, handler) -> unsubscribe, close() }.
+ */
+
+const { createMemoryBus } = require('./memoryBus');
+const { createLocalBrokerBus } = require('./localBrokerBus');
+
+const DEFAULT_BROKER_PORT = 7071;
+
+function createBus(kind = process.env.SOCKET_BUS || 'memory') {
+  switch (kind.toLowerCase()) {
+    case 'memory':
+      return createMemoryBus();
+    case 'local-broker':
+      return createLocalBrokerBus({
+        host: process.env.SOCKET_BROKER_HOST || '127.0.0.1',
+        port: parseInt(process.env.SOCKET_BROKER_PORT, 10) || DEFAULT_BROKER_PORT,
+      });
+    default:
+      console.warn(`[SocketBus] Unknown SOCKET_BUS "${kind}", falling back to memory`);
+      return createMemoryBus();
+  }
+}
+
+module.exports = { createBus, DEFAULT_BROKER_PORT };
@@ -0,0 +1,188 @@
+/**
+ * backend/utils/socket/bus/localBrokerBus.js
+ * TCP message bus for several backend processes on one machine
+ *
+ * A tiny broker (startBroker, or `node scripts/socketBroker.js`) relays
+ * newline-delimited JSON frames `{ c: channel, m: message }` from each
+ * connected process to every other one. Backend processes connect with
+ * createLocalBrokerBus; frames published while the broker is unreachable are
+ * queued (bounded) and flushed on reconnect.
+ */
+
+const net = require('net');
+
+const MAX_QUEUE = 10000;
+const MAX_RETRY_MS = 5000;
+const MAX_PENDING_BYTES = 64 * 1024 * 1024; // slow clients are dropped; they reconnect and resync via presence heartbeats
+
+/**
+ * Split a utf8 stream into lines, calling onLine for each complete one
+ */
+function lineReader(onLine) {
+  let buffer = '';
+  return (chunk) => {
+    buffer += chunk;
+    let index = buffer.indexOf('\n');
+    while (index !== -1) {
+      const line = buffer.slice(0, index);
+      buffer = buffer.slice(index + 1);
+      if (line) onLine(line);
+      index = buffer.indexOf('\n');
+    }
+  };
+}
+
+/**
+ * Connect to a local broker
+ * @param {Object} options
+ * @param {string} options.host
+ * @param {number} options.port
+ * @returns {Object} bus - { publish, subscribe, close }
+ */
+function createLocalBrokerBus({ host = '127.0.0.1', port }) {
+  const handlers = new Map(); // channel -> Set<handler>
+  let socket = null;
+  let connected = false;
+  let closed = false;
+  let queue = [];
+  let retryMs = 250;
+  let retryTimer = null;
+
+  const dispatch = (line) => {
+    let frame;
+    try {
+      frame = JSON.parse(line);
+    } catch (err) {
+      return;
+    }
+    const channelHandlers = handlers.get(frame.c);
+    if (!channelHandlers) return;
+    channelHandlers.forEach((handler) => {
+      try {
+        handler(frame.m);
+      } catch (err) {
+        console.error(`[SocketBus] Handler error on ${frame.c}:`, err.message);
+      }
+    });
+  };
+
+  const connect = () => {
+    retryTimer = null;
+    socket = net.createConnection({ host, port });
+    socket.setNoDelay(true);
+    socket.setEncoding('utf8');
+
+    socket.on('connect', () => {
+      connected = true;
+      retryMs = 250;
+      console.log(`[SocketBus] Connected to broker ${host}:${port}`);
+      if (queue.length > 0) {
+        socket.write(queue.join(''));
+        queue = [];
+      }
+    });
+    socket.on('data', lineReader(dispatch));
+    socket.on('error', (err) => {
+      if (connected) console.error('[SocketBus] Broker connection error:', err.message);
+    });
+    socket.on('close', () => {
+      const wasConnected = connected;
+      connected = false;
+      socket = null;
+      if (closed) return;
+      if (wasConnected) console.warn('[SocketBus] Broker connection lost, reconnecting...');
+      retryTimer = setTimeout(connect, retryMs);
+      retryMs = Math.min(retryMs * 2, MAX_RETRY_MS);
+    });
+  };
+
+  connect();
+
+  return {
+    kind: 'local-broker',
+
+    publish(channel, message) {
+      const line = `${JSON.stringify({ c: channel, m: message })}\n`;
+      if (connected) {
+        socket.write(line);
+        return;
+      }
+      queue.push(line);
+      if (queue.length > MAX_QUEUE) queue.shift();
+    },
+
+    subscribe(channel, handler) {
+      if (!handlers.has(channel)) handlers.set(channel, new Set());
+      handlers.get(channel).add(handler);
+      return () => {
+        const channelHandlers = handlers.get(channel);
+        if (channelHandlers) channelHandlers.delete(handler);
+      };
+    },
+
+    close() {
+      closed = true;
+      if (retryTimer) clearTimeout(retryTimer);
+      handlers.clear();
+      if (!socket) return Promise.resolve();
+      return new Promise((resolve) => {
+        socket.end(resolve);
+      });
+    },
+  };
+}
+
+/**
+ * Start a broker that relays every frame to all other connected processes
+ * @param {Object} options
+ * @param {string} options.host
+ * @param {number} options.port
+ * @returns {Promise<Object>} { server, clientCount, close }
+ */
+function startBroker({ host = '127.0.0.1', port }) {
+  const clients = new Set();
+
+  const server = net.createServer((conn) => {
+    conn.setNoDelay(true);
+    conn.setEncoding('utf8');
+    clients.add(conn);
+
+    let pending = '';
+    const reader = lineReader((line) => {
+      pending += `${line}\n`;
+    });
+    conn.on('data', (chunk) => {
+      reader(chunk);
+      if (!pending) return;
+      const frames = pending;
+      pending = '';
+      clients.forEach((other) => {
+        if (other === conn || other.destroyed) return;
+        if (other.writableLength > MAX_PENDING_BYTES) {
+          console.warn('[SocketBroker] Dropping slow client');
+          other.destroy();
+          return;
+        }
+        other.write(frames);
+      });
+    });
+    conn.on('close', () => clients.delete(conn));
+    conn.on('error', () => clients.delete(conn));
+  });
+
+  return new Promise((resolve, reject) => {
+    server.once('error', reject);
+    server.listen(port, host, () => {
+      resolve({
+        server,
+        clientCount: () => clients.size,
+        close: () => new Promise((done) => {
+          clients.forEach((conn) => conn.destroy());
+          server.close(() => done());
+        }),
+      });
+    });
+  });
+}
+
+module.exports = { createLocalBrokerBus, startBroker };
@@ -0,0 +1,58 @@
+/**
+ * backend/utils/socket/bus/memoryBus.js
+ * In-process message bus (single node)
+ *
+ * Every bus instance acts as one "node". Messages reach the subscribers of
+ * other instances in the same process (never the publisher's own), so a
+ * single-node deployment pays nothing, and several nodes can be simulated
+ * inside one process. Messages are JSON-copied and delivered on the next tick
+ * to behave like a real wire.
+ */
+
+const hub = new Map(); // channel -> Set<{ busId, handler }>
+let nextBusId = 1;
+
+function createMemoryBus() {
+  const busId = nextBusId++;
+  const subscriptions = new Set(); // [channel, listener]
+
+  return {
+    kind: 'memory',
+
+    publish(channel, message) {
+      const listeners = hub.get(channel);
+      if (!listeners) return;
+      let wire = null;
+      listeners.forEach((listener) => {
+        if (listener.busId === busId) return;
+        if (wire === null) wire = JSON.stringify(message);
+        const copy = JSON.parse(wire);
+        setImmediate(() => listener.handler(copy));
+      });
+    },
+
+    subscribe(channel, handler) {
+      const listener = { busId, handler };
+      if (!hub.has(channel)) hub.set(channel, new Set());
+      hub.get(channel).add(listener);
+      const subscription = [channel, listener];
+      subscriptions.add(subscription);
+      return () => {
+        const listeners = hub.get(channel);
+        if (listeners) listeners.delete(listener);
+        subscriptions.delete(subscription);
+      };
+    },
+
+    close() {
+      subscriptions.forEach(([channel, listener]) => {
+        const listeners = hub.get(channel);
+        if (listeners) listeners.delete(listener);
+      });
+      subscriptions.clear();
+      return Promise.resolve();
+    },
+  };
+}
+
+module.exports = { createMemoryBus };
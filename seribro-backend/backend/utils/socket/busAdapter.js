@@ -0,0 +1,60 @@
+/**
+ * backend/utils/socket/busAdapter.js
+ * Socket.io adapter that broadcasts across nodes over a pluggable bus
+ *
+ * Built on socket.io-adapter's ClusterAdapterWithHeartbeat, which already
+ * implements room broadcasts, acks, fetchSockets/serverSideEmit and node
+ * liveness on top of two primitives. This file only maps those primitives
+ * onto a bus (see ./bus): every `io.to(room).emit(...)` on any node reaches
+ * the matching sockets on all nodes.
+ */
+
+const { ClusterAdapterWithHeartbeat } = require('socket.io-adapter');
+
+const CHANNEL = 'socket.io';
+
+/**
+ * Create an adapter class bound to a bus (pass to `new Server(..., { adapter })`)
+ * @param {Object} bus - { publish, subscribe }
+ * @param {Object} [options]
+ * @param {number} [options.heartbeatInterval] - ms between node heartbeats
+ * @param {number} [options.heartbeatTimeout] - ms before a silent node is considered gone
+ * @returns {Function} Adapter constructor
+ */
+function createBusAdapter(bus, options = {}) {
+  const adapterOptions = {
+    heartbeatInterval: options.heartbeatInterval || 5000,
+    heartbeatTimeout: options.heartbeatTimeout || 10000,
+  };
+
+  return class BusAdapter extends ClusterAdapterWithHeartbeat {
+    constructor(nsp) {
+      super(nsp, adapterOptions);
+      this.unsubscribe = bus.subscribe(CHANNEL, (frame) => {
+        if (!frame || frame.nsp !== this.nsp.name) return;
+        if (frame.kind === 'response') {
+          if (frame.to === this.uid) this.onResponse(frame.payload);
+          return;
+        }
+        this.onMessage(frame.payload);
+      });
+    }
+
+    doPublish(message) {
+      bus.publish(CHANNEL, { kind: 'message', nsp: this.nsp.name, payload: message });
+      return Promise.resolve();
+    }
+
+    doPublishResponse(requesterUid, response) {
+      bus.publish(CHANNEL, { kind: 'response', nsp: this.nsp.name, to: requesterUid, payload: response });
+      return Promise.resolve();
+    }
+
+    close() {
+      this.unsubscribe();
+      return super.close();
+    }
+  };
+}
+
+module.exports = { createBusAdapter };
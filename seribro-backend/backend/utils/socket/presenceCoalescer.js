@@ -0,0 +1,195 @@
+/**
+ * backend/utils/socket/presenceCoalescer.js
+ * Server-side coalescing for typing indicators and presence events
+ *
+ * Busy workspaces used to rebroadcast every keystroke-level typing event and
+ * every join/leave as its own frame. Instead, events are queued per room and
+ * flushed once per tick (PRESENCE_TICK_MS) as a single `presence_batch` frame:
+ * - typing_start for a user already shown as typing within TYPING_DEBOUNCE_MS is merged
+ * - a start+stop pair inside one tick cancels out; a stop for a user not shown typing is merged
+ * - repeated online/offline events for a user in one tick collapse to the latest
+ * - each socket is rate limited (token bucket, SOCKET_EVENT_RATE per second)
+ * Counters for received / merged / rate-limited / emitted events are exposed via stats().
+ */
+
+const TICK_MS = parseInt(process.env.PRESENCE_TICK_MS, 10) || 100;
+const TYPING_DEBOUNCE_MS = parseInt(process.env.TYPING_DEBOUNCE_MS, 10) || 2000;
+const TYPING_TTL_MS = 10000; // typing state with no update for this long is forgotten
+const RATE_PER_SEC = parseInt(process.env.SOCKET_EVENT_RATE, 10) || 10;
+const RATE_BURST = RATE_PER_SEC * 2;
+
+/**
+ * @param {Object} options
+ * @param {Function} options.emit - (roomId, frame, { local }) => void
+ */
+function createPresenceCoalescer({ emit }) {
+  const typing = new Map(); // roomId -> Map<userId, { visible, pending, lastShownAt, payload }>
+  const dirty = new Map(); // `${scope}|${roomId}` -> { roomId, local, users: Set, presence: Map<userId, event> }
+  const counters = {
+    received: 0,
+    merged: 0,
+    rateLimited: 0,
+    emittedEvents: 0,
+    frames: 0,
+  };
+  let timer = null;
+
+  const flush = () => {
+    timer = null;
+    const now = Date.now();
+    dirty.forEach(({ roomId, local, users, presence }) => {
+      const events = [];
+      const roomTyping = typing.get(roomId);
+      users.forEach((userId) => {
+        const state = roomTyping && roomTyping.get(userId);
+        if (!state || !state.pending) return;
+        if (state.pending === 'start') {
+          events.push({ type: 'typing_start', ...state.payload });
+          state.visible = true;
+          state.lastShownAt = now;
+          state.pending = null;
+        } else {
+          events.push({ type: 'typing_stop', userId });
+          roomTyping.delete(userId);
+        }
+      });
+      presence.forEach((event) => events.push(event));
+      if (roomTyping && roomTyping.size === 0) typing.delete(roomId);
+      if (events.length === 0) return;
+
+      counters.emittedEvents += events.length;
+      counters.frames += 1;
+      emit(roomId, { projectId: roomId.replace(/^project_/, ''), events, timestamp: new Date() }, { local });
+    });
+    dirty.clear();
+  };
+
+  const markDirty = (roomId, local = false) => {
+    const key = `${local ? 'local' : 'cluster'}|${roomId}`;
+    if (!dirty.has(key)) dirty.set(key, { roomId, local, users: new Set(), presence: new Map() });
+    if (!timer) {
+      timer = setTimeout(flush, TICK_MS);
+      if (timer.unref) timer.unref();
+    }
+    return dirty.get(key);
+  };
+
+  const typingState = (roomId, userId) => {
+    if (!typing.has(roomId)) typing.set(roomId, new Map());
+    const roomTyping = typing.get(roomId);
+    if (!roomTyping.has(userId)) {
+      roomTyping.set(userId, { visible: false, pending: null, lastShownAt: 0, payload: null });
+    }
+    return roomTyping.get(userId);
+  };
+
+  // Forget typing states whose stop never arrived (client crashed mid-typing)
+  const sweep = setInterval(() => {
+    const cutoff = Date.now() - TYPING_TTL_MS;
+    typing.forEach((roomTyping, roomId) => {
+      roomTyping.forEach((state, userId) => {
+        if (!state.pending && state.lastShownAt < cutoff) roomTyping.delete(userId);
+      });
+      if (roomTyping.size === 0) typing.delete(roomId);
+    });
+  }, TYPING_TTL_MS);
+  if (sweep.unref) sweep.unref();
+
+  return {
+    /**
+     * Token bucket per socket (state kept on socket.data)
+     * @param {Socket} socket
+     * @returns {boolean} - False when the event should be dropped
+     */
+    allow(socket) {
+      counters.received += 1;
+      const now = Date.now();
+      const bucket = socket.data.eventBucket || { tokens: RATE_BURST, at: now };
+      bucket.tokens = Math.min(RATE_BURST, bucket.tokens + ((now - bucket.at) / 1000) * RATE_PER_SEC);
+      bucket.at = now;
+      socket.data.eventBucket = bucket;
+      if (bucket.tokens < 1) {
+        counters.rateLimited += 1;
+        return false;
+      }
+      bucket.tokens -= 1;
+      return true;
+    },
+
+    typingStart(roomId, userId, payload) {
+      const user = String(userId);
+      const state = typingState(roomId, user);
+      state.payload = { ...payload, userId: user };
+      if (state.pending === 'start') {
+        counters.merged += 1;
+        return;
+      }
+      const recentlyShown = state.visible && Date.now() - state.lastShownAt < TYPING_DEBOUNCE_MS;
+      if (state.pending === 'stop') {
+        // stop + start inside one tick: keep showing, re-announce only if the debounce ran out
+        counters.merged += 1;
+        state.pending = recentlyShown ? null : 'start';
+        return;
+      }
+      if (recentlyShown) {
+        counters.merged += 1;
+        return;
+      }
+      state.pending = 'start';
+      markDirty(roomId).users.add(user);
+    },
+
+    typingStop(roomId, userId) {
+      const user = String(userId);
+      const roomTyping = typing.get(roomId);
+      const state = roomTyping && roomTyping.get(user);
+      if (!state || state.pending === 'stop') {
+        counters.merged += 1;
+        return;
+      }
+      if (!state.visible) {
+        // start + stop inside one tick: nobody needs to see either
+        counters.merged += 2;
+        roomTyping.delete(user);
+        return;
+      }
+      state.pending = 'stop';
+      markDirty(roomId).users.add(user);
+    },
+
+    /**
+     * Queue user_online / user_offline for a room
+     * @param {string} roomId
+     * @param {Object} event - { type, userId, isOnline }
+     * @param {Object} [options]
+     * @param {boolean} [options.local] - Emit to this node's sockets only
+     */
+    presence(roomId, event, { local = false } = {}) {
+      const user = String(event.userId);
+      const entry = markDirty(roomId, local);
+      if (entry.presence.has(user)) counters.merged += 1;
+      entry.presence.set(user, { ...event, userId: user, timestamp: new Date() });
+
+      // Offline user is no longer typing anywhere in this room
+      if (event.type === 'user_offline') {
+        const roomTyping = typing.get(roomId);
+        if (roomTyping) roomTyping.delete(user);
+        entry.users.delete(user);
+      }
+    },
+
+    flush,
+
+    stats() {
+      return { ...counters, tickMs: TICK_MS, typingRooms: typing.size, pendingRooms: dirty.size };
+    },
+
+    close() {
+      if (timer) clearTimeout(timer);
+      clearInterval(sweep);
+      flush();
+    },
+  };
+}
+
+module.exports = { createPresenceCoalescer };
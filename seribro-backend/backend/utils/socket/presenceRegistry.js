@@ -0,0 +1,214 @@
+/**
+ * backend/utils/socket/presenceRegistry.js
+ * Cluster-wide workspace presence with heartbeat expiry
+ *
+ * Each node owns the sockets connected to it and replicates a view of every
+ * other node's sockets over the bus:
+ * - join / leave frames apply deltas as they happen
+ * - every node re-announces its full socket list on a heartbeat
+ * - a node that misses heartbeats for PRESENCE_TTL is dropped, and the users
+ *   that thereby went offline are reported through onExpire
+ * A (userId, projectId) pair is online while any socket on any node has it.
+ */
+
+const CHANNEL = 'presence';
+const HEARTBEAT_MS = parseInt(process.env.PRESENCE_HEARTBEAT_MS, 10) || 10000;
+const TTL_MS = HEARTBEAT_MS * 3;
+
+/**
+ * @param {Object} options
+ * @param {Object} options.bus - Cross-node bus
+ * @param {string} options.nodeId - This node's id
+ * @param {Function} [options.onExpire] - ([{ userId, projectId }]) => void, for users lost with a dead node
+ */
+function createPresenceRegistry({ bus, nodeId, onExpire = () => {} }) {
+  const nodes = new Map(); // nodeId -> { expiresAt, sockets: Map<socketId, { userId, projectIds: Set }> }
+  const online = new Map(); // projectId -> Map<userId, socket count>
+
+  const nodeFor = (id) => {
+    if (!nodes.has(id)) nodes.set(id, { expiresAt: Date.now() + TTL_MS, sockets: new Map() });
+    return nodes.get(id);
+  };
+  const localNode = nodeFor(nodeId);
+  localNode.expiresAt = Infinity;
+
+  // ---- index maintenance ----
+
+  const addRef = (userId, projectId) => {
+    if (!online.has(projectId)) online.set(projectId, new Map());
+    const users = online.get(projectId);
+    const count = users.get(userId) || 0;
+    users.set(userId, count + 1);
+    return count === 0;
+  };
+
+  const releaseRef = (userId, projectId) => {
+    const users = online.get(projectId);
+    if (!users || !users.has(userId)) return false;
+    const count = users.get(userId) - 1;
+    if (count > 0) {
+      users.set(userId, count);
+      return false;
+    }
+    users.delete(userId);
+    if (users.size === 0) online.delete(projectId);
+    return true;
+  };
+
+  const addToNode = (node, socketId, userId, projectId) => {
+    if (!node.sockets.has(socketId)) node.sockets.set(socketId, { userId, projectIds: new Set() });
+    const entry = node.sockets.get(socketId);
+    if (entry.projectIds.has(projectId)) return false;
+    entry.projectIds.add(projectId);
+    return addRef(entry.userId, projectId);
+  };
+
+  const removeFromNode = (node, socketId) => {
+    const entry = node.sockets.get(socketId);
+    if (!entry) return [];
+    node.sockets.delete(socketId);
+    const wentOffline = [];
+    entry.projectIds.forEach((projectId) => {
+      if (releaseRef(entry.userId, projectId)) wentOffline.push({ userId: entry.userId, projectId });
+    });
+    return wentOffline;
+  };
+
+  const dropNode = (id) => {
+    const node = nodes.get(id);
+    if (!node) return [];
+    const wentOffline = [...node.sockets.keys()].flatMap((socketId) => removeFromNode(node, socketId));
+    nodes.delete(id);
+    return wentOffline;
+  };
+
+  /**
+   * Replace a remote node's sockets with its heartbeat snapshot
+   * @returns {Array} pairs that went offline (were present before, not after)
+   */
+  const replaceNode = (id, sockets) => {
+    const node = nodeFor(id);
+    const before = new Set();
+    node.sockets.forEach((entry) => entry.projectIds.forEach((projectId) => before.add(`${entry.userId}|${projectId}`)));
+
+    const previous = [...node.sockets.keys()];
+    previous.forEach((socketId) => removeFromNode(node, socketId));
+    sockets.forEach(([socketId, userId, projectIds]) => {
+      projectIds.forEach((projectId) => addToNode(node, socketId, userId, projectId));
+    });
+    node.expiresAt = Date.now() + TTL_MS;
+
+    const wentOffline = [];
+    before.forEach((pair) => {
+      const [userId, projectId] = pair.split('|');
+      const users = online.get(projectId);
+      if (!users || !users.has(userId)) wentOffline.push({ userId, projectId });
+    });
+    return wentOffline;
+  };
+
+  const snapshot = () => [...localNode.sockets.entries()]
+    .map(([socketId, entry]) => [socketId, entry.userId, [...entry.projectIds]]);
+
+  const publish = (frame) => bus.publish(CHANNEL, { ...frame, n: nodeId });
+
+  // ---- bus ----
+
+  const unsubscribe = bus.subscribe(CHANNEL, (frame) => {
+    if (!frame || frame.n === nodeId) return;
+    switch (frame.t) {
+      case 'join':
+        addToNode(nodeFor(frame.n), frame.s, frame.u, frame.p);
+        break;
+      case 'leave':
+        // Owning node already broadcast user_offline through the adapter
+        removeFromNode(nodeFor(frame.n), frame.s);
+        break;
+      case 'hb': {
+        const wentOffline = replaceNode(frame.n, frame.sockets || []);
+        if (wentOffline.length > 0) onExpire(wentOffline);
+        break;
+      }
+      case 'hello':
+        // New node - send our snapshot right away instead of waiting for the next beat
+        publish({ t: 'hb', sockets: snapshot() });
+        break;
+      case 'bye': {
+        const wentOffline = dropNode(frame.n);
+        if (wentOffline.length > 0) onExpire(wentOffline);
+        break;
+      }
+      default:
+        break;
+    }
+  });
+
+  const heartbeat = setInterval(() => {
+    publish({ t: 'hb', sockets: snapshot() });
+    const now = Date.now();
+    const wentOffline = [];
+    nodes.forEach((node, id) => {
+      if (id !== nodeId && node.expiresAt < now) wentOffline.push(...dropNode(id));
+    });
+    if (wentOffline.length > 0) onExpire(wentOffline);
+  }, HEARTBEAT_MS);
+  if (heartbeat.unref) heartbeat.unref();
+
+  publish({ t: 'hello' });
+
+  return {
+    nodeId,
+
+    /**
+     * Register a local socket in a project room
+     * @returns {boolean} - True when the user just came online in that project (cluster-wide)
+     */
+    join(socketId, userId, projectId) {
+      const user = String(userId);
+      const project = String(projectId);
+      publish({ t: 'join', s: socketId, u: user, p: project });
+      return addToNode(localNode, socketId, user, project);
+    },
+
+    /**
+     * Remove a local socket
+     * @returns {Array} - [{ userId, projectId }] that went offline cluster-wide
+     */
+    leave(socketId) {
+      if (!localNode.sockets.has(socketId)) return [];
+      publish({ t: 'leave', s: socketId });
+      return removeFromNode(localNode, socketId);
+    },
+
+    getUser(socketId) {
+      const entry = localNode.sockets.get(socketId);
+      return entry ? entry.userId : null;
+    },
+
+    getOnlineUsers(projectId) {
+      const users = online.get(String(projectId));
+      return users ? [...users.keys()] : [];
+    },
+
+    isOnline(userId, projectId) {
+      const users = online.get(String(projectId));
+      return Boolean(users && users.has(String(userId)));
+    },
+
+    stats() {
+      let sockets = 0;
+      nodes.forEach((node) => {
+        sockets += node.sockets.size;
+      });
+      return { nodeId, nodes: nodes.size, sockets, localSockets: localNode.sockets.size, projects: online.size };
+    },
+
+    close() {
+      clearInterval(heartbeat);
+      publish({ t: 'bye' });
+      unsubscribe();
+    },
+  };
+}
+
+module.exports = { createPresenceRegistry };
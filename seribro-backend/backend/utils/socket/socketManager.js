@@ -4,17 +4,85 @@
  * 
  * Manages:
  * - Socket.io initialization with HTTP server
- * - User ↔ Socket mappings for online tracking
+ * - Cross-node broadcasts through a bus-backed adapter (SOCKET_BUS=memory|local-broker)
+ * - Cluster-wide workspace presence (see presenceRegistry.js)
  * - Room management (project workspaces)
  * - Connection/disconnect event handlers
- * - Typing indicators and presence events
+ * - Typing indicators and presence events, coalesced into per-room `presence_batch` frames
+ * - Per-user notification rooms (user_<userId>) for realtime notification push
  */
 
+const crypto = require('crypto');
+const os = require('os');
 const socketIO = require('socket.io');
+const jwt = require('jsonwebtoken');
+const { createBus } = require('./bus');
+const { createBusAdapter } = require('./busAdapter');
+const { createPresenceRegistry } = require('./presenceRegistry');
+const { createPresenceCoalescer } = require('./presenceCoalescer');
+const recentMessages = require('../workspace/recentMessages');
+const responseCache = require('../responseCache');
+const principalCache = require('../principalCache');
+const applicationStatsCache = require('../company/applicationStatsCache');
 
 let io = null;
-const socketToUserMap = new Map(); // Maps socket.id -> { userId, projectIds: Set }
-const userToSocketMap = new Map();  // Maps userId -> { socketId, projectIds: Set }
+let bus = null;
+let presence = null;
+let coalescer = null;
+
+/**
+ * Tell local sockets that users went offline
+ * Used for presence lost with a dead node - every surviving node sees the same
+ * expiry, so each one emits only to its own sockets (io.local) to avoid duplicates.
+ * @param {Array<{userId, projectId}>} transitions
+ */
+function emitExpired(transitions) {
+  if (!coalescer) return;
+  transitions.forEach(({ userId, projectId }) => {
+    coalescer.presence(`project_${projectId}`, { type: 'user_offline', userId, isOnline: false }, { local: true });
+  });
+}
+
+/**
+ * Read the JWT a socket connected with: handshake auth token, Bearer header, or the httpOnly `jwt` cookie
+ * @param {Socket} socket
+ * @param {string} [token] - Token sent explicitly with join_notifications
+ * @returns {string|null}
+ */
+function socketToken(socket, token) {
+  if (token) return token;
+  const { auth = {}, headers = {} } = socket.handshake;
+  if (auth.token) return auth.token;
+  if (headers.authorization && headers.authorization.startsWith('Bearer')) {
+    return headers.authorization.split(' ')[1];
+  }
+  const cookie = (headers.cookie || '')
+    .split(';')
+    .map((part) => part.trim())
+    .find((part) => part.startsWith('jwt='));
+  return cookie ? decodeURIComponent(cookie.slice(4)) : null;
+}
+
+/**
+ * Verify the socket's JWT and join its personal notification room.
+ * The room is derived from the token, never from client-supplied ids.
+ * @param {Socket} socket
+ * @param {string} [token]
+ * @returns {string|null} - Joined userId, or null when the token is missing/invalid
+ */
+function joinNotificationRoom(socket, token) {
+  const raw = socketToken(socket, token);
+  if (!raw) return null;
+  try {
+    const decoded = jwt.verify(raw, process.env.JWT_SECRET);
+    const userId = String(decoded.userId);
+    socket.join(`user_${userId}`);
+    socket.data.notificationUserId = userId;
+    return userId;
+  } catch (err) {
+    return null;
+  }
+}
 
 /**
  * Initialize Socket.io with Express HTTP server
@@ -23,7 +91,25 @@ const userToSocketMap = new Map();  // Maps userId -> { socketId, projectIds: Se
  * @returns {SocketIO.Server} - Initialized Socket.io instance
  */
 function initializeSocketIO(httpServer, allowedOrigins = []) {
+  bus = createBus();
+  presence = createPresenceRegistry({
+    bus,
+    nodeId: `${os.hostname()}:${process.pid}:${crypto.randomBytes(3).toString('hex')}`,
+    onExpire: emitExpired,
+  });
+  recentMessages.attachBus(bus);
+  responseCache.attachBus(bus);
+  principalCache.attachBus(bus);
+  applicationStatsCache.attachBus(bus);
+  coalescer = createPresenceCoalescer({
+    emit: (roomId, frame, { local }) => {
+      if (!io) return;
+      (local ? io.local : io).to(roomId).emit('presence_batch', frame);
+    },
+  });
+
   io = socketIO(httpServer, {
+    adapter: createBusAdapter(bus),
     cors: {
       origin: allowedOrigins.length > 0 ? allowedOrigins : true,
       methods: ['GET', 'POST'],
@@ -39,9 +125,24 @@ function initializeSocketIO(httpServer, allowedOrigins = []) {
   io.on('connection', (socket) => {
     console.log(`[Socket.io] User connected: ${socket.id}`);
 
+    // Auto-join the notification room when the handshake already carries a valid token
+    joinNotificationRoom(socket);
+
+    // Explicit join (e.g. token stored in localStorage, or socket opened before login)
+    socket.on('join_notifications', (data = {}, ack) => {
+      const userId = joinNotificationRoom(socket, data && data.token);
+      if (!userId) {
+        console.warn(`[Socket.io] join_notifications: invalid or missing token on ${socket.id}`);
+      }
+      if (typeof ack === 'function') {
+        ack({ success: Boolean(userId) });
+      }
+    });
+
     // Join workspace event: user joins project room
     socket.on('join_workspace', (data) => {
       try {
+        if (!coalescer.allow(socket)) return;
         const { projectId, userId } = data;
         if (!projectId || !userId) {
           console.warn('[Socket.io] join_workspace: Missing projectId or userId');
@@ -50,44 +151,42 @@ function initializeSocketIO(httpServer, allowedOrigins = []) {
 
         const roomId = `project_${projectId}`;
 
-        // Track socket -> user mapping
-        if (!socketToUserMap.has(socket.id)) {
-          socketToUserMap.set(socket.id, { userId, projectIds: new Set() });
-        }
-        const socketData = socketToUserMap.get(socket.id);
-        socketData.projectIds.add(projectId);
-
-        // Track user -> socket mapping
-        if (!userToSocketMap.has(userId)) {
-          userToSocketMap.set(userId, { socketId: socket.id, projectIds: new Set() });
-        }
-        const userData = userToSocketMap.get(userId);
-        userData.projectIds.add(projectId);
-
         // Join the room
         socket.join(roomId);
         console.log(`[Socket.io] User ${userId} joined room ${roomId}`);
 
-        // Broadcast user online status to room
-        io.to(roomId).emit('user_online', {
-          userId,
+        // Broadcast to every node only when the user just came online in this project
+        if (presence.join(socket.id, userId, projectId)) {
+          coalescer.presence(roomId, { type: 'user_online', userId, isOnline: true });
+        }
+
+        // Newcomer gets everyone already online (on any node) as one frame
+        socket.emit('presence_batch', {
+          projectId: String(projectId),
+          events: presence.getOnlineUsers(projectId).map((onlineUserId) => ({
+            type: 'user_online',
+            userId: onlineUserId,
+            isOnline: true,
+            timestamp: new Date(),
+          })),
           timestamp: new Date(),
-          isOnline: true,
         });
       } catch (err) {
         console.error('[Socket.io] Error in join_workspace:', err.message);
       }
     });
 
-    // Typing start event
+    // Typing start event (debounced per room, flushed with the next presence_batch)
     socket.on('typing_start', (data) => {
       try {
-        const { projectId, userId, senderName, senderRole } = data;
+        if (!coalescer.allow(socket)) return;
+        const { projectId, senderName, senderRole } = data || {};
         if (!projectId) return;
 
         const roomId = `project_${projectId}`;
-        socket.to(roomId).emit('typing_start', {
-          userId,
+        const userId = presence.getUser(socket.id) || data.userId;
+        if (!userId || !socket.rooms.has(roomId)) return;
+        coalescer.typingStart(roomId, userId, {
           senderName,
           senderRole,
           timestamp: new Date(),
@@ -100,14 +199,14 @@ function initializeSocketIO(httpServer, allowedOrigins = []) {
     // Typing stop event
     socket.on('typing_stop', (data) => {
       try {
-        const { projectId, userId } = data;
+        if (!coalescer.allow(socket)) return;
+        const { projectId } = data || {};
         if (!projectId) return;
 
         const roomId = `project_${projectId}`;
-        socket.to(roomId).emit('typing_stop', {
-          userId,
-          timestamp: new Date(),
-        });
+        const userId = presence.getUser(socket.id) || data.userId;
+        if (!userId || !socket.rooms.has(roomId)) return;
+        coalescer.typingStop(roomId, userId);
       } catch (err) {
         console.error('[Socket.io] Error in typing_stop:', err.message);
       }
@@ -118,28 +217,12 @@ function initializeSocketIO(httpServer, allowedOrigins = []) {
       try {
         console.log(`[Socket.io] User disconnected: ${socket.id}`);
 
-        const socketData = socketToUserMap.get(socket.id);
-        if (socketData) {
-          const { userId, projectIds } = socketData;
-
-          // Broadcast offline status to all rooms this user was in
-          projectIds.forEach((projectId) => {
-            const roomId = `project_${projectId}`;
-            io.to(roomId).emit('user_offline', {
-              userId,
-              timestamp: new Date(),
-              isOnline: false,
-            });
-          });
-
-          // Clean up user mappings
-          userToSocketMap.delete(userId);
-          socketToUserMap.delete(socket.id);
-        }
+        // Offline only when this was the user's last socket in the project cluster-wide
+        presence.leave(socket.id).forEach(({ userId, projectId }) => {
+          coalescer.presence(`project_${projectId}`, { type: 'user_offline', userId, isOnline: false });
+        });
       } catch (err) {
         console.error('[Socket.io] Error in disconnect handler:', err.message);
-        // Still attempt cleanup even if error occurs
-        socketToUserMap.delete(socket.id);
       }
     });
 
@@ -149,7 +232,7 @@ function initializeSocketIO(httpServer, allowedOrigins = []) {
     });
   });
 
-  console.log('[Socket.io] Initialized successfully');
+  console.log(`[Socket.io] Initialized successfully (bus: ${bus.kind}, node: ${presence.nodeId})`);
   return io;
 }
 
@@ -170,6 +253,9 @@ function getIO() {
  * @param {Object} messageData - The message object
  */
 function emitNewMessage(projectId, messageData) {
+  // Workspace ring buffer (this node + peers via the bus) - next workspace load skips Mongo
+  recentMessages.pushMessage(projectId, messageData);
+
   if (!io) {
     console.warn('[Socket.io] Not initialized. Message will not be broadcast via Socket.io.');
     return;
@@ -179,19 +265,26 @@ function emitNewMessage(projectId, messageData) {
   io.to(roomId).emit('new_message', messageData);
 }
 
+/**
+ * Push an event to every socket of a user (their notification room)
+ * @param {string} userId - The user ID
+ * @param {string} event - Event name
+ * @param {Object} payload - Event data
+ * @returns {boolean} - False when Socket.io is not initialized
+ */
+function emitToUser(userId, event, payload) {
+  if (!io || !userId) return false;
+  io.to(`user_${userId}`).emit(event, payload);
+  return true;
+}
+
 /**
  * Get online users in a workspace
  * @param {string} projectId - The project ID
  * @returns {Array<string>} - Array of online user IDs
  */
 function getOnlineUsersInWorkspace(projectId) {
-  const onlineUsers = [];
-  socketToUserMap.forEach(({ userId, projectIds }) => {
-    if (projectIds.has(projectId)) {
-      onlineUsers.push(userId);
-    }
-  });
-  return onlineUsers;
+  return presence ? presence.getOnlineUsers(projectId) : [];
 }
 
 /**
@@ -201,14 +294,46 @@ function getOnlineUsersInWorkspace(projectId) {
  * @returns {boolean} - True if user is online in the workspace
  */
 function isUserOnlineInWorkspace(userId, projectId) {
-  const userData = userToSocketMap.get(userId);
-  return userData ? userData.projectIds.has(projectId) : false;
+  return presence ? presence.isOnline(userId, projectId) : false;
+}
+
+/**
+ * Presence / bus stats for diagnostics
+ * @returns {Object|null}
+ */
+function getSocketStats() {
+  if (!presence) return null;
+  return { bus: bus.kind, ...presence.stats(), events: coalescer.stats() };
+}
+
+/**
+ * Leave the cluster cleanly on shutdown: announce departure so other nodes
+ * drop our presence at once instead of waiting for heartbeat expiry
+ * @returns {Promise<void>}
+ */
+async function closeSocketLayer() {
+  if (!io) return;
+  presence.close();
+  coalescer.close();
+  recentMessages.attachBus(null);
+  responseCache.attachBus(null);
+  principalCache.attachBus(null);
+  applicationStatsCache.attachBus(null);
+  await new Promise((resolve) => io.close(() => resolve()));
+  await bus.close();
+  io = null;
+  presence = null;
+  coalescer = null;
+  bus = null;
 }
 
 module.exports = {
   initializeSocketIO,
   getIO,
   emitNewMessage,
+  emitToUser,
   getOnlineUsersInWorkspace,
   isUserOnlineInWorkspace,
+  getSocketStats,
+  closeSocketLayer,
 };
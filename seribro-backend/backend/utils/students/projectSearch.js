@@ -0,0 +1,87 @@
+// backend/utils/students/projectSearch.js
+// Project browse search helpers - text index search + highlight snippets
+//
+// Browse search pehle `$regex` (case-insensitive, unanchored) use karta tha jo
+// har keystroke par poori collection scan karta hai. Ab default mode MongoDB
+// text index (Project: title/requiredSkills/description) use karta hai, jo
+// filters ke saath combine hota hai aur textScore se rank karta hai. $text sirf
+// poore (stemmed) words match karta hai, isliye text search kuch na de to browse
+// controller legacy regex par fallback karta hai (partial words: "reac", "node.j").
+
+const MAX_TERMS = 10;
+const SNIPPET_RADIUS = 80;
+
+/**
+ * Hinglish: Search string ko lowercase terms mein todo (highlight ke liye)
+ * @param {String} search - User ka search text
+ * @returns {Array} Unique terms (min 2 chars)
+ */
+exports.searchTerms = (search = '') => {
+    const terms = String(search)
+        .toLowerCase()
+        .split(/[^a-z0-9+#.]+/i)
+        .map((term) => term.replace(/^\.+|\.+$/g, ''))
+        .filter((term) => term.length >= 2);
+    return [...new Set(terms)].slice(0, MAX_TERMS);
+};
+
+/**
+ * Hinglish: Regex special characters escape karo (legacy regex mode ke liye)
+ */
+exports.escapeRegex = (text = '') => String(text).replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+
+/**
+ * Hinglish: Text mein terms ke match ranges dhundo
+ * @param {String} text - Title ya snippet
+ * @param {Array} terms - searchTerms ka result
+ * @returns {Array} [[start, end], ...] sorted, non-overlapping
+ */
+const findMatches = (text, terms) => {
+    if (!text || terms.length === 0) return [];
+    const pattern = new RegExp(terms.map(exports.escapeRegex).join('|'), 'gi');
+    const matches = [];
+    let match;
+    while ((match = pattern.exec(text)) !== null) {
+        matches.push([match.index, match.index + match[0].length]);
+        if (match[0].length === 0) pattern.lastIndex += 1;
+    }
+    return matches;
+};
+
+/**
+ * Hinglish: Highlight data banao - frontend ranges se <mark> render kar sakta hai
+ * (HTML yahan nahi banate, taki user content escape karna frontend ke haath mein rahe)
+ *
+ * @param {Object} project - Lean project document
+ * @param {Array} terms - searchTerms ka result
+ * @returns {Object} { title: [[s, e]], snippet, snippetMatches: [[s, e]] }
+ */
+exports.buildHighlight = (project, terms) => {
+    const description = project.description || '';
+    const descriptionMatches = findMatches(description, terms);
+
+    // Pehle match ke aas-paas ka window, warna description ki shuruaat
+    const anchor = descriptionMatches.length > 0 ? descriptionMatches[0][0] : 0;
+    let start = Math.max(0, anchor - SNIPPET_RADIUS);
+    let end = Math.min(description.length, anchor + SNIPPET_RADIUS);
+
+    // Word boundary par cut karo
+    if (start > 0) {
+        const space = description.indexOf(' ', start);
+        if (space !== -1 && space < anchor) start = space + 1;
+    }
+    if (end < description.length) {
+        const space = description.lastIndexOf(' ', end);
+        if (space > anchor) end = space;
+    }
+
+    const prefix = start > 0 ? '…' : '';
+    const suffix = end < description.length ? '…' : '';
+    const snippet = `${prefix}${description.slice(start, end)}${suffix}`;
+
+    return {
+        title: findMatches(project.title || '', terms),
+        snippet,
+        snippetMatches: findMatches(snippet, terms),
+    };
+};
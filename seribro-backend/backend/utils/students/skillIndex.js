@@ -0,0 +1,214 @@
+// backend/utils/students/skillIndex.js
+// Skill -> open projects inverted index - recommended projects ke liye
+//
+// Dashboard har visit par recommendations load karta hai. Pehle saare open
+// projects scan hote the; ab ek in-memory inverted index (skill -> projectIds)
+// rakhte hain jo Project ke save hooks se incrementally update hota hai.
+// Query sirf student ke skills ki posting lists padhti hai aur bounded min-heap
+// se top-K nikalti hai, isliye cost open projects ke count par depend nahi karti.
+
+const mongoose = require('mongoose');
+
+// Safety net: dusre process/instance ke writes ke liye periodic full rebuild
+const REBUILD_INTERVAL_MS = 10 * 60 * 1000;
+
+const normalize = (skill) => String(skill || '').trim().toLowerCase();
+
+const state = {
+    postings: new Map(), // skill -> Set<projectId>
+    projects: new Map(), // projectId -> { skills: Set, createdAt: Number }
+    builtAt: 0,
+    building: null,
+    stale: true,
+};
+
+const isIndexable = (project) =>
+    project &&
+    project.status === 'open' &&
+    !project.isDeleted &&
+    !project.assignedStudent &&
+    Array.isArray(project.requiredSkills) &&
+    project.requiredSkills.length > 0;
+
+const removeProject = (projectId) => {
+    const key = String(projectId);
+    const entry = state.projects.get(key);
+    if (!entry) return;
+    entry.skills.forEach((skill) => {
+        const posting = state.postings.get(skill);
+        if (!posting) return;
+        posting.delete(key);
+        if (posting.size === 0) state.postings.delete(skill);
+    });
+    state.projects.delete(key);
+};
+
+const addProject = (project) => {
+    const key = String(project._id);
+    const skills = new Set(project.requiredSkills.map(normalize).filter(Boolean));
+    state.projects.set(key, { skills, createdAt: new Date(project.createdAt || Date.now()).getTime() });
+    skills.forEach((skill) => {
+        if (!state.postings.has(skill)) state.postings.set(skill, new Set());
+        state.postings.get(skill).add(key);
+    });
+};
+
+/**
+ * Hinglish: Ek project ka index entry update karo (open hai to add, warna remove)
+ * @param {Object} project - Project document (save hook se)
+ */
+exports.upsertProject = (project) => {
+    if (!project || !project._id || state.stale) return; // Rebuild pending hai to wahi sab utha lega
+    // Partial select wale doc (requiredSkills/status load nahi hue) se decide nahi kar sakte
+    if (typeof project.isSelected === 'function' &&
+        (!project.isSelected('requiredSkills') || !project.isSelected('status'))) {
+        exports.markStale();
+        return;
+    }
+    removeProject(project._id);
+    if (isIndexable(project)) {
+        addProject(project);
+    }
+};
+
+exports.removeProject = removeProject;
+
+/**
+ * Hinglish: Index ko stale mark karo - agli query par rebuild hoga (updateMany jaise bulk writes ke baad)
+ */
+exports.markStale = () => {
+    state.stale = true;
+};
+
+const rebuild = async () => {
+    const Project = mongoose.model('Project');
+    state.postings = new Map();
+    state.projects = new Map();
+    state.stale = false;
+
+    const cursor = Project.find({ status: 'open', isDeleted: false, assignedStudent: null })
+        .select('requiredSkills createdAt status assignedStudent')
+        .lean()
+        .cursor();
+    for await (const project of cursor) {
+        if (isIndexable(project)) {
+            addProject(project);
+        }
+    }
+    state.builtAt = Date.now();
+};
+
+/**
+ * Hinglish: Index ready karo - pehli baar, stale hone par, ya interval ke baad rebuild
+ * Concurrent requests ek hi rebuild promise share karti hain.
+ */
+exports.ensureIndex = async () => {
+    const expired = Date.now() - state.builtAt > REBUILD_INTERVAL_MS;
+    if (!state.stale && !expired) return;
+    if (!state.building) {
+        state.building = rebuild()
+            .catch((error) => {
+                state.stale = true;
+                throw error;
+            })
+            .finally(() => {
+                state.building = null;
+            });
+    }
+    await state.building;
+};
+
+// Min-heap on [score, overlap, createdAt] - root sabse kamzor candidate
+const weaker = (a, b) =>
+    a.score !== b.score ? a.score < b.score
+        : a.overlap !== b.overlap ? a.overlap < b.overlap
+            : a.createdAt < b.createdAt;
+
+const siftUp = (heap, index) => {
+    while (index > 0) {
+        const parent = (index - 1) >> 1;
+        if (!weaker(heap[index], heap[parent])) break;
+        [heap[index], heap[parent]] = [heap[parent], heap[index]];
+        index = parent;
+    }
+};
+
+const siftDown = (heap, index) => {
+    for (;;) {
+        const left = 2 * index + 1;
+        const right = left + 1;
+        let smallest = index;
+        if (left < heap.length && weaker(heap[left], heap[smallest])) smallest = left;
+        if (right < heap.length && weaker(heap[right], heap[smallest])) smallest = right;
+        if (smallest === index) return;
+        [heap[index], heap[smallest]] = [heap[smallest], heap[index]];
+        index = smallest;
+    }
+};
+
+/**
+ * Hinglish: Student skills ke basis par top-K projects (index se)
+ * Score = matched required skills / total required skills (calculateSkillMatch jaisa)
+ *
+ * @param {Array} studentSkills - Technical skills + tech stack
+ * @param {Number} k - Kitne projects chahiye
+ * @returns {Promise<Array>} [{ projectId, skillMatch, matchedSkills }] best first
+ */
+exports.topProjectsForSkills = async (studentSkills = [], k = 6) => {
+    await exports.ensureIndex();
+
+    const skills = [...new Set(studentSkills.map(normalize).filter(Boolean))];
+    const overlap = new Map(); // projectId -> matched skills
+    skills.forEach((skill) => {
+        const posting = state.postings.get(skill);
+        if (!posting) return;
+        posting.forEach((projectId) => {
+            if (!overlap.has(projectId)) overlap.set(projectId, []);
+            overlap.get(projectId).push(skill);
+        });
+    });
+
+    const heap = [];
+    overlap.forEach((matched, projectId) => {
+        const entry = state.projects.get(projectId);
+        const candidate = {
+            projectId,
+            score: matched.length / entry.skills.size,
+            overlap: matched.length,
+            createdAt: entry.createdAt,
+            matched,
+        };
+        if (heap.length < k) {
+            heap.push(candidate);
+            siftUp(heap, heap.length - 1);
+        } else if (weaker(heap[0], candidate)) {
+            heap[0] = candidate;
+            siftDown(heap, 0);
+        }
+    });
+
+    return heap
+        .sort((a, b) => (weaker(a, b) ? 1 : -1))
+        .map((candidate) => ({
+            projectId: candidate.projectId,
+            skillMatch: Math.round(candidate.score * 100),
+            matchedSkills: candidate.matched,
+        }));
+};
+
+/**
+ * Hinglish: Project schema par hooks lagao taki index writes ke saath sync rahe
+ * @param {mongoose.Schema} schema - ProjectSchema (model compile hone se pehle)
+ */
+exports.attachHooks = (schema) => {
+    schema.post('save', (doc) => exports.upsertProject(doc));
+    schema.post('findOneAndUpdate', (doc) => {
+        if (doc) exports.markStale();
+    });
+    schema.post('updateOne', () => exports.markStale());
+    schema.post('updateMany', () => exports.markStale());
+    schema.post('findOneAndDelete', (doc) => {
+        if (doc) removeProject(doc._id);
+    });
+    schema.post('deleteOne', { document: true, query: false }, (doc) => removeProject(doc._id));
+};
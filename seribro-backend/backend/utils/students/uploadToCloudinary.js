@@ -7,12 +7,21 @@ const path = require('path');
 
 /**
  * Upload file to Cloudinary and delete local file
- * @param {string} filePath - Local file path
+ * Streaming storage (utils/uploads/streamingStorage) wali multer file pehle hi upload ho chuki hoti hai -
+ * uske liye dobara padhna / upload nahi, seedha stored result
+ * @param {string|object} filePath - Local file path, ya streamed multer file
  * @param {string} folder - Cloudinary folder name (e.g., 'resumes', 'certificates')
  * @param {string} userId - User ID for unique naming
  * @returns {Promise<object>} - { public_id, secure_url }
  */
 const uploadToCloudinary = async (filePath, folder, userId) => {
+    if (filePath && filePath.storage === 'stream') {
+        return {
+            public_id: filePath.publicId,
+            secure_url: filePath.url
+        };
+    }
+
     try {
         if (!fs.existsSync(filePath)) {
             throw new Error('File not found at provided path');
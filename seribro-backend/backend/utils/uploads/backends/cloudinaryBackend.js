@@ -0,0 +1,54 @@
+// backend/utils/uploads/backends/cloudinaryBackend.js
+// Hinglish: Cloudinary upload backend - multipart stream seedha upload_stream mein pipe
+
+const cloudinary = require('../../../config/cloudinary');
+
+const UPLOAD_TIMEOUT_MS = 60000;
+
+/**
+ * Hinglish: Cloudinary backend banao
+ * Backend = { kind, createUpload(target) -> { stream, result }, remove(stored) }
+ */
+const createCloudinaryBackend = () => ({
+    kind: 'cloudinary',
+
+    /**
+     * @param {Object} target - { folder, publicId, resourceType }
+     * @returns {Object} { stream: Writable, result: Promise<{ url, publicId, resourceType }> }
+     */
+    createUpload({ folder, publicId, resourceType }) {
+        let stream;
+        const result = new Promise((resolve, reject) => {
+            stream = cloudinary.uploader.upload_stream(
+                {
+                    folder: `seribro/${folder}`,
+                    public_id: publicId,
+                    resource_type: resourceType,
+                    timeout: UPLOAD_TIMEOUT_MS,
+                },
+                (error, uploaded) => {
+                    if (error) return reject(error);
+                    return resolve({
+                        url: uploaded.secure_url,
+                        publicId: uploaded.public_id,
+                        resourceType: uploaded.resource_type || resourceType,
+                    });
+                }
+            );
+        });
+        return { stream, result };
+    },
+
+    /**
+     * @param {Object} stored - { publicId, resourceType }
+     */
+    async remove({ publicId, resourceType }) {
+        if (!publicId) return;
+        await cloudinary.uploader.destroy(publicId, {
+            resource_type: resourceType === 'auto' ? 'image' : resourceType,
+            invalidate: true,
+        });
+    },
+});
+
+module.exports = { createCloudinaryBackend };
@@ -0,0 +1,39 @@
+// backend/utils/uploads/backends/index.js
+// Hinglish: Environment se upload backend chuno
+//
+// UPLOAD_BACKEND=cloudinary  (default) files seedha Cloudinary par stream hoti hain
+// UPLOAD_BACKEND=local       network ke bina - UPLOAD_LOCAL_DIR (default backend/uploads/streamed)
+//                            mein likhi jaati hain, url UPLOAD_LOCAL_BASE_URL (default /uploads/streamed)
+//
+// Backend = { kind, createUpload(target) -> { stream, result }, remove(stored) }
+
+const path = require('path');
+const { createCloudinaryBackend } = require('./cloudinaryBackend');
+const { createLocalBackend } = require('./localBackend');
+
+const DEFAULT_LOCAL_DIR = path.join(__dirname, '..', '..', '..', 'uploads', 'streamed');
+
+let defaultBackend = null;
+
+const createUploadBackend = (kind = process.env.UPLOAD_BACKEND || 'cloudinary') => {
+    switch (kind.toLowerCase()) {
+        case 'cloudinary':
+            return createCloudinaryBackend();
+        case 'local':
+            return createLocalBackend({
+                root: process.env.UPLOAD_LOCAL_DIR || DEFAULT_LOCAL_DIR,
+                baseUrl: process.env.UPLOAD_LOCAL_BASE_URL || '/uploads/streamed',
+            });
+        default:
+            console.warn(`[Uploads] Unknown UPLOAD_BACKEND "${kind}", falling back to cloudinary`);
+            return createCloudinaryBackend();
+    }
+};
+
+// Hinglish: Process bhar mein ek hi default backend
+const getUploadBackend = () => {
+    if (!defaultBackend) defaultBackend = createUploadBackend();
+    return defaultBackend;
+};
+
+module.exports = { createUploadBackend, getUploadBackend, createLocalBackend };
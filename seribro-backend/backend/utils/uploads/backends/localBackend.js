@@ -0,0 +1,67 @@
+// backend/utils/uploads/backends/localBackend.js
+// Hinglish: Local filesystem backend - tests / offline dev (UPLOAD_BACKEND=local) aur
+// un routes ke liye jinki file local hi rehni hai (signup verification documents)
+
+const fs = require('fs');
+const path = require('path');
+
+/**
+ * Hinglish: folder/publicId ko root ke andar resolve karo - `..` ya absolute path se
+ * root ke bahar jaane wala target reject (request params folder mein aa sakte hain)
+ */
+const resolveInside = (root, relative) => {
+    const base = path.resolve(root);
+    const filePath = path.resolve(base, ...relative.split('/'));
+    const inside = path.relative(base, filePath);
+    if (!inside || inside === '..' || inside.startsWith(`..${path.sep}`) || path.isAbsolute(inside)) {
+        const error = new Error('Upload path is outside the storage root');
+        error.code = 'INVALID_UPLOAD_PATH';
+        throw error;
+    }
+    return filePath;
+};
+
+/**
+ * Hinglish: Local backend banao
+ * @param {Object} options
+ * @param {String} options.root - Files is folder ke andar (folder/publicId) likhi jaati hain
+ * @param {String} options.baseUrl - Static serve path, url = `${baseUrl}/${relative}`
+ */
+const createLocalBackend = ({ root, baseUrl }) => ({
+    kind: 'local',
+
+    /**
+     * @param {Object} target - { folder, publicId, extension }
+     * @returns {Object} { stream: Writable, result: Promise<{ url, publicId, path }> }
+     * @throws INVALID_UPLOAD_PATH - target root ke bahar ho (kuch bhi likhne se pehle)
+     */
+    createUpload({ folder, publicId, extension = '' }) {
+        const relative = path.posix.join(folder || '', `${publicId}${extension}`);
+        const filePath = resolveInside(root, relative);
+        fs.mkdirSync(path.dirname(filePath), { recursive: true });
+
+        const stream = fs.createWriteStream(filePath);
+        const result = new Promise((resolve, reject) => {
+            let finished = false;
+            stream.on('finish', () => {
+                finished = true;
+                resolve({ url: `${baseUrl}/${relative}`, publicId: relative, path: filePath });
+            });
+            // Hinglish: Error ya beech mein destroy (size / type fail) - aadhi file mat chhodo
+            stream.on('close', () => {
+                if (!finished) fs.unlink(filePath, () => reject(new Error('Upload aborted')));
+            });
+        });
+        return { stream, result };
+    },
+
+    /**
+     * @param {Object} stored - { publicId }
+     */
+    async remove({ publicId }) {
+        if (!publicId) return;
+        await fs.promises.rm(resolveInside(root, publicId), { force: true });
+    },
+});
+
+module.exports = { createLocalBackend };
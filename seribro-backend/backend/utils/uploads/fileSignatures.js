@@ -0,0 +1,46 @@
+// backend/utils/uploads/fileSignatures.js
+// Hinglish: File ke pehle bytes (magic numbers) se type check - extension / MIME client bhejta hai,
+// content nahi jhooth bolta. Streaming storage pehle chunk par hi ye check karta hai.
+
+const ZIP = [[0x50, 0x4b, 0x03, 0x04], [0x50, 0x4b, 0x05, 0x06]];
+const OLE = [[0xd0, 0xcf, 0x11, 0xe0, 0xa1, 0xb1, 0x1a, 0xe1]];
+
+// Hinglish: Sirf binary formats - text files (.txt, .js, .md ...) ka koi fixed header nahi hota
+const SIGNATURES = {
+    '.jpg': [[0xff, 0xd8, 0xff]],
+    '.jpeg': [[0xff, 0xd8, 0xff]],
+    '.png': [[0x89, 0x50, 0x4e, 0x47, 0x0d, 0x0a, 0x1a, 0x0a]],
+    '.gif': [[0x47, 0x49, 0x46, 0x38]],
+    '.webp': [[0x52, 0x49, 0x46, 0x46]],
+    '.pdf': [[0x25, 0x50, 0x44, 0x46]],
+    '.zip': ZIP,
+    '.docx': ZIP,
+    '.xlsx': ZIP,
+    '.pptx': ZIP,
+    '.doc': OLE,
+    '.xls': OLE,
+    '.ppt': OLE,
+    '.rar': [[0x52, 0x61, 0x72, 0x21, 0x1a, 0x07]],
+    '.7z': [[0x37, 0x7a, 0xbc, 0xaf, 0x27, 0x1c]],
+    '.gz': [[0x1f, 0x8b]],
+    '.psd': [[0x38, 0x42, 0x50, 0x53]],
+};
+
+// Hinglish: Sabse lamba signature - itne bytes aa jaayein tab check karo
+const SNIFF_BYTES = 8;
+
+/**
+ * Hinglish: Header us extension ke kisi signature se match karta hai?
+ * @param {String} ext - '.pdf' jaisa lowercase extension
+ * @param {Buffer} head - File ke pehle bytes
+ * @returns {Boolean} - Unknown extension par true (check nahi hota)
+ */
+const matchesSignature = (ext, head) => {
+    const signatures = SIGNATURES[ext];
+    if (!signatures) return true;
+    return signatures.some((signature) => (
+        head.length >= signature.length && signature.every((byte, index) => head[index] === byte)
+    ));
+};
+
+module.exports = { SNIFF_BYTES, matchesSignature };
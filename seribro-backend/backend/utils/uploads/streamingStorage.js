@@ -0,0 +1,206 @@
+// backend/utils/uploads/streamingStorage.js
+// Hinglish: Multer ka streaming storage engine - multipart file stream seedha storage backend mein
+//
+// Pehle multer.diskStorage file ko backend/uploads mein likhta tha, upload util use dobara padhkar
+// Cloudinary bhejta tha aur phir unlink karta tha. Yahan file stream ek chhote inspector
+// Transform se hokar backend ke upload stream mein pipe hoti hai (backpressure ke saath,
+// memory bounded - poori file kabhi buffer nahi hoti). Inspector raaste mein hi:
+// - pehle bytes se content type check karta hai (magic numbers, extension ke against)
+// - size limit cross hote hi upload abort karta hai
+// - sha256 content hash banata hai
+// Fail hone par aadhi upload hata di jaati hai. Request 4xx/5xx par khatam ho to us request
+// ki streamed files bhi hat jaati hain (cleanupOnError), taki remote par orphan files na bachein.
+
+const crypto = require('crypto');
+const path = require('path');
+const { Transform } = require('stream');
+const multer = require('multer');
+const { SNIFF_BYTES, matchesSignature } = require('./fileSignatures');
+const { getUploadBackend } = require('./backends');
+
+const safeExtension = (originalname) => {
+    const ext = path.extname(originalname || '').toLowerCase();
+    return /^\.[a-z0-9]{1,10}$/.test(ext) ? ext : '';
+};
+
+/**
+ * Hinglish: Inspector Transform - size, type aur hash, data aage badhate hue
+ */
+const createInspector = ({ ext, maxFileSize, verifySignature }) => {
+    const hash = crypto.createHash('sha256');
+    let size = 0;
+    let head = Buffer.alloc(0);
+    let sniffed = !verifySignature;
+
+    const sniff = () => {
+        sniffed = true;
+        if (!matchesSignature(ext, head)) {
+            const error = new Error(`File content does not match its ${ext} extension`);
+            error.code = 'INVALID_FILE_CONTENT';
+            return error;
+        }
+        return null;
+    };
+
+    const inspector = new Transform({
+        transform(chunk, encoding, callback) {
+            size += chunk.length;
+            if (maxFileSize && size > maxFileSize) {
+                return callback(new multer.MulterError('LIMIT_FILE_SIZE'));
+            }
+            if (!sniffed) {
+                head = Buffer.concat([head, chunk.subarray(0, SNIFF_BYTES - head.length)]);
+                if (head.length >= SNIFF_BYTES) {
+                    const error = sniff();
+                    if (error) return callback(error);
+                }
+            }
+            hash.update(chunk);
+            return callback(null, chunk);
+        },
+        flush(callback) {
+            // Hinglish: SNIFF_BYTES se chhoti file - jitna mila usi par check
+            const error = sniffed ? null : sniff();
+            callback(error);
+        },
+    });
+
+    inspector.summary = () => ({ size, hash: hash.digest('hex') });
+    return inspector;
+};
+
+/**
+ * Hinglish: Request khatam hone par (status >= 400) us request ki streamed files hata do
+ */
+const scheduleCleanup = (req, storage) => {
+    if (req.streamedUploadsCleanup || !req.res) return;
+    req.streamedUploadsCleanup = true;
+    req.res.on('finish', () => {
+        if (req.res.statusCode < 400) return;
+        const files = [].concat(req.file || [], Array.isArray(req.files) ? req.files : Object.values(req.files || {}).flat());
+        files.filter((file) => file.storage === 'stream').forEach((file) => {
+            storage._removeFile(req, file, (error) => {
+                if (error) console.warn(`Warning: Could not remove streamed upload ${file.publicId}:`, error.message);
+            });
+        });
+    });
+};
+
+class StreamingStorage {
+    /**
+     * @param {Object} options
+     * @param {Object} [options.backend] - Default: UPLOAD_BACKEND wala backend
+     * @param {String|Function} options.folder - (req, file) => folder
+     * @param {Function} [options.publicIdPrefix] - (req, file) => prefix (e.g. userId)
+     * @param {Number} [options.maxFileSize] - Bytes (multer limits.fileSize ke saath bhi safe)
+     * @param {Boolean} [options.verifySignature] - Magic bytes check (default true)
+     * @param {Boolean} [options.cleanupOnError] - 4xx/5xx response par files hatao (default true)
+     */
+    constructor({
+        backend = null,
+        folder,
+        publicIdPrefix = null,
+        maxFileSize = 0,
+        verifySignature = true,
+        cleanupOnError = true,
+    }) {
+        this.backend = backend;
+        this.folder = folder;
+        this.publicIdPrefix = publicIdPrefix;
+        this.maxFileSize = maxFileSize;
+        this.verifySignature = verifySignature;
+        this.cleanupOnError = cleanupOnError;
+    }
+
+    getBackend() {
+        return this.backend || getUploadBackend();
+    }
+
+    _handleFile(req, file, cb) {
+        const backend = this.getBackend();
+        const ext = safeExtension(file.originalname);
+        const uniqueSuffix = `${Date.now()}-${Math.round(Math.random() * 1e9)}`;
+        const filename = `${file.fieldname}-${uniqueSuffix}`;
+        const prefix = this.publicIdPrefix ? this.publicIdPrefix(req, file) : null;
+        const publicId = prefix ? `${prefix}_${filename}` : filename;
+        const folder = typeof this.folder === 'function' ? this.folder(req, file) : this.folder;
+        const resourceType = ext === '.pdf' ? 'raw' : 'auto';
+
+        if (this.cleanupOnError) scheduleCleanup(req, this);
+
+        let upload;
+        try {
+            upload = backend.createUpload({ folder, publicId, resourceType, extension: ext });
+        } catch (error) {
+            // Hinglish: Backend ne target hi reject kiya (e.g. INVALID_UPLOAD_PATH) - file drain karke fail
+            file.stream.resume();
+            cb(error);
+            return;
+        }
+        const inspector = createInspector({ ext, maxFileSize: this.maxFileSize, verifySignature: this.verifySignature });
+
+        let settled = false;
+        const fail = (error) => {
+            if (settled) return;
+            settled = true;
+            // Hinglish: Source stream destroy nahi karte (busboy atak jaata) - unpipe karke drain
+            file.stream.unpipe(inspector);
+            file.stream.resume();
+            inspector.destroy();
+            upload.stream.destroy();
+            // Abort ke baad bhi backend ne upload poora kar diya ho to use hata do
+            upload.result
+                .then((stored) => backend.remove({ ...stored, resourceType: stored.resourceType || resourceType }))
+                .catch(() => {});
+            cb(error);
+        };
+
+        inspector.on('error', fail);
+        upload.stream.on('error', fail);
+        upload.result.catch(fail);
+        upload.stream.on('finish', () => {
+            if (settled) return;
+            // Hinglish: Multer / busboy ne limits.fileSize par stream kaat di (truncated)
+            if (file.stream.truncated) {
+                fail(new multer.MulterError('LIMIT_FILE_SIZE', file.fieldname));
+                return;
+            }
+            upload.result.then((stored) => {
+                if (settled) return;
+                settled = true;
+                const { size, hash } = inspector.summary();
+                cb(null, {
+                    storage: 'stream',
+                    backend: backend.kind,
+                    filename: `${filename}${ext}`,
+                    size,
+                    hash,
+                    url: stored.url,
+                    publicId: stored.publicId,
+                    resourceType: stored.resourceType || resourceType,
+                    path: stored.path,
+                });
+            }, fail);
+        });
+
+        file.stream.pipe(inspector).pipe(upload.stream);
+    }
+
+    _removeFile(req, file, cb) {
+        if (!file.publicId) return cb(null);
+        this.getBackend()
+            .remove({ publicId: file.publicId, resourceType: file.resourceType })
+            .then(() => {
+                file.publicId = null;
+                cb(null);
+            }, cb);
+    }
+}
+
+/**
+ * Hinglish: Streaming storage engine banao (multer({ storage }) mein do)
+ * @param {Object} options - StreamingStorage constructor dekho
+ */
+const createStreamingStorage = (options) => new StreamingStorage(options);
+
+module.exports = { createStreamingStorage };
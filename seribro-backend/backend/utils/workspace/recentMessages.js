@@ -0,0 +1,215 @@
+// backend/utils/workspace/recentMessages.js
+// Per-project ring buffer of latest workspace messages (hot path for workspace loads)
+//
+// Active workspaces baar baar reload hote hain aur har reload par wahi last few
+// messages Mongo se aate the. Yahan har project ke last RECENT_MESSAGES_SIZE
+// messages memory mein rakhe jaate hain:
+// - pehli read par Mongo se prime hota hai (ek indexed query)
+// - emitNewMessage har naya message push karta hai (bus se dusre nodes par bhi)
+// - read-receipts (markRead) buffer mein bhi apply hote hain
+// - idle projects RECENT_MESSAGES_IDLE_MS ke baad evict, aur max RECENT_MESSAGES_PROJECTS (LRU)
+
+const Message = require('../../models/Message');
+
+const BUFFER_SIZE = parseInt(process.env.RECENT_MESSAGES_SIZE, 10) || 20;
+const IDLE_MS = parseInt(process.env.RECENT_MESSAGES_IDLE_MS, 10) || 15 * 60 * 1000;
+const MAX_PROJECTS = parseInt(process.env.RECENT_MESSAGES_PROJECTS, 10) || 1000;
+const CHANNEL = 'workspace.recentMessages';
+
+// projectId -> { items (oldest first), complete, lastAccess, loading, pending }
+// Map insertion order = least recently used first
+const buffers = new Map();
+const stats = { hits: 0, misses: 0, pushes: 0, evictions: 0 };
+
+let bus = null;
+let unsubscribe = null;
+let sweepTimer = null;
+
+const touch = (projectId, entry) => {
+    entry.lastAccess = Date.now();
+    buffers.delete(projectId);
+    buffers.set(projectId, entry);
+};
+
+const evictOverflow = () => {
+    while (buffers.size > MAX_PROJECTS) {
+        buffers.delete(buffers.keys().next().value);
+        stats.evictions += 1;
+    }
+};
+
+const ensureSweep = () => {
+    if (sweepTimer) return;
+    sweepTimer = setInterval(() => {
+        const cutoff = Date.now() - IDLE_MS;
+        buffers.forEach((entry, projectId) => {
+            if (!entry.loading && entry.lastAccess < cutoff) {
+                buffers.delete(projectId);
+                stats.evictions += 1;
+            }
+        });
+    }, Math.min(IDLE_MS, 60 * 1000));
+    if (sweepTimer.unref) sweepTimer.unref();
+};
+
+// Hinglish: Plain JSON shape - wahi jo socket/HTTP par jaata hai (subdocs/Dates serialize ho jaate hain)
+const normalize = (projectId, message) => JSON.parse(JSON.stringify({ project: projectId, ...message }));
+
+const append = (entry, message) => {
+    const id = String(message._id);
+    if (entry.items.some((item) => String(item._id) === id)) return;
+    entry.items.push(message);
+    if (entry.items.length > BUFFER_SIZE) {
+        entry.items.splice(0, entry.items.length - BUFFER_SIZE);
+        entry.complete = false;
+    }
+};
+
+const applyRead = (entry, readerId, readAt) => {
+    entry.items.forEach((item) => {
+        if (!item.isRead && String(item.sender) !== readerId) {
+            item.isRead = true;
+            item.readAt = readAt;
+        }
+    });
+};
+
+const applyPush = (projectId, message) => {
+    const entry = buffers.get(projectId);
+    if (!entry) return; // Hinglish: Cold project - agli read Mongo se prime karegi
+    if (entry.loading) {
+        entry.pending.push({ type: 'push', message });
+        return;
+    }
+    append(entry, message);
+};
+
+const applyMarkRead = (projectId, readerId, readAt) => {
+    const entry = buffers.get(projectId);
+    if (!entry) return;
+    if (entry.loading) {
+        entry.pending.push({ type: 'read', readerId, readAt });
+        return;
+    }
+    applyRead(entry, readerId, readAt);
+};
+
+/**
+ * Hinglish: Buffer warm karo (cold ho to Mongo se last BUFFER_SIZE messages)
+ * Concurrent callers same load promise share karte hain; load ke dauraan aaye
+ * push/read events baad mein replay hote hain.
+ * @returns {Promise<Object>} entry
+ */
+const load = async (projectId) => {
+    const existing = buffers.get(projectId);
+    if (existing) {
+        touch(projectId, existing);
+        if (existing.loading) {
+            await existing.loading;
+        } else {
+            stats.hits += 1;
+        }
+        return existing;
+    }
+
+    stats.misses += 1;
+    const entry = { items: [], complete: false, lastAccess: Date.now(), loading: null, pending: [] };
+    buffers.set(projectId, entry);
+    evictOverflow();
+    ensureSweep();
+
+    entry.loading = Message.find({ project: projectId })
+        .sort({ createdAt: -1, _id: -1 })
+        .limit(BUFFER_SIZE)
+        .lean()
+        .then((latest) => {
+            entry.items = latest.reverse().map((message) => normalize(projectId, message));
+            entry.complete = latest.length < BUFFER_SIZE;
+            entry.pending.forEach((event) => {
+                if (event.type === 'push') append(entry, event.message);
+                else applyRead(entry, event.readerId, event.readAt);
+            });
+        })
+        .catch((error) => {
+            buffers.delete(projectId);
+            throw error;
+        })
+        .finally(() => {
+            entry.loading = null;
+            entry.pending = [];
+        });
+
+    await entry.loading;
+    return entry;
+};
+
+/**
+ * Hinglish: Latest messages (chronological, oldest first)
+ * @param {String} projectId
+ * @param {Number} [limit] - Default: poora buffer
+ * @returns {Promise<Object>} { messages, hasMore } - hasMore = buffer ke pehle bhi messages hain
+ */
+exports.getRecentMessages = async (projectId, limit = BUFFER_SIZE) => {
+    const key = String(projectId);
+    const entry = await load(key);
+    const count = Math.min(limit, entry.items.length);
+    const messages = entry.items.slice(entry.items.length - count).map((item) => ({ ...item }));
+    return {
+        messages,
+        hasMore: entry.items.length > count || !entry.complete,
+    };
+};
+
+/**
+ * Hinglish: Newest page buffer se serve ho sakta hai? (limit buffer se bada ho to nahi)
+ * @returns {Boolean}
+ */
+exports.canServe = (limit) => limit <= BUFFER_SIZE;
+
+/**
+ * Hinglish: Naya message buffer mein daalo (aur dusre nodes ko bhejo)
+ * @param {String} projectId
+ * @param {Object} message - Wahi payload jo socket par emit hota hai
+ */
+exports.pushMessage = (projectId, message) => {
+    const key = String(projectId);
+    const normalized = normalize(key, message);
+    stats.pushes += 1;
+    applyPush(key, normalized);
+    if (bus) bus.publish(CHANNEL, { t: 'push', p: key, m: normalized });
+};
+
+/**
+ * Hinglish: Reader ne project ke messages padh liye - buffer mein bhi isRead update karo
+ * @param {String} projectId
+ * @param {String} readerId - User jisne padha (uske apne messages untouched)
+ */
+exports.markRead = (projectId, readerId) => {
+    const key = String(projectId);
+    const reader = String(readerId);
+    const readAt = new Date().toISOString();
+    applyMarkRead(key, reader, readAt);
+    if (bus) bus.publish(CHANNEL, { t: 'read', p: key, u: reader, at: readAt });
+};
+
+/**
+ * Hinglish: Cross-node bus se jodo (socketManager init par) - null pass karo to detach
+ * @param {Object|null} nextBus
+ */
+exports.attachBus = (nextBus) => {
+    if (unsubscribe) unsubscribe();
+    unsubscribe = null;
+    bus = nextBus;
+    if (!bus) return;
+    unsubscribe = bus.subscribe(CHANNEL, (event) => {
+        if (!event || !event.p) return;
+        if (event.t === 'push') applyPush(event.p, event.m);
+        else if (event.t === 'read') applyMarkRead(event.p, event.u, event.at);
+    });
+};
+
+exports.getRecentMessagesStats = () => ({
+    ...stats,
+    projects: buffers.size,
+    bufferSize: BUFFER_SIZE,
+});
@@ -12,6 +12,21 @@ async function uploadWorkFilesToCloudinary(files = [], projectId) {
 
   const uploaded = [];
   for (const file of files) {
+    // Streaming storage se aayi file upload ho chuki hai - metadata hi banao
+    if (file.storage === 'stream') {
+      uploaded.push({
+        filename: file.filename,
+        originalName: file.originalname,
+        fileType: file.mimetype,
+        url: file.url,
+        public_id: file.publicId,
+        size: file.size,
+        hash: file.hash,
+        uploadedAt: new Date(),
+      });
+      continue;
+    }
+
     // Use projectId to group files
     const folder = `work-submissions/${projectId}`;
     try {
@@ -0,0 +1,35 @@
+// scripts/socketBroker.js
+// Local message broker so several backend processes share socket.io rooms and presence
+// Run with: node scripts/socketBroker.js [--port 7071] [--host 127.0.0.1]
+//
+// Then start each backend with SOCKET_BUS=local-broker (and a distinct PORT /
+// SOCKET_PORT); a message emitted on one node reaches workspace sockets on all
+// of them, and presence is shared. Keeps running until SIGINT/SIGTERM.
+
+const { startBroker } = require('../backend/utils/socket/bus/localBrokerBus');
+const { DEFAULT_BROKER_PORT } = require('../backend/utils/socket/bus');
+
+const args = process.argv.slice(2);
+const argValue = (name) => {
+  const index = args.indexOf(name);
+  return index !== -1 ? args[index + 1] : undefined;
+};
+
+async function run() {
+  const host = argValue('--host') || process.env.SOCKET_BROKER_HOST || '127.0.0.1';
+  const port = Number(argValue('--port')) || parseInt(process.env.SOCKET_BROKER_PORT, 10) || DEFAULT_BROKER_PORT;
+  const broker = await startBroker({ host, port });
+  console.log(`SOCKET_BROKER=${host}:${port}`);
+
+  const stop = async () => {
+    await broker.close();
+    process.exit(0);
+  };
+  process.once('SIGINT', stop);
+  process.once('SIGTERM', stop);
+}
+
+run().catch((error) => {
+  console.error('Failed to start socket broker:', error.message);
+  process.exit(1);
+});
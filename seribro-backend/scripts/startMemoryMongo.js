@@ -0,0 +1,41 @@
+// scripts/startMemoryMongo.js
+// Local stand-in MongoDB (mongodb-memory-server) for benchmarks and the seeder
+// Run with: node scripts/startMemoryMongo.js [--replset] [--port 27018] [--dbPath ./.mongo-bench]
+//
+// Prints a single line `MONGO_URI=<uri>` once the server is ready, then keeps
+// running until SIGINT/SIGTERM. The Python seeder (seribro_client.seed
+// --memory-server) spawns this script and reads that line.
+
+const { MongoMemoryServer, MongoMemoryReplSet } = require('mongodb-memory-server');
+
+const args = process.argv.slice(2);
+const argValue = (name) => {
+  const index = args.indexOf(name);
+  return index !== -1 ? args[index + 1] : undefined;
+};
+
+async function startMemoryMongo() {
+  const port = argValue('--port') ? Number(argValue('--port')) : undefined;
+  const dbPath = argValue('--dbPath');
+  const instance = { port, dbPath, storageEngine: dbPath ? 'wiredTiger' : undefined };
+
+  // Replica set is needed for the controllers that use transactions
+  const server = args.includes('--replset')
+    ? await MongoMemoryReplSet.create({ replSet: { count: 1 }, instanceOpts: [instance] })
+    : await MongoMemoryServer.create({ instance });
+
+  const uri = server.getUri('seribro');
+  console.log(`MONGO_URI=${uri}`);
+
+  const shutdown = async () => {
+    await server.stop();
+    process.exit(0);
+  };
+  process.on('SIGINT', shutdown);
+  process.on('SIGTERM', shutdown);
+}
+
+startMemoryMongo().catch((err) => {
+  console.error('❌ Could not start mongodb-memory-server:', err.message);
+  process.exit(1);
+});
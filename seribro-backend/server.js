@@ -7,7 +7,7 @@ const cookieParser = require('cookie-parser');
 const path = require('path');
 const cors = require('cors');
 const http = require('http');
-const { initializeSocketIO } = require('./backend/utils/socket/socketManager');
+const { initializeSocketIO, closeSocketLayer } = require('./backend/utils/socket/socketManager');
 
 // Load environment variables
 dotenv.config();
@@ -186,6 +186,10 @@ try {
   app.use('/api/admin/projects', require('./backend/routes/adminProjectRoutes'));
   console.log('   ✅ /api/admin/projects routes mounted');
 
+  console.log('📌 Mounting /api/admin/jobs (scheduler metrics)...');
+  app.use('/api/admin/jobs', require('./backend/routes/adminJobRoutes'));
+  console.log('   ✅ /api/admin/jobs routes mounted');
+
   console.log('📌 Mounting /api/admin/applications (Phase 2.1 Admin)...');
   app.use('/api/admin/applications', require('./backend/routes/adminApplicationRoutes'));
   console.log('   ✅ /api/admin/applications routes mounted');
@@ -256,6 +260,10 @@ console.log('⏰ Starting Cron Job Scheduler...');
 const { initializeCronJobs } = require('./backend/utils/cronScheduler');
 initializeCronJobs();
 
+// Notification outbox - batched notification writes + replay sweep
+const { startNotificationOutbox, drainNotificationOutbox } = require('./backend/utils/notifications/notificationOutbox');
+startNotificationOutbox();
+
 /**
  * ⚠️ PHASE 6 - DORMANT / FUTURE WORK ⚠️
  * 
@@ -337,3 +345,19 @@ httpServer.on('error', (error) => {
         process.exit(1);
     }
 });
+
+// Graceful shutdown - queued notifications flush karke, cluster ko bye bol ke exit
+const shutdown = (signal) => {
+    console.log(`\n${signal} received, flushing notification outbox...`);
+    const forceExit = setTimeout(() => process.exit(0), 5000);
+    drainNotificationOutbox()
+        .catch((error) => console.error('❌ Notification outbox drain failed:', error.message))
+        .then(() => closeSocketLayer())
+        .catch((error) => console.error('❌ Socket layer close failed:', error.message))
+        .finally(() => {
+            clearTimeout(forceExit);
+            process.exit(0);
+        });
+};
+process.once('SIGTERM', () => shutdown('SIGTERM'));
+process.once('SIGINT', () => shutdown('SIGINT'));
@@ -0,0 +1,108 @@
+const mongoose = require('mongoose');
+const { MongoMemoryReplSet } = require('mongodb-memory-server');
+const Application = require('../backend/models/Application');
+const applicationStatsCache = require('../backend/utils/company/applicationStatsCache');
+const { createMemoryBus } = require('../backend/utils/socket/bus/memoryBus');
+
+let replSet;
+
+beforeAll(async () => {
+  replSet = await MongoMemoryReplSet.create({ replSet: { count: 1 } });
+  const uri = replSet.getUri();
+  await mongoose.connect(uri, { useNewUrlParser: true, useUnifiedTopology: true });
+});
+
+afterAll(async () => {
+  await mongoose.disconnect();
+  await replSet.stop();
+});
+
+afterEach(async () => {
+  jest.restoreAllMocks();
+  applicationStatsCache.clear();
+  await Promise.all(Object.keys(mongoose.connection.collections).map(key => mongoose.connection.collections[key].deleteMany({})));
+});
+
+const seedApplication = async (companyId) => {
+  const { insertedId } = await Application.collection.insertOne({
+    projectId: new mongoose.Types.ObjectId(),
+    companyId,
+    studentId: new mongoose.Types.ObjectId(),
+    status: 'pending',
+    appliedAt: new Date(),
+  });
+  return insertedId;
+};
+
+// Cache mein entry daalo; cached: true = entry abhi bhi hai
+const warm = (companyId) => applicationStatsCache.get(companyId, async () => ({ total: 1 }));
+const isCached = async (companyId) => (await applicationStatsCache.get(companyId, async () => ({ total: 1 }))).cached;
+
+test('touchesStats only flags updates to the fields stats are built from', () => {
+  expect(applicationStatsCache.touchesStats({ $set: { companyViewedAt: new Date() } })).toBe(false);
+  expect(applicationStatsCache.touchesStats({ $set: { companyResponse: 'ok' }, $push: { statusHistory: {} } })).toBe(false);
+  expect(applicationStatsCache.touchesStats({ $set: { status: 'shortlisted' } })).toBe(true);
+  expect(applicationStatsCache.touchesStats({ companyId: new mongoose.Types.ObjectId() })).toBe(true);
+  expect(applicationStatsCache.touchesStats([{ $set: { companyResponse: 'x' } }])).toBe(true);
+});
+
+test('non-stats updates skip the company lookup and keep the entry', async () => {
+  const companyId = new mongoose.Types.ObjectId();
+  const applicationId = await seedApplication(companyId);
+  await warm(companyId);
+  const distinct = jest.spyOn(Application, 'distinct');
+
+  await Application.updateOne({ _id: applicationId }, { $set: { companyViewedAt: new Date() } });
+  await Application.updateMany({ _id: applicationId }, { $set: { companyResponse: 'seen' } });
+
+  expect(distinct).not.toHaveBeenCalled();
+  expect(await isCached(companyId)).toBe(true);
+});
+
+test('status updates look up the company and invalidate its entry', async () => {
+  const companyId = new mongoose.Types.ObjectId();
+  const otherCompany = new mongoose.Types.ObjectId();
+  const applicationId = await seedApplication(companyId);
+  await warm(companyId);
+  await warm(otherCompany);
+  const distinct = jest.spyOn(Application, 'distinct');
+
+  await Application.updateOne({ _id: applicationId }, { $set: { status: 'shortlisted' } });
+
+  expect(distinct).toHaveBeenCalledTimes(1);
+  expect(await isCached(companyId)).toBe(false);
+  expect(await isCached(otherCompany)).toBe(true);
+});
+
+test('deletes always invalidate', async () => {
+  const companyId = new mongoose.Types.ObjectId();
+  const applicationId = await seedApplication(companyId);
+  await warm(companyId);
+
+  await Application.deleteOne({ _id: applicationId });
+
+  expect(await isCached(companyId)).toBe(false);
+});
+
+test('invalidations travel over the bus in both directions', async () => {
+  const localBus = createMemoryBus();
+  const remoteBus = createMemoryBus();
+  const published = [];
+  remoteBus.subscribe('applications.statsCache', (event) => published.push(event));
+  applicationStatsCache.attachBus(localBus);
+  const companyId = new mongoose.Types.ObjectId();
+  await warm(companyId);
+
+  // Dusre node par is company ke application par write hua
+  remoteBus.publish('applications.statsCache', { c: String(companyId) });
+  await new Promise((r) => setTimeout(r, 10));
+  expect(await isCached(companyId)).toBe(false);
+
+  const otherCompany = new mongoose.Types.ObjectId();
+  applicationStatsCache.invalidateCompany(otherCompany);
+  await new Promise((r) => setTimeout(r, 10));
+  expect(published).toEqual([{ c: String(otherCompany) }]);
+
+  applicationStatsCache.attachBus(null);
+  await Promise.all([localBus.close(), remoteBus.close()]);
+});
@@ -0,0 +1,63 @@
+const mongoose = require('mongoose');
+const { MongoMemoryReplSet } = require('mongodb-memory-server');
+const Application = require('../backend/models/Application');
+const { shardMatch, shardOf } = require('../backend/utils/background/applicationTimeoutJob');
+
+let replSet;
+
+beforeAll(async () => {
+  replSet = await MongoMemoryReplSet.create({ replSet: { count: 1 } });
+  const uri = replSet.getUri();
+  await mongoose.connect(uri, { useNewUrlParser: true, useUnifiedTopology: true });
+});
+
+afterAll(async () => {
+  await mongoose.disconnect();
+  await replSet.stop();
+});
+
+afterEach(async () => {
+  await Promise.all(Object.keys(mongoose.connection.collections).map(key => mongoose.connection.collections[key].deleteMany({})));
+});
+
+// Ek hi second mein bane projects - timestamp sab ka same, sirf low-order bytes alag
+const seedExpired = async (projectCount) => {
+  const past = new Date(Date.now() - 1000 * 60 * 60);
+  const projectIds = Array.from({ length: projectCount }, () => new mongoose.Types.ObjectId());
+  await Application.collection.insertMany(projectIds.map((projectId) => ({
+    projectId,
+    status: 'awaiting_acceptance',
+    acceptanceDeadline: past,
+  })));
+  return projectIds;
+};
+
+test.each([2, 4, 5, 8, 10, 16])('every one of %i shards gets work', async (shards) => {
+  const projectIds = await seedExpired(64);
+
+  const perShard = [];
+  for (let shard = 0; shard < shards; shard += 1) {
+    perShard.push(await Application.countDocuments({ status: 'awaiting_acceptance', ...shardMatch(shard, shards) }));
+  }
+
+  expect(perShard.every((count) => count > 0)).toBe(true);
+  expect(perShard.reduce((sum, count) => sum + count, 0)).toBe(projectIds.length);
+});
+
+test('aggregation shard matches the JS shardOf for each project', async () => {
+  const projectIds = await seedExpired(32);
+  const shards = 8;
+
+  for (let shard = 0; shard < shards; shard += 1) {
+    const rows = await Application.find({ ...shardMatch(shard, shards) }).select('projectId').lean();
+    rows.forEach((row) => expect(shardOf(row.projectId, shards)).toBe(shard));
+  }
+  expect(projectIds.length).toBe(32);
+});
+
+test('a single shard matches everything', async () => {
+  await seedExpired(5);
+
+  expect(shardMatch(0, 1)).toEqual({});
+  expect(await Application.countDocuments({ ...shardMatch(0, 1) })).toBe(5);
+});
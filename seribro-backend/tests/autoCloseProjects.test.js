@@ -0,0 +1,90 @@
+const mongoose = require('mongoose');
+const { MongoMemoryReplSet } = require('mongodb-memory-server');
+const Project = require('../backend/models/Project');
+const Application = require('../backend/models/Application');
+const StudentProfile = require('../backend/models/StudentProfile');
+const Notification = require('../backend/models/Notification');
+const { closeExpiredProjects } = require('../backend/jobs/autoCloseProjects');
+const { drainNotificationOutbox } = require('../backend/utils/notifications/notificationOutbox');
+
+let replSet;
+
+beforeAll(async () => {
+  replSet = await MongoMemoryReplSet.create({ replSet: { count: 1 } });
+  const uri = replSet.getUri();
+  await mongoose.connect(uri, { useNewUrlParser: true, useUnifiedTopology: true });
+});
+
+afterAll(async () => {
+  await mongoose.disconnect();
+  await replSet.stop();
+});
+
+afterEach(async () => {
+  await Promise.all(Object.keys(mongoose.connection.collections).map(key => mongoose.connection.collections[key].deleteMany({})));
+});
+
+const past = () => new Date(Date.now() - 1000 * 60 * 60);
+const future = () => new Date(Date.now() + 1000 * 60 * 60 * 24);
+
+// Past deadline validation se nahi banti - raw inserts
+const seedProject = async (overrides = {}) => {
+  const { insertedId } = await Project.collection.insertOne({
+    title: 'Expired',
+    status: 'open',
+    deadline: past(),
+    assignedStudent: null,
+    isDeleted: false,
+    createdBy: new mongoose.Types.ObjectId(),
+    requiredSkills: ['JS'],
+    ...overrides,
+  });
+  return insertedId;
+};
+
+const seedApplication = async (projectId, status) => {
+  const studentUser = new mongoose.Types.ObjectId();
+  const { insertedId: studentId } = await StudentProfile.collection.insertOne({ user: studentUser });
+  await Application.collection.insertOne({ projectId, studentId, companyId: new mongoose.Types.ObjectId(), status, appliedAt: new Date() });
+  return studentUser;
+};
+
+test('closes expired open projects in batches and rejects their open applications', async () => {
+  const expired = [];
+  for (let i = 0; i < 5; i += 1) expired.push(await seedProject({ title: `Expired ${i}` }));
+  const assigned = await seedProject({ assignedStudent: new mongoose.Types.ObjectId() });
+  const live = await seedProject({ deadline: future() });
+
+  const pendingUser = await seedApplication(expired[0], 'pending');
+  const shortlistedUser = await seedApplication(expired[1], 'shortlisted');
+  await seedApplication(expired[1], 'withdrawn');
+  await seedApplication(live, 'pending');
+
+  const stats = await closeExpiredProjects({ batchSize: 2 });
+
+  expect(stats).toEqual(expect.objectContaining({
+    batches: 3, projectsClosed: 5, applicationsRejected: 2, notificationsSent: 7, failedBatches: 0, truncated: false,
+  }));
+  expect(await Project.countDocuments({ _id: { $in: expired }, status: 'closed' })).toBe(5);
+  expect((await Project.findById(assigned).lean()).status).toBe('open');
+  expect((await Project.findById(live).lean()).status).toBe('open');
+  expect(await Application.countDocuments({ status: 'rejected' })).toBe(2);
+  expect(await Application.countDocuments({ status: 'withdrawn' })).toBe(1);
+  expect(await Application.countDocuments({ projectId: live, status: 'pending' })).toBe(1);
+
+  await drainNotificationOutbox();
+  const studentNotices = await Notification.find({ userRole: 'student' }).lean();
+  expect(studentNotices.map((n) => String(n.userId)).sort()).toEqual([String(pendingUser), String(shortlistedUser)].sort());
+  expect(await Notification.countDocuments({ userRole: 'company' })).toBe(5);
+});
+
+test('stops at the time budget and leaves the rest for the next run', async () => {
+  for (let i = 0; i < 4; i += 1) await seedProject({ title: `Expired ${i}` });
+
+  const first = await closeExpiredProjects({ batchSize: 2, maxDurationMs: -1 });
+  expect(first).toEqual(expect.objectContaining({ batches: 1, projectsClosed: 2, truncated: true }));
+
+  const second = await closeExpiredProjects({ batchSize: 2 });
+  expect(second.projectsClosed).toBe(2);
+  expect(await Project.countDocuments({ status: 'open' })).toBe(0);
+});
@@ -0,0 +1,138 @@
+const mongoose = require('mongoose');
+const { MongoMemoryReplSet } = require('mongodb-memory-server');
+const CompanyProfile = require('../backend/models/companyProfile');
+const StudentProfile = require('../backend/models/StudentProfile');
+const Student = require('../backend/models/Student');
+const User = require('../backend/models/User');
+const Project = require('../backend/models/Project');
+const Application = require('../backend/models/Application');
+const Counter = require('../backend/models/Counter');
+const Notification = require('../backend/models/Notification');
+const { runBulkTransition } = require('../backend/utils/applications/bulkTransitions');
+const { drainNotificationOutbox } = require('../backend/utils/notifications/notificationOutbox');
+
+let replSet;
+
+beforeAll(async () => {
+  replSet = await MongoMemoryReplSet.create({ replSet: { count: 1 } });
+  const uri = replSet.getUri();
+  await mongoose.connect(uri, { useNewUrlParser: true, useUnifiedTopology: true });
+});
+
+afterAll(async () => {
+  await mongoose.disconnect();
+  await replSet.stop();
+});
+
+afterEach(async () => {
+  jest.restoreAllMocks();
+  await Promise.all(Object.keys(mongoose.connection.collections).map(key => mongoose.connection.collections[key].deleteMany({})));
+});
+
+const createCompany = async (email) => {
+  const user = await User.create({ email, password: 'CompanyPass1!', role: 'company' });
+  const profile = await CompanyProfile.create({ user: user._id, companyName: email });
+  const project = await Project.create({
+    company: user._id,
+    companyId: profile._id,
+    title: `Project of ${email}`,
+    description: 'desc',
+    category: 'Web Development',
+    requiredSkills: ['JS'],
+    budgetMin: 10,
+    budgetMax: 100,
+    projectDuration: '1 week',
+    deadline: new Date(Date.now() + 1000 * 60 * 60 * 24),
+    createdBy: user._id,
+  });
+  return { user, profile, project };
+};
+
+let studentSeq = 0;
+const apply = async ({ profile, project }, status) => {
+  studentSeq += 1;
+  const user = await User.create({ email: `bulk${studentSeq}@test.com`, password: 'StudentPass1!', role: 'student' });
+  const student = await Student.create({ user: user._id, fullName: `S${studentSeq}`, college: 'C1' });
+  const studentProfile = await StudentProfile.create({ student: student._id, user: user._id, basicInfo: { fullName: `S${studentSeq}` } });
+  const app = await Application.create({
+    project: project._id, projectId: project._id,
+    student: studentProfile._id, studentId: studentProfile._id,
+    company: profile._id, companyId: profile._id,
+    coverLetter: 'c'.repeat(60), proposedPrice: 50, estimatedTime: '1 week', status,
+  });
+  return { app, user };
+};
+
+test('mixed batch reports a result per item and keeps counters in step', async () => {
+  const owner = await createCompany('owner@test.com');
+  const other = await createCompany('other@test.com');
+
+  const pending = await apply(owner, 'pending');
+  const shortlisted = await apply(owner, 'shortlisted');
+  const accepted = await apply(owner, 'accepted');
+  const conflicting = await apply(owner, 'pending');
+  const foreign = await apply(other, 'pending');
+  const missingId = String(new mongoose.Types.ObjectId());
+
+  // find ke baad aur bulkWrite se pehle koi aur conflicting ko on_hold kar deta hai
+  const realBulkWrite = Application.bulkWrite;
+  jest.spyOn(Application, 'bulkWrite').mockImplementationOnce(async function (ops, options) {
+    await Application.updateOne({ _id: conflicting.app._id }, { $set: { status: 'on_hold' } });
+    return realBulkWrite.call(this, ops, options);
+  });
+
+  const { results, summary } = await runBulkTransition({
+    action: 'reject',
+    applicationIds: [
+      pending.app._id, shortlisted.app._id, accepted.app._id, conflicting.app._id,
+      foreign.app._id, missingId, 'not-an-id', String(pending.app._id),
+    ],
+    companyProfileId: owner.profile._id,
+    actorUserId: owner.user._id,
+    reason: 'Position filled',
+  });
+
+  const byId = Object.fromEntries(results.map((result) => [result.applicationId, result]));
+  expect(results).toHaveLength(7);
+  expect(byId[String(pending.app._id)]).toEqual(expect.objectContaining({ success: true, status: 'rejected' }));
+  expect(byId[String(shortlisted.app._id)]).toEqual(expect.objectContaining({ success: true, status: 'rejected' }));
+  expect(byId[String(accepted.app._id)].code).toBe('INVALID_STATUS');
+  expect(byId[String(conflicting.app._id)].code).toBe('CONFLICT');
+  expect(byId[String(foreign.app._id)].code).toBe('FORBIDDEN');
+  expect(byId[missingId].code).toBe('NOT_FOUND');
+  expect(byId['not-an-id'].code).toBe('INVALID_ID');
+  expect(summary).toEqual({ requested: 7, succeeded: 2, failed: 5, notified: 2 });
+
+  const conflicted = await Application.findById(conflicting.app._id).lean();
+  expect(conflicted.status).toBe('on_hold');
+  const rejected = await Application.findById(pending.app._id).lean();
+  expect(rejected.rejectionReason).toBe('Position filled');
+  expect(rejected.statusHistory.slice(-1)[0].metadata).toEqual({ bulk: true, previousStatus: 'pending' });
+
+  // bulkWrite hooks nahi chalata - recordChanges ne counters theek kiye hon
+  const projectCounter = await Counter.findById(`project:${owner.project._id}`).lean();
+  expect(projectCounter.counts.applications).toEqual(expect.objectContaining({
+    total: 4, pending: 0, shortlisted: 0, rejected: 2, accepted: 1, on_hold: 1,
+  }));
+  const otherCounter = await Counter.findById(`project:${other.project._id}`).lean();
+  expect(otherCounter.counts.applications).toEqual(expect.objectContaining({ total: 1, pending: 1 }));
+
+  await drainNotificationOutbox();
+  const notified = await Notification.find({ type: 'application_rejected' }).lean();
+  expect(notified.map((n) => String(n.userId)).sort()).toEqual([String(pending.user._id), String(shortlisted.user._id)].sort());
+});
+
+test('a batch with nothing eligible writes nothing', async () => {
+  const owner = await createCompany('solo@test.com');
+  const accepted = await apply(owner, 'accepted');
+  const bulkWrite = jest.spyOn(Application, 'bulkWrite');
+
+  const { summary } = await runBulkTransition({
+    action: 'shortlist',
+    applicationIds: [accepted.app._id],
+    companyProfileId: owner.profile._id,
+  });
+
+  expect(summary).toEqual({ requested: 1, succeeded: 0, failed: 1, notified: 0 });
+  expect(bulkWrite).not.toHaveBeenCalled();
+});
@@ -0,0 +1,62 @@
+const express = require('express');
+const request = require('supertest');
+const { conditionalGet } = require('../backend/middleware/conditionalGet');
+const responseCache = require('../backend/utils/responseCache');
+
+const userId = 'user-1';
+
+// protect ki jagah - sirf req.user set karta hai
+const buildApp = (options) => {
+  const app = express();
+  const calls = { count: 0 };
+  app.use((req, res, next) => {
+    req.user = { _id: userId };
+    next();
+  });
+  app.get('/items', conditionalGet(options), (req, res) => {
+    calls.count += 1;
+    res.json({ success: true, data: { items: ['a', 'b'] } });
+  });
+  return { app, calls };
+};
+
+afterEach(() => {
+  responseCache.clear();
+});
+
+test('cached route serves repeat polls without running the handler until a version bump', async () => {
+  const { app, calls } = buildApp({ versions: (req) => [['Notification', req.user._id]], cache: true });
+
+  const first = await request(app).get('/items');
+  const second = await request(app).get('/items');
+
+  expect(first.status).toBe(200);
+  expect(second.body).toEqual(first.body);
+  expect(calls.count).toBe(1);
+
+  responseCache.bump('Notification', userId);
+  await request(app).get('/items');
+  expect(calls.count).toBe(2);
+});
+
+test('ETag-only route runs the handler on every request and answers 304 when unchanged', async () => {
+  const { app, calls } = buildApp();
+
+  const first = await request(app).get('/items');
+  const etag = first.headers.etag;
+  const second = await request(app).get('/items').set('If-None-Match', etag);
+
+  expect(etag).toBeTruthy();
+  expect(second.status).toBe(304);
+  expect(calls.count).toBe(2);
+});
+
+test('a cache hit still honours If-None-Match', async () => {
+  const { app, calls } = buildApp({ versions: () => [['Project', 'p1']], cache: true });
+
+  const first = await request(app).get('/items');
+  const second = await request(app).get('/items').set('If-None-Match', first.headers.etag);
+
+  expect(second.status).toBe(304);
+  expect(calls.count).toBe(1);
+});
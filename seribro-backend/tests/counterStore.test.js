@@ -0,0 +1,153 @@
+const mongoose = require('mongoose');
+const { MongoMemoryReplSet } = require('mongodb-memory-server');
+const Counter = require('../backend/models/Counter');
+const JobLease = require('../backend/models/JobLease');
+const Notification = require('../backend/models/Notification');
+const counterStore = require('../backend/utils/counters/counterStore');
+const responseCache = require('../backend/utils/responseCache');
+
+let replSet;
+
+beforeAll(async () => {
+  replSet = await MongoMemoryReplSet.create({ replSet: { count: 1 } });
+  const uri = replSet.getUri();
+  await mongoose.connect(uri, { useNewUrlParser: true, useUnifiedTopology: true });
+});
+
+afterAll(async () => {
+  await mongoose.disconnect();
+  await replSet.stop();
+});
+
+afterEach(async () => {
+  jest.restoreAllMocks();
+  await Promise.all(Object.keys(mongoose.connection.collections).map(key => mongoose.connection.collections[key].deleteMany({})));
+});
+
+// save / insertMany hooks $inc await karte hain - write ke turant baad counter sahi hona chahiye
+const unreadCounter = async (userId) => {
+  const doc = await Counter.findById(`user:${userId}`).lean();
+  return doc ? (doc.counts.unreadNotifications || 0) : 0;
+};
+
+const notification = (userId, extra = {}) => ({ userId, userRole: 'student', message: 'hello', type: 'info', ...extra });
+
+test('save hook diffs before and after contributions', async () => {
+  const userId = new mongoose.Types.ObjectId();
+
+  const doc = await Notification.create(notification(userId));
+  expect(await unreadCounter(userId)).toBe(1);
+
+  const loaded = await Notification.findById(doc._id);
+  loaded.isRead = true;
+  await loaded.save();
+  expect(await unreadCounter(userId)).toBe(0);
+
+  // Counter par na asar karne wala change - koi $inc nahi
+  loaded.message = 'edited';
+  await loaded.save();
+  expect(await unreadCounter(userId)).toBe(0);
+});
+
+test('the notification version is bumped only after the counter write lands', async () => {
+  const userId = new mongoose.Types.ObjectId();
+  const tagOf = () => responseCache.versionTag([['Notification', userId]]).tag;
+  const tagBefore = tagOf();
+  const tagsAfterWrite = [];
+  const realBulkWrite = Counter.collection.bulkWrite.bind(Counter.collection);
+  jest.spyOn(Counter.collection, 'bulkWrite').mockImplementation(async (...args) => {
+    const result = await realBulkWrite(...args);
+    tagsAfterWrite.push(tagOf());
+    return result;
+  });
+
+  await Notification.create(notification(userId));
+
+  // $inc ke waqt tag purana tha - /unread/count poll naye tag ke saath purana count cache nahi kar sakta
+  expect(tagsAfterWrite).toEqual([tagBefore]);
+  expect(tagOf()).not.toBe(tagBefore);
+});
+
+test('insertMany, updateMany and deleteMany hooks keep the counter in step', async () => {
+  const userId = new mongoose.Types.ObjectId();
+  const otherUser = new mongoose.Types.ObjectId();
+
+  await Notification.insertMany([notification(userId), notification(userId), notification(userId), notification(otherUser)]);
+  expect(await unreadCounter(userId)).toBe(3);
+  expect(await unreadCounter(otherUser)).toBe(1);
+
+  const [first] = await Notification.find({ userId }).limit(1);
+  await Notification.updateMany({ _id: first._id }, { $set: { isRead: true } });
+  expect(await unreadCounter(userId)).toBe(2);
+
+  // Jo update counter fields ko touch nahi karta wo before/after find nahi karta
+  await Notification.updateMany({ userId }, { $set: { message: 'bulk edit' } });
+  expect(await unreadCounter(userId)).toBe(2);
+
+  await Notification.deleteMany({ userId, isRead: { $ne: true } });
+  expect(await unreadCounter(userId)).toBe(0);
+  expect(await unreadCounter(otherUser)).toBe(1);
+});
+
+test('reconcileCounters repairs drifted counters', async () => {
+  const userId = new mongoose.Types.ObjectId();
+  await Notification.insertMany([notification(userId), notification(userId)]);
+  await unreadCounter(userId);
+  await counterStore.getCounts('user', userId);
+
+  // Drift - counter ko galat value par likho (jaise aborted transaction ke baad)
+  await Counter.collection.updateOne({ _id: `user:${userId}` }, { $set: { 'counts.unreadNotifications': 7 } });
+
+  const stats = await counterStore.reconcileCounters();
+
+  expect(stats.repaired).toBe(1);
+  expect(stats.errors).toBe(0);
+  const counts = await counterStore.getCounts('user', userId);
+  expect(counts.unreadNotifications).toBe(2);
+});
+
+test('a truncated reconcile resumes from the cursor stored on the job lease', async () => {
+  const users = [new mongoose.Types.ObjectId(), new mongoose.Types.ObjectId(), new mongoose.Types.ObjectId()];
+  await Promise.all(users.map((userId) => counterStore.getCounts('user', userId)));
+
+  // Budget turant khatam - pehle batch ke baad ruk jao
+  const first = await counterStore.reconcileCounters({ batchSize: 1, maxDurationMs: -1 });
+  expect(first).toEqual(expect.objectContaining({ checked: 1, truncated: true }));
+  const lease = await JobLease.findById('reconcileCounters').lean();
+  const [firstKey] = (await Counter.find().sort({ _id: 1 }).limit(1).lean()).map((doc) => doc._id);
+  expect(lease.cursor).toBe(firstKey);
+
+  // Agla run (kisi bhi replica par) wahi se aage badhta hai
+  const second = await counterStore.reconcileCounters();
+  expect(second).toEqual(expect.objectContaining({ checked: 2, truncated: false }));
+  expect((await JobLease.findById('reconcileCounters').lean()).cursor).toBeNull();
+});
+
+test('first read recounts a counter that was never reconciled', async () => {
+  const userId = new mongoose.Types.ObjectId();
+  // Raw collection writes - hooks nahi chalte, counter document bhi nahi banta
+  await Notification.collection.insertMany([
+    notification(userId, { isRead: false }),
+    notification(userId, { isRead: false }),
+    notification(userId, { isRead: true }),
+  ]);
+  expect(await Counter.findById(`user:${userId}`).lean()).toBeNull();
+
+  const counts = await counterStore.getCounts('user', userId);
+
+  expect(counts.unreadNotifications).toBe(2);
+  const stored = await Counter.findById(`user:${userId}`).lean();
+  expect(stored.reconciledAt).toBeTruthy();
+});
+
+test('recordChanges applies writes that bypassed the hooks', async () => {
+  const userId = new mongoose.Types.ObjectId();
+  await counterStore.getCounts('user', userId);
+
+  const docs = [notification(userId), notification(userId)];
+  await counterStore.recordChanges('Notification', [], docs);
+  expect(await unreadCounter(userId)).toBe(2);
+
+  await counterStore.recordChanges('Notification', [docs[0]], [{ ...docs[0], isRead: true }]);
+  expect(await unreadCounter(userId)).toBe(1);
+});
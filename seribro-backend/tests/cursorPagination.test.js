@@ -0,0 +1,82 @@
+const mongoose = require('mongoose');
+const { MongoMemoryReplSet } = require('mongodb-memory-server');
+const Application = require('../backend/models/Application');
+const { encodeCursor, decodeCursor, fetchCursorPage } = require('../backend/utils/pagination/cursorPagination');
+
+let replSet;
+
+beforeAll(async () => {
+  replSet = await MongoMemoryReplSet.create({ replSet: { count: 1 } });
+  const uri = replSet.getUri();
+  await mongoose.connect(uri, { useNewUrlParser: true, useUnifiedTopology: true });
+});
+
+afterAll(async () => {
+  await mongoose.disconnect();
+  await replSet.stop();
+});
+
+afterEach(async () => {
+  await Promise.all(Object.keys(mongoose.connection.collections).map(key => mongoose.connection.collections[key].deleteMany({})));
+});
+
+test('cursor tokens round-trip dates and numbers and reject foreign tokens', () => {
+  const id = new mongoose.Types.ObjectId();
+  const appliedAt = new Date('2026-02-03T04:05:06Z');
+
+  const dateCursor = decodeCursor(encodeCursor({ _id: id, appliedAt }, 'appliedAt'), 'appliedAt');
+  expect(dateCursor.value).toEqual(appliedAt);
+  expect(String(dateCursor.id)).toBe(String(id));
+
+  const numberCursor = decodeCursor(encodeCursor({ _id: id, budgetMax: 500 }, 'budgetMax'), 'budgetMax');
+  expect(numberCursor.value).toBe(500);
+
+  // Dusre sort ka token, kachra, aur bigda hua id - sab null
+  expect(decodeCursor(encodeCursor({ _id: id, appliedAt }, 'appliedAt'), 'budgetMax')).toBeNull();
+  expect(decodeCursor('not-a-token', 'appliedAt')).toBeNull();
+  const badId = Buffer.from(JSON.stringify({ k: 'appliedAt', t: 'date', v: appliedAt.toISOString(), id: 'x' })).toString('base64url');
+  expect(decodeCursor(badId, 'appliedAt')).toBeNull();
+});
+
+test('walking every page returns each row once, in order, even with tied sort values', async () => {
+  const studentId = new mongoose.Types.ObjectId();
+  const tie = new Date('2026-01-10T00:00:00Z');
+  const docs = Array.from({ length: 11 }, (_, i) => ({
+    _id: new mongoose.Types.ObjectId(),
+    studentId,
+    status: 'pending',
+    // Beech ke rows ka appliedAt same - tie _id se toot-ta hai
+    appliedAt: i >= 3 && i <= 7 ? tie : new Date(Date.UTC(2026, 0, 1 + i)),
+  }));
+  await Application.collection.insertMany(docs);
+  await Application.collection.insertOne({ studentId: new mongoose.Types.ObjectId(), status: 'pending', appliedAt: tie });
+
+  const expected = [...docs]
+    .sort((a, b) => (b.appliedAt - a.appliedAt) || (String(b._id) < String(a._id) ? -1 : 1))
+    .map((doc) => String(doc._id));
+
+  const seen = [];
+  let after;
+  let pages = 0;
+  do {
+    const page = await fetchCursorPage({
+      Model: Application, filter: { studentId }, field: 'appliedAt', direction: -1, limit: 4, after,
+    });
+    pages += 1;
+    expect(page.pagination.total).toBe(11);
+    seen.push(...page.items.map((item) => String(item._id)));
+    after = page.pagination.nextCursor;
+    expect(page.pagination.hasMore).toBe(Boolean(after));
+  } while (after);
+
+  expect(pages).toBe(3);
+  expect(seen).toEqual(expected);
+});
+
+test('an invalid cursor is reported instead of restarting from the first page', async () => {
+  const page = await fetchCursorPage({
+    Model: Application, filter: {}, field: 'appliedAt', direction: -1, limit: 5, after: 'garbage',
+  });
+
+  expect(page).toEqual({ error: 'Invalid pagination cursor' });
+});
@@ -0,0 +1,110 @@
+const mongoose = require('mongoose');
+const { MongoMemoryReplSet } = require('mongodb-memory-server');
+const Payment = require('../backend/models/Payment');
+const LedgerEntry = require('../backend/models/LedgerEntry');
+const LedgerBalance = require('../backend/models/LedgerBalance');
+const JobLease = require('../backend/models/JobLease');
+const earningsLedger = require('../backend/utils/ledger/earningsLedger');
+
+let replSet;
+
+beforeAll(async () => {
+  replSet = await MongoMemoryReplSet.create({ replSet: { count: 1 } });
+  const uri = replSet.getUri();
+  await mongoose.connect(uri, { useNewUrlParser: true, useUnifiedTopology: true });
+  // Transaction ke andar collections create nahi ho sakte - pehle bana lo
+  await Promise.all([LedgerEntry.createCollection(), LedgerBalance.createCollection()]);
+});
+
+afterAll(async () => {
+  await mongoose.disconnect();
+  await replSet.stop();
+});
+
+afterEach(async () => {
+  await Promise.all([Payment.deleteMany({}), LedgerEntry.deleteMany({}), LedgerBalance.deleteMany({}), JobLease.deleteMany({})]);
+});
+
+// getBalance unverified balance ko raw Payments se bana deta hai - postings check karne ke liye seedha padho
+const postedBalance = (scope, ref) => LedgerBalance.findById(`${scope}:${ref}`).lean();
+
+const createPayment = () => Payment.create({
+  project: new mongoose.Types.ObjectId(),
+  company: new mongoose.Types.ObjectId(),
+  student: new mongoose.Types.ObjectId(),
+  amount: 500,
+  netAmount: 450,
+});
+
+test('repeat transitions are each posted to the ledger', async () => {
+  const payment = await createPayment();
+
+  for (const status of ['captured', 'failed', 'captured']) {
+    payment.status = status;
+    await payment.save();
+  }
+
+  const entries = await LedgerEntry.find({ payment: payment._id }).sort({ seq: 1 }).lean();
+  expect(entries.map((entry) => `${entry.fromStatus}->${entry.toStatus}`)).toEqual([
+    'null->pending', 'pending->captured', 'captured->failed', 'failed->captured',
+  ]);
+  expect(entries.map((entry) => entry.seq)).toEqual([0, 1, 2, 3]);
+  expect(entries[3]._id).toBe(`${payment._id}:failed->captured:3`);
+
+  const balance = await postedBalance('student', payment.student);
+  expect(balance.totals.escrow).toBe(450);
+  expect(balance.entries).toBe(3);
+});
+
+test('replaying the latest transition is a no-op', async () => {
+  const payment = await createPayment();
+  payment.status = 'captured';
+  await payment.save();
+
+  const before = { ...payment.toObject(), status: 'pending' };
+  await earningsLedger.recordTransition(before, payment.toObject());
+
+  expect(await LedgerEntry.countDocuments({ payment: payment._id })).toBe(2);
+  const balance = await postedBalance('company', payment.company);
+  expect(balance.totals.escrow).toBe(450);
+  expect(balance.entries).toBe(1);
+});
+
+test('released payments land in the monthly bucket after a failed retry', async () => {
+  const payment = await createPayment();
+  for (const status of ['captured', 'failed', 'captured', 'ready_for_release', 'released']) {
+    payment.status = status;
+    if (status === 'released') payment.releasedAt = new Date('2026-03-15T00:00:00Z');
+    await payment.save();
+  }
+
+  const posted = await postedBalance('student', payment.student);
+  expect(posted.totals).toEqual(expect.objectContaining({ escrow: 0, released: 450, releasedCount: 1 }));
+  expect(posted.months['2026-03']).toEqual({ total: 450, count: 1 });
+
+  // Ek baar verify (opening balance), phir dobara verify par koi drift nahi
+  await earningsLedger.getBalance('student', payment.student);
+  const { drifted } = await earningsLedger.verifyBalance('student', payment.student);
+  expect(drifted).toBe(false);
+  expect(await LedgerEntry.countDocuments({ kind: 'adjustment' })).toBe(0);
+});
+
+test('a truncated verify resumes from the cursor stored on the job lease', async () => {
+  for (let i = 0; i < 2; i += 1) {
+    const payment = await createPayment();
+    payment.status = 'captured';
+    await payment.save();
+  }
+  // Har payment ke student aur company - 4 balances
+  const total = await LedgerBalance.countDocuments();
+  expect(total).toBe(4);
+
+  const first = await earningsLedger.verifyLedger({ batchSize: 1, maxDurationMs: -1 });
+  expect(first).toEqual(expect.objectContaining({ checked: 1, truncated: true }));
+  const [firstKey] = (await LedgerBalance.find().sort({ _id: 1 }).limit(1).lean()).map((doc) => doc._id);
+  expect((await JobLease.findById('verifyEarningsLedger').lean()).cursor).toBe(firstKey);
+
+  const second = await earningsLedger.verifyLedger();
+  expect(second).toEqual(expect.objectContaining({ checked: total - 1, truncated: false }));
+  expect((await JobLease.findById('verifyEarningsLedger').lean()).cursor).toBeNull();
+});
@@ -0,0 +1,96 @@
+const mongoose = require('mongoose');
+const { MongoMemoryReplSet } = require('mongodb-memory-server');
+const JobLease = require('../backend/models/JobLease');
+const { registerJob, startScheduler, stopScheduler, getJobMetrics, OWNER } = require('../backend/utils/scheduler/jobScheduler');
+
+let replSet;
+
+beforeAll(async () => {
+  replSet = await MongoMemoryReplSet.create({ replSet: { count: 1 } });
+  const uri = replSet.getUri();
+  await mongoose.connect(uri, { useNewUrlParser: true, useUnifiedTopology: true });
+});
+
+afterAll(async () => {
+  stopScheduler();
+  await mongoose.disconnect();
+  await replSet.stop();
+});
+
+afterEach(async () => {
+  stopScheduler();
+  await Promise.all(Object.keys(mongoose.connection.collections).map(key => mongoose.connection.collections[key].deleteMany({})));
+});
+
+const sleep = (ms) => new Promise((r) => setTimeout(r, ms));
+
+const metricsOf = async (name) => (await getJobMetrics()).jobs.find((job) => job.name === name);
+
+test('registerJob rejects incomplete definitions', () => {
+  expect(() => registerJob({ name: 'noop', interval: 1000 })).toThrow('needs a name and a run function');
+  expect(() => registerJob({ name: 'noop', run: async () => {} })).toThrow('needs a cron expression or an interval');
+  expect(() => registerJob({ name: 'noop', cron: 'not a cron', run: async () => {} })).toThrow('Invalid cron expression');
+});
+
+test('an interval job runs once per slot under a lease and records cluster metrics', async () => {
+  const run = jest.fn(async () => ({ processed: 3 }));
+  registerJob({ name: 'test:interval', interval: 100, jitterMs: 0, run, items: (result) => result.processed });
+  startScheduler();
+
+  await sleep(450);
+  stopScheduler();
+  await sleep(50);
+
+  expect(run.mock.calls.length).toBeGreaterThanOrEqual(2);
+  const lease = await JobLease.findById('test:interval').lean();
+  expect(lease.owner).toBe(OWNER);
+  expect(lease.leaseUntil).toBeNull();
+  expect(lease.totals).toEqual({ runs: run.mock.calls.length, failures: 0, items: 3 * run.mock.calls.length });
+  expect(lease.lastRun).toEqual(expect.objectContaining({ success: true, items: 3 }));
+
+  const metrics = await metricsOf('test:interval');
+  expect(metrics.local).toEqual(expect.objectContaining({ runs: run.mock.calls.length, failures: 0, lastItems: 3 }));
+});
+
+test('a live lease held by another replica blocks the run until it expires', async () => {
+  await JobLease.create({ _id: 'test:leased', owner: 'other-host:1:abc', leaseUntil: new Date(Date.now() + 60 * 1000) });
+  const run = jest.fn(async () => ({}));
+  registerJob({ name: 'test:leased', interval: 100, jitterMs: 0, run });
+  startScheduler();
+
+  await sleep(350);
+  expect(run).not.toHaveBeenCalled();
+  expect((await metricsOf('test:leased')).local.skippedLease).toBeGreaterThan(0);
+
+  // Dusre replica ka process mar gaya - lease expire
+  await JobLease.updateOne({ _id: 'test:leased' }, { $set: { leaseUntil: new Date(Date.now() - 1000) } });
+  await sleep(300);
+  expect(run).toHaveBeenCalled();
+});
+
+test('a slow run skips overlapping ticks instead of stacking them', async () => {
+  const run = jest.fn(() => sleep(350));
+  registerJob({ name: 'test:slow', interval: 100, jitterMs: 0, run });
+  startScheduler();
+
+  await sleep(400);
+  stopScheduler();
+
+  expect(run).toHaveBeenCalledTimes(1);
+  expect((await metricsOf('test:slow')).local.skippedOverlap).toBeGreaterThan(0);
+  await sleep(150);
+});
+
+test('failures are counted locally and in the cluster totals', async () => {
+  registerJob({ name: 'test:failing', interval: 100, jitterMs: 0, run: async () => { throw new Error('boom'); } });
+  startScheduler();
+
+  await sleep(250);
+  stopScheduler();
+  await sleep(50);
+
+  const lease = await JobLease.findById('test:failing').lean();
+  expect(lease.totals.failures).toBeGreaterThanOrEqual(1);
+  expect(lease.lastRun).toEqual(expect.objectContaining({ success: false, error: 'boom' }));
+  expect((await metricsOf('test:failing')).local.lastError).toBe('boom');
+});
@@ -0,0 +1,97 @@
+const mongoose = require('mongoose');
+const { MongoMemoryReplSet } = require('mongodb-memory-server');
+const Notification = require('../backend/models/Notification');
+const NotificationOutbox = require('../backend/models/NotificationOutbox');
+const { enqueue, sweepOutbox, drainNotificationOutbox } = require('../backend/utils/notifications/notificationOutbox');
+const responseCache = require('../backend/utils/responseCache');
+
+let replSet;
+
+beforeAll(async () => {
+  replSet = await MongoMemoryReplSet.create({ replSet: { count: 1 } });
+  const uri = replSet.getUri();
+  await mongoose.connect(uri, { useNewUrlParser: true, useUnifiedTopology: true });
+});
+
+afterAll(async () => {
+  await mongoose.disconnect();
+  await replSet.stop();
+});
+
+afterEach(async () => {
+  jest.restoreAllMocks();
+  await Promise.all(Object.keys(mongoose.connection.collections).map(key => mongoose.connection.collections[key].deleteMany({})));
+});
+
+const notificationFor = (userId, message) => ({ userId, userRole: 'student', message, type: 'info' });
+
+test('fast path inserts notifications directly without touching the outbox', async () => {
+  const userId = new mongoose.Types.ObjectId();
+  const outboxInsert = jest.spyOn(NotificationOutbox, 'insertMany');
+  const outboxDelete = jest.spyOn(NotificationOutbox, 'deleteMany');
+
+  const queued = enqueue([notificationFor(userId, 'one'), notificationFor(userId, 'two')]);
+  await drainNotificationOutbox();
+
+  expect(queued).toHaveLength(2);
+  const stored = await Notification.find({ userId }).lean();
+  expect(stored.map(n => String(n._id)).sort()).toEqual(queued.map(n => String(n._id)).sort());
+  expect(outboxInsert).not.toHaveBeenCalled();
+  expect(outboxDelete).not.toHaveBeenCalled();
+  expect(await NotificationOutbox.countDocuments()).toBe(0);
+});
+
+test('failed insert parks the batch and the sweep replays it once', async () => {
+  const userId = new mongoose.Types.ObjectId();
+  jest.spyOn(Notification, 'insertMany').mockRejectedValueOnce(new Error('primary stepped down'));
+
+  const queued = enqueue(notificationFor(userId, 'parked'));
+  await drainNotificationOutbox();
+
+  expect(await Notification.countDocuments({ userId })).toBe(0);
+  const parked = await NotificationOutbox.find().lean();
+  expect(parked).toHaveLength(1);
+  expect(String(parked[0]._id)).toBe(String(queued[0]._id));
+  expect(parked[0].lastError).toBe('primary stepped down');
+
+  const result = await sweepOutbox();
+
+  expect(result.replayed).toBe(1);
+  const stored = await Notification.find({ userId }).lean();
+  expect(stored).toHaveLength(1);
+  expect(String(stored[0]._id)).toBe(String(queued[0]._id));
+  expect(await NotificationOutbox.countDocuments()).toBe(0);
+});
+
+test('replaying an already inserted notification does not duplicate it', async () => {
+  const userId = new mongoose.Types.ObjectId();
+  const [queued] = enqueue(notificationFor(userId, 'dup'));
+  await drainNotificationOutbox();
+
+  const { _id, ...payload } = queued;
+  await NotificationOutbox.create({ _id, payload, attempts: 1 });
+  await sweepOutbox();
+
+  expect(await Notification.countDocuments({ userId })).toBe(1);
+  expect(await NotificationOutbox.countDocuments()).toBe(0);
+});
+
+test('replay that hits a duplicate still bumps the version for the newly inserted notifications', async () => {
+  const userId = new mongoose.Types.ObjectId();
+  const [delivered] = enqueue(notificationFor(userId, 'first'));
+  await drainNotificationOutbox();
+  const tagOf = () => responseCache.versionTag([['Notification', userId]]).tag;
+  const tagBefore = tagOf();
+
+  // Ek row pehle hi insert ho chuki (duplicate), doosri nayi - insertMany error deta hai, hooks nahi chalte
+  const { _id: deliveredId, ...deliveredPayload } = delivered;
+  const fresh = new mongoose.Types.ObjectId();
+  await NotificationOutbox.create([
+    { _id: deliveredId, payload: deliveredPayload, attempts: 1 },
+    { _id: fresh, payload: notificationFor(userId, 'second'), attempts: 1 },
+  ]);
+  await sweepOutbox();
+
+  expect(await Notification.countDocuments({ userId })).toBe(2);
+  expect(tagOf()).not.toBe(tagBefore);
+});
@@ -0,0 +1,94 @@
+const { createPresenceCoalescer } = require('../backend/utils/socket/presenceCoalescer');
+
+let frames;
+let coalescer;
+
+beforeEach(() => {
+  frames = [];
+  coalescer = createPresenceCoalescer({ emit: (roomId, frame, options) => frames.push({ roomId, frame, options }) });
+});
+
+afterEach(() => {
+  coalescer.close();
+});
+
+const eventsOf = (frame) => frame.frame.events.map((event) => `${event.type}:${event.userId}`);
+
+test('repeated typing_start inside one tick goes out as a single event', () => {
+  coalescer.typingStart('project_p1', 'u1', { userName: 'Asha' });
+  coalescer.typingStart('project_p1', 'u1', { userName: 'Asha' });
+  coalescer.typingStart('project_p1', 'u1', { userName: 'Asha' });
+  coalescer.flush();
+
+  expect(frames).toHaveLength(1);
+  expect(frames[0].frame.projectId).toBe('p1');
+  expect(eventsOf(frames[0])).toEqual(['typing_start:u1']);
+  expect(frames[0].frame.events[0].userName).toBe('Asha');
+  expect(coalescer.stats()).toEqual(expect.objectContaining({ merged: 2, emittedEvents: 1, frames: 1 }));
+});
+
+test('start and stop in the same tick cancel out', () => {
+  coalescer.typingStart('project_p1', 'u1', {});
+  coalescer.typingStop('project_p1', 'u1');
+  coalescer.flush();
+
+  expect(frames).toHaveLength(0);
+  expect(coalescer.stats().merged).toBe(2);
+});
+
+test('typing shown recently is debounced and a later stop is delivered', () => {
+  coalescer.typingStart('project_p1', 'u1', {});
+  coalescer.flush();
+  // Debounce window ke andar - dobara announce nahi
+  coalescer.typingStart('project_p1', 'u1', {});
+  coalescer.flush();
+  coalescer.typingStop('project_p1', 'u1');
+  coalescer.typingStop('project_p1', 'u1');
+  coalescer.flush();
+
+  expect(frames.map(eventsOf)).toEqual([['typing_start:u1'], ['typing_stop:u1']]);
+  expect(coalescer.stats().typingRooms).toBe(0);
+});
+
+test('presence events collapse to the latest per user and clear typing on offline', () => {
+  coalescer.typingStart('project_p1', 'u1', {});
+  coalescer.presence('project_p1', { type: 'user_online', userId: 'u1', isOnline: true });
+  coalescer.presence('project_p1', { type: 'user_offline', userId: 'u1', isOnline: false });
+  coalescer.presence('project_p1', { type: 'user_online', userId: 'u2', isOnline: true });
+  coalescer.flush();
+
+  expect(frames).toHaveLength(1);
+  expect(eventsOf(frames[0])).toEqual(['user_offline:u1', 'user_online:u2']);
+});
+
+test('local and cluster presence for one room are flushed as separate frames', () => {
+  coalescer.presence('project_p1', { type: 'user_online', userId: 'u1', isOnline: true });
+  coalescer.presence('project_p1', { type: 'user_online', userId: 'u2', isOnline: true }, { local: true });
+  coalescer.flush();
+
+  expect(frames.map((f) => [f.options.local, eventsOf(f)])).toEqual([
+    [false, ['user_online:u1']],
+    [true, ['user_online:u2']],
+  ]);
+});
+
+test('each socket is rate limited by its own token bucket', () => {
+  const noisy = { data: {} };
+  const quiet = { data: {} };
+
+  const allowed = Array.from({ length: 40 }, () => coalescer.allow(noisy)).filter(Boolean).length;
+
+  // Burst = SOCKET_EVENT_RATE * 2 (default 10/s); test itne jaldi chalta hai ki refill ~0
+  expect(allowed).toBeGreaterThanOrEqual(20);
+  expect(allowed).toBeLessThan(25);
+  expect(coalescer.allow(quiet)).toBe(true);
+  expect(coalescer.stats().rateLimited).toBe(40 - allowed);
+});
+
+test('queued events are flushed on the tick without a manual flush', async () => {
+  coalescer.typingStart('project_p2', 'u1', {});
+
+  await new Promise((r) => setTimeout(r, 150));
+
+  expect(frames.map(eventsOf)).toEqual([['typing_start:u1']]);
+});
@@ -0,0 +1,104 @@
+// Heartbeat chhota rakho taki expiry test jaldi ho (module load se pehle)
+process.env.PRESENCE_HEARTBEAT_MS = '50';
+
+const { createMemoryBus } = require('../backend/utils/socket/bus/memoryBus');
+const { createPresenceRegistry } = require('../backend/utils/socket/presenceRegistry');
+
+const tick = (ms = 5) => new Promise((r) => setTimeout(r, ms));
+
+// Crash simulate karne ke liye - alive false hote hi node kuch publish nahi karta (bye bhi nahi)
+const crashableBus = () => {
+  const bus = createMemoryBus();
+  const control = { alive: true };
+  return {
+    control,
+    bus: { ...bus, publish: (channel, message) => control.alive && bus.publish(channel, message) },
+    close: () => bus.close(),
+  };
+};
+
+const registries = [];
+const buses = [];
+const createNode = (nodeId, onExpire) => {
+  const wire = crashableBus();
+  const registry = createPresenceRegistry({ bus: wire.bus, nodeId, onExpire });
+  registries.push(registry);
+  buses.push(wire);
+  return { registry, wire };
+};
+
+afterEach(async () => {
+  registries.splice(0).forEach((registry) => registry.close());
+  await Promise.all(buses.splice(0).map((wire) => wire.close()));
+});
+
+test('memory bus never delivers a message back to its publisher', async () => {
+  const a = createMemoryBus();
+  const b = createMemoryBus();
+  const seenByA = jest.fn();
+  const seenByB = jest.fn();
+  a.subscribe('ch', seenByA);
+  b.subscribe('ch', seenByB);
+
+  a.publish('ch', { hello: 1 });
+  await tick();
+
+  expect(seenByA).not.toHaveBeenCalled();
+  expect(seenByB).toHaveBeenCalledWith({ hello: 1 });
+  await Promise.all([a.close(), b.close()]);
+});
+
+test('joins replicate across nodes and a user stays online while any socket remains', async () => {
+  const { registry: a } = createNode('node-a');
+  const { registry: b } = createNode('node-b');
+  await tick();
+
+  expect(a.join('sa', 'u1', 'p1')).toBe(true);
+  await tick();
+  expect(b.isOnline('u1', 'p1')).toBe(true);
+  // Cluster mein user pehle se online hai - dusra socket "came online" nahi
+  expect(b.join('sb', 'u1', 'p1')).toBe(false);
+  await tick();
+
+  expect(a.leave('sa')).toEqual([]);
+  await tick();
+  expect(a.isOnline('u1', 'p1')).toBe(true);
+
+  expect(b.leave('sb')).toEqual([{ userId: 'u1', projectId: 'p1' }]);
+  await tick();
+  expect(a.getOnlineUsers('p1')).toEqual([]);
+});
+
+test('a node that joins late learns existing sockets from the hello snapshot', async () => {
+  const { registry: a } = createNode('node-a');
+  a.join('sa', 'u1', 'p1');
+  await tick();
+
+  const { registry: late } = createNode('node-late');
+  await tick(20);
+
+  expect(late.getOnlineUsers('p1')).toEqual(['u1']);
+  expect(late.stats()).toEqual(expect.objectContaining({ nodes: 2, sockets: 1, localSockets: 0 }));
+});
+
+test('a clean shutdown and a missed heartbeat both report the users lost with the node', async () => {
+  const expired = jest.fn();
+  const { registry: watcher } = createNode('watcher', expired);
+  const { registry: leaving } = createNode('leaving');
+  const { registry: crashing, wire: crashingWire } = createNode('crashing');
+  await tick();
+
+  leaving.join('s1', 'u1', 'p1');
+  crashing.join('s2', 'u2', 'p2');
+  await tick();
+
+  leaving.close();
+  await tick();
+  expect(expired).toHaveBeenCalledWith([{ userId: 'u1', projectId: 'p1' }]);
+
+  crashingWire.control.alive = false;
+  // TTL = 3 heartbeats (150ms) - uske baad watcher ka heartbeat node ko drop kare
+  await tick(260);
+  expect(expired).toHaveBeenCalledWith([{ userId: 'u2', projectId: 'p2' }]);
+  expect(watcher.isOnline('u2', 'p2')).toBe(false);
+});
@@ -0,0 +1,110 @@
+const mongoose = require('mongoose');
+const express = require('express');
+const request = require('supertest');
+const jwt = require('jsonwebtoken');
+const { MongoMemoryReplSet } = require('mongodb-memory-server');
+const User = require('../backend/models/User');
+const CompanyProfile = require('../backend/models/companyProfile');
+const principalCache = require('../backend/utils/principalCache');
+const { protect } = require('../backend/middleware/authMiddleware');
+const { createMemoryBus } = require('../backend/utils/socket/bus/memoryBus');
+
+let replSet;
+
+beforeAll(async () => {
+  process.env.JWT_SECRET = process.env.JWT_SECRET || 'principal-cache-test-secret';
+  replSet = await MongoMemoryReplSet.create({ replSet: { count: 1 } });
+  const uri = replSet.getUri();
+  await mongoose.connect(uri, { useNewUrlParser: true, useUnifiedTopology: true });
+});
+
+afterAll(async () => {
+  await mongoose.disconnect();
+  await replSet.stop();
+});
+
+afterEach(async () => {
+  jest.restoreAllMocks();
+  principalCache.clear();
+  await Promise.all(Object.keys(mongoose.connection.collections).map(key => mongoose.connection.collections[key].deleteMany({})));
+});
+
+const app = express();
+app.get('/me', protect, (req, res) => {
+  res.json({ role: req.user.role, companyProfileId: req.user.companyProfileId ? String(req.user.companyProfileId) : null });
+});
+
+const tokenFor = (user) => jwt.sign({ userId: String(user._id) }, process.env.JWT_SECRET, { expiresIn: '1h' });
+
+test('repeat requests with the same token are served from the cache', async () => {
+  const user = await User.create({ email: 'cached@test.com', password: 'CompanyPass1!', role: 'company' });
+  const profile = await CompanyProfile.create({ user: user._id, companyName: 'Cached Co' });
+  const token = tokenFor(user);
+  const findUser = jest.spyOn(User, 'findById');
+
+  const first = await request(app).get('/me').set('Authorization', `Bearer ${token}`);
+  const second = await request(app).get('/me').set('Authorization', `Bearer ${token}`);
+
+  expect(first.body).toEqual({ role: 'company', companyProfileId: String(profile._id) });
+  expect(second.body).toEqual(first.body);
+  expect(findUser).toHaveBeenCalledTimes(1);
+});
+
+test('user and profile writes invalidate the cached principal', async () => {
+  const user = await User.create({ email: 'changes@test.com', password: 'CompanyPass1!', role: 'company' });
+  const token = tokenFor(user);
+
+  const before = await request(app).get('/me').set('Authorization', `Bearer ${token}`);
+  expect(before.body.companyProfileId).toBeNull();
+
+  // Profile bana - cached principal ka companyProfileId purana ho gaya
+  const profile = await CompanyProfile.create({ user: user._id, companyName: 'Later Co' });
+  const afterProfile = await request(app).get('/me').set('Authorization', `Bearer ${token}`);
+  expect(afterProfile.body.companyProfileId).toBe(String(profile._id));
+
+  await User.updateOne({ _id: user._id }, { $set: { role: 'admin' } });
+  const afterRole = await request(app).get('/me').set('Authorization', `Bearer ${token}`);
+  expect(afterRole.body.role).toBe('admin');
+});
+
+test('entries never outlive the token and invalidateUser drops every token of a user', () => {
+  const now = Math.floor(Date.now() / 1000);
+  const expired = { userId: 'u1', iat: now - 10, exp: now - 1 };
+  principalCache.set(expired, { user: { _id: 'u1' } });
+  expect(principalCache.get(expired)).toBeNull();
+
+  const laptop = { userId: 'u2', iat: now - 5, exp: now + 3600 };
+  const phone = { userId: 'u2', iat: now, exp: now + 3600 };
+  principalCache.set(laptop, { user: { _id: 'u2' } });
+  principalCache.set(phone, { user: { _id: 'u2' } });
+  expect(principalCache.get(phone)).toEqual({ user: { _id: 'u2' } });
+
+  principalCache.invalidateUser('u2');
+
+  expect(principalCache.get(laptop)).toBeNull();
+  expect(principalCache.get(phone)).toBeNull();
+});
+
+test('invalidations from other nodes arrive over the bus', async () => {
+  const localBus = createMemoryBus();
+  const remoteBus = createMemoryBus();
+  const published = [];
+  remoteBus.subscribe('auth.principalCache', (event) => published.push(event));
+  principalCache.attachBus(localBus);
+
+  const now = Math.floor(Date.now() / 1000);
+  const token = { userId: 'u3', iat: now, exp: now + 3600 };
+  principalCache.set(token, { user: { _id: 'u3' } });
+
+  // Dusre node par role change - yahan wala entry bhi hatna chahiye
+  remoteBus.publish('auth.principalCache', { u: 'u3' });
+  await new Promise((r) => setTimeout(r, 10));
+  expect(principalCache.get(token)).toBeNull();
+
+  principalCache.invalidateUser('u4');
+  await new Promise((r) => setTimeout(r, 10));
+  expect(published).toEqual([{ u: 'u4' }]);
+
+  principalCache.attachBus(null);
+  await Promise.all([localBus.close(), remoteBus.close()]);
+});
@@ -0,0 +1,91 @@
+const mongoose = require('mongoose');
+const { MongoMemoryReplSet } = require('mongodb-memory-server');
+const CompanyProfile = require('../backend/models/companyProfile');
+const User = require('../backend/models/User');
+const Project = require('../backend/models/Project');
+const { browseProjects } = require('../backend/controllers/studentProjectController');
+
+let replSet;
+
+beforeAll(async () => {
+  replSet = await MongoMemoryReplSet.create({ replSet: { count: 1 } });
+  const uri = replSet.getUri();
+  await mongoose.connect(uri, { useNewUrlParser: true, useUnifiedTopology: true });
+  // $text ke liye text index bana hona chahiye
+  await Project.init();
+});
+
+afterAll(async () => {
+  await mongoose.disconnect();
+  await replSet.stop();
+});
+
+afterEach(async () => {
+  await Promise.all(Object.keys(mongoose.connection.collections).map(key => mongoose.connection.collections[key].deleteMany({})));
+});
+
+const seedProjects = async () => {
+  const companyUser = await User.create({ email: 'browse@test.com', password: 'CompanyPass1!', role: 'company' });
+  const companyProfile = await CompanyProfile.create({ user: companyUser._id, companyName: 'Browse Co' });
+  const base = {
+    company: companyUser._id,
+    companyId: companyProfile._id,
+    category: 'Web Development',
+    budgetMin: 10,
+    budgetMax: 100,
+    projectDuration: '1 week',
+    deadline: new Date(Date.now() + 1000 * 60 * 60 * 24),
+    createdBy: companyUser._id,
+  };
+  await Project.create({ ...base, title: 'React dashboard', description: 'Build a React admin dashboard', requiredSkills: ['React'] });
+  await Project.create({ ...base, title: 'API server', description: 'REST API on Node.js with Express', requiredSkills: ['Node.js'] });
+};
+
+const browse = async (query) => {
+  const req = { query, user: { id: new mongoose.Types.ObjectId() } };
+  const res = { status: function(code) { this._status = code; return this; }, json: function(obj) { this._body = obj; return this; } };
+  await browseProjects(req, res);
+  return res;
+};
+
+test('whole-word search uses the text index', async () => {
+  await seedProjects();
+
+  const res = await browse({ search: 'dashboard' });
+
+  expect(res._status).toBe(200);
+  expect(res._body.data.searchMode).toBe('text');
+  expect(res._body.data.projects.map(p => p.title)).toEqual(['React dashboard']);
+});
+
+test('partial-word search falls back to regex when the text search finds nothing', async () => {
+  await seedProjects();
+
+  const partial = await browse({ search: 'reac' });
+  expect(partial._body.data.searchMode).toBe('regex');
+  expect(partial._body.data.projects.map(p => p.title)).toEqual(['React dashboard']);
+  expect(partial._body.data.pagination.total).toBe(1);
+
+  const dotted = await browse({ search: 'node.j' });
+  expect(dotted._body.data.searchMode).toBe('regex');
+  expect(dotted._body.data.projects.map(p => p.title)).toEqual(['API server']);
+});
+
+test('cursor mode falls back the same way', async () => {
+  await seedProjects();
+
+  const res = await browse({ search: 'dash', sortBy: 'newest', paginate: 'cursor' });
+
+  expect(res._status).toBe(200);
+  expect(res._body.data.searchMode).toBe('regex');
+  expect(res._body.data.projects.map(p => p.title)).toEqual(['React dashboard']);
+});
+
+test('no match in either mode returns an empty page', async () => {
+  await seedProjects();
+
+  const res = await browse({ search: 'kubernetes' });
+
+  expect(res._body.data.projects).toEqual([]);
+  expect(res._body.data.pagination.total).toBe(0);
+});
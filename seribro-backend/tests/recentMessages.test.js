@@ -0,0 +1,143 @@
+// Chhota buffer taki overflow jaldi dikhe (module load se pehle)
+process.env.RECENT_MESSAGES_SIZE = '5';
+
+const mongoose = require('mongoose');
+const { MongoMemoryReplSet } = require('mongodb-memory-server');
+const Message = require('../backend/models/Message');
+const recentMessages = require('../backend/utils/workspace/recentMessages');
+const { createMemoryBus } = require('../backend/utils/socket/bus/memoryBus');
+
+let replSet;
+
+beforeAll(async () => {
+  replSet = await MongoMemoryReplSet.create({ replSet: { count: 1 } });
+  const uri = replSet.getUri();
+  await mongoose.connect(uri, { useNewUrlParser: true, useUnifiedTopology: true });
+});
+
+afterAll(async () => {
+  recentMessages.attachBus(null);
+  await mongoose.disconnect();
+  await replSet.stop();
+});
+
+afterEach(async () => {
+  jest.restoreAllMocks();
+  await Promise.all(Object.keys(mongoose.connection.collections).map(key => mongoose.connection.collections[key].deleteMany({})));
+});
+
+const student = new mongoose.Types.ObjectId();
+const company = new mongoose.Types.ObjectId();
+
+// Ek second ke andar bhi order pakka rahe - createdAt khud set
+const seedMessages = async (projectId, count, start = Date.UTC(2026, 0, 1)) => {
+  const docs = Array.from({ length: count }, (_, i) => ({
+    _id: new mongoose.Types.ObjectId(),
+    project: projectId,
+    sender: i % 2 === 0 ? student : company,
+    senderRole: i % 2 === 0 ? 'student' : 'company',
+    senderName: i % 2 === 0 ? 'Student' : 'Company',
+    message: `m${i}`,
+    isRead: false,
+    createdAt: new Date(start + i * 1000),
+  }));
+  await Message.collection.insertMany(docs);
+  return docs;
+};
+
+test('first read primes from Mongo once and later reads come from the buffer', async () => {
+  const projectId = new mongoose.Types.ObjectId();
+  await seedMessages(projectId, 3);
+  const find = jest.spyOn(Message, 'find');
+
+  const first = await recentMessages.getRecentMessages(projectId);
+  const second = await recentMessages.getRecentMessages(projectId, 2);
+
+  expect(first.messages.map((m) => m.message)).toEqual(['m0', 'm1', 'm2']);
+  expect(first.hasMore).toBe(false);
+  expect(second.messages.map((m) => m.message)).toEqual(['m1', 'm2']);
+  expect(second.hasMore).toBe(true);
+  expect(find).toHaveBeenCalledTimes(1);
+});
+
+test('pushes keep only the newest messages and flag older history', async () => {
+  const projectId = new mongoose.Types.ObjectId();
+  await seedMessages(projectId, 4);
+  await recentMessages.getRecentMessages(projectId);
+
+  for (let i = 4; i < 7; i += 1) {
+    recentMessages.pushMessage(projectId, { _id: new mongoose.Types.ObjectId(), sender: student, message: `m${i}`, isRead: false });
+  }
+
+  const { messages, hasMore } = await recentMessages.getRecentMessages(projectId);
+  expect(messages.map((m) => m.message)).toEqual(['m2', 'm3', 'm4', 'm5', 'm6']);
+  expect(hasMore).toBe(true);
+});
+
+test('markRead only flips messages from the other party', async () => {
+  const projectId = new mongoose.Types.ObjectId();
+  await seedMessages(projectId, 2);
+  await recentMessages.getRecentMessages(projectId);
+
+  recentMessages.markRead(projectId, company);
+
+  const { messages } = await recentMessages.getRecentMessages(projectId);
+  expect(messages.map((m) => [m.message, m.isRead])).toEqual([['m0', true], ['m1', false]]);
+});
+
+test('pushes that arrive while the buffer is priming are replayed after the load', async () => {
+  const projectId = new mongoose.Types.ObjectId();
+  await seedMessages(projectId, 2);
+
+  const loading = recentMessages.getRecentMessages(projectId);
+  // Prime abhi chal raha hai - ye push pending mein jaana chahiye, duplicate nahi
+  const liveId = new mongoose.Types.ObjectId();
+  recentMessages.pushMessage(projectId, { _id: liveId, sender: company, message: 'live', isRead: false });
+  recentMessages.pushMessage(projectId, { _id: liveId, sender: company, message: 'live', isRead: false });
+  await loading;
+
+  const { messages } = await recentMessages.getRecentMessages(projectId);
+  expect(messages.map((m) => m.message)).toEqual(['m0', 'm1', 'live']);
+});
+
+test('pushes and reads from other nodes arrive over the bus', async () => {
+  const projectId = new mongoose.Types.ObjectId();
+  await recentMessages.getRecentMessages(projectId);
+  const localBus = createMemoryBus();
+  const remoteBus = createMemoryBus();
+  recentMessages.attachBus(localBus);
+
+  const remoteId = new mongoose.Types.ObjectId();
+  remoteBus.publish('workspace.recentMessages', {
+    t: 'push', p: String(projectId), m: { _id: String(remoteId), project: String(projectId), sender: String(student), message: 'remote', isRead: false },
+  });
+  remoteBus.publish('workspace.recentMessages', { t: 'read', p: String(projectId), u: String(company), at: new Date().toISOString() });
+  await new Promise((r) => setTimeout(r, 10));
+
+  const { messages } = await recentMessages.getRecentMessages(projectId);
+  expect(messages).toEqual([expect.objectContaining({ message: 'remote', isRead: true })]);
+
+  recentMessages.attachBus(null);
+  await Promise.all([localBus.close(), remoteBus.close()]);
+});
+
+test('history before a cursor pages back through older messages chronologically', async () => {
+  const projectId = new mongoose.Types.ObjectId();
+  const docs = await seedMessages(projectId, 7);
+  const anchor = docs[4];
+
+  // Raw `<createdAt ISO>,<id>` pair - anchor se strictly purane messages
+  const page = await Message.getProjectMessagesBefore(projectId, {
+    before: `${anchor.createdAt.toISOString()},${anchor._id}`,
+    limit: 3,
+  });
+
+  expect(page.messages.map((m) => m.message)).toEqual(['m1', 'm2', 'm3']);
+  expect(page.pagination.hasMore).toBe(true);
+
+  const older = await Message.getProjectMessagesBefore(projectId, { before: page.pagination.nextCursor, limit: 3 });
+  expect(older.messages.map((m) => m.message)).toEqual(['m0']);
+  expect(older.pagination.hasMore).toBe(false);
+
+  expect(await Message.getProjectMessagesBefore(projectId, { before: 'garbage' })).toEqual({ error: 'Invalid pagination cursor' });
+});
@@ -0,0 +1,77 @@
+const mongoose = require('mongoose');
+const { MongoMemoryReplSet } = require('mongodb-memory-server');
+const CompanyProfile = require('../backend/models/companyProfile');
+const Company = require('../backend/models/Company');
+const { BatchLoader, getLoaders, toCompanyCard } = require('../backend/utils/loaders/requestLoaders');
+
+let replSet;
+
+beforeAll(async () => {
+  replSet = await MongoMemoryReplSet.create({ replSet: { count: 1 } });
+  const uri = replSet.getUri();
+  await mongoose.connect(uri, { useNewUrlParser: true, useUnifiedTopology: true });
+});
+
+afterAll(async () => {
+  await mongoose.disconnect();
+  await replSet.stop();
+});
+
+afterEach(async () => {
+  jest.restoreAllMocks();
+  await Promise.all(Object.keys(mongoose.connection.collections).map(key => mongoose.connection.collections[key].deleteMany({})));
+});
+
+const echoBatch = () => jest.fn(async (keys) => new Map(keys.filter((key) => key !== 'missing').map((key) => [key, { key }])));
+
+test('same-tick loads share one deduplicated batch and later loads hit the cache', async () => {
+  const batchFn = echoBatch();
+  const loader = new BatchLoader(batchFn);
+
+  const results = await Promise.all([loader.load('a'), loader.load('b'), loader.load('a'), loader.load('missing')]);
+
+  expect(results).toEqual([{ key: 'a' }, { key: 'b' }, { key: 'a' }, null]);
+  expect(batchFn).toHaveBeenCalledTimes(1);
+  expect(batchFn).toHaveBeenCalledWith(['a', 'b', 'missing']);
+
+  await loader.loadMany(['a', 'b']);
+  expect(batchFn).toHaveBeenCalledTimes(1);
+  expect(await loader.load(null)).toBeNull();
+});
+
+test('a failed batch is not cached', async () => {
+  const batchFn = jest.fn()
+    .mockRejectedValueOnce(new Error('network blip'))
+    .mockImplementation(async (keys) => new Map(keys.map((key) => [key, { key }])));
+  const loader = new BatchLoader(batchFn);
+
+  await expect(loader.load('a')).rejects.toThrow('network blip');
+  await expect(loader.load('a')).resolves.toEqual({ key: 'a' });
+  expect(batchFn).toHaveBeenCalledTimes(2);
+});
+
+test('company loader resolves profiles and legacy companies in at most two queries', async () => {
+  const profileId = new mongoose.Types.ObjectId();
+  const legacyId = new mongoose.Types.ObjectId();
+  await CompanyProfile.collection.insertOne({
+    _id: profileId, companyName: 'Profile Co', officeAddress: { city: 'Pune' }, verificationStatus: 'approved',
+  });
+  await Company.collection.insertOne({ _id: legacyId, companyName: 'Legacy Co', city: 'Delhi', isVerified: false });
+  const profileFind = jest.spyOn(CompanyProfile, 'find');
+  const legacyFind = jest.spyOn(Company, 'find');
+
+  const req = {};
+  const { company } = getLoaders(req);
+  const [profile, legacy, unknown, invalid] = await Promise.all([
+    company.load(profileId), company.load(legacyId), company.load(new mongoose.Types.ObjectId()), company.load('nope'),
+  ]);
+
+  expect(profileFind).toHaveBeenCalledTimes(1);
+  expect(legacyFind).toHaveBeenCalledTimes(1);
+  expect(toCompanyCard(profile)).toEqual({ name: 'Profile Co', city: 'Pune', logo: undefined, isVerified: true });
+  expect(toCompanyCard(legacy)).toEqual({ name: 'Legacy Co', city: 'Delhi', logo: undefined, isVerified: false });
+  expect(unknown).toBeNull();
+  expect(invalid).toBeNull();
+  // Loaders request par hi rehte hain
+  expect(getLoaders(req).company).toBe(company);
+});
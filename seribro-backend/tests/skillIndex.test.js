@@ -0,0 +1,85 @@
+const mongoose = require('mongoose');
+const { MongoMemoryReplSet } = require('mongodb-memory-server');
+const Project = require('../backend/models/Project');
+const skillIndex = require('../backend/utils/students/skillIndex');
+
+let replSet;
+
+beforeAll(async () => {
+  replSet = await MongoMemoryReplSet.create({ replSet: { count: 1 } });
+  const uri = replSet.getUri();
+  await mongoose.connect(uri, { useNewUrlParser: true, useUnifiedTopology: true });
+});
+
+afterAll(async () => {
+  await mongoose.disconnect();
+  await replSet.stop();
+});
+
+afterEach(async () => {
+  await Promise.all(Object.keys(mongoose.connection.collections).map(key => mongoose.connection.collections[key].deleteMany({})));
+  // Index process-wide hai - har test fresh rebuild se shuru ho
+  skillIndex.markStale();
+});
+
+const createProject = (title, requiredSkills, extra = {}) => {
+  const companyUser = new mongoose.Types.ObjectId();
+  return Project.create({
+    company: companyUser,
+    companyId: new mongoose.Types.ObjectId(),
+    title,
+    description: `${title} description`,
+    category: 'Web Development',
+    requiredSkills,
+    budgetMin: 10,
+    budgetMax: 100,
+    projectDuration: '1 week',
+    deadline: new Date(Date.now() + 1000 * 60 * 60 * 24),
+    createdBy: companyUser,
+    ...extra,
+  });
+};
+
+const titlesFor = async (skills, k) => {
+  const top = await skillIndex.topProjectsForSkills(skills, k);
+  const projects = await Project.find({ _id: { $in: top.map((item) => item.projectId) } }).select('title').lean();
+  const titleOf = new Map(projects.map((project) => [String(project._id), project.title]));
+  return top.map((item) => ({ title: titleOf.get(item.projectId), skillMatch: item.skillMatch }));
+};
+
+test('ranks by match ratio, then overlap, then newest, and keeps only the top k', async () => {
+  await createProject('Full match', ['React', 'Node.js']);
+  await createProject('Half of four', ['React', 'Node.js', 'Go', 'Rust']);
+  await createProject('Half of two old', ['react', 'Python']);
+  await new Promise((r) => setTimeout(r, 10));
+  await createProject('Half of two new', ['REACT ', 'Python']);
+  await createProject('No overlap', ['Go']);
+
+  expect(await titlesFor(['react', 'node.js'], 3)).toEqual([
+    { title: 'Full match', skillMatch: 100 },
+    { title: 'Half of four', skillMatch: 50 },
+    { title: 'Half of two new', skillMatch: 50 },
+  ]);
+});
+
+test('save hooks keep the index current without a rebuild', async () => {
+  await skillIndex.ensureIndex();
+  const project = await createProject('Fresh', ['Vue']);
+
+  expect((await titlesFor(['vue'], 6)).map((item) => item.title)).toEqual(['Fresh']);
+
+  project.status = 'assigned';
+  project.assignedStudent = new mongoose.Types.ObjectId();
+  await project.save();
+
+  expect(await skillIndex.topProjectsForSkills(['vue'], 6)).toEqual([]);
+});
+
+test('bulk query updates mark the index stale so the next read rebuilds', async () => {
+  await createProject('Closing soon', ['Svelte']);
+  expect(await skillIndex.topProjectsForSkills(['svelte'], 6)).toHaveLength(1);
+
+  await Project.updateMany({}, { $set: { status: 'closed' } });
+
+  expect(await skillIndex.topProjectsForSkills(['svelte'], 6)).toEqual([]);
+});
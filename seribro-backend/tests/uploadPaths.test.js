@@ -0,0 +1,73 @@
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const express = require('express');
+const request = require('supertest');
+const { createLocalBackend } = require('../backend/utils/uploads/backends');
+const { uploadWorkFiles } = require('../backend/middleware/workSubmissionUploadMiddleware');
+
+let workDir;
+let root;
+
+beforeEach(() => {
+  workDir = fs.mkdtempSync(path.join(os.tmpdir(), 'upload-paths-'));
+  root = path.join(workDir, 'root');
+  fs.mkdirSync(root);
+});
+
+afterEach(() => {
+  fs.rmSync(workDir, { recursive: true, force: true });
+});
+
+const writeAll = (upload, content) => new Promise((resolve, reject) => {
+  upload.result.then(resolve, reject);
+  upload.stream.end(content);
+});
+
+test('local backend writes inside the root', async () => {
+  const backend = createLocalBackend({ root, baseUrl: '/files' });
+
+  const stored = await writeAll(backend.createUpload({ folder: 'work-submissions/abc', publicId: 'file', extension: '.txt' }), 'hello');
+
+  expect(stored.publicId).toBe('work-submissions/abc/file.txt');
+  expect(stored.url).toBe('/files/work-submissions/abc/file.txt');
+  expect(fs.readFileSync(path.join(root, 'work-submissions', 'abc', 'file.txt'), 'utf8')).toBe('hello');
+});
+
+test.each([
+  ['work-submissions/../..', 'escape'],
+  ['../root-sibling', 'escape'],
+  ['', '../escape'],
+])('local backend rejects targets outside the root (folder %p, publicId %p)', (folder, publicId) => {
+  const backend = createLocalBackend({ root, baseUrl: '/files' });
+
+  expect(() => backend.createUpload({ folder, publicId, extension: '.txt' }))
+    .toThrow(expect.objectContaining({ code: 'INVALID_UPLOAD_PATH' }));
+  // Kuch bhi likha ya banaya nahi gaya
+  expect(fs.readdirSync(workDir)).toEqual(['root']);
+  expect(fs.readdirSync(root)).toEqual([]);
+});
+
+test('local backend refuses to remove files outside the root', async () => {
+  const outside = path.join(workDir, 'keep.txt');
+  fs.writeFileSync(outside, 'keep');
+  const backend = createLocalBackend({ root, baseUrl: '/files' });
+
+  await expect(backend.remove({ publicId: '../keep.txt' })).rejects.toMatchObject({ code: 'INVALID_UPLOAD_PATH' });
+  expect(fs.existsSync(outside)).toBe(true);
+});
+
+test('work submission upload rejects a non-ObjectId projectId before streaming', async () => {
+  const app = express();
+  const reached = jest.fn((req, res) => res.json({ success: true }));
+  app.post('/projects/:projectId/submit-work', uploadWorkFiles, reached);
+
+  // Express %2F ko param mein decode karta hai - '../../x'
+  const res = await request(app)
+    .post('/projects/..%2F..%2Fx/submit-work')
+    .attach('workFiles', Buffer.from('plain text'), 'notes.txt');
+
+  expect(res.status).toBe(400);
+  expect(res.body.success).toBe(false);
+  expect(reached).not.toHaveBeenCalled();
+});
@@ -25,11 +25,12 @@ export const getWorkspaceOverview = async (projectId) => {
     }
 };
 
-export const getMessages = async (projectId, page = 1, limit = 20) => {
+// Cursor paging: no `before` = newest page, `before` = nextCursor from the previous page
+export const getMessages = async (projectId, { before = null, limit = 20 } = {}) => {
     try {
         const res = await axiosInstance.get(
             `${BASE_URL}/projects/${projectId}/messages`,
-            { params: { page, limit } }
+            { params: before ? { before, limit } : { paginate: 'cursor', limit } }
         );
         return res.data;
     } catch (error) {
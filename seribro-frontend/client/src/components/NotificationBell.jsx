@@ -2,8 +2,14 @@
 // Hinglish: Notification bell component for navbar
 
 import React, { useState, useEffect } from 'react';
+import { io } from 'socket.io-client';
 import { Bell, X, Check, Trash2 } from 'lucide-react';
 import { getNotifications, getUnreadCount, markAsRead, markAllAsRead, deleteNotification } from '../apis/notificationApi';
+import { SOCKET_BASE_URL } from '../apis/config';
+
+// Hinglish: Socket disconnected ho tabhi fallback polling (5 minute)
+const FALLBACK_POLL_MS = 5 * 60 * 1000;
+const DROPDOWN_LIMIT = 5;
 
 /**
  * Hinglish: Notification bell component
@@ -19,18 +25,55 @@ const NotificationBell = () => {
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState(null);
 
-  // Hinglish: Component mount par notifications fetch karo
+  // Hinglish: Component mount par notifications fetch karo, phir socket se live updates
   useEffect(() => {
     fetchNotifications();
     fetchUnreadCount();
 
-    // Hinglish: 30 seconds mein auto-refresh
+    const token = localStorage.getItem('token') || localStorage.getItem('jwtToken');
+    const socket = io(SOCKET_BASE_URL, {
+      reconnection: true,
+      reconnectionDelay: 1000,
+      reconnectionDelayMax: 10000,
+      transports: ['websocket', 'polling'],
+      withCredentials: true,
+      auth: token ? { token } : {},
+    });
+
+    let hasConnected = false;
+    socket.on('connect', () => {
+      socket.emit('join_notifications', { token });
+      // Hinglish: Reconnect par beech ke notifications miss na hon
+      if (hasConnected) {
+        fetchNotifications();
+        fetchUnreadCount();
+      }
+      hasConnected = true;
+    });
+
+    // Hinglish: Server outbox flush hote hi naya notification push karta hai
+    socket.on('notification', (notification) => {
+      setNotifications(prev => {
+        if (prev.some(n => n._id === notification._id)) return prev;
+        return [notification, ...prev].slice(0, DROPDOWN_LIMIT);
+      });
+      if (!notification.isRead) {
+        setUnreadCount(count => count + 1);
+      }
+    });
+
+    // Hinglish: Sirf socket down ho tab polling (fallback)
     const interval = setInterval(() => {
-      fetchNotifications();
-      fetchUnreadCount();
-    }, 30000);
+      if (!socket.connected) {
+        fetchNotifications();
+        fetchUnreadCount();
+      }
+    }, FALLBACK_POLL_MS);
 
-    return () => clearInterval(interval);
+    return () => {
+      clearInterval(interval);
+      socket.disconnect();
+    };
   }, []);
 
   /**
@@ -39,7 +82,7 @@ const NotificationBell = () => {
   const fetchNotifications = async () => {
     try {
       setLoading(true);
-      const response = await getNotifications(1, 5);
+      const response = await getNotifications(1, DROPDOWN_LIMIT);
       if (response.success) {
         setNotifications(response.data.notifications);
       }
@@ -28,7 +28,8 @@ const ProjectWorkspace = () => {
 
   const [workspace, setWorkspace] = useState(null);
   const [messages, setMessages] = useState([]);
-  const [pagination, setPagination] = useState({ currentPage: 1, totalPages: 1, hasMore: false });
+  // olderLoaded: user ne history scroll ki hai - newest-page refresh cursor overwrite na kare
+  const [pagination, setPagination] = useState({ hasMore: false, nextCursor: null, olderLoaded: false });
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
   const [sending, setSending] = useState(false);
@@ -183,7 +184,7 @@ const ProjectWorkspace = () => {
         }
       });
 
-      socketRef.current.on('typing_start', (data) => {
+      const handleTypingStartEvent = (data) => {
         const { userId, senderName, senderRole } = data;
         setTypingUsers((prev) => new Map(prev).set(userId, { senderName, senderRole, timestamp: Date.now() }));
 
@@ -203,9 +204,9 @@ const ProjectWorkspace = () => {
         }, 3000);
 
         typingTimeoutRef.current.set(userId, timeoutId);
-      });
+      };
 
-      socketRef.current.on('typing_stop', (data) => {
+      const handleTypingStopEvent = (data) => {
         const { userId } = data;
         setTypingUsers((prev) => {
           const updated = new Map(prev);
@@ -217,20 +218,45 @@ const ProjectWorkspace = () => {
           clearTimeout(typingTimeoutRef.current.get(userId));
           typingTimeoutRef.current.delete(userId);
         }
-      });
+      };
 
-      socketRef.current.on('user_online', (data) => {
+      const handleUserOnlineEvent = (data) => {
         const { userId } = data;
         setOnlineUsers((prev) => new Set([...prev, userId]));
-      });
+      };
 
-      socketRef.current.on('user_offline', (data) => {
+      const handleUserOfflineEvent = (data) => {
         const { userId } = data;
         setOnlineUsers((prev) => {
           const updated = new Set(prev);
           updated.delete(userId);
           return updated;
         });
+        handleTypingStopEvent({ userId });
+      };
+
+      socketRef.current.on('typing_start', handleTypingStartEvent);
+      socketRef.current.on('typing_stop', handleTypingStopEvent);
+      socketRef.current.on('user_online', handleUserOnlineEvent);
+      socketRef.current.on('user_offline', handleUserOfflineEvent);
+
+      // Server coalesces typing/presence into one frame per room per tick
+      const batchHandlers = {
+        typing_start: handleTypingStartEvent,
+        typing_stop: handleTypingStopEvent,
+        user_online: handleUserOnlineEvent,
+        user_offline: handleUserOfflineEvent,
+      };
+      socketRef.current.on('presence_batch', (frame) => {
+        const { projectId: pid, events = [] } = frame || {};
+        if (pid && pid.toString() !== projectId) return;
+        events.forEach((event) => {
+          const handler = batchHandlers[event.type];
+          if (!handler) return;
+          // Batched typing frames include our own events - the room is not filtered per sender
+          if (event.type.startsWith('typing_') && String(event.userId) === String(currentUserIdRef.current)) return;
+          handler(event);
+        });
       });
 
       socketRef.current.on('disconnect', (reason) => {
@@ -271,6 +297,7 @@ const ProjectWorkspace = () => {
           socketRef.current.off('typing_stop');
           socketRef.current.off('user_online');
           socketRef.current.off('user_offline');
+          socketRef.current.off('presence_batch');
           socketRef.current.off('disconnect');
           socketRef.current.off('error');
           
@@ -332,6 +359,11 @@ const ProjectWorkspace = () => {
       // Properly update state using setWorkspace - this triggers re-render
       setWorkspace(res.data);
       mergeMessages(res.data.recentMessages || []);
+      setPagination((prev) => (prev.olderLoaded ? prev : {
+        ...prev,
+        hasMore: Boolean(res.data.messageHistory?.hasMore),
+        nextCursor: res.data.messageHistory?.nextCursor || null,
+      }));
       await markMessagesAsRead(projectId);
       
       // Debug: Log updated state to verify it's correct
@@ -348,13 +380,17 @@ const ProjectWorkspace = () => {
   }, [projectId, mergeMessages]);
 
   const loadMessages = useCallback(
-    async (page = 1) => {
-      const res = await getMessages(projectId, page, 20);
+    async (before = null) => {
+      const res = await getMessages(projectId, { before, limit: 20 });
       if (res.success) {
         mergeMessages(res.data.messages || []);
-        setPagination({
-          ...res.data.pagination,
-          hasMore: res.data.pagination?.hasMore,
+        setPagination((prev) => {
+          if (!before && prev.olderLoaded) return prev;
+          return {
+            hasMore: Boolean(res.data.pagination?.hasMore),
+            nextCursor: res.data.pagination?.nextCursor || null,
+            olderLoaded: prev.olderLoaded || Boolean(before),
+          };
         });
       } else {
         setError(res.message || 'Failed to load messages');
@@ -366,7 +402,7 @@ const ProjectWorkspace = () => {
   useEffect(() => {
     // Run once when projectId changes to avoid re-trigger loops
     loadWorkspace();
-    loadMessages(1);
+    loadMessages();
 
     // If we navigated here after a successful payment, reload workspace to pick up the new state
     if (location && location.state && location.state.paymentVerified) {
@@ -377,7 +413,7 @@ const ProjectWorkspace = () => {
     }
 
     // polling for new messages (30s fallback if Socket.io fails)
-    pollingRef.current = setInterval(() => loadMessages(1), 30000);
+    pollingRef.current = setInterval(() => loadMessages(), 30000);
     return () => {
       if (pollingRef.current) clearInterval(pollingRef.current);
     };
@@ -508,9 +544,8 @@ const ProjectWorkspace = () => {
   };
 
   const handleLoadMore = async () => {
-    if (!pagination.hasMore) return;
-    const nextPage = (pagination.currentPage || 1) + 1;
-    await loadMessages(nextPage);
+    if (!pagination.hasMore || !pagination.nextCursor) return;
+    await loadMessages(pagination.nextCursor);
   };
 
   // Handle typing indicator events
@@ -1,27 +1,15 @@
-import requests
+from seribro_client import SeribroClient, message_of
 
-BASE_URL = "http://localhost:7000"
 EMAIL = "afmahetar2006@gmail.com"
 OTP_CODE = "654321"
-TIMEOUT = 30
+
+api = SeribroClient()
+
 
 def test_verify_otp_with_correct_email_and_otp():
-    url = f"{BASE_URL}/api/auth/verify-otp"
-    payload = {
-        "email": EMAIL,
-        "otp": OTP_CODE
-    }
-    headers = {
-        "Content-Type": "application/json"
-    }
-    try:
-        response = requests.post(url, json=payload, headers=headers, timeout=TIMEOUT)
-        response.raise_for_status()
-        data = response.json()
-        assert response.status_code == 200, f"Expected status 200, got {response.status_code}"
-        assert data.get("success") is True, "Success flag is not True"
-        assert "Email verified successfully" in data.get("message", ""), "Unexpected success message"
-    except requests.RequestException as e:
-        raise AssertionError(f"Request failed: {e}")
+    api.auth.verify_otp(EMAIL, OTP_CODE)
+    message = message_of(api.auth.last_response) or ""
+    assert "Email verified successfully" in message, "Unexpected success message"
+
 
-test_verify_otp_with_correct_email_and_otp()
\ No newline at end of file
+test_verify_otp_with_correct_email_and_otp()
@@ -1,9 +1,4 @@
-import requests
-
-BASE_URL = "http://localhost:5000"
-LOGIN_PATH = "/api/auth/login"
-STUDENT_PROFILE_PATH = "/api/student/profile"
-TIMEOUT = 30
+from seribro_client import SeribroClient
 
 credentials = {
     "email": "afmahetar2006@gmail.com",
@@ -11,37 +6,16 @@ credentials = {
     "role": "student"
 }
 
+api = SeribroClient()
+
 
 def test_student_profile_get_returns_complete_profile_data():
     # Step 1: Login to get JWT token
-    login_url = BASE_URL + LOGIN_PATH
-    try:
-        login_resp = requests.post(login_url, json=credentials, timeout=TIMEOUT)
-        login_resp.raise_for_status()
-    except requests.RequestException as e:
-        assert False, f"Login request failed: {e}"
-
-    login_data = login_resp.json()
-    assert login_data.get("success") is True, "Login unsuccessful"
-    token = login_data.get("data", {}).get("token")
-    assert token, "JWT token not found in login response"
-
-    headers = {
-        "Authorization": f"Bearer {token}"
-    }
+    student = api.login(credentials["email"], credentials["password"], credentials["role"])
+    assert student.token, "JWT token not found in login response"
 
     # Step 2: Get student profile
-    profile_url = BASE_URL + STUDENT_PROFILE_PATH
-    try:
-        profile_resp = requests.get(profile_url, headers=headers, timeout=TIMEOUT)
-        profile_resp.raise_for_status()
-    except requests.RequestException as e:
-        assert False, f"Get student profile request failed: {e}"
-
-    profile_data = profile_resp.json()
-    assert profile_data.get("success") is True, "Failed to get student profile"
-
-    data = profile_data.get("data")
+    data = student.student.profile()
     assert isinstance(data, dict), "Profile data is not a dictionary"
 
     # Verify all required profile sections are present
@@ -1,98 +1,60 @@
-import requests
-import json
-import datetime
-import time
+from seribro_client import ApiError, SeribroClient
+from seribro_client.identity import fixture_project_id
 
-BASE_URL = "http://localhost:7000"
 STUDENT_EMAIL = "afmahetar2006@gmail.com"
 STUDENT_PASSWORD = "Arman2006@#"
-OTP_CODE = "654321"  # Given second OTP
-TIMEOUT = 30
+
+api = SeribroClient()
+
 
 def test_apply_to_project_with_complete_student_profile_and_valid_proposal():
-    session = requests.Session()
-    headers = {}
+    student = None
     application = {}
 
     try:
         # PHASE 1: Login as student to get token
-        login_resp = session.post(
-            f"{BASE_URL}/api/auth/login",
-            json={
-                "email": STUDENT_EMAIL,
-                "password": STUDENT_PASSWORD,
-                "role": "student"
-            },
-            timeout=TIMEOUT
-        )
-        assert login_resp.status_code == 200, f"Login failed: {login_resp.text}"
-        login_data = login_resp.json()
-        assert login_data.get("success") is True
-        token = login_data["data"]["token"]
-        headers = {"Authorization": f"Bearer {token}"}
+        student = api.login(STUDENT_EMAIL, STUDENT_PASSWORD, "student")
 
         # PHASE 2: Get student profile and check completion and verification
-        profile_resp = session.get(f"{BASE_URL}/api/student/profile", headers=headers, timeout=TIMEOUT)
-        assert profile_resp.status_code == 200, f"Get profile failed: {profile_resp.text}"
-        profile_data = profile_resp.json()
-        assert profile_data.get("success") is True
-        profile = profile_data.get("data", {})
+        profile = student.student.profile()
         completion = profile.get("profileCompletion", 0)
         assert completion == 100, f"Profile completion is not 100%, got {completion}"
         # We assume email verified if OTP verified as per scenario, no direct flag found in PRD
 
-        # PHASE 3: Browse projects and select an open project
-        browse_params = {"page": 1, "limit": 10}
-        browse_resp = session.get(f"{BASE_URL}/api/student/projects/browse", headers=headers, params=browse_params, timeout=TIMEOUT)
-        assert browse_resp.status_code == 200, f"Browse projects failed: {browse_resp.text}"
-        browse_data = browse_resp.json()
-        assert browse_data.get("success") is True
-        projects = browse_data.get("data", {}).get("projects", [])
+        # PHASE 3: Browse projects and select the open project posted for this run
+        projects = student.student.browse_projects(page=1, limit=10).get("projects", [])
         assert len(projects) > 0, "No projects available to apply"
-        project = projects[0]
-        project_id = project.get("id")
-        assert project_id is not None
+        # Outside the runner there is no fixture project; fall back to the first listed one
+        project_id = fixture_project_id() or projects[0].get("_id") or projects[0].get("id")
+        assert project_id, "No project id to apply to"
+        project = student.student.project(project_id).get("project", {})
+        assert project.get("status", "open") == "open", f"Project {project_id} is not open: {project.get('status')}"
 
         # PHASE 3.2: Apply to the project with valid proposal
-        proposal_text = "I am very interested in this project and have the required skills to deliver quality results."
-        proposed_price = 1500.0
-        estimated_time = "4 weeks"
-
-        apply_payload = {
-            "proposal": proposal_text,
-            "proposedPrice": proposed_price,
-            "estimatedTime": estimated_time
-        }
-
-        apply_resp = session.post(
-            f"{BASE_URL}/api/student/projects/{project_id}/apply",
-            headers=headers,
-            json=apply_payload,
-            timeout=TIMEOUT
-        )
-        assert apply_resp.status_code == 200, f"Apply to project failed: {apply_resp.text}"
-        apply_data = apply_resp.json()
-        assert apply_data.get("success") is True
-        application = apply_data.get("data", {}).get("application", {})
+        application = student.student.apply(
+            project_id,
+            cover_letter="I am very interested in this project and have the required skills to deliver quality results.",
+            proposed_price=1500.0,
+            estimated_time="4 weeks",
+        ).get("application", {})
         assert application.get("status") == "pending", f"Application status expected 'pending' but got {application.get('status')}"
 
     finally:
         # Cleanup: Withdraw application to leave clean state if application created
-        if application and application.get("id") and headers:
+        if student and application and application.get("id"):
             app_id = application["id"]
-            withdraw_resp = session.put(
-                f"{BASE_URL}/api/student/projects/applications/{app_id}/withdraw",
-                headers=headers,
-                timeout=TIMEOUT
-            )
-            # Withdraw may or may not succeed, do not assert here but log if failure
-            if withdraw_resp.status_code != 200:
-                print(f"Warning: Failed to withdraw application {app_id}, status: {withdraw_resp.status_code}")
+            try:
+                student.student.withdraw(app_id)
+            except ApiError as err:
+                # Withdraw may or may not succeed, do not assert here but log if failure
+                print(f"Warning: Failed to withdraw application {app_id}, status: {err.status_code}")
 
         # Logout student
-        if headers:
-            logout_resp = session.post(f"{BASE_URL}/api/auth/logout", headers=headers, timeout=TIMEOUT)
-            if logout_resp.status_code != 200:
-                print(f"Warning: Logout failed for student, status: {logout_resp.status_code}")
+        if student:
+            try:
+                api.logout(student)
+            except ApiError as err:
+                print(f"Warning: Logout failed for student, status: {err.status_code}")
+
 
-test_apply_to_project_with_complete_student_profile_and_valid_proposal()
\ No newline at end of file
+test_apply_to_project_with_complete_student_profile_and_valid_proposal()
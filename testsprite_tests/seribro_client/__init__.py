@@ -0,0 +1,29 @@
+"""Shared Python client for the Seribro backend API.
+
+Replaces the ``login``/``verify_otp``/``create_project`` helpers that were
+copy-pasted across the ``TC0xx`` scripts with one pooled, keep-alive
+implementation that parses the ``success/data`` envelope in one place.
+"""
+
+from .client import RoleClient, SeribroClient
+from .envelope import ApiError, message_of, unwrap
+from .resources import AdminApi, AuthApi, CompanyApi, NotificationsApi, StudentApi
+from .session import Principal, TokenCache, close_sessions, get_session, token_cache
+
+__all__ = [
+    "AdminApi",
+    "ApiError",
+    "AuthApi",
+    "CompanyApi",
+    "NotificationsApi",
+    "Principal",
+    "RoleClient",
+    "SeribroClient",
+    "StudentApi",
+    "TokenCache",
+    "close_sessions",
+    "get_session",
+    "message_of",
+    "token_cache",
+    "unwrap",
+]
@@ -0,0 +1,70 @@
+"""Entry point tying pooled sessions, token cache and resources together.
+
+Typical use from a test script::
+
+    from seribro_client import SeribroClient
+
+    api = SeribroClient()
+    company = api.login("company@example.com", "CompanyPass1!", "company")
+    project = company.company.create_project(title="...", ...)
+"""
+
+import time
+from typing import Optional
+
+from . import config
+from .resources import AdminApi, AuthApi, CompanyApi, NotificationsApi, StudentApi
+from .session import Principal, TokenCache, get_session, token_cache
+
+
+class RoleClient:
+    """All resources bound to one authenticated principal and its session."""
+
+    def __init__(self, base_url: str, principal: Principal):
+        self.base_url = base_url
+        self.principal = principal
+        self.session = get_session(principal.role, base_url)
+        self.auth = AuthApi(self.session, base_url, principal)
+        self.student = StudentApi(self.session, base_url, principal)
+        self.company = CompanyApi(self.session, base_url, principal)
+        self.admin = AdminApi(self.session, base_url, principal)
+        self.notifications = NotificationsApi(self.session, base_url, principal)
+
+    @property
+    def token(self) -> str:
+        return self.principal.token
+
+    @property
+    def user_id(self) -> Optional[str]:
+        return self.principal.user_id
+
+
+class SeribroClient:
+    """Factory for anonymous and per-role clients against one backend."""
+
+    def __init__(self, base_url: Optional[str] = None, cache: Optional[TokenCache] = None):
+        self.base_url = (base_url or config.BASE_URL).rstrip("/")
+        self.cache = cache if cache is not None else token_cache
+        self.auth = AuthApi(get_session("anonymous", self.base_url), self.base_url)
+
+    def login(self, email: str, password: str, role: str, fresh: bool = False) -> RoleClient:
+        """Return a client for the account, reusing a cached token when possible."""
+        principal = None if fresh else self.cache.get(self.base_url, email, role)
+        if principal is None:
+            auth = AuthApi(get_session(role, self.base_url), self.base_url)
+            principal = auth.login(email, password, role)
+            principal.issued_at = time.time()
+            self.cache.put(self.base_url, principal)
+        return RoleClient(self.base_url, principal)
+
+    def logout(self, client: RoleClient) -> None:
+        """Log the principal out and drop its cached token."""
+        try:
+            client.auth.logout()
+        finally:
+            self.cache.invalidate(self.base_url, client.principal.email, client.principal.role)
+
+    def verify_email(self, email: str, otp: str = config.OTP_CODE) -> None:
+        """Request and confirm an OTP for ``email`` using the fixed test code."""
+        self.auth.send_otp(email)
+        self.auth.verify_otp(email, otp)
@@ -0,0 +1,25 @@
+"""Shared settings for the Seribro API client.
+
+Every value can be overridden through the environment so the same scripts
+work against a local backend, a CI container or a staging deploy.
+"""
+
+import os
+
+BASE_URL = os.environ.get("SERIBRO_BASE_URL", "http://localhost:7000")
+TIMEOUT = float(os.environ.get("SERIBRO_TIMEOUT", "30"))
+
+# Fixed OTP accepted by the test backend (second OTP from the test instructions)
+OTP_CODE = os.environ.get("SERIBRO_OTP_CODE", "654321")
+
+# Admin account seeded in the test backend (cannot be self-registered)
+ADMIN_EMAIL = os.environ.get("SERIBRO_ADMIN_EMAIL", "admin@example.com")
+ADMIN_PASSWORD = os.environ.get("SERIBRO_ADMIN_PASSWORD", "AdminPass1!")
+
+# Connection pool sizing per role session (keep-alive sockets reused across calls)
+POOL_CONNECTIONS = int(os.environ.get("SERIBRO_POOL_CONNECTIONS", "4"))
+POOL_MAXSIZE = int(os.environ.get("SERIBRO_POOL_MAXSIZE", "16"))
+MAX_RETRIES = int(os.environ.get("SERIBRO_MAX_RETRIES", "2"))
+
+# Optional JSON file used to share login tokens between test processes
+TOKEN_CACHE_FILE = os.environ.get("SERIBRO_TOKEN_CACHE_FILE", "")
@@ -0,0 +1,61 @@
+"""Parsing of the backend's ``{success, message, data}`` response envelope."""
+
+from typing import Any, Optional
+
+
+class ApiError(AssertionError):
+    """Raised when a call fails at the HTTP level or reports ``success: false``.
+
+    Subclasses ``AssertionError`` so failures surface exactly like the inline
+    ``assert data.get("success") is True`` checks the test scripts used before.
+    """
+
+    def __init__(self, method: str, url: str, status_code: int, message: str, body: Any = None):
+        self.method = method
+        self.url = url
+        self.status_code = status_code
+        self.message = message
+        self.body = body
+        super().__init__(f"{method} {url} -> {status_code}: {message}")
+
+
+def parse_body(response) -> Any:
+    """Return the decoded JSON body, or the raw text when it is not JSON."""
+    try:
+        return response.json()
+    except ValueError:
+        return response.text
+
+
+def unwrap(response, expect_success: bool = True) -> Any:
+    """Validate a response and return its ``data`` payload.
+
+    Controllers built on ``sendResponse`` wrap results in ``data``; a few
+    auth endpoints still reply with a flat object. Both shapes are accepted
+    and the flat object is returned as-is.
+    """
+    method = response.request.method if response.request is not None else "?"
+    body = parse_body(response)
+
+    if not isinstance(body, dict):
+        if response.status_code >= 400:
+            raise ApiError(method, response.url, response.status_code, str(body)[:500], body)
+        return body
+
+    message = str(body.get("message", ""))
+    if response.status_code >= 400:
+        raise ApiError(method, response.url, response.status_code, message or "request failed", body)
+    if expect_success and body.get("success") is False:
+        raise ApiError(method, response.url, response.status_code, message or "success=false", body)
+
+    if "data" in body:
+        return body["data"]
+    return body
+
+
+def message_of(response) -> Optional[str]:
+    """Return the envelope ``message`` field, if present."""
+    body = parse_body(response)
+    if isinstance(body, dict):
+        return body.get("message")
+    return None
@@ -0,0 +1,103 @@
+"""Per-namespace fixture state for the testsprite scripts.
+
+Registering an account is not enough for most scripts: applying to a
+project needs a 100% complete, admin-approved student profile, and
+browsing needs at least one open project. These helpers build that state
+through the public API for one namespace, so a test case never depends on
+data another worker created or changed.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from . import config, identity
+from .client import RoleClient, SeribroClient
+from .envelope import ApiError
+
+FIXTURE_PASSWORD = "FixturePass1!"
+FIXTURE_COMPANY_EMAIL = "fixture-company@example.com"
+
+# Smallest valid uploads; the backend only checks MIME type and size
+PDF_BYTES = b"%PDF-1.4\n% seribro fixture\n"
+PNG_BYTES = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR seribro fixture"
+
+
+def admin_client(api: SeribroClient) -> RoleClient:
+    return api.login(config.ADMIN_EMAIL, config.ADMIN_PASSWORD, "admin")
+
+
+def _profile_id(profile: dict) -> str:
+    return profile.get("_id") or profile.get("id")
+
+
+def complete_student_profile(student: RoleClient, admin: RoleClient) -> dict:
+    """Fill every section the completion score checks, then approve the profile.
+
+    Returns the refreshed profile; ``profileCompletion`` is 100 and the
+    profile is ``approved`` afterwards.
+    """
+    profile = student.student.profile()
+    if profile.get("verificationStatus") == "approved" and profile.get("profileCompletion") == 100:
+        return profile
+
+    student.student.update_basic_info(
+        fullName=f"Student {identity.namespace()}",
+        phone="9999999999",
+        collegeName="Fixture Institute of Technology",
+        degree="B.Tech",
+        graduationYear=datetime.now(timezone.utc).year + 1,
+    )
+    student.student.update_skills(["Python", "React"], ["Communication"])
+    # The completion score needs at least three portfolio projects
+    for index in range(3 - len(profile.get("projects") or [])):
+        student.student.add_project(
+            title=f"Fixture portfolio project {index + 1}",
+            description="Portfolio entry created by the test fixture.",
+            technologies=["Python"],
+        )
+    student.student.upload_resume(PDF_BYTES)
+    student.student.upload_college_id(PNG_BYTES, filename="college_id.png", content_type="image/png")
+    student.student.submit_verification()
+
+    admin.admin.approve_student(_profile_id(student.student.profile()))
+    return student.student.profile()
+
+
+def create_company(api: SeribroClient, admin: RoleClient) -> RoleClient:
+    """Register a namespaced company with a complete, approved profile."""
+    email = identity.unique_email(FIXTURE_COMPANY_EMAIL)
+    name = identity.unique_name("Fixture Co")
+    try:
+        api.auth.register_company(email, FIXTURE_PASSWORD, name, "Fixture Contact", phone="9999999999")
+        api.verify_email(email)
+    except ApiError as err:
+        if err.status_code != 409:
+            raise
+    company = api.login(email, FIXTURE_PASSWORD, "company")
+
+    profile = company.company.init_profile().get("profile") or {}
+    if profile.get("verificationStatus") == "approved":
+        return company
+    company.company.update_basic_info(companyName=name, mobile="9999999999")
+    company.company.update_details(industryType="Information Technology", about="Fixture company.")
+    company.company.update_authorized_person(name="Fixture Contact", designation="Founder", email=email)
+    company.company.upload_logo(PNG_BYTES)
+    company.company.upload_documents(PDF_BYTES)
+    company.company.submit_verification()
+    admin.admin.approve_company(_profile_id(profile))
+    return company
+
+
+def create_open_project(company: RoleClient) -> dict:
+    """Post an open project titled with the current namespace."""
+    deadline = datetime.now(timezone.utc) + timedelta(days=30)
+    data = company.company.create_project(
+        title=identity.unique_name("Fixture Project"),
+        description="Open project created by the test fixture for this namespace.",
+        category="Web Development",
+        requiredSkills=["Python", "React"],
+        budgetMin=1000,
+        budgetMax=5000,
+        projectDuration="1 month",
+        deadline=deadline.isoformat(timespec="seconds").replace("+00:00", "Z"),
+    )
+    return data["project"]
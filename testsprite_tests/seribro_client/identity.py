@@ -0,0 +1,74 @@
+"""Per-run / per-worker identities so test cases can run side by side.
+
+The runner exports ``SERIBRO_RUN_ID`` and ``SERIBRO_WORKER_ID`` (and a
+per-test namespace) before executing a test case. Scripts that build
+accounts or project titles through these helpers get values that never
+collide with another worker of the same run or with a previous run.
+"""
+
+import os
+import re
+import uuid
+
+EMAIL_RE = re.compile(r"""(["'])([A-Za-z0-9._%{}-]+)(?:\+[A-Za-z0-9._-]*)?@([A-Za-z0-9.-]+\.[A-Za-z]{2,})\1""")
+
+
+def run_id() -> str:
+    value = os.environ.get("SERIBRO_RUN_ID")
+    if not value:
+        value = uuid.uuid4().hex[:8]
+        os.environ["SERIBRO_RUN_ID"] = value
+    return value
+
+
+def worker_id() -> str:
+    return os.environ.get("SERIBRO_WORKER_ID", "0")
+
+
+def namespace() -> str:
+    """Namespace unique to the current test case within this run."""
+    return os.environ.get("SERIBRO_NAMESPACE") or f"{run_id()}w{worker_id()}"
+
+
+def unique_email(email: str) -> str:
+    """Plus-address ``email`` with the current namespace.
+
+    ``student@example.com`` becomes ``student+<ns>@example.com`` so the
+    same script can register its own copy of every account it touches.
+    """
+    local, _, domain = email.partition("@")
+    local = local.split("+", 1)[0]
+    return f"{local}+{namespace()}@{domain}"
+
+
+def unique_name(prefix: str) -> str:
+    """Return a project/company title tagged with the current namespace."""
+    return f"{prefix} [{namespace()}]"
+
+
+def fixture_project_id() -> str:
+    """Id of the open project the runner posted for the current namespace ("" outside the runner)."""
+    return os.environ.get("SERIBRO_FIXTURE_PROJECT_ID", "")
+
+
+def isolate_source(source: str, ns: str, keep=()) -> tuple:
+    """Rewrite every quoted email literal in ``source`` into the namespace ``ns``.
+
+    Addresses listed in ``keep`` (e.g. the admin account, which cannot be
+    self-registered) are left untouched. Returns
+    ``(rewritten_source, {original: rewritten})``. Used by the runner for
+    legacy scripts that hard-code shared accounts.
+    """
+    mapping = {}
+    keep = {email.lower() for email in keep}
+
+    def _replace(match):
+        quote, local, domain = match.group(1), match.group(2), match.group(3)
+        original = f"{local}@{domain}"
+        if original.lower() in keep:
+            return match.group(0)
+        rewritten = f"{local}+{ns}@{domain}"
+        mapping[original] = rewritten
+        return f"{quote}{rewritten}{quote}"
+
+    return EMAIL_RE.sub(_replace, source), mapping
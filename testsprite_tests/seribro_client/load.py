@@ -0,0 +1,364 @@
+"""Asyncio load generator replaying the project lifecycle from TC010.
+
+Virtual users (VUs) arrive as a Poisson process at a configurable rate and
+are split between roles by ``--company-ratio``:
+
+* company VU: create a project, wait for applicants, shortlist them and
+  approve one (``companyApplicationController``);
+* student VU: browse open projects, apply to one it has not applied to
+  yet and list its own applications (``studentProjectController``).
+
+Each student account's applied projects are loaded once and tracked, and
+projects a company VU has approved someone for are dropped from the pool,
+so duplicate or closed-project 400s do not inflate the error rate.
+
+All VUs share one ``aiohttp`` connection pool. With ``--step`` the arrival
+rate is raised stage by stage until the error rate or p99 latency crosses a
+threshold, which gives the request rate at which the controllers fall over.
+
+The tool needs pre-verified accounts (student profiles complete, companies
+approved); pass them as a JSON file::
+
+    {"students": [{"email": "...", "password": "..."}],
+     "companies": [{"email": "...", "password": "..."}]}
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m seribro_client.load --accounts accounts.json --rate 50 --duration 60
+    python -m seribro_client.load --accounts accounts.json --step 25,50,100,200,400
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Set
+
+import aiohttp
+
+from . import config
+from .metrics import Histogram
+
+
+@dataclass
+class RouteStats:
+    latency: Histogram = field(default_factory=Histogram)
+    errors: int = 0
+    statuses: Dict[int, int] = field(default_factory=lambda: defaultdict(int))
+
+    @property
+    def count(self) -> int:
+        return self.latency.total
+
+    def percentile(self, pct: float) -> float:
+        return self.latency.percentile(pct) / 1000.0
+
+
+class Stats:
+    """Latency and error counters for one load stage."""
+
+    def __init__(self):
+        self.routes: Dict[str, RouteStats] = defaultdict(RouteStats)
+        self.started = time.perf_counter()
+        self.vus_started = 0
+        self.vus_failed = 0
+
+    def record(self, route: str, status: int, elapsed_ms: float, ok: bool) -> None:
+        stats = self.routes[route]
+        stats.latency.record(elapsed_ms * 1000)
+        stats.statuses[status] += 1
+        if not ok:
+            stats.errors += 1
+
+    @property
+    def requests(self) -> int:
+        return sum(stats.count for stats in self.routes.values())
+
+    @property
+    def errors(self) -> int:
+        return sum(stats.errors for stats in self.routes.values())
+
+    def overall(self) -> RouteStats:
+        merged = RouteStats()
+        for stats in self.routes.values():
+            merged.latency.merge(stats.latency)
+            merged.errors += stats.errors
+        return merged
+
+    def summary(self) -> dict:
+        elapsed = time.perf_counter() - self.started
+        overall = self.overall()
+        return {
+            "durationSec": round(elapsed, 2),
+            "vus": self.vus_started,
+            "vusFailed": self.vus_failed,
+            "requests": self.requests,
+            "rps": round(self.requests / elapsed, 2) if elapsed else 0.0,
+            "errorRate": round(self.errors / self.requests, 4) if self.requests else 0.0,
+            "p50": round(overall.percentile(50), 1),
+            "p99": round(overall.percentile(99), 1),
+            "routes": {
+                route: {
+                    "count": stats.count,
+                    "errors": stats.errors,
+                    "p50": round(stats.percentile(50), 1),
+                    "p90": round(stats.percentile(90), 1),
+                    "p99": round(stats.percentile(99), 1),
+                    "statuses": dict(stats.statuses),
+                }
+                for route, stats in sorted(self.routes.items())
+            },
+        }
+
+
+class VuError(Exception):
+    pass
+
+
+class LoadContext:
+    """State shared by every VU: the HTTP pool, tokens, open projects and applications."""
+
+    def __init__(self, session: aiohttp.ClientSession, base_url: str, accounts: dict, stats: Stats):
+        self.session = session
+        self.base_url = base_url
+        self.students = accounts.get("students", [])
+        self.companies = accounts.get("companies", [])
+        self.stats = stats
+        self.tokens: Dict[str, str] = {}
+        self.login_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self.open_projects: Deque[str] = deque(maxlen=500)
+        self.closed_projects: Set[str] = set()
+        self.applied: Dict[str, Set[str]] = {}
+        self.applied_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    async def request(self, method: str, route: str, path: str, token: Optional[str] = None, **kwargs) -> dict:
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        started = time.perf_counter()
+        status, body = 0, None
+        try:
+            async with self.session.request(method, f"{self.base_url}{path}", headers=headers, **kwargs) as resp:
+                status = resp.status
+                body = await resp.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as err:
+            self.stats.record(route, status, (time.perf_counter() - started) * 1000, False)
+            raise VuError(f"{route}: {err!r}") from err
+        ok = status < 400 and not (isinstance(body, dict) and body.get("success") is False)
+        self.stats.record(route, status, (time.perf_counter() - started) * 1000, ok)
+        if not ok:
+            raise VuError(f"{route}: HTTP {status}")
+        if isinstance(body, dict) and "data" in body:
+            return body["data"]
+        return body or {}
+
+    async def token_for(self, account: dict, role: str) -> str:
+        """Log an account in once and reuse its token for later VUs."""
+        email = account["email"]
+        if email in self.tokens:
+            return self.tokens[email]
+        async with self.login_locks[email]:
+            if email not in self.tokens:
+                data = await self.request(
+                    "POST", "POST /api/auth/login", "/api/auth/login",
+                    json={"email": email, "password": account["password"], "role": role},
+                )
+                self.tokens[email] = data["token"]
+        return self.tokens[email]
+
+    async def applied_for(self, account: dict, token: str) -> Set[str]:
+        """Projects the student account has applied to, loaded once per account."""
+        email = account["email"]
+        if email in self.applied:
+            return self.applied[email]
+        async with self.applied_locks[email]:
+            if email not in self.applied:
+                data = await self.request(
+                    "GET", "GET /api/student/projects/applications/my-applications",
+                    "/api/student/projects/applications/my-applications", token,
+                    params={"limit": 1000},
+                )
+                self.applied[email] = {_project_of(app) for app in data.get("applications", [])}
+        return self.applied[email]
+
+    def close_project(self, project_id: str) -> None:
+        """Stop offering a project to student VUs once it is assigned."""
+        self.closed_projects.add(project_id)
+        try:
+            self.open_projects.remove(project_id)
+        except ValueError:
+            pass
+
+
+def _project_of(application: dict) -> Optional[str]:
+    project = application.get("project")
+    if isinstance(project, dict):
+        return project.get("id") or project.get("_id")
+    return application.get("projectId") or project
+
+
+async def company_vu(ctx: LoadContext, rng: random.Random, wait_for_applicants: float) -> None:
+    token = await ctx.token_for(rng.choice(ctx.companies), "company")
+    data = await ctx.request(
+        "POST", "POST /api/company/projects/create", "/api/company/projects/create", token,
+        json={
+            "title": f"Load test project {rng.randrange(1_000_000)}",
+            "description": "Project created by the load generator to exercise the application flow.",
+            "category": "Web Development",
+            "requiredSkills": rng.sample(["React", "Node.js", "Python", "MongoDB", "Django", "Figma"], 3),
+            "budgetMin": 1000,
+            "budgetMax": 5000,
+            "projectDuration": "2 weeks",
+            "deadline": "2030-12-31T23:59:59Z",
+        },
+    )
+    project = data.get("project", data)
+    project_id = project.get("id") or project.get("_id")
+    ctx.open_projects.append(project_id)
+
+    # Poll for applicants the way the company dashboard does
+    deadline = time.perf_counter() + wait_for_applicants
+    applications: list = []
+    while time.perf_counter() < deadline:
+        await asyncio.sleep(rng.uniform(1.0, 3.0))
+        data = await ctx.request(
+            "GET", "GET /api/company/applications/projects/:projectId/applications",
+            f"/api/company/applications/projects/{project_id}/applications", token,
+        )
+        applications = data.get("applications", []) if isinstance(data, dict) else data
+        if len(applications) >= 2:
+            break
+    if not applications:
+        return
+
+    for application in applications[:3]:
+        app_id = application.get("id") or application.get("_id")
+        await ctx.request(
+            "POST", "POST /api/company/applications/:applicationId/shortlist",
+            f"/api/company/applications/{app_id}/shortlist", token,
+        )
+    chosen = applications[0].get("id") or applications[0].get("_id")
+    await ctx.request(
+        "POST", "POST /api/company/applications/:applicationId/approve",
+        f"/api/company/applications/{chosen}/approve", token,
+    )
+    ctx.close_project(project_id)
+
+
+async def student_vu(ctx: LoadContext, rng: random.Random) -> None:
+    account = rng.choice(ctx.students)
+    token = await ctx.token_for(account, "student")
+    applied = await ctx.applied_for(account, token)
+    data = await ctx.request(
+        "GET", "GET /api/student/projects/browse", "/api/student/projects/browse", token,
+        params={"page": rng.randint(1, 5), "limit": 12},
+    )
+    candidates = [p.get("id") or p.get("_id") for p in data.get("projects", [])]
+    candidates.extend(ctx.open_projects)
+    candidates = [pid for pid in dict.fromkeys(candidates) if pid not in applied and pid not in ctx.closed_projects]
+    if not candidates:
+        return
+    project_id = rng.choice(candidates)
+    # Claim it before the request so concurrent VUs on the same account pick another project
+    applied.add(project_id)
+    await ctx.request(
+        "POST", "POST /api/student/projects/:id/apply", f"/api/student/projects/{project_id}/apply", token,
+        json={
+            "coverLetter": "I have shipped similar projects and can start immediately. " * 2,
+            "proposedPrice": rng.randint(1000, 5000),
+            "estimatedTime": "2 weeks",
+        },
+    )
+    await ctx.request(
+        "GET", "GET /api/student/projects/applications/my-applications",
+        "/api/student/projects/applications/my-applications", token,
+    )
+
+
+async def _run_vu(ctx: LoadContext, rng: random.Random, company_ratio: float, wait: float) -> None:
+    ctx.stats.vus_started += 1
+    try:
+        if ctx.companies and (not ctx.students or rng.random() < company_ratio):
+            await company_vu(ctx, rng, wait)
+        else:
+            await student_vu(ctx, rng)
+    except VuError:
+        ctx.stats.vus_failed += 1
+
+
+async def run_stage(session: aiohttp.ClientSession, args, accounts: dict, rate: float) -> Stats:
+    """Spawn VUs at ``rate`` per second (Poisson arrivals) for ``args.duration`` seconds."""
+    stats = Stats()
+    ctx = LoadContext(session, args.base_url, accounts, stats)
+    rng = random.Random(args.seed)
+    tasks = set()
+    end = time.perf_counter() + args.duration
+    while time.perf_counter() < end:
+        task = asyncio.ensure_future(_run_vu(ctx, rng, args.company_ratio, args.applicant_wait))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        await asyncio.sleep(rng.expovariate(rate))
+    if tasks:
+        await asyncio.wait(tasks, timeout=args.drain)
+        for task in tasks:
+            task.cancel()
+    return stats
+
+
+async def main_async(args) -> int:
+    with open(args.accounts, "r", encoding="utf-8") as fh:
+        accounts = json.load(fh)
+    if not accounts.get("students") and not accounts.get("companies"):
+        print("Accounts file has no students or companies")
+        return 1
+
+    rates = [float(r) for r in args.step.split(",")] if args.step else [args.rate]
+    connector = aiohttp.TCPConnector(limit=args.connections, keepalive_timeout=30)
+    timeout = aiohttp.ClientTimeout(total=config.TIMEOUT)
+    report = []
+    breaking_rate = None
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        for rate in rates:
+            stats = await run_stage(session, args, accounts, rate)
+            summary = {"arrivalRate": rate, **stats.summary()}
+            report.append(summary)
+            print(
+                f"rate={rate:>7.1f}/s  rps={summary['rps']:>8.1f}  p50={summary['p50']:>7.1f}ms  "
+                f"p99={summary['p99']:>8.1f}ms  errors={summary['errorRate']:.2%}"
+            )
+            if summary["errorRate"] > args.max_error_rate or summary["p99"] > args.max_p99:
+                breaking_rate = rate
+                break
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump({"stages": report, "breakingRate": breaking_rate}, fh, indent=2)
+    if breaking_rate is not None:
+        print(f"\nThresholds exceeded at arrival rate {breaking_rate}/s")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay the project lifecycle under load")
+    parser.add_argument("--accounts", required=True, help="JSON file with verified students and companies")
+    parser.add_argument("--base-url", default=config.BASE_URL)
+    parser.add_argument("--rate", type=float, default=10.0, help="VU arrivals per second")
+    parser.add_argument("--step", help="Comma-separated arrival rates to ramp through")
+    parser.add_argument("--duration", type=float, default=60.0, help="Seconds per stage")
+    parser.add_argument("--company-ratio", type=float, default=0.1, help="Fraction of VUs acting as companies")
+    parser.add_argument("--applicant-wait", type=float, default=20.0, help="Seconds a company VU waits for applicants")
+    parser.add_argument("--drain", type=float, default=30.0, help="Seconds to let in-flight VUs finish")
+    parser.add_argument("--connections", type=int, default=256, help="Size of the shared connection pool")
+    parser.add_argument("--max-error-rate", type=float, default=0.01)
+    parser.add_argument("--max-p99", type=float, default=2000.0, help="p99 latency threshold in ms")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="Write the stage report as JSON")
+    args = parser.parse_args(argv)
+    args.base_url = args.base_url.rstrip("/")
+    return asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
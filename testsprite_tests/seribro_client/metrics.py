@@ -0,0 +1,318 @@
+"""Per-route latency histograms for every HTTP call made by the suite.
+
+``install()`` wraps ``requests.Session.send`` so every call -- through
+``seribro_client`` or a bare ``requests.post`` in a legacy script -- is
+recorded under its route template (``POST /api/student/projects/:id/apply``)
+with an HDR-style log-linear histogram, bytes in/out and status codes.
+
+Snapshots are plain dicts so worker processes can ship them back to the
+runner, which merges them into ``tmp/latency_metrics.json`` and a Markdown
+section of ``testsprite-mcp-test-report.md``.
+"""
+
+import json
+import math
+import re
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+SUB_BUCKET_BITS = 7  # 128 sub-buckets per power of two, < 1% relative error
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+SUB_BUCKET_HALF = SUB_BUCKET_COUNT >> 1
+
+REPORT_START = "<!-- latency-report:start -->"
+REPORT_END = "<!-- latency-report:end -->"
+
+_ID_SEGMENT = re.compile(
+    r"^(?:[0-9a-fA-F]{24}|\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})$"
+)
+
+
+def route_template(method: str, url: str) -> str:
+    """Collapse ids in ``url`` so calls group by route: ``GET /api/x/:id``."""
+    path = urlsplit(url).path or "/"
+    segments = [":id" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/")]
+    return f"{method.upper()} {'/'.join(segments)}"
+
+
+class Histogram:
+    """Log-linear latency histogram in microseconds (HdrHistogram layout).
+
+    Values below ``SUB_BUCKET_COUNT`` are exact; above that each power of
+    two is split into ``SUB_BUCKET_HALF`` linear buckets, so memory stays
+    bounded while percentiles keep ~2 significant digits.
+    """
+
+    def __init__(self):
+        self.counts: Dict[int, int] = defaultdict(int)
+        self.total = 0
+        self.min = 0
+        self.max = 0
+        self.sum = 0
+
+    @staticmethod
+    def _index(value: int) -> int:
+        if value < SUB_BUCKET_COUNT:
+            return value
+        shift = value.bit_length() - SUB_BUCKET_BITS
+        return shift * SUB_BUCKET_HALF + (value >> shift)
+
+    @staticmethod
+    def _upper_bound(index: int) -> int:
+        if index < SUB_BUCKET_COUNT:
+            return index
+        shift = index // SUB_BUCKET_HALF - 1
+        mantissa = index - shift * SUB_BUCKET_HALF
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, micros: float) -> None:
+        value = max(0, int(micros))
+        self.counts[self._index(value)] += 1
+        self.min = value if self.total == 0 else min(self.min, value)
+        self.max = max(self.max, value)
+        self.total += 1
+        self.sum += value
+
+    def percentile(self, pct: float) -> int:
+        if self.total == 0:
+            return 0
+        target = max(1, math.ceil(pct / 100.0 * self.total))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self._upper_bound(index), self.max)
+        return self.max
+
+    def merge(self, other: "Histogram") -> None:
+        if other.total == 0:
+            return
+        for index, count in other.counts.items():
+            self.counts[index] += count
+        self.min = other.min if self.total == 0 else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.total += other.total
+        self.sum += other.sum
+
+    def to_dict(self) -> dict:
+        return {
+            "counts": {str(index): count for index, count in self.counts.items()},
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+            "sum": self.sum,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Histogram":
+        hist = cls()
+        for index, count in data.get("counts", {}).items():
+            hist.counts[int(index)] = count
+        hist.total = data.get("total", 0)
+        hist.min = data.get("min", 0)
+        hist.max = data.get("max", 0)
+        hist.sum = data.get("sum", 0)
+        return hist
+
+
+class RouteMetrics:
+    def __init__(self):
+        self.latency = Histogram()
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.statuses: Dict[str, int] = defaultdict(int)
+
+    @property
+    def count(self) -> int:
+        return self.latency.total
+
+    def record(self, micros: float, status: int, bytes_in: int, bytes_out: int) -> None:
+        self.latency.record(micros)
+        self.bytes_in += bytes_in
+        self.bytes_out += bytes_out
+        self.statuses[str(status)] += 1
+
+    def merge(self, other: "RouteMetrics") -> None:
+        self.latency.merge(other.latency)
+        self.bytes_in += other.bytes_in
+        self.bytes_out += other.bytes_out
+        for status, count in other.statuses.items():
+            self.statuses[status] += count
+
+    def summary(self) -> dict:
+        ms = lambda micros: round(micros / 1000.0, 2)  # noqa: E731
+        return {
+            "count": self.count,
+            "p50Ms": ms(self.latency.percentile(50)),
+            "p90Ms": ms(self.latency.percentile(90)),
+            "p95Ms": ms(self.latency.percentile(95)),
+            "p99Ms": ms(self.latency.percentile(99)),
+            "maxMs": ms(self.latency.max),
+            "bytesIn": self.bytes_in,
+            "bytesOut": self.bytes_out,
+            "statuses": dict(self.statuses),
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            "latency": self.latency.to_dict(),
+            "bytesIn": self.bytes_in,
+            "bytesOut": self.bytes_out,
+            "statuses": dict(self.statuses),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RouteMetrics":
+        metrics = cls()
+        metrics.latency = Histogram.from_dict(data.get("latency", {}))
+        metrics.bytes_in = data.get("bytesIn", 0)
+        metrics.bytes_out = data.get("bytesOut", 0)
+        metrics.statuses.update(data.get("statuses", {}))
+        return metrics
+
+
+class Recorder:
+    """Thread-safe collection of ``RouteMetrics`` keyed by route template."""
+
+    def __init__(self):
+        self.routes: Dict[str, RouteMetrics] = defaultdict(RouteMetrics)
+        self._lock = threading.Lock()
+
+    def record(self, route: str, micros: float, status: int, bytes_in: int, bytes_out: int) -> None:
+        with self._lock:
+            self.routes[route].record(micros, status, bytes_in, bytes_out)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.routes.clear()
+
+    def snapshot(self) -> Dict[str, dict]:
+        with self._lock:
+            return {route: metrics.to_dict() for route, metrics in self.routes.items()}
+
+
+recorder = Recorder()
+_original_send = None
+
+
+def _body_size(body) -> int:
+    if body is None:
+        return 0
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    if isinstance(body, str):
+        return len(body.encode("utf-8"))
+    return 0
+
+
+def install(target: Optional[Recorder] = None) -> Recorder:
+    """Start recording every ``requests`` call into ``target`` (default: module recorder)."""
+    global _original_send
+    import requests
+
+    target = target or recorder
+    if _original_send is None:
+        _original_send = requests.Session.send
+
+    original = _original_send
+
+    def send(self, request, **kwargs):
+        started = time.perf_counter()
+        response = original(self, request, **kwargs)
+        if not kwargs.get("stream"):
+            bytes_in = len(response.content or b"")
+        else:
+            bytes_in = int(response.headers.get("Content-Length") or 0)
+        micros = (time.perf_counter() - started) * 1_000_000
+        target.record(
+            route_template(request.method, request.url),
+            micros,
+            response.status_code,
+            bytes_in,
+            _body_size(request.body),
+        )
+        return response
+
+    requests.Session.send = send
+    return target
+
+
+def uninstall() -> None:
+    global _original_send
+    if _original_send is None:
+        return
+    import requests
+
+    requests.Session.send = _original_send
+    _original_send = None
+
+
+def merge_snapshots(snapshots: Iterable[Dict[str, dict]]) -> Dict[str, RouteMetrics]:
+    merged: Dict[str, RouteMetrics] = defaultdict(RouteMetrics)
+    for snapshot in snapshots:
+        for route, data in snapshot.items():
+            merged[route].merge(RouteMetrics.from_dict(data))
+    return merged
+
+
+def build_artifact(per_test: Dict[str, Dict[str, dict]]) -> dict:
+    """Build the JSON artifact from per-test snapshots keyed by test title."""
+    merged = merge_snapshots(per_test.values())
+    return {
+        "generatedAt": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "routes": {route: merged[route].summary() for route in sorted(merged)},
+        "workflows": {
+            title: {
+                "requests": sum(RouteMetrics.from_dict(data).count for data in snapshot.values()),
+                "routes": {route: RouteMetrics.from_dict(data).count for route, data in sorted(snapshot.items())},
+            }
+            for title, snapshot in sorted(per_test.items())
+        },
+        "histograms": {route: merged[route].to_dict() for route in sorted(merged)},
+    }
+
+
+def render_markdown(artifact: dict) -> str:
+    lines = [
+        REPORT_START,
+        "## Latency by Route",
+        "",
+        f"_Generated {artifact.get('generatedAt', '')} from the Python suite HTTP calls._",
+        "",
+        "| Route | Calls | p50 (ms) | p90 (ms) | p99 (ms) | max (ms) | Bytes in | Bytes out | Statuses |",
+        "|-------|------:|---------:|---------:|---------:|---------:|---------:|----------:|----------|",
+    ]
+    for route, row in artifact.get("routes", {}).items():
+        statuses = ", ".join(f"{code}×{count}" for code, count in sorted(row["statuses"].items()))
+        lines.append(
+            f"| `{route}` | {row['count']} | {row['p50Ms']} | {row['p90Ms']} | {row['p99Ms']} | "
+            f"{row['maxMs']} | {row['bytesIn']} | {row['bytesOut']} | {statuses} |"
+        )
+    lines.append(REPORT_END)
+    return "\n".join(lines)
+
+
+def write_report_section(report_path: str, artifact: dict) -> None:
+    """Insert or replace the latency section in the Markdown test report."""
+    section = render_markdown(artifact)
+    try:
+        with open(report_path, "r", encoding="utf-8") as fh:
+            content = fh.read()
+    except OSError:
+        content = ""
+    if REPORT_START in content and REPORT_END in content:
+        head, _, rest = content.partition(REPORT_START)
+        _, _, tail = rest.partition(REPORT_END)
+        content = f"{head}{section}{tail}"
+    else:
+        content = f"{content.rstrip()}\n\n---\n\n{section}\n"
+    with open(report_path, "w", encoding="utf-8") as fh:
+        fh.write(content)
+
+
+def write_artifact(path: str, artifact: dict) -> None:
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(artifact, fh, indent=2)
@@ -0,0 +1,191 @@
+"""Performance regression gate over the latency artifact.
+
+Compares a ``tmp/latency_metrics.json`` produced by the runner against the
+committed baseline ``testsprite_backend_perf_baseline.json`` and fails when
+
+* a route's p95 grows by more than ``p95Ratio`` (and by at least
+  ``p95MinDeltaMs``, so 2 ms -> 3 ms jitter does not trip the gate), or
+* a workflow (test case) makes more calls to a route than the baseline
+  allows -- e.g. an extra round trip appearing in the accept flow, or an
+  N+1 pattern making ``browse`` fan out, or
+* a baseline route or workflow is missing from the run (a test that
+  stopped early would otherwise look like a speed-up).
+
+An empty baseline (nothing recorded yet, as right after checkout) means
+there is no gate: ``compare`` prints a warning and passes until a baseline
+is recorded with ``update``.
+
+``--partial`` (used by the runner when only some test cases were selected)
+turns missing routes and workflows into warnings.
+
+Every compare appends one line to ``testsprite_backend_perf_history.jsonl``
+so trends stay visible across deploys.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m seribro_client.perfgate compare tmp/latency_metrics.json
+    python -m seribro_client.perfgate update tmp/latency_metrics.json
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from typing import List, Optional
+
+TESTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(TESTS_DIR, "testsprite_backend_perf_baseline.json")
+DEFAULT_HISTORY = os.path.join(TESTS_DIR, "testsprite_backend_perf_history.jsonl")
+DEFAULT_ARTIFACT = os.path.join(TESTS_DIR, "tmp", "latency_metrics.json")
+
+DEFAULT_THRESHOLDS = {
+    "p95Ratio": 0.25,
+    "p95MinDeltaMs": 10.0,
+    "requestCountDelta": 0,
+    # Logins are served from the token cache, so their count depends on scheduling
+    "ignoreCountRoutes": ["^POST /api/auth/login$"],
+}
+
+
+def _load(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def is_empty(baseline: dict) -> bool:
+    """True when no baseline has been recorded yet (no routes and no workflows)."""
+    return not baseline.get("routes") and not baseline.get("workflows")
+
+
+def missing_entries(current: dict, baseline: dict) -> List[str]:
+    """Baseline routes and workflows the current run never exercised."""
+    missing = [
+        f"route {route}: in baseline but not called in this run"
+        for route in baseline.get("routes", {})
+        if route not in current.get("routes", {})
+    ]
+    missing.extend(
+        f"workflow {workflow}: in baseline but missing from this run"
+        for workflow in baseline.get("workflows", {})
+        if workflow not in current.get("workflows", {})
+    )
+    return missing
+
+
+def compare(current: dict, baseline: dict, thresholds: Optional[dict] = None, partial: bool = False) -> List[str]:
+    """Return a list of human-readable regressions (empty when the gate passes or there is no baseline)."""
+    if is_empty(baseline):
+        return []
+
+    limits = {**DEFAULT_THRESHOLDS, **baseline.get("thresholds", {}), **(thresholds or {})}
+    ignored = [re.compile(pattern) for pattern in limits["ignoreCountRoutes"]]
+    failures = [] if partial else missing_entries(current, baseline)
+
+    for route, base in baseline.get("routes", {}).items():
+        row = current.get("routes", {}).get(route)
+        if row is None or not base.get("p95Ms"):
+            continue
+        limit = max(base["p95Ms"] * (1 + limits["p95Ratio"]), base["p95Ms"] + limits["p95MinDeltaMs"])
+        if row["p95Ms"] > limit:
+            failures.append(
+                f"p95 {route}: {row['p95Ms']} ms > {round(limit, 2)} ms (baseline {base['p95Ms']} ms)"
+            )
+
+    for workflow, base in baseline.get("workflows", {}).items():
+        row = current.get("workflows", {}).get(workflow)
+        if row is None:
+            continue
+        for route, base_count in base.get("routes", {}).items():
+            if any(pattern.search(route) for pattern in ignored):
+                continue
+            count = row.get("routes", {}).get(route, 0)
+            if count > base_count + limits["requestCountDelta"]:
+                failures.append(f"calls {workflow} / {route}: {count} > baseline {base_count}")
+        for route, count in row.get("routes", {}).items():
+            if route not in base.get("routes", {}) and not any(pattern.search(route) for pattern in ignored):
+                failures.append(f"calls {workflow} / {route}: new route called {count}x")
+
+    return failures
+
+
+def baseline_from(current: dict, thresholds: Optional[dict] = None) -> dict:
+    return {
+        "updatedAt": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "thresholds": thresholds or dict(DEFAULT_THRESHOLDS),
+        "routes": {
+            route: {"p95Ms": row["p95Ms"], "p99Ms": row["p99Ms"], "count": row["count"]}
+            for route, row in current.get("routes", {}).items()
+        },
+        "workflows": {
+            workflow: {"routes": dict(row.get("routes", {}))}
+            for workflow, row in current.get("workflows", {}).items()
+        },
+    }
+
+
+def append_history(path: str, current: dict, failures: List[str]) -> None:
+    entry = {
+        "at": current.get("generatedAt") or time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "commit": os.environ.get("GIT_COMMIT", ""),
+        "passed": not failures,
+        "regressions": len(failures),
+        "routes": {route: {"p95Ms": row["p95Ms"], "count": row["count"]} for route, row in current.get("routes", {}).items()},
+        "workflowRequests": {workflow: row.get("requests", 0) for workflow, row in current.get("workflows", {}).items()},
+    }
+    with open(path, "a", encoding="utf-8") as fh:
+        fh.write(json.dumps(entry, sort_keys=True) + "\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare latency metrics against the stored baseline")
+    parser.add_argument("mode", choices=["compare", "update"])
+    parser.add_argument("artifact", nargs="?", default=DEFAULT_ARTIFACT)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--history", default=DEFAULT_HISTORY)
+    parser.add_argument("--p95-ratio", type=float, help="Allowed relative p95 growth (0.25 = +25%%)")
+    parser.add_argument("--count-delta", type=int, help="Allowed extra calls per route per workflow")
+    parser.add_argument("--partial", action="store_true",
+                        help="Run covered only some test cases: warn instead of failing on missing entries")
+    args = parser.parse_args(argv)
+
+    current = _load(args.artifact)
+    overrides = {}
+    if args.p95_ratio is not None:
+        overrides["p95Ratio"] = args.p95_ratio
+    if args.count_delta is not None:
+        overrides["requestCountDelta"] = args.count_delta
+
+    if args.mode == "update":
+        if not current.get("routes"):
+            print(f"{args.artifact} has no routes; refusing to write an empty baseline")
+            return 1
+        existing = _load(args.baseline) if os.path.exists(args.baseline) else {}
+        thresholds = {**DEFAULT_THRESHOLDS, **existing.get("thresholds", {}), **overrides}
+        with open(args.baseline, "w", encoding="utf-8") as fh:
+            json.dump(baseline_from(current, thresholds), fh, indent=2)
+            fh.write("\n")
+        print(f"Baseline updated -> {args.baseline}")
+        return 0
+
+    baseline = _load(args.baseline)
+    failures = compare(current, baseline, overrides, partial=args.partial)
+    append_history(args.history, current, failures)
+    if is_empty(baseline):
+        print(f"Warning: {args.baseline} is empty, so there is no gate; record one with `perfgate update`")
+        return 0
+    if args.partial:
+        for warning in missing_entries(current, baseline):
+            print(f"Warning: {warning}")
+    if failures:
+        print("Performance regressions:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+    print("Performance gate passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
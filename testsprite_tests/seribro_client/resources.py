@@ -0,0 +1,305 @@
+"""Typed wrappers for the Seribro REST routes used by the test suite.
+
+Each resource maps one route prefix (``/api/auth``, ``/api/student`` ...) to
+methods that return the unwrapped ``data`` payload. Raw ``Response``
+objects are still reachable through ``request(...)`` for negative tests,
+and ``last_response`` keeps the most recent one for tests that assert on
+the envelope ``message`` or on cookies.
+"""
+
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+import requests
+
+from . import config
+from .envelope import unwrap
+from .session import Principal
+
+JSON = Dict[str, Any]
+
+
+class Resource:
+    """Base class binding a route prefix to a pooled session and principal."""
+
+    prefix = ""
+
+    def __init__(self, session: requests.Session, base_url: str, principal: Optional[Principal] = None):
+        self.session = session
+        self.base_url = base_url.rstrip("/")
+        self.principal = principal
+        self._local = threading.local()
+
+    @property
+    def last_response(self) -> Optional[requests.Response]:
+        """The last response this resource received on the calling thread."""
+        return getattr(self._local, "response", None)
+
+    def url(self, path: str = "") -> str:
+        return f"{self.base_url}{self.prefix}{path}"
+
+    def request(self, method: str, path: str = "", **kwargs) -> requests.Response:
+        """Send a request and return the raw response without checking it."""
+        headers = dict(kwargs.pop("headers", None) or {})
+        if self.principal is not None:
+            headers.setdefault("Authorization", f"Bearer {self.principal.token}")
+        kwargs.setdefault("timeout", config.TIMEOUT)
+        response = self.session.request(method, self.url(path), headers=headers, **kwargs)
+        self._local.response = response
+        return response
+
+    def call(self, method: str, path: str = "", **kwargs) -> Any:
+        """Send a request and return its unwrapped ``data`` payload."""
+        return unwrap(self.request(method, path, **kwargs))
+
+
+class AuthApi(Resource):
+    prefix = "/api/auth"
+
+    def register_student(self, email: str, password: str, full_name: str, phone: str,
+                         college_id: bytes = b"dummy college id content",
+                         filename: str = "college_id.jpg") -> JSON:
+        files = {"collegeId": (filename, college_id, "image/jpeg")}
+        data = {"email": email, "password": password, "fullName": full_name, "phone": phone}
+        return self.call("POST", "/student/register", data=data, files=files)
+
+    def register_company(self, email: str, password: str, company_name: str, contact_person: str,
+                         phone: str = "", document: Optional[bytes] = None,
+                         filename: str = "verification.pdf") -> JSON:
+        data = {
+            "email": email,
+            "password": password,
+            "companyName": company_name,
+            "contactPerson": contact_person,
+            "phone": phone,
+        }
+        files = None
+        if document is not None:
+            files = {"verificationDocument": (filename, document, "application/pdf")}
+        return self.call("POST", "/company/register", data=data, files=files)
+
+    def send_otp(self, email: str) -> JSON:
+        return self.call("POST", "/send-otp", json={"email": email})
+
+    def verify_otp(self, email: str, otp: str = config.OTP_CODE) -> JSON:
+        return self.call("POST", "/verify-otp", json={"email": email, "otp": otp})
+
+    def login(self, email: str, password: str, role: str) -> Principal:
+        data = self.call("POST", "/login", json={"email": email, "password": password, "role": role})
+        user = data.get("user") or {}
+        user_id = user.get("id") or user.get("_id") or data.get("_id")
+        token = data.get("token")
+        assert token, f"Login for {email} ({role}) returned no token"
+        return Principal(email=email, role=role, token=token, user_id=user_id)
+
+    def logout(self) -> JSON:
+        return self.call("POST", "/logout")
+
+    def forgot_password(self, email: str) -> JSON:
+        return self.call("POST", "/forgot-password", json={"email": email})
+
+    def reset_password(self, email: str, otp: str, password: str) -> JSON:
+        return self.call("POST", "/reset-password", json={"email": email, "otp": otp, "password": password})
+
+
+class StudentApi(Resource):
+    prefix = "/api/student"
+
+    # Profile
+    def profile(self) -> JSON:
+        return self.call("GET", "/profile")
+
+    def dashboard(self) -> JSON:
+        return self.call("GET", "/dashboard")
+
+    def update_basic_info(self, **fields) -> JSON:
+        return self.call("PUT", "/profile/basic", json=fields)
+
+    def update_skills(self, technical: Iterable[str], soft: Iterable[str] = ()) -> JSON:
+        return self.call("PUT", "/profile/skills", json={"technical": list(technical), "soft": list(soft)})
+
+    def update_tech_stack(self, tech_stack: Iterable[str]) -> JSON:
+        return self.call("PUT", "/profile/tech", json={"techStack": list(tech_stack)})
+
+    def update_links(self, **links) -> JSON:
+        return self.call("PUT", "/profile/links", json=links)
+
+    def add_project(self, **project) -> JSON:
+        return self.call("POST", "/profile/projects", json=project)
+
+    def upload_resume(self, content: bytes, filename: str = "resume.pdf") -> JSON:
+        return self.call("POST", "/profile/resume", files={"resume": (filename, content, "application/pdf")})
+
+    def upload_college_id(self, content: bytes, filename: str = "college_id.jpg",
+                          content_type: str = "image/jpeg") -> JSON:
+        return self.call("POST", "/profile/college-id", files={"collegeId": (filename, content, content_type)})
+
+    def submit_verification(self) -> JSON:
+        return self.call("POST", "/profile/submit-verification")
+
+    def earnings(self) -> JSON:
+        return self.call("GET", "/earnings")
+
+    # Projects
+    def browse_projects(self, **params) -> JSON:
+        return self.call("GET", "/projects/browse", params=params)
+
+    def recommended_projects(self) -> JSON:
+        return self.call("GET", "/projects/recommended")
+
+    def project(self, project_id: str) -> JSON:
+        return self.call("GET", f"/projects/{project_id}")
+
+    def apply(self, project_id: str, cover_letter: str, proposed_price: float, estimated_time: str) -> JSON:
+        payload = {
+            "coverLetter": cover_letter,
+            "proposedPrice": proposed_price,
+            "estimatedTime": estimated_time,
+        }
+        return self.call("POST", f"/projects/{project_id}/apply", json=payload)
+
+    # Applications
+    def my_applications(self, **params) -> JSON:
+        return self.call("GET", "/projects/applications/my-applications", params=params)
+
+    def application_stats(self) -> JSON:
+        return self.call("GET", "/projects/applications/stats")
+
+    def application(self, application_id: str) -> JSON:
+        return self.call("GET", f"/projects/applications/{application_id}")
+
+    def withdraw(self, application_id: str) -> JSON:
+        return self.call("PUT", f"/projects/applications/{application_id}/withdraw")
+
+
+class CompanyApi(Resource):
+    prefix = "/api/company"
+
+    # Profile
+    def init_profile(self) -> JSON:
+        return self.call("POST", "/profile/init")
+
+    def profile(self) -> JSON:
+        return self.call("GET", "/profile")
+
+    def dashboard(self) -> JSON:
+        return self.call("GET", "/dashboard")
+
+    def update_basic_info(self, **fields) -> JSON:
+        return self.call("PUT", "/profile/basic", json=fields)
+
+    def update_details(self, **fields) -> JSON:
+        return self.call("PUT", "/profile/details", json=fields)
+
+    def update_authorized_person(self, **fields) -> JSON:
+        return self.call("PUT", "/profile/person", json=fields)
+
+    def upload_logo(self, content: bytes, filename: str = "logo.png", content_type: str = "image/png") -> JSON:
+        return self.call("POST", "/profile/logo", files={"logo": (filename, content, content_type)})
+
+    def upload_documents(self, content: bytes, filename: str = "registration.pdf") -> JSON:
+        return self.call("POST", "/profile/documents", files=[("documents", (filename, content, "application/pdf"))])
+
+    def submit_verification(self) -> JSON:
+        return self.call("POST", "/profile/submit-verification")
+
+    # Projects
+    def create_project(self, **project) -> JSON:
+        return self.call("POST", "/projects/create", json=project)
+
+    def my_projects(self, **params) -> JSON:
+        return self.call("GET", "/projects/my-projects", params=params)
+
+    def project(self, project_id: str) -> JSON:
+        return self.call("GET", f"/projects/{project_id}")
+
+    def update_project(self, project_id: str, **fields) -> JSON:
+        return self.call("PUT", f"/projects/{project_id}", json=fields)
+
+    def delete_project(self, project_id: str) -> JSON:
+        return self.call("DELETE", f"/projects/{project_id}")
+
+    # Applications
+    def application_stats(self) -> JSON:
+        return self.call("GET", "/applications/stats")
+
+    def all_applications(self, **params) -> JSON:
+        return self.call("GET", "/applications/all", params=params)
+
+    def project_applications(self, project_id: str, **params) -> List[JSON]:
+        data = self.call("GET", f"/applications/projects/{project_id}/applications", params=params)
+        return data.get("applications", []) if isinstance(data, dict) else data
+
+    def application(self, application_id: str) -> JSON:
+        return self.call("GET", f"/applications/{application_id}")
+
+    def shortlist(self, application_id: str) -> JSON:
+        return self.call("POST", f"/applications/{application_id}/shortlist")
+
+    def approve(self, application_id: str) -> JSON:
+        return self.call("POST", f"/applications/{application_id}/approve")
+
+    def reject(self, application_id: str, reason: str = "") -> JSON:
+        return self.call("POST", f"/applications/{application_id}/reject", json={"rejectionReason": reason})
+
+    def bulk_reject(self, application_ids: Iterable[str], reason: str = "") -> JSON:
+        payload = {"applicationIds": list(application_ids), "rejectionReason": reason}
+        return self.call("POST", "/applications/bulk-reject", json=payload)
+
+
+class AdminApi(Resource):
+    prefix = "/api/admin"
+
+    def dashboard(self) -> JSON:
+        return self.call("GET", "/dashboard")
+
+    def pending_students(self) -> JSON:
+        return self.call("GET", "/students/pending")
+
+    def pending_companies(self) -> JSON:
+        return self.call("GET", "/companies/pending")
+
+    def approve_student(self, student_id: str) -> JSON:
+        return self.call("POST", f"/student/{student_id}/approve")
+
+    def reject_student(self, student_id: str, reason: str) -> JSON:
+        return self.call("POST", f"/student/{student_id}/reject", json={"reason": reason})
+
+    def approve_company(self, company_id: str) -> JSON:
+        return self.call("POST", f"/company/{company_id}/approve")
+
+    def reject_company(self, company_id: str, reason: str) -> JSON:
+        return self.call("POST", f"/company/{company_id}/reject", json={"reason": reason})
+
+    def projects(self, **params) -> JSON:
+        return self.call("GET", "/projects/all", params=params)
+
+    def project_stats(self) -> JSON:
+        return self.call("GET", "/projects/stats")
+
+    def applications(self, **params) -> JSON:
+        return self.call("GET", "/applications/all", params=params)
+
+    def application_stats(self) -> JSON:
+        return self.call("GET", "/applications/stats")
+
+
+class NotificationsApi(Resource):
+    prefix = "/api/notifications"
+
+    def list(self, **params) -> List[JSON]:
+        data = self.call("GET", "", params=params)
+        return data.get("notifications", []) if isinstance(data, dict) else data
+
+    def unread_count(self) -> int:
+        data = self.call("GET", "/unread/count")
+        return int(data.get("unreadCount", data.get("count", 0))) if isinstance(data, dict) else int(data)
+
+    def mark_read(self, notification_id: str) -> JSON:
+        return self.call("PUT", f"/{notification_id}/read")
+
+    def mark_all_read(self) -> JSON:
+        return self.call("PUT", "/read-all")
+
+    def delete(self, notification_id: str) -> JSON:
+        return self.call("DELETE", f"/{notification_id}")
@@ -0,0 +1,270 @@
+"""Parallel, isolated runner for the ``TC0xx`` testsprite scripts.
+
+Each script calls its test function at import time, so the runner executes
+the script source in a worker process the same way the testsprite handler
+does (``exec(code, env)``). Before execution every quoted email literal is
+plus-addressed with a namespace unique to the run, worker and test case,
+and any shared account the script expects to exist is registered for that
+namespace first. A namespace that uses a student account also gets the state
+the scripts assume: the student profile is completed and approved by the
+admin, and an open project is posted under a namespaced company (its id is
+exported as ``SERIBRO_FIXTURE_PROJECT_ID``). Test cases therefore stop
+colliding on accounts such as ``afmahetar2006@gmail.com`` or on each other's
+projects, and can run across a process pool.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m seribro_client.runner --workers 8
+    python -m seribro_client.runner TC010 TC005 --output /tmp/results.json
+"""
+
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import traceback
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from . import config, identity, metrics, perfgate
+from .session import token_cache
+
+TESTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_OUTPUT = os.path.join(TESTS_DIR, "tmp", "test_results.json")
+DEFAULT_METRICS = os.path.join(TESTS_DIR, "tmp", "latency_metrics.json")
+DEFAULT_REPORT = os.path.join(TESTS_DIR, "testsprite-mcp-test-report.md")
+TEST_PLAN = os.path.join(TESTS_DIR, "testsprite_backend_test_plan.json")
+LEGACY_BASE_URL = "http://localhost:7000"
+
+# Accounts the legacy scripts assume already exist; provisioned per namespace
+DEFAULT_ACCOUNTS = [
+    {"email": "afmahetar2006@gmail.com", "password": "Arman2006@#", "role": "student"},
+]
+# Accounts that cannot be self-registered and are shared by every worker
+DEFAULT_KEEP = [config.ADMIN_EMAIL]
+
+
+@dataclass
+class TestCase:
+    test_id: str
+    path: str
+    title: str
+    description: str
+
+    @property
+    def name(self) -> str:
+        return os.path.splitext(os.path.basename(self.path))[0]
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def load_plan_descriptions(path: str = TEST_PLAN) -> Dict[str, str]:
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            plan = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+    return {f"{item['id']}-{item['title']}": item.get("description", "") for item in plan}
+
+
+def discover(test_dir: str = TESTS_DIR, selectors: Optional[List[str]] = None) -> List[TestCase]:
+    """Find ``TC*.py`` scripts, optionally filtered by id or filename prefix."""
+    descriptions = load_plan_descriptions()
+    cases = []
+    for path in sorted(glob.glob(os.path.join(test_dir, "TC*.py"))):
+        name = os.path.splitext(os.path.basename(path))[0]
+        if selectors and not any(name.startswith(sel) for sel in selectors):
+            continue
+        test_id, _, rest = name.partition("_")
+        title = f"{test_id}-{rest.replace('_', ' ')}"
+        cases.append(TestCase(test_id, path, title, descriptions.get(title, "")))
+    return cases
+
+
+def _provision(namespace: str, accounts: List[dict], mapping: Dict[str, str]) -> None:
+    """Create the namespaced copy of every shared account the script uses.
+
+    Student accounts are brought to a complete, approved profile and the
+    namespace gets its own open project, so scripts that apply or browse do
+    not depend on state left behind by another test case.
+    """
+    from . import fixtures
+    from .client import SeribroClient
+    from .envelope import ApiError
+
+    os.environ.pop("SERIBRO_FIXTURE_PROJECT_ID", None)
+    api = SeribroClient()
+    students = []
+    for account in accounts:
+        email = mapping.get(account["email"])
+        if not email:
+            continue
+        try:
+            if account.get("role") == "company":
+                api.auth.register_company(email, account["password"], f"Company {namespace}", f"Contact {namespace}")
+            else:
+                api.auth.register_student(email, account["password"], f"Student {namespace}", "9999999999")
+            api.verify_email(email)
+        except ApiError as err:
+            # 409 means an earlier test of this namespace already created it
+            if err.status_code != 409:
+                raise
+        if account.get("role", "student") == "student":
+            students.append(api.login(email, account["password"], "student"))
+
+    if not students:
+        return
+    admin = fixtures.admin_client(api)
+    for student in students:
+        fixtures.complete_student_profile(student, admin)
+    project = fixtures.create_open_project(fixtures.create_company(api, admin))
+    os.environ["SERIBRO_FIXTURE_PROJECT_ID"] = project.get("_id") or project.get("id")
+
+
+def _init_worker(counter, env: Dict[str, str]) -> None:
+    with counter.get_lock():
+        counter.value += 1
+        worker = counter.value
+    os.environ.update(env)
+    os.environ["SERIBRO_WORKER_ID"] = str(worker)
+    # The package may already be imported (fork), so refresh env-derived settings
+    config.BASE_URL = env["SERIBRO_BASE_URL"]
+    token_cache.path = env["SERIBRO_TOKEN_CACHE_FILE"]
+    if TESTS_DIR not in sys.path:
+        sys.path.insert(0, TESTS_DIR)
+    metrics.install()
+
+
+def run_case(case: TestCase, index: int, base_url: str, accounts: List[dict], keep: List[str]) -> tuple:
+    """Execute one test case in the current (worker) process.
+
+    Returns ``(result, latency_snapshot)``; the snapshot covers every HTTP
+    call the case made, provisioning excluded.
+    """
+    namespace = f"{identity.run_id()}w{identity.worker_id()}t{index}"
+    os.environ["SERIBRO_NAMESPACE"] = namespace
+
+    with open(case.path, "r", encoding="utf-8") as fh:
+        original = fh.read()
+    code, mapping = identity.isolate_source(original, namespace, keep)
+    if base_url != LEGACY_BASE_URL:
+        code = code.replace(LEGACY_BASE_URL, base_url)
+
+    metrics.recorder.reset()
+    created = _now()
+    started = time.perf_counter()
+    status, error = "PASSED", None
+    try:
+        _provision(namespace, accounts, mapping)
+        metrics.recorder.reset()
+        exec(compile(code, case.path, "exec"), {"__name__": "__testsprite__", "__file__": case.path})
+    except BaseException:  # noqa: B902 - scripts may call sys.exit or raise anything
+        status, error = "FAILED", traceback.format_exc()
+
+    result = {
+        "projectId": os.environ.get("SERIBRO_PROJECT_ID", ""),
+        "testId": str(uuid.uuid5(uuid.NAMESPACE_URL, case.title)),
+        "userId": namespace,
+        "title": case.title,
+        "description": case.description,
+        "code": original,
+        "testStatus": status,
+        "testError": error,
+        "testType": "BACKEND",
+        "createFrom": "runner",
+        "created": created,
+        "modified": _now(),
+        "durationMs": round((time.perf_counter() - started) * 1000, 1),
+    }
+    return result, metrics.recorder.snapshot()
+
+
+def run(cases: List[TestCase], workers: int, base_url: str, accounts: List[dict],
+        keep: List[str] = DEFAULT_KEEP) -> tuple:
+    """Run ``cases`` across a process pool; returns ``(results, per_test_latency)``."""
+    run_id = identity.run_id()
+    cache_file = os.path.join(tempfile.gettempdir(), f"seribro-tokens-{run_id}.json")
+    env = {
+        "SERIBRO_RUN_ID": run_id,
+        "SERIBRO_BASE_URL": base_url,
+        "SERIBRO_TOKEN_CACHE_FILE": cache_file,
+    }
+    counter = multiprocessing.Value("i", 0)
+    results: List[Optional[dict]] = [None] * len(cases)
+    latency: Dict[str, Dict[str, dict]] = {}
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(counter, env)) as pool:
+            futures = {
+                pool.submit(run_case, case, index, base_url, accounts, keep): index
+                for index, case in enumerate(cases)
+            }
+            for future in as_completed(futures):
+                result, snapshot = future.result()
+                results[futures[future]] = result
+                latency[result["title"]] = snapshot
+                print(f"{result['testStatus']:<7} {result['title']} ({result['durationMs']} ms)")
+    finally:
+        if os.path.exists(cache_file):
+            os.remove(cache_file)
+    return [result for result in results if result is not None], latency
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the testsprite TC scripts in parallel")
+    parser.add_argument("selectors", nargs="*", help="TC ids or filename prefixes to run (default: all)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4)
+    parser.add_argument("--base-url", default=config.BASE_URL)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--metrics", default=DEFAULT_METRICS, help="Latency histogram JSON artifact")
+    parser.add_argument("--report", default=DEFAULT_REPORT, help="Markdown report to add the latency section to")
+    parser.add_argument("--no-report", action="store_true", help="Do not touch the Markdown report")
+    parser.add_argument("--compare", action="store_true", help="Fail on regressions against the perf baseline")
+    parser.add_argument("--accounts", help="JSON list of {email, password, role} shared accounts to provision")
+    parser.add_argument("--keep-email", action="append", default=None,
+                        help="Email literal to leave shared across workers (default: admin@example.com)")
+    args = parser.parse_args(argv)
+
+    accounts = DEFAULT_ACCOUNTS
+    if args.accounts:
+        with open(args.accounts, "r", encoding="utf-8") as fh:
+            accounts = json.load(fh)
+
+    cases = discover(selectors=args.selectors)
+    if not cases:
+        print("No test cases found")
+        return 1
+
+    started = time.perf_counter()
+    keep = args.keep_email if args.keep_email is not None else DEFAULT_KEEP
+    results, latency = run(cases, max(1, args.workers), args.base_url.rstrip("/"), accounts, keep)
+    elapsed = time.perf_counter() - started
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as fh:
+        json.dump(results, fh, indent=2)
+
+    artifact = metrics.build_artifact(latency)
+    metrics.write_artifact(args.metrics, artifact)
+    if not args.no_report:
+        metrics.write_report_section(args.report, artifact)
+
+    failed = sum(1 for result in results if result["testStatus"] != "PASSED")
+    print(f"\n{len(results) - failed} passed, {failed} failed in {elapsed:.1f}s -> {args.output}")
+
+    regressed = 0
+    if args.compare:
+        regressed = perfgate.main(["compare", args.metrics] + (["--partial"] if args.selectors else []))
+    return 1 if failed or regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,502 @@
+"""Deterministic bulk seeder for realistic-scale benchmark databases.
+
+Writes straight into the backend's collections (``users``, ``students``,
+``studentprofiles``, ``companyprofiles``, ``projects``, ``applications``,
+``messages``, ``notifications``, ``payments``) with batched
+``insert_many``. The same ``--seed`` and ``--now`` always produce the same
+documents, including ObjectIds, so benchmark runs are comparable. Every
+date (and ObjectId timestamp) is derived from ``--now``, a fixed reference
+time by default; ``--wall-clock`` opts into the current time, which makes
+runs differ. The one exception is the deadline of an open project: it keeps
+its seeded distance ahead of ``--now`` but is shifted forward to the real
+clock at seed time, so the backend's ``closeExpiredProjects`` job does not
+close the whole open pool on its first run.
+
+Default volumes (``--scale 1``): 100k students, 10k companies, 500k
+projects, ~3M applications and ~2M each of messages and notifications.
+Use ``--scale 0.01`` for a quick local dataset.
+
+Every seeded account uses ``--password`` so the load tool can log in;
+``--accounts-out`` writes a sample of approved accounts in the format
+``seribro_client.load --accounts`` expects.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m seribro_client.seed --uri mongodb://localhost:27017/seribro_bench --drop
+    python -m seribro_client.seed --memory-server --scale 0.01 --keep-alive
+"""
+
+import argparse
+import json
+import os
+import random
+import struct
+import subprocess
+import sys
+import time
+from bisect import bisect_left
+from datetime import datetime, timedelta, timezone
+from itertools import accumulate
+from typing import Iterator, List, Optional, Sequence
+
+from bson import ObjectId
+from pymongo import MongoClient
+
+TESTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_NOW = "2026-01-01T00:00:00+00:00"
+BACKEND_DIR = os.path.join(os.path.dirname(TESTS_DIR), "seribro-backend")
+
+BASE_VOLUMES = {
+    "students": 100_000,
+    "companies": 10_000,
+    "projects": 500_000,
+    "applicationsPerProject": 6.0,
+    "messagesPerActiveProject": 12.0,
+    "notificationsPerUser": 18.0,
+}
+
+SKILLS = [
+    "JavaScript", "React", "Node.js", "Python", "MongoDB", "Express", "HTML", "CSS",
+    "TypeScript", "Django", "Flask", "Java", "Spring Boot", "SQL", "PostgreSQL", "Figma",
+    "Flutter", "React Native", "Kotlin", "Swift", "AWS", "Docker", "Kubernetes", "Git",
+    "Machine Learning", "TensorFlow", "PyTorch", "Pandas", "Data Analysis", "Next.js",
+    "Vue.js", "Angular", "Tailwind CSS", "GraphQL", "Redis", "Firebase", "C++", "Go",
+    "Solidity", "Cybersecurity",
+]
+# Zipf-like popularity: a few skills dominate, with a long tail
+SKILL_WEIGHTS = [1.0 / (rank + 1) ** 0.9 for rank in range(len(SKILLS))]
+
+CATEGORIES = [
+    ("Web Development", 30), ("Full Stack", 15), ("Frontend Development", 10),
+    ("Backend Development", 10), ("Mobile Development", 10), ("AI/ML", 8),
+    ("Data Science", 7), ("Cloud & DevOps", 4), ("Cybersecurity", 2),
+    ("Blockchain", 1), ("IoT", 1), ("Other", 2),
+]
+DURATIONS = [("1 week", 10), ("2 weeks", 25), ("1 month", 35), ("2 months", 18), ("3 months", 8), ("6 months", 4)]
+PROJECT_STATUSES = [
+    ("open", 30), ("assigned", 6), ("in-progress", 14), ("under-review", 4),
+    ("completed", 30), ("closed", 12), ("cancelled", 4),
+]
+APPLICATION_STATUSES = [("pending", 45), ("shortlisted", 12), ("rejected", 35), ("withdrawn", 6), ("expired", 2)]
+ESTIMATES = ["1 week", "2 weeks", "3-4 weeks", "1-2 months", "2-3 months"]
+COLLEGES = [
+    "IIT Bombay", "NIT Surat", "LD College of Engineering", "DA-IICT", "Nirma University",
+    "VIT Vellore", "BITS Pilani", "Pune Institute of Computer Technology", "MSU Baroda", "GTU",
+]
+CITIES = ["Ahmedabad", "Surat", "Vadodara", "Mumbai", "Pune", "Bengaluru", "Delhi", "Hyderabad", "Rajkot", "Jaipur"]
+INDUSTRIES = ["IT Services", "E-commerce", "EdTech", "FinTech", "HealthTech", "Manufacturing", "Media", "Logistics"]
+FIRST_NAMES = ["Aarav", "Vivaan", "Aditya", "Diya", "Ananya", "Ishaan", "Kavya", "Riya", "Arjun", "Meera",
+               "Rohan", "Saanvi", "Krish", "Priya", "Yash", "Nisha", "Dev", "Pooja", "Harsh", "Sneha"]
+LAST_NAMES = ["Patel", "Shah", "Mehta", "Desai", "Joshi", "Sharma", "Verma", "Iyer", "Reddy", "Nair"]
+WORDS = ["inventory", "dashboard", "portal", "mobile", "analytics", "booking", "chat", "payments",
+         "marketplace", "tracker", "CRM", "landing page", "API", "automation", "recommendation"]
+
+
+class WeightedChoice:
+    def __init__(self, pairs: Sequence[tuple]):
+        self.values = [value for value, _ in pairs]
+        self.cumulative = list(accumulate(weight for _, weight in pairs))
+
+    def __call__(self, rng: random.Random):
+        return self.values[bisect_left(self.cumulative, rng.random() * self.cumulative[-1])]
+
+
+class Seeder:
+    def __init__(self, db, seed: int, scale: float, batch_size: int, password_hash: str, now: datetime,
+                 deadline_anchor: Optional[datetime] = None):
+        self.db = db
+        self.rng = random.Random(seed)
+        self.scale = scale
+        self.batch_size = batch_size
+        self.password_hash = password_hash
+        self.now = now
+        # Open deadlines are moved by however far the real clock is past ``now``
+        self.open_deadline_shift = max(timedelta(0), (deadline_anchor or now) - now)
+        self.span = timedelta(days=730)
+        self.counts = {}
+        self.category = WeightedChoice(CATEGORIES)
+        self.duration = WeightedChoice(DURATIONS)
+        self.project_status = WeightedChoice(PROJECT_STATUSES)
+        self.application_status = WeightedChoice(APPLICATION_STATUSES)
+        # Compact per-entity arrays kept for cross references
+        self.student_users: List[ObjectId] = []
+        self.student_profiles: List[ObjectId] = []
+        self.student_skills: List[list] = []
+        self.company_users: List[ObjectId] = []
+        self.company_profiles: List[ObjectId] = []
+
+    # ----- helpers -----
+    def volume(self, key: str) -> int:
+        return max(1, int(BASE_VOLUMES[key] * self.scale))
+
+    def object_id(self, at: datetime) -> ObjectId:
+        """ObjectId whose embedded timestamp matches ``at``; remaining bytes come from the seeded RNG."""
+        return ObjectId(struct.pack(">I", int(at.timestamp())) + self.rng.getrandbits(64).to_bytes(8, "big"))
+
+    def created_at(self, after: Optional[datetime] = None) -> datetime:
+        """Dates skewed toward the present, like a growing platform."""
+        start = after or (self.now - self.span)
+        window = (self.now - start).total_seconds()
+        return start + timedelta(seconds=window * (self.rng.random() ** 0.6))
+
+    def skills(self, low: int, high: int) -> list:
+        count = self.rng.randint(low, high)
+        picked = set()
+        while len(picked) < count:
+            picked.add(self.rng.choices(SKILLS, weights=SKILL_WEIGHTS)[0])
+        return sorted(picked)
+
+    def name(self) -> str:
+        return f"{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)}"
+
+    def insert(self, collection: str, docs: Iterator[dict]) -> int:
+        batch, total = [], 0
+        for doc in docs:
+            batch.append(doc)
+            if len(batch) >= self.batch_size:
+                self.db[collection].insert_many(batch, ordered=False)
+                total += len(batch)
+                batch = []
+        if batch:
+            self.db[collection].insert_many(batch, ordered=False)
+            total += len(batch)
+        self.counts[collection] = self.counts.get(collection, 0) + total
+        return total
+
+    # ----- generators -----
+    def users_and_students(self) -> None:
+        users, students, profiles = [], [], []
+        for index in range(self.volume("students")):
+            created = self.created_at()
+            user_id, student_id, profile_id = self.object_id(created), self.object_id(created), self.object_id(created)
+            name = self.name()
+            email = f"student{index}@seed.seribro.test"
+            skills = self.skills(3, 9)
+            approved = self.rng.random() < 0.8
+            users.append({
+                "_id": user_id, "email": email, "password": self.password_hash, "role": "student",
+                "emailVerified": True, "profileCompleted": approved, "authProvider": [], "devices": [],
+                "createdAt": created, "updatedAt": created, "__v": 0,
+            })
+            students.append({
+                "_id": student_id, "user": user_id, "fullName": name, "college": self.rng.choice(COLLEGES),
+                "createdAt": created, "updatedAt": created, "__v": 0,
+            })
+            profiles.append({
+                "_id": profile_id, "student": student_id, "user": user_id,
+                "basicInfo": {
+                    "fullName": name, "email": email, "phone": f"9{self.rng.randrange(10 ** 9):09d}",
+                    "collegeName": self.rng.choice(COLLEGES), "degree": self.rng.choice(["B.Tech", "BCA", "MCA", "B.Sc"]),
+                    "graduationYear": self.rng.randint(2024, 2029), "location": self.rng.choice(CITIES),
+                },
+                "skills": {
+                    "technical": skills, "soft": ["Communication"], "languages": ["English", "Hindi"],
+                    "techStack": skills[:5],
+                },
+                "projects": [],
+                "verificationStatus": "approved" if approved else self.rng.choice(["draft", "pending", "rejected"]),
+                "profileStats": {"profileCompletion": 100 if approved else self.rng.randint(20, 90), "lastUpdated": created},
+                "createdAt": created, "updatedAt": created, "__v": 0,
+            })
+            self.student_users.append(user_id)
+            self.student_profiles.append(profile_id)
+            self.student_skills.append(skills)
+        self.insert("users", iter(users))
+        self.insert("students", iter(students))
+        self.insert("studentprofiles", iter(profiles))
+
+    def companies(self) -> None:
+        users, profiles = [], []
+        for index in range(self.volume("companies")):
+            created = self.created_at()
+            user_id, profile_id = self.object_id(created), self.object_id(created)
+            email = f"company{index}@seed.seribro.test"
+            approved = self.rng.random() < 0.85
+            users.append({
+                "_id": user_id, "email": email, "password": self.password_hash, "role": "company",
+                "emailVerified": True, "profileCompleted": approved, "authProvider": [], "devices": [],
+                "createdAt": created, "updatedAt": created, "__v": 0,
+            })
+            profiles.append({
+                "_id": profile_id, "user": user_id,
+                "companyName": f"{self.rng.choice(WORDS).title()} Labs {index}",
+                "companyEmail": email, "mobile": f"9{self.rng.randrange(10 ** 9):09d}",
+                "industryType": self.rng.choice(INDUSTRIES), "companySize": self.rng.choice(["1-10", "11-50", "51-200"]),
+                "officeAddress": {"city": self.rng.choice(CITIES), "state": "Gujarat", "country": "India"},
+                "logoUrl": "https://res.cloudinary.com/seribro/image/upload/seed-logo.png",
+                "authorizedPerson": {"name": self.name(), "designation": "Founder", "email": email},
+                "profileComplete": approved, "profileCompletionPercentage": 100 if approved else 60,
+                "verificationStatus": "approved" if approved else "pending",
+                "createdAt": created, "updatedAt": created, "__v": 0,
+            })
+            self.company_users.append(user_id)
+            self.company_profiles.append(profile_id)
+        self.insert("users", iter(users))
+        self.insert("companyprofiles", iter(profiles))
+
+    def projects_and_dependents(self) -> None:
+        """Stream projects in batches and emit their applications, messages and payments alongside."""
+        projects, applications, messages, payments = [], [], [], []
+        apps_mean = BASE_VOLUMES["applicationsPerProject"]
+        msgs_mean = BASE_VOLUMES["messagesPerActiveProject"]
+        total_projects = self.volume("projects")
+        company_count = len(self.company_profiles)
+        student_count = len(self.student_profiles)
+
+        def flush(force: bool = False) -> None:
+            for name, docs in (("projects", projects), ("applications", applications),
+                               ("messages", messages), ("payments", payments)):
+                if docs and (force or len(docs) >= self.batch_size):
+                    self.insert(name, iter(docs))
+                    docs.clear()
+
+        for _ in range(total_projects):
+            # Company activity is heavy-tailed: a few companies post most projects
+            company_index = min(company_count - 1, int(company_count * (self.rng.random() ** 2.2)))
+            created = self.created_at()
+            project_id = self.object_id(created)
+            status = self.project_status(self.rng)
+            skills = self.skills(2, 6)
+            budget_min = self.rng.choice([1000, 2000, 3000, 5000, 8000, 10000, 15000])
+            budget_max = budget_min + self.rng.choice([1000, 2000, 5000, 10000])
+            deadline = created + timedelta(days=self.rng.randint(7, 120))
+            if status == "open":
+                if deadline <= self.now:
+                    deadline = self.now + timedelta(days=self.rng.randint(3, 90))
+                deadline += self.open_deadline_shift
+            project = {
+                "_id": project_id,
+                "company": self.company_profiles[company_index],
+                "companyId": self.company_profiles[company_index],
+                "title": f"{self.rng.choice(WORDS).title()} {self.rng.choice(WORDS)} for {self.rng.choice(INDUSTRIES)}",
+                "description": f"Build a {self.rng.choice(WORDS)} using {', '.join(skills)}. " * 3,
+                "category": self.category(self.rng),
+                "requiredSkills": skills,
+                "budgetMin": budget_min,
+                "budgetMax": budget_max,
+                "projectDuration": self.duration(self.rng),
+                "deadline": deadline,
+                "status": status,
+                "paymentStatus": "pending",
+                "applicationsCount": 0,
+                "shortlistedStudents": [],
+                "isDeleted": False,
+                "createdBy": self.company_users[company_index],
+                "lastActivity": created,
+                "messageCount": 0,
+                "createdAt": created,
+                "updatedAt": created,
+                "__v": 0,
+            }
+
+            # Application count per project ~ geometric around the mean, capped
+            count = min(student_count, int(self.rng.expovariate(1.0 / apps_mean)))
+            applicants = self.rng.sample(range(student_count), count) if count else []
+            assigned_index = applicants[0] if applicants and status not in ("open", "closed", "cancelled") else None
+            for position, student_index in enumerate(applicants):
+                applied = self.created_at(created)
+                app_status = "accepted" if student_index == assigned_index else self.application_status(self.rng)
+                if assigned_index is not None and app_status in ("pending", "shortlisted"):
+                    app_status = "rejected"
+                applications.append({
+                    "_id": self.object_id(applied),
+                    "project": project_id, "projectId": project_id,
+                    "student": self.student_profiles[student_index], "studentId": self.student_profiles[student_index],
+                    "company": project["companyId"], "companyId": project["companyId"],
+                    "coverLetter": "I have built similar projects and can deliver this on time with clean code. " * 2,
+                    "proposedPrice": self.rng.randint(budget_min, budget_max),
+                    "estimatedTime": self.rng.choice(ESTIMATES),
+                    "status": app_status,
+                    "appliedAt": applied,
+                    "studentSkills": self.student_skills[student_index],
+                    "statusHistory": [{"status": app_status, "changedAt": applied}],
+                    "createdAt": applied, "updatedAt": applied, "__v": 0,
+                })
+            project["applicationsCount"] = count
+
+            if assigned_index is not None:
+                student_user = self.student_users[assigned_index]
+                student_profile = self.student_profiles[assigned_index]
+                project["assignedStudent"] = student_profile
+                project["selectedStudentId"] = student_profile
+                project["workspaceCreatedAt"] = created
+                message_count = int(self.rng.expovariate(1.0 / msgs_mean))
+                at = created
+                for _ in range(message_count):
+                    at = min(self.now, at + timedelta(minutes=self.rng.randint(5, 2 * 24 * 60)))
+                    from_student = self.rng.random() < 0.55
+                    messages.append({
+                        "_id": self.object_id(at), "project": project_id,
+                        "sender": student_user if from_student else project["createdBy"],
+                        "senderRole": "student" if from_student else "company",
+                        "senderName": "Student" if from_student else "Company",
+                        "message": f"Update on the {self.rng.choice(WORDS)}: {self.rng.choice(WORDS)} is done.",
+                        "attachments": [], "isRead": self.rng.random() < 0.85,
+                        "createdAt": at, "updatedAt": at, "__v": 0,
+                    })
+                project["messageCount"] = message_count
+                project["lastActivity"] = at
+
+                amount = self.rng.randint(budget_min, budget_max)
+                payment_status = {
+                    "completed": self.rng.choice(["released", "released", "released", "ready_for_release"]),
+                    "under-review": "captured",
+                    "in-progress": "captured",
+                }.get(status, "pending")
+                paid_at = self.created_at(created)
+                payment = {
+                    "_id": self.object_id(created), "project": project_id,
+                    "company": project["companyId"], "student": student_profile,
+                    "amount": amount, "baseAmount": amount, "platformFee": round(amount * 0.05),
+                    "totalAmount": amount + round(amount * 0.05), "netAmount": amount, "currency": "INR",
+                    "status": payment_status, "createdAt": created, "transactionHistory": [],
+                }
+                if payment_status != "pending":
+                    payment["capturedAt"] = paid_at
+                if payment_status == "released":
+                    payment["releasedAt"] = paid_at
+                payments.append(payment)
+                project["payment"] = payment["_id"]
+                project["paymentStatus"] = payment_status
+
+            projects.append(project)
+            flush()
+        flush(force=True)
+
+    def notifications(self) -> None:
+        per_user = BASE_VOLUMES["notificationsPerUser"]
+        types = {
+            "student": ["application_submitted", "application_shortlisted", "application_rejected",
+                        "application_accepted", "workspace_message", "payment_released", "approved"],
+            "company": ["application_received", "workspace_message", "payment_required", "approved"],
+        }
+
+        def generate() -> Iterator[dict]:
+            for role, users in (("student", self.student_users), ("company", self.company_users)):
+                for user_id in users:
+                    for _ in range(int(self.rng.expovariate(1.0 / per_user))):
+                        at = self.created_at()
+                        kind = self.rng.choice(types[role])
+                        yield {
+                            "_id": self.object_id(at), "userId": user_id, "userRole": role,
+                            "message": f"Seeded {kind.replace('_', ' ')} notification",
+                            "type": kind, "isRead": self.rng.random() < 0.7,
+                            "relatedProfileType": None, "relatedProfileId": None,
+                            "createdAt": at, "updatedAt": at, "__v": 0,
+                        }
+
+        self.insert("notifications", generate())
+
+    def run(self) -> dict:
+        started = time.perf_counter()
+        for step in (self.users_and_students, self.companies, self.projects_and_dependents, self.notifications):
+            step_started = time.perf_counter()
+            step()
+            print(f"  {step.__name__:<26} {time.perf_counter() - step_started:7.1f}s")
+        return {"counts": self.counts, "seconds": round(time.perf_counter() - started, 1)}
+
+    def sample_accounts(self, count: int, password: str) -> dict:
+        """Approved accounts for the load generator (same RNG-independent order every run)."""
+        students = self.db.studentprofiles.find({"verificationStatus": "approved"}, {"basicInfo.email": 1}).limit(count)
+        companies = self.db.companyprofiles.find({"verificationStatus": "approved"}, {"companyEmail": 1}).limit(max(1, count // 10))
+        return {
+            "students": [{"email": doc["basicInfo"]["email"], "password": password} for doc in students],
+            "companies": [{"email": doc["companyEmail"], "password": password} for doc in companies],
+        }
+
+
+BCRYPT_ALPHABET = "./ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+
+
+def hash_password(password: str, seed: int) -> str:
+    """bcrypt hash compatible with bcryptjs (computed once and shared by every seeded user).
+
+    The salt comes from ``seed`` rather than ``gensalt()`` so the stored hash
+    is reproducible too; the last salt character only carries 2 bits.
+    """
+    import bcrypt
+
+    rng = random.Random(f"bcrypt-salt-{seed}")
+    salt = "".join(rng.choice(BCRYPT_ALPHABET) for _ in range(21)) + rng.choice(".Oeu")
+    return bcrypt.hashpw(password.encode("utf-8"), f"$2a$10${salt}".encode("ascii")).decode("utf-8")
+
+
+def parse_now(value: str) -> datetime:
+    """Parse ``--now``; a value without an offset is taken as UTC."""
+    now = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return now if now.tzinfo else now.replace(tzinfo=timezone.utc)
+
+
+def start_memory_server(replset: bool) -> tuple:
+    """Spawn ``scripts/startMemoryMongo.js`` and return ``(process, uri)``."""
+    command = ["node", os.path.join("scripts", "startMemoryMongo.js")]
+    if replset:
+        command.append("--replset")
+    process = subprocess.Popen(command, cwd=BACKEND_DIR, stdout=subprocess.PIPE, text=True)
+    for line in process.stdout:
+        if line.startswith("MONGO_URI="):
+            return process, line.strip().split("=", 1)[1]
+    process.wait()
+    raise RuntimeError("mongodb-memory-server exited before reporting a URI")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Seed a benchmark database with synthetic Seribro data")
+    parser.add_argument("--uri", default=os.environ.get("MONGO_URI", "mongodb://localhost:27017/seribro_bench"))
+    parser.add_argument("--memory-server", action="store_true", help="Seed a local mongodb-memory-server instead")
+    parser.add_argument("--replset", action="store_true", help="Start the memory server as a replica set")
+    parser.add_argument("--keep-alive", action="store_true", help="Keep the memory server running after seeding")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplier for the default volumes")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--now", default=os.environ.get("SERIBRO_SEED_NOW", DEFAULT_NOW),
+                        help="ISO 8601 reference time all dates are derived from")
+    parser.add_argument("--wall-clock", action="store_true",
+                        help="Use the current time instead of --now (output differs between runs)")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--password", default="SeedPass1!")
+    parser.add_argument("--drop", action="store_true", help="Drop the seeded collections first")
+    parser.add_argument("--accounts-out", help="Write approved accounts for seribro_client.load")
+    parser.add_argument("--accounts-count", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    server = None
+    uri = args.uri
+    if args.memory_server:
+        server, uri = start_memory_server(args.replset)
+        print(f"mongodb-memory-server: {uri}")
+
+    try:
+        client = MongoClient(uri)
+        db = client.get_default_database(default="seribro_bench")
+        if args.drop:
+            for name in ("users", "students", "studentprofiles", "companyprofiles", "projects",
+                         "applications", "messages", "notifications", "payments"):
+                db.drop_collection(name)
+
+        wall_now = datetime.now(timezone.utc)
+        now = wall_now if args.wall_clock else parse_now(args.now)
+        seeder = Seeder(db, args.seed, args.scale, args.batch_size, hash_password(args.password, args.seed), now,
+                        deadline_anchor=wall_now)
+        print(f"Seeding {db.name} (scale={args.scale}, seed={args.seed})")
+        summary = seeder.run()
+        print(json.dumps(summary, indent=2))
+
+        if args.accounts_out:
+            with open(args.accounts_out, "w", encoding="utf-8") as fh:
+                json.dump(seeder.sample_accounts(args.accounts_count, args.password), fh, indent=2)
+            print(f"Accounts -> {args.accounts_out}")
+
+        if server is not None and args.keep_alive:
+            print(f"MONGO_URI={uri}  (Ctrl+C to stop)")
+            server.wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if server is not None and server.poll() is None:
+            server.terminate()
+            server.wait()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
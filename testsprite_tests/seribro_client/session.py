@@ -0,0 +1,154 @@
+"""Pooled keep-alive HTTP sessions and a login token cache.
+
+A single ``requests.Session`` is kept per ``(base_url, role)`` pair so every
+call made for a role reuses the same TCP/TLS connections instead of opening
+a fresh socket per ``requests.post``. Tokens are cached per account so a
+suite logs each account in once rather than once per test.
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from . import config
+
+_sessions: Dict[Tuple[str, str], requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    # Only retry idempotent methods on connection errors; never replay a POST
+    retry = Retry(
+        total=config.MAX_RETRIES,
+        connect=config.MAX_RETRIES,
+        read=0,
+        status=0,
+        allowed_methods=frozenset({"GET", "HEAD", "OPTIONS"}),
+        backoff_factor=0.1,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=config.POOL_CONNECTIONS,
+        pool_maxsize=config.POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Connection": "keep-alive", "Accept": "application/json"})
+    return session
+
+
+def get_session(role: str, base_url: Optional[str] = None) -> requests.Session:
+    """Return the shared session for ``role``, creating it on first use."""
+    key = (base_url or config.BASE_URL, role)
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = _build_session()
+            _sessions[key] = session
+        return session
+
+
+def close_sessions() -> None:
+    """Close every pooled session (call once at the end of a run)."""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+@dataclass
+class Principal:
+    """An authenticated account: the bearer token plus who it belongs to."""
+
+    email: str
+    role: str
+    token: str
+    user_id: Optional[str] = None
+    issued_at: float = 0.0
+
+    @property
+    def auth_header(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.token}"}
+
+
+class TokenCache:
+    """Thread-safe cache of ``Principal`` objects keyed by account.
+
+    When ``path`` is set the cache is mirrored to a JSON file so separate
+    test processes on the same machine can reuse each other's logins.
+    Entries older than ``max_age`` seconds are treated as missing.
+    """
+
+    def __init__(self, path: str = "", max_age: float = 6 * 60 * 60):
+        self.path = path
+        self.max_age = max_age
+        self._entries: Dict[str, Principal] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(base_url: str, email: str, role: str) -> str:
+        return f"{base_url}|{role}|{email.lower()}"
+
+    def get(self, base_url: str, email: str, role: str) -> Optional[Principal]:
+        key = self.key(base_url, email, role)
+        with self._lock:
+            principal = self._entries.get(key)
+            if principal is None and self.path:
+                principal = self._read_file().get(key)
+                if principal is not None:
+                    self._entries[key] = principal
+            if principal is None:
+                return None
+            if time.time() - principal.issued_at > self.max_age:
+                self._entries.pop(key, None)
+                return None
+            return principal
+
+    def put(self, base_url: str, principal: Principal) -> None:
+        key = self.key(base_url, principal.email, principal.role)
+        with self._lock:
+            self._entries[key] = principal
+            if self.path:
+                entries = self._read_file()
+                entries[key] = principal
+                self._write_file(entries)
+
+    def invalidate(self, base_url: str, email: str, role: str) -> None:
+        key = self.key(base_url, email, role)
+        with self._lock:
+            self._entries.pop(key, None)
+            if self.path:
+                entries = self._read_file()
+                if entries.pop(key, None) is not None:
+                    self._write_file(entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self.path and os.path.exists(self.path):
+                os.remove(self.path)
+
+    def _read_file(self) -> Dict[str, Principal]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as fh:
+                raw = json.load(fh)
+        except (OSError, ValueError):
+            return {}
+        return {key: Principal(**value) for key, value in raw.items()}
+
+    def _write_file(self, entries: Dict[str, Principal]) -> None:
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump({key: asdict(value) for key, value in entries.items()}, fh)
+        os.replace(tmp_path, self.path)
+
+
+token_cache = TokenCache(config.TOKEN_CACHE_FILE)
@@ -0,0 +1,442 @@
+"""Socket.io load and soak harness for the workspace realtime layer.
+
+Opens many concurrent ``python-socketio`` asyncio clients, joins them to
+``project_<id>`` rooms with ``join_workspace`` and drives traffic through the
+same path as the app:
+
+* messages are sent over HTTP (``POST /api/workspace/projects/:id/messages``)
+  by the project's company / student, so delivery goes through
+  ``emitNewMessage``; every listener in the room times the ``new_message``
+  frame against the moment the POST was issued (fan-out latency) and missing
+  frames count against the delivery ratio;
+* listeners emit ``typing_start`` / ``typing_stop`` and count the coalesced
+  ``presence_batch`` frames they get back;
+* connect time is recorded for every socket, and with ``--storm-every`` a
+  fraction of the sockets is dropped and reconnected at once (reconnect
+  storm) to time how long the server takes to take them all back;
+* with ``--server-pid`` the backend's RSS is sampled from ``/proc`` and the
+  growth rate (MB/hour, least squares after warm-up) is reported, so a
+  multi-hour soak catches leaks in presence maps, buffers or the adapter.
+
+Workspaces (projects with an assigned student) and the accounts allowed to
+post in them come from a JSON file::
+
+    {"workspaces": [{"projectId": "...",
+                     "company": {"email": "...", "password": "..."},
+                     "student": {"email": "...", "password": "..."}}]}
+
+The process exits non-zero when ``--max-fanout-p99``, ``--min-delivery`` or
+``--max-rss-growth`` is exceeded, so the soak can gate a deploy.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m seribro_client.soak --workspaces workspaces.json --sockets 2000 --duration 300
+    python -m seribro_client.soak --workspaces workspaces.json --sockets 5000 --duration 14400 \\
+        --server-pid 12345 --storm-every 900 --output tmp/soak.json
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import aiohttp
+import socketio
+
+from . import config
+from .load import LoadContext, Stats, VuError
+from .metrics import Histogram
+
+NONCE_PREFIX = "soak:"
+
+
+@dataclass
+class Storm:
+    started: float
+    sockets: int
+    reconnected: int = 0
+    failed: int = 0
+    duration_ms: float = 0.0
+
+
+@dataclass
+class SoakStats:
+    connect: Histogram = field(default_factory=Histogram)
+    fanout: Histogram = field(default_factory=Histogram)
+    connect_errors: int = 0
+    disconnects: int = 0
+    messages_sent: int = 0
+    message_errors: int = 0
+    expected: int = 0
+    received: int = 0
+    late: int = 0
+    typing_sent: int = 0
+    presence_frames: int = 0
+    presence_events: int = 0
+    storms: List[Storm] = field(default_factory=list)
+    rss: List[tuple] = field(default_factory=list)  # (elapsed seconds, MB)
+
+    @property
+    def delivery(self) -> float:
+        return self.received / self.expected if self.expected else 1.0
+
+
+def _ms(hist: Histogram, pct: float) -> float:
+    return round(hist.percentile(pct) / 1000.0, 1)
+
+
+def rss_growth(samples: List[tuple], warmup: float) -> Optional[float]:
+    """Least-squares slope of RSS in MB/hour, ignoring the first ``warmup`` fraction."""
+    if len(samples) < 3:
+        return None
+    start = samples[-1][0] * warmup
+    points = [(t / 3600.0, mb) for t, mb in samples if t >= start]
+    if len(points) < 3:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    var = sum((x - mean_x) ** 2 for x, _ in points)
+    if var == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var
+
+
+def read_rss_mb(pid: int) -> Optional[float]:
+    try:
+        with open(f"/proc/{pid}/status", "r", encoding="utf-8") as fh:
+            for line in fh:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024.0
+    except OSError:
+        return None
+    return None
+
+
+class Listener:
+    """One socket joined to one workspace room."""
+
+    def __init__(self, index: int, project_id: str, soak: "Soak"):
+        self.index = index
+        self.project_id = project_id
+        self.user_id = f"soak-{index}"
+        self.soak = soak
+        self.connected = False
+        self.sio = socketio.AsyncClient(reconnection=True, reconnection_delay=1, reconnection_delay_max=5)
+        self.sio.on("connect", self._on_connect)
+        self.sio.on("disconnect", self._on_disconnect)
+        self.sio.on("new_message", self._on_message)
+        self.sio.on("presence_batch", self._on_presence)
+
+    async def _on_connect(self):
+        self.connected = True
+        # Also runs after automatic reconnects, so the socket is always back in its room
+        await self.sio.emit("join_workspace", {"projectId": self.project_id, "userId": self.user_id})
+
+    async def _on_disconnect(self, *args):
+        if self.connected:
+            self.soak.stats.disconnects += 1
+        self.connected = False
+
+    async def _on_message(self, data):
+        text = (data or {}).get("message", "")
+        if text.startswith(NONCE_PREFIX):
+            self.soak.receipt(text[len(NONCE_PREFIX):].split(" ", 1)[0])
+
+    async def _on_presence(self, frame):
+        self.soak.stats.presence_frames += 1
+        self.soak.stats.presence_events += len((frame or {}).get("events", []))
+
+    async def connect(self) -> bool:
+        started = time.perf_counter()
+        try:
+            await self.sio.connect(self.soak.args.base_url, transports=["websocket"], wait_timeout=self.soak.args.connect_timeout)
+        except (socketio.exceptions.ConnectionError, asyncio.TimeoutError):
+            self.soak.stats.connect_errors += 1
+            return False
+        self.soak.stats.connect.record((time.perf_counter() - started) * 1_000_000)
+        return True
+
+    async def type_once(self, rng: random.Random) -> None:
+        if not self.connected:
+            return
+        payload = {"projectId": self.project_id, "userId": self.user_id, "senderName": self.user_id, "senderRole": "student"}
+        await self.sio.emit("typing_start", payload)
+        self.soak.stats.typing_sent += 1
+        await asyncio.sleep(rng.uniform(0.5, 3.0))
+        if self.connected:
+            await self.sio.emit("typing_stop", payload)
+            self.soak.stats.typing_sent += 1
+
+
+class Soak:
+    def __init__(self, args, workspaces: List[dict], ctx: LoadContext):
+        self.args = args
+        self.workspaces = workspaces
+        self.ctx = ctx
+        self.stats = SoakStats()
+        self.rng = random.Random(args.seed)
+        self.listeners: List[Listener] = []
+        self.pending: Dict[str, dict] = {}  # nonce -> {sent, expected, received}
+        self.started = time.perf_counter()
+
+    # ---- fan-out bookkeeping ----
+
+    def receipt(self, nonce: str) -> None:
+        entry = self.pending.get(nonce)
+        if entry is None:
+            self.stats.late += 1
+            return
+        entry["received"] += 1
+        self.stats.received += 1
+        self.stats.fanout.record((time.perf_counter() - entry["sent"]) * 1_000_000)
+
+    def expire_pending(self, max_age: float) -> None:
+        cutoff = time.perf_counter() - max_age
+        for nonce in [n for n, e in self.pending.items() if e["sent"] < cutoff]:
+            del self.pending[nonce]
+
+    # ---- phases ----
+
+    async def connect_all(self) -> None:
+        rooms = itertools.cycle(ws["projectId"] for ws in self.workspaces)
+        self.listeners = [Listener(i, next(rooms), self) for i in range(self.args.sockets)]
+        gate = asyncio.Semaphore(self.args.connect_concurrency)
+
+        async def connect(listener: Listener) -> None:
+            async with gate:
+                await listener.connect()
+
+        await asyncio.gather(*(connect(listener) for listener in self.listeners))
+
+    async def send_messages(self, end: float) -> None:
+        if self.args.message_rate <= 0:
+            return
+        senders = itertools.cycle(
+            (ws["projectId"], ws[role], role) for ws in self.workspaces for role in ("company", "student") if ws.get(role)
+        )
+        tasks = set()
+        while time.perf_counter() < end:
+            project_id, account, role = next(senders)
+            task = asyncio.ensure_future(self._send(project_id, account, role))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            await asyncio.sleep(self.rng.expovariate(self.args.message_rate))
+        if tasks:
+            await asyncio.wait(tasks, timeout=self.args.drain)
+
+    async def _send(self, project_id: str, account: dict, role: str) -> None:
+        try:
+            token = await self.ctx.token_for(account, role)
+        except VuError:
+            self.stats.message_errors += 1
+            return
+        nonce = uuid.uuid4().hex
+        expected = sum(1 for l in self.listeners if l.connected and l.project_id == project_id)
+        self.pending[nonce] = {"sent": time.perf_counter(), "expected": expected, "received": 0}
+        self.stats.expected += expected
+        try:
+            await self.ctx.request(
+                "POST", "POST /api/workspace/projects/:projectId/messages",
+                f"/api/workspace/projects/{project_id}/messages", token,
+                json={"message": f"{NONCE_PREFIX}{nonce} soak traffic"},
+            )
+            self.stats.messages_sent += 1
+        except VuError:
+            self.stats.message_errors += 1
+            self.stats.expected -= expected
+            self.pending.pop(nonce, None)
+
+    async def send_typing(self, end: float) -> None:
+        if self.args.typing_rate <= 0:
+            return
+        rate = self.args.typing_rate * len(self.listeners) / 60.0
+        tasks = set()
+        while time.perf_counter() < end:
+            task = asyncio.ensure_future(self.rng.choice(self.listeners).type_once(self.rng))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            await asyncio.sleep(self.rng.expovariate(rate))
+        if tasks:
+            await asyncio.wait(tasks, timeout=5)
+
+    async def storms(self, end: float) -> None:
+        if not self.args.storm_every:
+            return
+        while time.perf_counter() + self.args.storm_every < end:
+            await asyncio.sleep(self.args.storm_every)
+            victims = [l for l in self.listeners if l.connected]
+            victims = self.rng.sample(victims, int(len(victims) * self.args.storm_fraction))
+            storm = Storm(started=time.perf_counter() - self.started, sockets=len(victims))
+            began = time.perf_counter()
+            await asyncio.gather(*(l.sio.disconnect() for l in victims), return_exceptions=True)
+            results = await asyncio.gather(*(l.connect() for l in victims))
+            storm.reconnected = sum(1 for ok in results if ok)
+            storm.failed = len(victims) - storm.reconnected
+            storm.duration_ms = round((time.perf_counter() - began) * 1000, 1)
+            self.stats.storms.append(storm)
+            print(f"storm: {storm.sockets} sockets back in {storm.duration_ms:.0f}ms ({storm.failed} failed)")
+
+    async def sample_memory(self, end: float) -> None:
+        if not self.args.server_pid:
+            return
+        while time.perf_counter() < end:
+            rss = read_rss_mb(self.args.server_pid)
+            if rss is not None:
+                self.stats.rss.append((time.perf_counter() - self.started, round(rss, 1)))
+            await asyncio.sleep(self.args.sample_every)
+
+    async def report_progress(self, end: float) -> None:
+        while time.perf_counter() < end:
+            await asyncio.sleep(self.args.report_every)
+            self.expire_pending(self.args.drain)
+            s = self.stats
+            rss = f"  rss={s.rss[-1][1]:.0f}MB" if s.rss else ""
+            print(
+                f"t={time.perf_counter() - self.started:>7.0f}s  connected={sum(l.connected for l in self.listeners):>6}  "
+                f"msgs={s.messages_sent:>6}  fanout p99={_ms(s.fanout, 99):>7.1f}ms  "
+                f"delivery={s.delivery:.2%}  presence frames={s.presence_frames}{rss}"
+            )
+
+    async def close(self) -> None:
+        await asyncio.gather(*(l.sio.disconnect() for l in self.listeners), return_exceptions=True)
+
+    def summary(self) -> dict:
+        s = self.stats
+        growth = rss_growth(s.rss, self.args.warmup)
+        return {
+            "durationSec": round(time.perf_counter() - self.started, 1),
+            "sockets": len(self.listeners),
+            "rooms": len(self.workspaces),
+            "connect": {
+                "count": s.connect.total,
+                "errors": s.connect_errors,
+                "p50Ms": _ms(s.connect, 50),
+                "p99Ms": _ms(s.connect, 99),
+                "maxMs": round(s.connect.max / 1000.0, 1),
+            },
+            "fanout": {
+                "messages": s.messages_sent,
+                "messageErrors": s.message_errors,
+                "expectedDeliveries": s.expected,
+                "delivered": s.received,
+                "late": s.late,
+                "delivery": round(s.delivery, 4),
+                "p50Ms": _ms(s.fanout, 50),
+                "p90Ms": _ms(s.fanout, 90),
+                "p99Ms": _ms(s.fanout, 99),
+                "maxMs": round(s.fanout.max / 1000.0, 1),
+            },
+            "presence": {
+                "typingSent": s.typing_sent,
+                "framesReceived": s.presence_frames,
+                "eventsReceived": s.presence_events,
+            },
+            "disconnects": s.disconnects,
+            "storms": [storm.__dict__ for storm in s.storms],
+            "memory": {
+                "samples": s.rss,
+                "startMb": s.rss[0][1] if s.rss else None,
+                "endMb": s.rss[-1][1] if s.rss else None,
+                "growthMbPerHour": round(growth, 2) if growth is not None else None,
+            },
+        }
+
+
+def check_gates(summary: dict, args) -> List[str]:
+    failures = []
+    if args.max_fanout_p99 and summary["fanout"]["p99Ms"] > args.max_fanout_p99:
+        failures.append(f"fan-out p99 {summary['fanout']['p99Ms']}ms > {args.max_fanout_p99}ms")
+    if summary["fanout"]["expectedDeliveries"] and summary["fanout"]["delivery"] < args.min_delivery:
+        failures.append(f"delivery {summary['fanout']['delivery']:.2%} < {args.min_delivery:.2%}")
+    growth = summary["memory"]["growthMbPerHour"]
+    if args.max_rss_growth and growth is not None and growth > args.max_rss_growth:
+        failures.append(f"server RSS growing {growth} MB/hour > {args.max_rss_growth} MB/hour")
+    if any(storm["failed"] for storm in summary["storms"]):
+        failures.append("sockets failed to reconnect after a reconnect storm")
+    return failures
+
+
+async def main_async(args) -> int:
+    with open(args.workspaces, "r", encoding="utf-8") as fh:
+        workspaces = json.load(fh).get("workspaces", [])
+    if not workspaces:
+        print("Workspaces file has no workspaces")
+        return 1
+
+    connector = aiohttp.TCPConnector(limit=args.connections, keepalive_timeout=30)
+    timeout = aiohttp.ClientTimeout(total=config.TIMEOUT)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        ctx = LoadContext(session, args.base_url, {}, Stats())
+        soak = Soak(args, workspaces, ctx)
+
+        await soak.connect_all()
+        connect = soak.stats.connect
+        print(
+            f"connected {connect.total}/{args.sockets} sockets  p50={_ms(connect, 50)}ms  "
+            f"p99={_ms(connect, 99)}ms  errors={soak.stats.connect_errors}"
+        )
+
+        end = time.perf_counter() + args.duration
+        await asyncio.gather(
+            soak.send_messages(end),
+            soak.send_typing(end),
+            soak.storms(end),
+            soak.sample_memory(end),
+            soak.report_progress(end),
+        )
+        await soak.close()
+
+    summary = soak.summary()
+    summary["http"] = ctx.stats.summary()
+    failures = check_gates(summary, args)
+    summary["failures"] = failures
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(summary, fh, indent=2)
+
+    fanout = summary["fanout"]
+    print(
+        f"\nfan-out p50={fanout['p50Ms']}ms p99={fanout['p99Ms']}ms delivery={fanout['delivery']:.2%}  "
+        f"rss growth={summary['memory']['growthMbPerHour']} MB/h"
+    )
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Load and soak test the workspace socket.io layer")
+    parser.add_argument("--workspaces", required=True, help="JSON file with workspaces and their participants")
+    parser.add_argument("--base-url", default=config.BASE_URL)
+    parser.add_argument("--sockets", type=int, default=1000, help="Concurrent listener sockets")
+    parser.add_argument("--connect-concurrency", type=int, default=200, help="Sockets connecting at once")
+    parser.add_argument("--connect-timeout", type=float, default=10.0)
+    parser.add_argument("--duration", type=float, default=300.0, help="Seconds of traffic after connecting")
+    parser.add_argument("--message-rate", type=float, default=5.0, help="Messages per second across all rooms")
+    parser.add_argument("--typing-rate", type=float, default=2.0, help="Typing bursts per socket per minute")
+    parser.add_argument("--storm-every", type=float, default=0.0, help="Seconds between reconnect storms (0 = off)")
+    parser.add_argument("--storm-fraction", type=float, default=0.5, help="Fraction of sockets dropped per storm")
+    parser.add_argument("--server-pid", type=int, help="Backend PID to sample RSS from /proc")
+    parser.add_argument("--sample-every", type=float, default=30.0, help="Seconds between RSS samples")
+    parser.add_argument("--warmup", type=float, default=0.1, help="Fraction of the run ignored for RSS growth")
+    parser.add_argument("--report-every", type=float, default=30.0, help="Seconds between progress lines")
+    parser.add_argument("--drain", type=float, default=30.0, help="Seconds to wait for in-flight deliveries")
+    parser.add_argument("--connections", type=int, default=64, help="HTTP pool size for message senders")
+    parser.add_argument("--max-fanout-p99", type=float, default=1000.0, help="Fan-out p99 threshold in ms (0 = off)")
+    parser.add_argument("--min-delivery", type=float, default=0.999)
+    parser.add_argument("--max-rss-growth", type=float, default=50.0, help="RSS growth threshold in MB/hour (0 = off)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="Write the soak report as JSON")
+    args = parser.parse_args(argv)
+    args.base_url = args.base_url.rstrip("/")
+    return asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""Unit tests for the latency histogram and the Markdown report section."""
+
+import math
+import random
+
+import pytest
+
+from seribro_client import metrics
+from seribro_client.metrics import REPORT_END, REPORT_START, Histogram, RouteMetrics
+
+
+def exact_percentile(values, pct):
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def artifact_for(route, micros):
+    route_metrics = RouteMetrics()
+    for value in micros:
+        route_metrics.record(value, 200, 10, 5)
+    return {"generatedAt": "2026-01-01T00:00:00Z", "routes": {route: route_metrics.summary()}}
+
+
+def test_values_below_sub_bucket_count_are_exact():
+    hist = Histogram()
+    for value in range(1, metrics.SUB_BUCKET_COUNT):
+        hist.record(value)
+
+    assert hist.percentile(50) == exact_percentile(range(1, metrics.SUB_BUCKET_COUNT), 50)
+    assert hist.percentile(100) == metrics.SUB_BUCKET_COUNT - 1
+
+
+@pytest.mark.parametrize("pct", [50, 90, 95, 99, 99.9])
+def test_percentile_stays_within_relative_error_bound(pct):
+    rng = random.Random(42)
+    values = [int(rng.lognormvariate(10, 1.2)) for _ in range(20_000)]
+    hist = Histogram()
+    for value in values:
+        hist.record(value)
+
+    exact = exact_percentile(values, pct)
+    estimate = hist.percentile(pct)
+    # Upper bound of a bucket: never below the true value, at most one bucket width above
+    assert exact <= estimate <= exact * (1 + 1 / metrics.SUB_BUCKET_HALF)
+
+
+def test_percentile_never_exceeds_recorded_max():
+    hist = Histogram()
+    for value in (1_000, 5_000, 123_457):
+        hist.record(value)
+
+    assert hist.percentile(100) == 123_457
+    assert hist.percentile(99) <= hist.max
+
+
+def test_empty_histogram_reports_zero():
+    assert Histogram().percentile(99) == 0
+
+
+def test_merge_matches_single_histogram_and_survives_round_trip():
+    rng = random.Random(7)
+    values = [rng.randint(0, 2_000_000) for _ in range(5_000)]
+    whole, left, right = Histogram(), Histogram(), Histogram()
+    for index, value in enumerate(values):
+        whole.record(value)
+        (left if index % 2 else right).record(value)
+
+    merged = Histogram.from_dict(left.to_dict())
+    merged.merge(Histogram.from_dict(right.to_dict()))
+
+    assert merged.total == whole.total
+    assert (merged.min, merged.max, merged.sum) == (whole.min, whole.max, whole.sum)
+    for pct in (50, 95, 99):
+        assert merged.percentile(pct) == whole.percentile(pct)
+
+
+def test_route_template_collapses_ids():
+    url = "http://localhost:7000/api/student/projects/64b7f0c2a1b2c3d4e5f60718/apply?x=1"
+    assert metrics.route_template("post", url) == "POST /api/student/projects/:id/apply"
+
+
+def test_write_report_section_appends_once_and_keeps_surrounding_text(tmp_path):
+    report = tmp_path / "report.md"
+    report.write_text("# Test Report\n\nSome results.\n", encoding="utf-8")
+
+    metrics.write_report_section(str(report), artifact_for("GET /api/a", [1_000, 2_000]))
+    first = report.read_text(encoding="utf-8")
+
+    assert first.startswith("# Test Report\n\nSome results.\n")
+    assert first.count(REPORT_START) == 1 and first.count(REPORT_END) == 1
+    assert "`GET /api/a`" in first
+
+
+def test_write_report_section_is_idempotent(tmp_path):
+    report = tmp_path / "report.md"
+    report.write_text("# Test Report\n", encoding="utf-8")
+    artifact = artifact_for("GET /api/a", [1_000, 2_000])
+
+    metrics.write_report_section(str(report), artifact)
+    once = report.read_text(encoding="utf-8")
+    metrics.write_report_section(str(report), artifact)
+
+    assert report.read_text(encoding="utf-8") == once
+
+
+def test_write_report_section_replaces_only_the_marked_section(tmp_path):
+    report = tmp_path / "report.md"
+    report.write_text("# Test Report\n", encoding="utf-8")
+    metrics.write_report_section(str(report), artifact_for("GET /api/old", [1_000]))
+    with open(report, "a", encoding="utf-8") as fh:
+        fh.write("\n## Notes\n\nKeep me.\n")
+
+    metrics.write_report_section(str(report), artifact_for("GET /api/new", [3_000]))
+    content = report.read_text(encoding="utf-8")
+
+    assert "`GET /api/old`" not in content
+    assert "`GET /api/new`" in content
+    assert content.count(REPORT_START) == 1
+    assert content.startswith("# Test Report\n")
+    assert content.endswith("## Notes\n\nKeep me.\n")
+
+
+def test_write_report_section_creates_missing_report(tmp_path):
+    report = tmp_path / "missing.md"
+
+    metrics.write_report_section(str(report), artifact_for("GET /api/a", [1_000]))
+
+    assert REPORT_START in report.read_text(encoding="utf-8")
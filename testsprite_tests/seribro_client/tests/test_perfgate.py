@@ -0,0 +1,162 @@
+"""Unit tests for the performance gate comparison."""
+
+import json
+
+from seribro_client import perfgate
+
+LOGIN = "POST /api/auth/login"
+BROWSE = "GET /api/student/projects"
+APPLY = "POST /api/student/projects/:id/apply"
+
+
+def artifact(routes, workflows):
+    return {
+        "routes": {
+            route: {"p95Ms": p95, "p99Ms": p95, "count": 1}
+            for route, p95 in routes.items()
+        },
+        "workflows": {
+            name: {"routes": dict(calls), "requests": sum(calls.values())}
+            for name, calls in workflows.items()
+        },
+    }
+
+
+def baseline():
+    return perfgate.baseline_from(
+        artifact(
+            {LOGIN: 40.0, BROWSE: 100.0, APPLY: 20.0},
+            {"TC009": {LOGIN: 1, BROWSE: 1, APPLY: 1}},
+        )
+    )
+
+
+def current(**overrides):
+    routes = {LOGIN: 40.0, BROWSE: 100.0, APPLY: 20.0}
+    routes.update(overrides.pop("routes", {}))
+    calls = {LOGIN: 1, BROWSE: 1, APPLY: 1}
+    calls.update(overrides.pop("calls", {}))
+    return artifact(routes, {"TC009": calls})
+
+
+def test_identical_run_passes():
+    assert perfgate.compare(current(), baseline()) == []
+
+
+def test_p95_growth_past_ratio_fails():
+    failures = perfgate.compare(current(routes={BROWSE: 126.0}), baseline())
+
+    assert len(failures) == 1
+    assert failures[0].startswith(f"p95 {BROWSE}: 126.0 ms > 125.0 ms")
+
+
+def test_p95_growth_within_ratio_passes():
+    assert perfgate.compare(current(routes={BROWSE: 125.0}), baseline()) == []
+
+
+def test_small_routes_use_the_jitter_floor():
+    # +50% on a 20 ms route is only 10 ms, which the floor absorbs
+    assert perfgate.compare(current(routes={APPLY: 30.0}), baseline()) == []
+
+    failures = perfgate.compare(current(routes={APPLY: 30.5}), baseline())
+    assert failures == [f"p95 {APPLY}: 30.5 ms > 30.0 ms (baseline 20.0 ms)"]
+
+
+def test_threshold_overrides_take_precedence():
+    failures = perfgate.compare(current(routes={BROWSE: 110.5}), baseline(), {"p95Ratio": 0.1})
+
+    assert failures == [f"p95 {BROWSE}: 110.5 ms > 110.0 ms (baseline 100.0 ms)"]
+
+
+def test_extra_call_in_workflow_fails():
+    failures = perfgate.compare(current(calls={BROWSE: 2}), baseline())
+
+    assert failures == [f"calls TC009 / {BROWSE}: 2 > baseline 1"]
+
+
+def test_count_delta_allows_extra_calls():
+    assert perfgate.compare(current(calls={BROWSE: 2}), baseline(), {"requestCountDelta": 1}) == []
+
+
+def test_new_route_in_workflow_fails():
+    extra = "GET /api/student/projects/:id"
+    run = current(routes={extra: 5.0}, calls={extra: 3})
+
+    failures = perfgate.compare(run, baseline())
+
+    assert failures == [f"calls TC009 / {extra}: new route called 3x"]
+
+
+def test_login_counts_are_ignored():
+    assert perfgate.compare(current(calls={LOGIN: 4}), baseline()) == []
+
+
+def test_missing_route_and_workflow_fail():
+    run = current()
+    del run["routes"][APPLY]
+    run["workflows"]["TC010"] = run["workflows"].pop("TC009")
+    base = baseline()
+    base["workflows"]["TC010"] = base["workflows"]["TC009"]
+
+    failures = perfgate.compare(run, base)
+
+    assert failures == [
+        f"route {APPLY}: in baseline but not called in this run",
+        "workflow TC009: in baseline but missing from this run",
+    ]
+
+
+def test_partial_run_only_warns_on_missing_entries():
+    run = current()
+    del run["routes"][APPLY]
+    del run["workflows"]["TC009"]
+
+    assert perfgate.compare(run, baseline(), partial=True) == []
+    assert perfgate.missing_entries(run, baseline()) == [
+        f"route {APPLY}: in baseline but not called in this run",
+        "workflow TC009: in baseline but missing from this run",
+    ]
+
+
+def test_partial_run_still_fails_on_regressions():
+    run = current(routes={BROWSE: 200.0})
+    del run["workflows"]["TC009"]
+
+    failures = perfgate.compare(run, baseline(), partial=True)
+
+    assert len(failures) == 1 and failures[0].startswith(f"p95 {BROWSE}")
+
+
+def test_empty_baseline_is_no_gate():
+    assert perfgate.is_empty({})
+    assert perfgate.is_empty({"thresholds": {}, "routes": {}, "workflows": {}})
+    assert perfgate.compare(current(routes={BROWSE: 900.0}), {"routes": {}, "workflows": {}}) == []
+
+
+def test_main_warns_and_passes_on_empty_baseline(tmp_path, capsys):
+    artifact_path = tmp_path / "latency_metrics.json"
+    baseline_path = tmp_path / "baseline.json"
+    history_path = tmp_path / "history.jsonl"
+    artifact_path.write_text(json.dumps(current()), encoding="utf-8")
+    baseline_path.write_text("{}", encoding="utf-8")
+
+    code = perfgate.main(
+        ["compare", str(artifact_path), "--baseline", str(baseline_path), "--history", str(history_path)]
+    )
+
+    assert code == 0
+    assert "is empty, so there is no gate" in capsys.readouterr().out
+    assert len(history_path.read_text(encoding="utf-8").splitlines()) == 1
+
+
+def test_main_fails_on_regression(tmp_path):
+    artifact_path = tmp_path / "latency_metrics.json"
+    baseline_path = tmp_path / "baseline.json"
+    artifact_path.write_text(json.dumps(current(calls={APPLY: 2})), encoding="utf-8")
+    baseline_path.write_text(json.dumps(baseline()), encoding="utf-8")
+
+    code = perfgate.main(
+        ["compare", str(artifact_path), "--baseline", str(baseline_path), "--history", str(tmp_path / "h.jsonl")]
+    )
+
+    assert code == 1